@@ -0,0 +1,88 @@
+"""Benchmark chime_tts announcement assembly with the decoded audio cache.
+
+Assembles a doorbell announcement (the ding_dong chime, a TTS segment from a
+fake TTS engine that answers at once, the bells chime with a volume
+conversion and the tada end chime) the way async_get_playback_audio_path
+does.  Cold, every chime is decoded with pydub/FFmpeg as before the cache;
+warm, the decoded audio comes from the AudioCache.  Both must produce the
+same audio.  Prints the time per announcement and the cache statistics.
+Needs Home Assistant and FFmpeg installed; run from the config directory
+with:
+
+    python -m benchmarks.chime_tts_audio_cache
+"""
+
+import asyncio
+import tempfile
+import time
+from types import SimpleNamespace
+
+from pydub.generators import Sine
+
+from custom_components.chime_tts import (
+    _data,
+    async_get_audio_from_path,
+    async_process_segments,
+    audio_cache,
+    tts_audio_helper,
+)
+from custom_components.chime_tts.const import CUSTOM_CHIMES_PATH_KEY, TEMP_PATH_KEY
+
+ROUNDS = 10
+MESSAGE = """
+- tts: "Someone is at the front door"
+- chime: bells
+  audio_conversion: volume 60%
+"""
+PARAMS = {"offset": 450}
+
+
+async def fake_request_tts_audio(hass, tts_platform, message, language, cache, options):
+    """A TTS engine that answers at once."""
+    return Sine(440).to_audio_segment(duration=60 * len(message)).set_frame_rate(24000)
+
+
+async def assemble(hass):
+    """Assemble the announcement as async_get_playback_audio_path does."""
+    audio = await async_get_audio_from_path(hass=hass, filepath="ding_dong", cache=True)
+    audio = await async_process_segments(hass, MESSAGE, audio, PARAMS, {})
+    return await async_get_audio_from_path(
+        hass=hass, filepath="tada", cache=True, offset=450, audio=audio
+    )
+
+
+async def main():
+    """Run the benchmark with a cold and a warm cache."""
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        async_add_executor_job=lambda target, *args: loop.run_in_executor(None, target, *args)
+    )
+    tts_audio_helper.async_request_tts_audio = fake_request_tts_audio
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        _data[TEMP_PATH_KEY] = temp_folder
+        _data[CUSTOM_CHIMES_PATH_KEY] = ""
+        results = {}
+        for name, clear in [("cold (decoded every time)", True), ("warm", False)]:
+            audio_cache.clear()
+            await assemble(hass)
+            t_start = time.perf_counter()
+            for _ in range(ROUNDS):
+                if clear:
+                    audio_cache.clear()
+                audio = await assemble(hass)
+            elapsed = (time.perf_counter() - t_start) / ROUNDS
+            results[name] = audio.raw_data
+            print(f"{name}: {elapsed * 1000:.0f} ms per announcement")
+
+        stats = audio_cache.get_stats()
+        print(
+            f"cache: {stats['entries']} entries, {stats['size_bytes'] / 1024:.0f} KiB, "
+            f"{stats['hits']} hits, {stats['misses']} misses"
+        )
+        (cold, warm) = results.values()
+        assert cold == warm
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Benchmark chime_tts FFmpeg conversions over pipes against temporary files.
+
+Changes the speed, pitch and volume of eight 5 second TTS clips.  The
+previous way exports each clip to an mp3 file for each conversion, runs
+FFmpeg on the file, loads the converted file and deletes both, one clip at
+a time as they shared a temporary file name.  The pipe way chains the three
+filters into one FFmpeg call that reads and writes raw PCM, with all clips
+at the same time.  The results must have the same duration (within the mp3
+padding).  Pass the folder for the temporary files as the first argument,
+e.g. a folder on the SD card; a temporary folder is used otherwise.  Needs
+Home Assistant and FFmpeg installed; run from the config directory with:
+
+    python -m benchmarks.chime_tts_ffmpeg_pipes [/media/sdcard/tmp]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from pydub.generators import Sine
+
+from custom_components.chime_tts.helpers.filesystem import FilesystemHelper
+from custom_components.chime_tts.helpers.helpers import ChimeTTSHelper
+
+CLIPS = 8
+SPEED = 125
+PITCH = 2
+VOLUME = "-filter:a volume=0.6"
+
+helpers = ChimeTTSHelper()
+filesystem_helper = FilesystemHelper()
+
+
+def conversions(audio):
+    """The FFmpeg arguments of the three conversions."""
+    return [
+        helpers.get_speed_ffmpeg_args(SPEED),
+        helpers.get_pitch_ffmpeg_args(PITCH, audio.frame_rate),
+        VOLUME,
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation: async_ffmpeg_convert_from_audio_segment with files
+# ---------------------------------------------------------------------------
+async def convert_with_files(hass, audio, ffmpeg_args, folder):
+    """Export, convert, reload and delete, as each conversion did."""
+    temp_audio_file = await filesystem_helper.async_save_audio_to_folder(
+        hass=hass, audio=audio, folder=folder, file_name="temp_segment.mp3"
+    )
+    converted_audio_file = await helpers.async_ffmpeg_convert_from_file(hass, temp_audio_file, ffmpeg_args)
+    audio = await filesystem_helper.async_load_audio(str(converted_audio_file))
+    for file_path in {temp_audio_file, converted_audio_file}:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+    return audio
+
+
+async def previous(hass, clips, folder):
+    """Convert the clips one after the other, each conversion through files."""
+    results = []
+    for audio in clips:
+        for ffmpeg_args in conversions(audio):
+            audio = await convert_with_files(hass, audio, ffmpeg_args, folder)
+        results.append(audio)
+    return results
+
+
+async def pipes(hass, clips, folder):
+    """Convert all clips at once, the three filters chained in one FFmpeg call."""
+
+    async def convert(audio):
+        filters = []
+        for ffmpeg_args in conversions(audio):
+            filters += helpers.get_ffmpeg_filters(ffmpeg_args)
+        return await helpers.async_ffmpeg_filter_audio_segment(audio, filters)
+
+    return await asyncio.gather(*[convert(audio) for audio in clips])
+
+
+async def main(folder):
+    """Run the benchmark with temporary files and with pipes."""
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        async_add_executor_job=lambda target, *args: loop.run_in_executor(None, target, *args)
+    )
+    clips = [
+        Sine(220 + 40 * i).to_audio_segment(duration=5000).set_frame_rate(24000)
+        for i in range(CLIPS)
+    ]
+
+    results = {}
+    for name, convert in [("temporary files (previous)", previous), ("pipes", pipes)]:
+        t_start = time.perf_counter()
+        results[name] = await convert(hass, clips, folder)
+        elapsed = time.perf_counter() - t_start
+        print(f"{name}: {elapsed:.2f} s for {CLIPS} clips, {elapsed / CLIPS * 1000:.0f} ms per clip")
+
+    (old, new) = results.values()
+    for old_audio, new_audio in zip(old, new):
+        assert abs(len(old_audio) - len(new_audio)) < 100, (len(old_audio), len(new_audio))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        asyncio.run(main(os.path.abspath(sys.argv[1])))
+    else:
+        with tempfile.TemporaryDirectory() as temp_folder:
+            asyncio.run(main(temp_folder))
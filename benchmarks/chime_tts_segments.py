@@ -0,0 +1,114 @@
+"""Benchmark chime_tts message segment rendering.
+
+Renders a five segment announcement (four TTS segments and a delay, each TTS
+segment sped up with FFmpeg) with a fake TTS engine that answers after a
+fixed latency.  Compares the previous loop, which fetched and converted one
+segment after the other, with async_process_segments, which renders the
+segments concurrently and combines them in order.  Both must produce audio
+of the same length.  Prints the time per announcement and the time of each
+stage per segment.  Needs Home Assistant and FFmpeg installed; run from the
+config directory with:
+
+    python -m benchmarks.chime_tts_segments
+"""
+
+import asyncio
+import tempfile
+import time
+from types import SimpleNamespace
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from custom_components.chime_tts import (
+    _data,
+    async_process_segments,
+    get_segment_offset,
+    helpers,
+    tts_audio_helper,
+)
+from custom_components.chime_tts.const import TEMP_PATH_KEY
+
+TTS_LATENCY = 0.4
+ROUNDS = 3
+MESSAGE = """
+- tts: "Someone is at the front door"
+- delay: 300
+- tts: "The parcel has been delivered"
+- tts: "The washing machine has finished"
+- tts: "Rain is expected within the hour"
+"""
+PARAMS = {"tts_speed": 125, "offset": 450}
+
+
+async def fake_request_tts_audio(hass, tts_platform, message, language, cache, options):
+    """A TTS engine that takes TTS_LATENCY seconds to answer."""
+    await asyncio.sleep(TTS_LATENCY)
+    return Sine(440).to_audio_segment(duration=60 * len(message)).set_frame_rate(24000)
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation: one segment after the other
+# ---------------------------------------------------------------------------
+async def process_segments_previous(hass, message, output_audio=None, params={}, options={}):
+    """The TTS and delay paths of the previous async_process_segments."""
+    for segment in helpers.parse_message(message):
+        segment_offset = get_segment_offset(output_audio, segment, params)
+        segment_crossfade = segment.get("crossfade", params.get("crossfade", 0))
+        if segment["type"] == "delay":
+            delay_audio = AudioSegment.silent(duration=float(segment["length"]))
+            output_audio = output_audio + delay_audio if output_audio else delay_audio
+        if segment["type"] == "tts":
+            tts_audio = await tts_audio_helper.async_request_tts_audio(
+                hass=hass,
+                tts_platform=None,
+                message=segment["message"],
+                language=None,
+                cache=False,
+                options={},
+            )
+            temp_folder = _data.get(TEMP_PATH_KEY, None)
+            tts_speed = float(segment.get("tts_speed", params.get("tts_speed", 100)))
+            tts_pitch = float(segment.get("tts_pitch", params.get("tts_pitch", 0)))
+            tts_audio = await helpers.async_change_speed_of_audiosegment(hass, tts_audio, tts_speed, temp_folder)
+            tts_audio = await helpers.async_change_pitch_of_audiosegment(hass, tts_audio, tts_pitch, temp_folder)
+            output_audio = helpers.combine_audio(output_audio, tts_audio, segment_offset, segment_crossfade)
+    return output_audio
+
+
+async def main():
+    """Run the benchmark with the previous loop and the pipeline."""
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        async_add_executor_job=lambda target, *args: loop.run_in_executor(None, target, *args)
+    )
+    tts_audio_helper.async_request_tts_audio = fake_request_tts_audio
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        _data[TEMP_PATH_KEY] = temp_folder
+        lengths = {}
+        for name, process in [
+            ("one segment at a time (previous)", process_segments_previous),
+            ("concurrent pipeline", async_process_segments),
+        ]:
+            t_start = time.perf_counter()
+            for _ in range(ROUNDS):
+                audio = await process(hass, MESSAGE, None, PARAMS, {})
+            elapsed = (time.perf_counter() - t_start) / ROUNDS
+            lengths[name] = len(audio)
+            print(f"{name}: {elapsed:.2f} s per announcement, {len(audio)} ms of audio")
+
+        for index, timing in enumerate(_data["segment_timings"]):
+            stages = ", ".join(
+                f"{stage} {seconds * 1000:.0f} ms"
+                for stage, seconds in timing.items()
+                if stage != "type"
+            )
+            print(f"  segment {index + 1} ({timing['type']}): {stages}")
+
+        (old, new) = lengths.values()
+        assert abs(old - new) <= 1, (old, new)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
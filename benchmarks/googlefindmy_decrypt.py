@@ -0,0 +1,117 @@
+"""Benchmark googlefindmy location report decryption.
+
+Decrypts 1000 synthetic reports for one tracker (90% crowdsourced reports
+spread over 48 hours of EID rotation windows, 10% own reports) with the
+previous path, one executor job per report with r and R = r·G recomputed
+for every report, and with the batch API, where the whole set is decrypted
+in one executor job using the per-window cache, first with an empty cache
+and then with a warm one (as on the next poll, which returns mostly the same
+windows).  Needs Home Assistant installed; run from the config directory with:
+
+    python -m benchmarks.googlefindmy_decrypt
+"""
+
+import asyncio
+import hashlib
+import random
+import secrets
+import time
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from ecdsa import SECP160r1
+from ecdsa.ellipticcurve import Point
+
+from custom_components.googlefindmy.FMDNCrypto import eid_generator
+from custom_components.googlefindmy.FMDNCrypto.foreign_tracker_cryptor import (
+    decrypt_aes_eax,
+    encrypt,
+    rx_to_ry,
+)
+from custom_components.googlefindmy.KeyBackup.cloud_key_decryptor import decrypt_aes_gcm
+from custom_components.googlefindmy.NovaApi.ExecuteAction.LocateTracker.decrypt_locations import (
+    async_decrypt_reports,
+)
+from custom_components.googlefindmy.ProtoDecoders import DeviceUpdate_pb2
+
+NUM_REPORTS = 1000
+OWN_REPORT_SHARE = 0.1
+HISTORY_S = 48 * 3600
+
+
+def make_reports(identity_key):
+    """Return (reports, plaintexts) for one tracker."""
+    rnd = random.Random(1)
+    now = 1_700_000_000
+    identity_key_hash = hashlib.sha256(identity_key).digest()
+    reports = []
+    plaintexts = []
+    for _ in range(NUM_REPORTS):
+        location = DeviceUpdate_pb2.Location(
+            latitude=int(rnd.uniform(51.9, 52.1) * 1e7),
+            longitude=int(rnd.uniform(4.2, 4.5) * 1e7),
+            altitude=rnd.randint(0, 30),
+        ).SerializeToString()
+        plaintexts.append(location)
+        if rnd.random() < OWN_REPORT_SHARE:
+            iv = secrets.token_bytes(12)
+            reports.append((iv + AESGCM(identity_key_hash).encrypt(iv, location, None), b"", 0))
+            continue
+        time_offset = now - rnd.randrange(HISTORY_S)
+        eid = eid_generator.generate_eid(identity_key, time_offset)
+        encrypted_and_tag, sx = encrypt(location, secrets.token_bytes(32), eid)
+        reports.append((encrypted_and_tag, sx, time_offset))
+    eid_generator.clear_window_cache()
+    return reports, plaintexts
+
+
+def decrypt_previous(identity_key, encrypted_and_tag, sx, beacon_time_counter):
+    """Decrypt one crowdsourced report the previous way: r and R every time, affine points."""
+    curve = SECP160r1
+    r = eid_generator._calculate_r(identity_key, beacon_time_counter)
+    R = r * curve.generator
+    sx_int = int.from_bytes(sx, byteorder="big")
+    S = Point(curve.curve, sx_int, rx_to_ry(sx_int, curve.curve))
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"")
+    k = hkdf.derive((r * S).x().to_bytes(20, "big"))
+    nonce = R.x().to_bytes(20, "big")[-8:] + S.x().to_bytes(20, "big")[-8:]
+    return decrypt_aes_eax(encrypted_and_tag[:-16], encrypted_and_tag[-16:], nonce, k)
+
+
+async def decrypt_per_report(identity_key, reports):
+    """Decrypt with one executor job per report, as before."""
+    out = []
+    for encrypted_location, public_key_random, time_offset in reports:
+        if public_key_random == b"":
+            identity_key_hash = hashlib.sha256(identity_key).digest()
+            out.append(await asyncio.to_thread(decrypt_aes_gcm, identity_key_hash, encrypted_location))
+        else:
+            out.append(
+                await asyncio.to_thread(
+                    decrypt_previous, identity_key, encrypted_location, public_key_random, time_offset
+                )
+            )
+    return out
+
+
+async def main():
+    """Run the benchmark with the previous path and the batch API."""
+    identity_key = secrets.token_bytes(32)
+    reports, plaintexts = make_reports(identity_key)
+    windows = len({time_offset >> eid_generator.K for _, pkr, time_offset in reports if pkr})
+    print(f"{NUM_REPORTS} reports, {windows} rotation windows")
+    for name, run in [
+        ("per-report jobs, no cache", lambda: decrypt_per_report(identity_key, reports)),
+        ("batch, cold window cache", lambda: async_decrypt_reports(identity_key, reports)),
+        ("batch, warm window cache", lambda: async_decrypt_reports(identity_key, reports)),
+    ]:
+        t_start = time.perf_counter()
+        decrypted = await run()
+        elapsed = time.perf_counter() - t_start
+        assert decrypted == plaintexts
+        print(f"{name}: {elapsed:.2f} s, {elapsed / NUM_REPORTS * 1000:.2f} ms per report")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+"""Benchmark googlefindmy best-fix selection in the protobuf decoder.
+
+Builds report batches shaped like the decrypted payloads of a crowdsourced
+response: 50 trackers with 40 reports each, where several finders report the
+same sighting within seconds (a few positions per tracker, slightly jittered)
+and about 10% are semantic-only reports.  Each batch is processed the previous
+way, per tracker (normalize, add rank keys and sort, merge the semantic
+label), and with one FixBatch for all trackers.  Needs Home Assistant
+installed; run from the config directory with:
+
+    python -m benchmarks.googlefindmy_fix_batch
+"""
+
+import math
+import random
+import time
+
+from custom_components.googlefindmy.fix_batch import FixBatch
+
+NUM_TRACKERS = 50
+REPORTS_PER_TRACKER = 40
+ROUNDS = 50
+NEAR_TS_TOLERANCE_S = 5.0
+
+
+def make_batches():
+    """Return {tracker: [report]}."""
+    rnd = random.Random(1)
+    t0 = 1_700_000_000
+    batches = {}
+    for tracker in range(NUM_TRACKERS):
+        sightings = [
+            (52.0 + rnd.uniform(-0.2, 0.2), 4.3 + rnd.uniform(-0.2, 0.2), t0 + rnd.randrange(3600))
+            for _ in range(rnd.randint(2, 5))
+        ]
+        reports = []
+        for _ in range(REPORTS_PER_TRACKER):
+            lat, lon, seen = rnd.choice(sightings)
+            seen += rnd.randrange(10)
+            if rnd.random() < 0.1:
+                reports.append(
+                    {
+                        "latitude": None,
+                        "longitude": None,
+                        "altitude": None,
+                        "accuracy": None,
+                        "last_seen": seen,
+                        "status": "0",
+                        "is_own_report": False,
+                        "semantic_name": rnd.choice(["Home", "Office"]),
+                    }
+                )
+                continue
+            reports.append(
+                {
+                    "latitude": lat + rnd.uniform(-0.00005, 0.00005),
+                    "longitude": lon + rnd.uniform(-0.00005, 0.00005),
+                    "altitude": rnd.randint(0, 30),
+                    "accuracy": rnd.randint(5, 150),
+                    "last_seen": seen,
+                    "status": "1",
+                    "is_own_report": rnd.random() < 0.1,
+                    "semantic_name": None,
+                    "_report_hint": "in_all_areas",
+                }
+            )
+        batches[f"dev_{tracker}"] = reports
+    return batches
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation (ProtoDecoders/decoder.py)
+# ---------------------------------------------------------------------------
+def _normalize_location_dict(loc):
+    out = dict(loc)
+    for num_key in ("latitude", "longitude", "accuracy", "last_seen", "altitude"):
+        val = out.get(num_key)
+        if val is None:
+            continue
+        try:
+            f = float(val)
+            if not math.isfinite(f):
+                out.pop(num_key, None)
+            else:
+                out[num_key] = f
+        except (TypeError, ValueError):
+            out.pop(num_key, None)
+    return out
+
+
+def _select_best_location(cands):
+    if not cands:
+        return None, []
+    normed_cands = [_normalize_location_dict(c or {}) for c in cands]
+    for n in normed_cands:
+        has_coords = isinstance(n.get("latitude"), (int, float)) and isinstance(
+            n.get("longitude"), (int, float)
+        )
+        n["_rank_has_coords"] = 1 if has_coords else 0
+        try:
+            n["_rank_seen"] = float(n.get("last_seen") or 0.0)
+        except (TypeError, ValueError):
+            n["_rank_seen"] = 0.0
+        try:
+            acc = float(n.get("accuracy")) if n.get("accuracy") is not None else float("inf")
+            n["_rank_acc"] = -acc
+        except (TypeError, ValueError):
+            n["_rank_acc"] = float("-inf")
+        n["_rank_is_own"] = 1 if bool(n.get("is_own_report")) else 0
+    normed_cands.sort(
+        key=lambda x: (x["_rank_has_coords"], x["_rank_seen"], x["_rank_acc"], x["_rank_is_own"]),
+        reverse=True,
+    )
+    best_candidate = normed_cands[0]
+    for k in ("_rank_has_coords", "_rank_seen", "_rank_acc", "_rank_is_own"):
+        best_candidate.pop(k, None)
+    return dict(best_candidate), normed_cands
+
+
+def _merge_semantics_if_near_ts(best, normed_cands, *, tolerance_s=NEAR_TS_TOLERANCE_S):
+    out = dict(best)
+    if out.get("semantic_name"):
+        return out
+    try:
+        t_best = float(out.get("last_seen") or 0.0)
+    except (TypeError, ValueError):
+        t_best = 0.0
+    best_label = None
+    min_delta = float("inf")
+    if t_best > 0:
+        for n in normed_cands:
+            label = n.get("semantic_name")
+            if not label:
+                continue
+            try:
+                t = float(n.get("last_seen") or 0.0)
+            except (TypeError, ValueError):
+                t = 0.0
+            if t <= 0:
+                continue
+            delta = abs(t - t_best)
+            if delta <= tolerance_s and delta < min_delta:
+                best_label = str(label)
+                min_delta = delta
+    if best_label:
+        out["semantic_name"] = best_label
+    return out
+
+
+def process_previous(batches):
+    """Return {tracker: best} the previous way."""
+    best_by_tracker = {}
+    for tracker, reports in batches.items():
+        best, normed = _select_best_location(reports)
+        best_by_tracker[tracker] = _merge_semantics_if_near_ts(best, normed)
+    return best_by_tracker
+
+
+def process_batched(batches):
+    """Return {tracker: best} with one batch."""
+    batch = FixBatch()
+    for tracker, reports in batches.items():
+        batch.extend(tracker, reports)
+    return batch.best(tolerance_s=NEAR_TS_TOLERANCE_S)
+
+
+def main():
+    """Run the benchmark with the previous per-tracker path and the batch."""
+    batches = make_batches()
+    reports = sum(len(r) for r in batches.values())
+    print(f"{NUM_TRACKERS} trackers, {reports} reports per batch")
+    results = {}
+    for name, run in [("per tracker (previous)", process_previous), ("one batch", process_batched)]:
+        t_start = time.perf_counter()
+        for _ in range(ROUNDS):
+            results[name] = run(batches)
+        elapsed = (time.perf_counter() - t_start) / ROUNDS
+        print(f"{name}: {elapsed * 1000:.2f} ms per batch, {elapsed / reports * 1e6:.2f} us per report")
+
+    old_best, new_best = results.values()
+    assert old_best == new_best
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Benchmark googlefindmy location history.
+
+Fills the history of 20 trackers with 2048 fixes each (one every 5 minutes,
+about 7 days), then times the three readers with the previous Recorder path
+and with the in-memory ring buffers: a map page for the default 7 day range,
+a 24 hour history lookup and a best-location pick over 24 hours.  The Recorder
+is stood in for by a SQLite file with the same layout as its states table
+(state, last_updated_ts and JSON attributes per row) and is queried in an
+executor the way the history helpers are, so the numbers include the database
+round-trip and attribute decoding but not the Recorder's own overhead.  Also
+prints the memory used by the buffers.  Needs Home Assistant installed; run
+from the config directory with:
+
+    python -m benchmarks.googlefindmy_location_history
+"""
+
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from homeassistant.core import State
+
+from custom_components.googlefindmy.location_recorder import (
+    LOCATION_HISTORY_SIZE,
+    LocationRecorder,
+)
+
+NUM_TRACKERS = 20
+FIX_INTERVAL_S = 300
+ROUNDS = 20
+
+
+def make_states(now):
+    """Return {entity_id: [State]} with LOCATION_HISTORY_SIZE fixes per tracker, oldest first."""
+    rnd = random.Random(1)
+    start = now - LOCATION_HISTORY_SIZE * FIX_INTERVAL_S
+    histories = {}
+    for tracker in range(NUM_TRACKERS):
+        entity_id = f"device_tracker.tracker_{tracker}"
+        states = []
+        for i in range(LOCATION_HISTORY_SIZE):
+            written = datetime.fromtimestamp(start + i * FIX_INTERVAL_S + tracker, tz=timezone.utc)
+            attrs = {
+                "source_type": "gps",
+                "latitude": 52.0 + rnd.uniform(-0.05, 0.05),
+                "longitude": 4.3 + rnd.uniform(-0.05, 0.05),
+                "gps_accuracy": rnd.randint(5, 200),
+                "altitude": rnd.randint(0, 30),
+                "is_own_report": rnd.random() < 0.3,
+                "semantic_location": None,
+                "last_seen": written.isoformat(),
+                "device_status": "online",
+                "friendly_name": f"Tracker {tracker}",
+            }
+            states.append(State(entity_id, "not_home", attrs, last_changed=written, last_updated=written))
+        histories[entity_id] = states
+    return histories
+
+
+class SqliteHistory:
+    """Stand-in for the Recorder: states rows with JSON attributes, read in an executor."""
+
+    def __init__(self, path, histories):
+        self._path = path
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE states (entity_id TEXT, state TEXT, last_updated_ts REAL, attributes TEXT)"
+        )
+        conn.execute("CREATE INDEX ix_states_entity_id_last_updated_ts ON states (entity_id, last_updated_ts)")
+        conn.executemany(
+            "INSERT INTO states VALUES (?, ?, ?, ?)",
+            [
+                (s.entity_id, s.state, s.last_updated.timestamp(), json.dumps(dict(s.attributes)))
+                for states in histories.values()
+                for s in states
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+    def _sync_significant_states(self, start_ts, end_ts, entity_id):
+        conn = sqlite3.connect(self._path)
+        try:
+            rows = conn.execute(
+                "SELECT state, last_updated_ts, attributes FROM states "
+                "WHERE entity_id = ? AND last_updated_ts >= ? AND last_updated_ts < ? "
+                "ORDER BY last_updated_ts",
+                (entity_id, start_ts, end_ts),
+            ).fetchall()
+        finally:
+            conn.close()
+        states = []
+        for state, ts, attributes in rows:
+            written = datetime.fromtimestamp(ts, tz=timezone.utc)
+            states.append(State(entity_id, state, json.loads(attributes), last_changed=written, last_updated=written))
+        return {entity_id: states} if states else {}
+
+    async def significant_states(self, start_ts, end_ts, entity_id):
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._sync_significant_states, start_ts, end_ts, entity_id
+        )
+
+
+async def map_points_recorder(db, entity_id, start_ts, end_ts):
+    """Map points as the previous map view built them from Recorder history."""
+    history = await db.significant_states(start_ts, end_ts, entity_id)
+    locations = []
+    last_seen = None
+    for state in history.get(entity_id, []):
+        lat_raw = state.attributes.get("latitude")
+        lon_raw = state.attributes.get("longitude")
+        if lat_raw is None or lon_raw is None:
+            continue
+        current_last_seen = state.attributes.get("last_seen")
+        if current_last_seen and current_last_seen == last_seen:
+            continue
+        last_seen = current_last_seen
+        locations.append(
+            {
+                "lat": float(lat_raw),
+                "lon": float(lon_raw),
+                "accuracy": max(0.0, float(state.attributes.get("gps_accuracy", 0))),
+                "timestamp": state.last_updated.isoformat(),
+                "last_seen": current_last_seen,
+                "entity_id": entity_id,
+                "state": state.state,
+                "is_own_report": state.attributes.get("is_own_report"),
+                "semantic_location": state.attributes.get("semantic_location"),
+            }
+        )
+    return locations
+
+
+async def history_recorder(db, entity_id, start_ts, end_ts):
+    """History dicts (newest first) as the previous get_location_history built them."""
+    history = await db.significant_states(start_ts, end_ts, entity_id)
+    locations = [
+        {
+            "timestamp": state.last_updated.timestamp(),
+            "latitude": state.attributes.get("latitude"),
+            "longitude": state.attributes.get("longitude"),
+            "accuracy": state.attributes.get("gps_accuracy"),
+            "is_own_report": state.attributes.get("is_own_report", False),
+            "altitude": state.attributes.get("altitude"),
+            "state": state.state,
+        }
+        for state in history.get(entity_id, [])
+    ]
+    locations.sort(key=lambda x: x["timestamp"], reverse=True)
+    return locations
+
+
+def map_points_memory(recorder, entity_id, start_ts, end_ts):
+    """Map points from the in-memory buffer (same shape as the map view builds)."""
+    from custom_components.googlefindmy.map_view import GoogleFindMyMapView
+
+    view = SimpleNamespace(hass=SimpleNamespace(data={"googlefindmy": {"e": SimpleNamespace(location_recorder=recorder)}}))
+    return GoogleFindMyMapView._locations_from_memory(
+        view,
+        entity_id,
+        datetime.fromtimestamp(start_ts, tz=timezone.utc),
+        datetime.fromtimestamp(end_ts, tz=timezone.utc),
+    )
+
+
+async def timed(label, func):
+    """Run func for every tracker ROUNDS times and print the time per call."""
+    t_start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for tracker in range(NUM_TRACKERS):
+            result = func(f"device_tracker.tracker_{tracker}")
+            if asyncio.iscoroutine(result):
+                result = await result
+    elapsed = time.perf_counter() - t_start
+    print(f"{label}: {elapsed / (ROUNDS * NUM_TRACKERS) * 1000:.2f} ms per call")
+    return result
+
+
+async def main():
+    """Run the benchmark with the Recorder stand-in and the ring buffers."""
+    now = time.time()
+    histories = make_states(now)
+    hass = SimpleNamespace()
+    # coverage starts in the past, as after seeding at startup
+    with patch("custom_components.googlefindmy.location_recorder.time.time", return_value=now - 8 * 24 * 3600):
+        recorder = LocationRecorder(hass)
+    for states in histories.values():
+        for state in states:
+            recorder.async_record_state(state)
+    stats = recorder.stats()
+    print(
+        f"{stats['entities']} trackers, {stats['fixes']} fixes, "
+        f"{stats['memory_bytes'] / 1024:.0f} KiB in the ring buffers"
+    )
+
+    week_start = now - 7 * 24 * 3600
+    day_start = now - 24 * 3600
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = SqliteHistory(os.path.join(tmp_dir, "home-assistant_v2.db"), histories)
+
+        old = await timed("map 7 days, Recorder", lambda e: map_points_recorder(db, e, week_start, now))
+        new = await timed("map 7 days, memory", lambda e: map_points_memory(recorder, e, week_start, now))
+        assert [p["lat"] for p in old] == [p["lat"] for p in new]
+
+        await timed("history 24 h, Recorder", lambda e: history_recorder(db, e, day_start, now))
+        await timed("history 24 h, memory", lambda e: recorder.get_location_history(e, hours=24))
+
+        async def best_recorder(entity_id):
+            return recorder.get_best_location(await history_recorder(db, entity_id, day_start, now))
+
+        old = await timed("best location 24 h, Recorder", best_recorder)
+        async def best_memory(entity_id):
+            return recorder.get_best_location(await recorder.get_location_history(entity_id, hours=24))
+
+        new = await timed("best location 24 h, memory", best_memory)
+        assert old["timestamp"] == new["timestamp"]
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,196 @@
+"""Benchmark kidschores overdue and badge evaluation.
+
+Builds a coordinator with 50 kids, 2000 chores and 200 badges, then times
+a periodic overdue check and a badge check after each points change, with
+the previous full scans (every chore against every assigned kid's claimed
+and approved lists, every badge for the kid) and with the due-date heap,
+per-check claimed/approved sets and threshold-sorted badge index.  Needs Home
+Assistant installed; run from the config directory with:
+
+    python -m benchmarks.kidschores_overdue_badges
+"""
+
+import asyncio
+from datetime import timedelta
+import random
+import time
+from types import SimpleNamespace
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.kidschores.const import (
+    BADGE_THRESHOLD_TYPE_CHORE_COUNT,
+    BADGE_THRESHOLD_TYPE_POINTS,
+    CHORE_STATE_OVERDUE,
+    DATA_BADGES,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
+)
+from custom_components.kidschores.coordinator import KidsChoresDataCoordinator
+
+NUM_KIDS = 50
+NUM_CHORES = 2000
+NUM_BADGES = 200
+NUM_CHECKS = 20
+NUM_POINT_CHANGES = 2000
+
+
+def make_data():
+    """Return a kidschores data tree; about 5% of the chores are past due."""
+    rnd = random.Random(1)
+    now = dt_util.utcnow()
+    kids = {
+        f"kid_{i}": {
+            "name": f"Kid {i}",
+            "points": 0.0,
+            "max_points_ever": 0.0,
+            "claimed_chores": [],
+            "approved_chores": [],
+            "overdue_chores": [],
+            "overdue_notifications": {},
+            "badges": [],
+            "completed_chores_total": 0,
+            "completed_chores_daily": 0,
+            "completed_chores_weekly": 0,
+            "points_multiplier": 1.0,
+        }
+        for i in range(NUM_KIDS)
+    }
+    chores = {}
+    for i in range(NUM_CHORES):
+        chore_id = f"chore_{i}"
+        assigned = rnd.sample(sorted(kids), rnd.randint(1, 4))
+        if rnd.random() < 0.05:
+            due = now - timedelta(minutes=rnd.randint(1, 600))
+        else:
+            due = now + timedelta(hours=rnd.randint(1, 24 * 14))
+        chores[chore_id] = {
+            "name": f"Chore {i}",
+            "assigned_kids": assigned,
+            "due_date": due.isoformat(),
+            "state": "pending",
+            "shared_chore": False,
+            "internal_id": chore_id,
+        }
+        for kid_id in assigned:
+            if rnd.random() < 0.3:
+                kids[kid_id]["claimed_chores"].append(chore_id)
+            elif rnd.random() < 0.3:
+                kids[kid_id]["approved_chores"].append(chore_id)
+    badges = {}
+    for i in range(NUM_BADGES):
+        if i % 2:
+            badge = {"threshold_type": BADGE_THRESHOLD_TYPE_POINTS, "threshold_value": 100 * (i + 1)}
+        else:
+            badge = {
+                "threshold_type": BADGE_THRESHOLD_TYPE_CHORE_COUNT,
+                "threshold_value": 5 * (i + 1),
+                "chore_count_type": "total",
+            }
+        badges[f"badge_{i}"] = {**badge, "name": f"Badge {i}", "earned_by": [], "points_multiplier": 1.0}
+    return {
+        DATA_KIDS: kids,
+        DATA_CHORES: chores,
+        DATA_BADGES: badges,
+        DATA_PENDING_CHORE_APPROVALS: [],
+        DATA_PENDING_REWARD_APPROVALS: [],
+    }
+
+
+def make_coordinator():
+    """Return a coordinator with notifications, persistence and listeners stubbed out."""
+    hass = SimpleNamespace(async_create_task=lambda coro: coro.close())
+    coordinator = KidsChoresDataCoordinator(hass, None, None)
+    coordinator._data = make_data()
+    coordinator._persist = lambda: None
+    coordinator.async_set_updated_data = lambda data: None
+    return coordinator
+
+
+async def check_overdue_scan(coordinator):
+    """Run the previous overdue check: every chore, list lookups, a due date parse each."""
+    now = dt_util.utcnow()
+    for chore_id, chore_info in coordinator.chores_data.items():
+        assigned_kids = chore_info.get("assigned_kids", [])
+        if all(
+            chore_id in coordinator.kids_data.get(kid_id, {}).get("claimed_chores", [])
+            or chore_id in coordinator.kids_data.get(kid_id, {}).get("approved_chores", [])
+            for kid_id in assigned_kids
+        ):
+            continue
+        for kid_id in assigned_kids:
+            kid_info = coordinator.kids_data.get(kid_id, {})
+            chore_id in kid_info.get("claimed_chores", [])
+            chore_id in kid_info.get("approved_chores", [])
+        due_date = dt_util.as_utc(dt_util.parse_datetime(chore_info["due_date"]))
+        if now < due_date:
+            continue
+        for kid_id in assigned_kids:
+            kid_info = coordinator.kids_data.get(kid_id, {})
+            if chore_id in kid_info.get("claimed_chores", []) or chore_id in kid_info.get(
+                "approved_chores", []
+            ):
+                continue
+            coordinator._process_chore_state(kid_id, chore_id, CHORE_STATE_OVERDUE)
+
+
+def check_badges_scan(coordinator, kid_id):
+    """Run the previous badge check: every badge for the kid."""
+    kid_info = coordinator.kids_data[kid_id]
+    for badge_id, badge_data in coordinator.badges_data.items():
+        if kid_id in badge_data.get("earned_by", []):
+            continue
+        threshold_val = badge_data.get("threshold_value", 0)
+        if badge_data["threshold_type"] == BADGE_THRESHOLD_TYPE_POINTS:
+            if kid_info["points"] >= threshold_val:
+                coordinator._award_badge(kid_id, badge_id)
+        elif kid_info.get("completed_chores_total", 0) >= threshold_val:
+            coordinator._award_badge(kid_id, badge_id)
+
+
+async def bench_overdue(check):
+    """Return the mean seconds per overdue check, after a first check marked the overdue chores."""
+    coordinator = make_coordinator()
+    await check(coordinator)
+    t_start = time.perf_counter()
+    for _ in range(NUM_CHECKS):
+        await check(coordinator)
+    return (time.perf_counter() - t_start) / NUM_CHECKS
+
+
+def bench_badges(check):
+    """Return the mean seconds per badge check, each after a small points and count change."""
+    coordinator = make_coordinator()
+    kid_ids = sorted(coordinator.kids_data)
+    t_start = time.perf_counter()
+    for seq in range(NUM_POINT_CHANGES):
+        kid_id = kid_ids[seq % NUM_KIDS]
+        kid_info = coordinator.kids_data[kid_id]
+        kid_info["points"] += 25
+        kid_info["completed_chores_total"] += 1
+        check(coordinator, kid_id)
+    elapsed = (time.perf_counter() - t_start) / NUM_POINT_CHANGES
+    earned = sum(len(kid_info["badges"]) for kid_info in coordinator.kids_data.values())
+    return elapsed, earned
+
+
+async def main():
+    """Run the overdue and badge benchmarks with the scans and with the indexes."""
+    for name, check in [
+        ("full scan", check_overdue_scan),
+        ("indexed", KidsChoresDataCoordinator._check_overdue_chores),
+    ]:
+        elapsed = await bench_overdue(check)
+        print(f"overdue check, {name}: {elapsed * 1000:.2f} ms")
+    for name, check in [
+        ("full scan", check_badges_scan),
+        ("indexed", KidsChoresDataCoordinator._check_badges_for_kid),
+    ]:
+        elapsed, earned = bench_badges(check)
+        print(f"badge check, {name}: {elapsed * 1e6:.1f} us ({earned} badges earned)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+"""Benchmark kidschores persistence.
+
+Applies 10,000 small mutations (points changes, chore claims and approvals) to
+a data tree with 25 kids and 500 chores, and reports the bytes written and the
+time spent saving with the previous full rewrite of the storage file after every
+change, with a journal flush after every change, and with changes coalesced
+into one journal flush per 50 mutations as the save window would.  Journal
+flushes only serialize the items marked changed; the last run compares every
+item instead, as unmarked saves do.  Compactions are included in the journaled
+numbers.  The storage file is written by a small stand-in for Home Assistant's
+Store (serialize, write a temp file, rename), so only the write path is
+compared.  Needs Home Assistant installed; run from the config directory with:
+
+    python -m benchmarks.kidschores_persistence
+"""
+
+import asyncio
+import os
+import random
+import tempfile
+import time
+from types import SimpleNamespace
+
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.kidschores import storage_manager
+from custom_components.kidschores.const import (
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
+)
+
+NUM_KIDS = 25
+NUM_CHORES = 500
+NUM_MUTATIONS = 10000
+MUTATIONS_PER_WINDOW = 50
+
+
+class FileStore:
+    """Write the storage file the way Store does, counting the bytes written."""
+
+    def __init__(self, hass, version, key):
+        self._path = hass.config.path(".storage", key)
+        self.bytes_written = 0
+
+    async def async_load(self):
+        return None
+
+    async def async_save(self, data):
+        body = json_bytes({"version": 1, "key": "kidschores_data", "data": data})
+        tmp_path = self._path + ".tmp"
+        with open(tmp_path, "wb") as file_desc:
+            file_desc.write(body)
+            file_desc.flush()
+            os.fsync(file_desc.fileno())
+        os.replace(tmp_path, self._path)
+        self.bytes_written += len(body)
+
+
+def make_data():
+    """Return a kidschores data tree with some chore and points history."""
+    rnd = random.Random(1)
+    kids = {
+        f"kid_{i}": {
+            "name": f"Kid {i}",
+            "points": 0.0,
+            "claimed_chores": [],
+            "approved_chores": [],
+            "badges": [],
+            "chore_streaks": {f"chore_{j}": {"current_streak": 3, "last_date": "2024-01-01"} for j in range(40)},
+            "points_history": {f"2024-01-{d:02d}": rnd.randint(0, 50) for d in range(1, 29)},
+        }
+        for i in range(NUM_KIDS)
+    }
+    chores = {
+        f"chore_{i}": {
+            "name": f"Chore {i}",
+            "description": "Clean up and put everything back where it belongs",
+            "assigned_kids": rnd.sample(sorted(kids), 2),
+            "due_date": "2024-02-01T18:00:00+00:00",
+            "state": "pending",
+            "default_points": 5,
+            "internal_id": f"chore_{i}",
+        }
+        for i in range(NUM_CHORES)
+    }
+    return {
+        DATA_KIDS: kids,
+        DATA_CHORES: chores,
+        DATA_PENDING_CHORE_APPROVALS: [],
+        DATA_PENDING_REWARD_APPROVALS: [],
+    }
+
+
+def mutate(data, rnd, seq):
+    """Apply one small change, like a single button press; return the items changed."""
+    kid_id = f"kid_{rnd.randrange(NUM_KIDS)}"
+    chore_id = f"chore_{rnd.randrange(NUM_CHORES)}"
+    kid_info = data[DATA_KIDS][kid_id]
+    choice = seq % 3
+    if choice == 0:
+        kid_info["points"] += 5
+        return [(DATA_KIDS, kid_id)]
+    if choice == 1:
+        kid_info["claimed_chores"].append(chore_id)
+        data[DATA_CHORES][chore_id]["state"] = "claimed"
+    else:
+        kid_info["approved_chores"].append(chore_id)
+        data[DATA_CHORES][chore_id]["state"] = "approved"
+    return [(DATA_KIDS, kid_id), (DATA_CHORES, chore_id)]
+
+
+async def make_manager(tmp_dir):
+    """Return an initialized storage manager writing to tmp_dir."""
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        config=SimpleNamespace(path=lambda *parts: os.path.join(tmp_dir, *parts)),
+        async_add_executor_job=lambda func, *args: loop.run_in_executor(None, func, *args),
+        bus=SimpleNamespace(async_listen_once=lambda *args: lambda: None),
+    )
+    os.makedirs(os.path.join(tmp_dir, ".storage"), exist_ok=True)
+    manager = storage_manager.KidsChoresStorageManager(hass, "kidschores_data")
+    await manager.async_initialize()
+    manager.set_data(make_data())
+    await manager.async_save()
+    manager._store.bytes_written = 0
+    return manager
+
+
+async def bench(mutations_per_save, journal, mark):
+    """Return the bytes written, total save seconds and number of saves."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = await make_manager(tmp_dir)
+        journal_bytes = 0
+        append_journal = manager._append_journal
+
+        def counted_append(chunk):
+            nonlocal journal_bytes
+            journal_bytes += len(chunk)
+            append_journal(chunk)
+
+        manager._append_journal = counted_append
+        rnd = random.Random(2)
+        save_time = 0.0
+        saves = 0
+        for seq in range(NUM_MUTATIONS):
+            changed = mutate(manager.data, rnd, seq)
+            manager.async_mark_changed(changed if mark else None)
+            if (seq + 1) % mutations_per_save:
+                continue
+            t_start = time.perf_counter()
+            if journal:
+                await manager.async_flush()
+            else:
+                await manager._store.async_save(manager.data)
+            save_time += time.perf_counter() - t_start
+            saves += 1
+        return manager._store.bytes_written + journal_bytes, save_time, saves
+
+
+async def main():
+    """Run the benchmark with full rewrites and with the journal."""
+    storage_manager.Store = FileStore
+    for name, mutations_per_save, journal, mark in [
+        ("full rewrite per change", 1, False, False),
+        ("journal per change", 1, True, True),
+        (f"journal per {MUTATIONS_PER_WINDOW} changes", MUTATIONS_PER_WINDOW, True, True),
+        (
+            f"journal per {MUTATIONS_PER_WINDOW} changes, every item compared",
+            MUTATIONS_PER_WINDOW,
+            True,
+            False,
+        ),
+    ]:
+        written, save_time, saves = await bench(mutations_per_save, journal, mark)
+        print(
+            f"{name}: {written / 1e6:.1f} MB written, {save_time:.2f} s saving, "
+            f"{save_time / saves * 1000:.2f} ms per save, "
+            f"{save_time / NUM_MUTATIONS * 1e6:.0f} us per change"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,193 @@
+"""Benchmark nordpool price queries over many sensors.
+
+Sets up a sensor for 15 minute prices for today and tomorrow (192 slots) in
+16 areas and two currencies, with VAT and a time-of-use additional costs
+template, and runs an automation pass over every sensor: the cheapest 3 hour
+window, the 8 cheapest slots, the percentile rank of the current price and
+the runs below the day's average.  Compares the way a template answers them
+from the sensor's raw_today and raw_tomorrow attributes (copying them and
+scanning or sorting per query) with the queries on the sensor's PriceIndex,
+including the time to build the indexes once per priced series.  Both must
+give the same answers.  Needs Home Assistant installed; run from the config
+directory with:
+
+    python -m benchmarks.nordpool_price_queries
+"""
+
+import asyncio
+import math
+import random
+import tempfile
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+from homeassistant.util import dt as dt_utils
+
+from custom_components.nordpool.sensor import NordpoolSensor
+
+AREAS = [
+    "DK1", "DK2", "FI", "EE", "LT", "LV", "NO1", "NO2",
+    "NO3", "NO4", "NO5", "SE1", "SE2", "SE3", "SE4", "NL",
+]
+CURRENCIES = ["EUR", "SEK"]
+SLOTS = 96
+PASSES = 200
+WINDOW = timedelta(hours=3)
+COUNT = 8
+AD_TEMPLATE = "{{ current_price * 0.25 + (0.05 if now().hour < 6 else 0.08) }}"
+
+
+class FakeApi:
+    """Hands out the same price data, as NordpoolData does between fetches."""
+
+    def __init__(self, hass, today, tomorrow):
+        self._hass = hass
+        self._today = today
+        self._tomorrow = tomorrow
+
+    async def today(self, area, currency):
+        return self._today
+
+    async def tomorrow(self, area, currency):
+        return self._tomorrow
+
+
+def make_day(start, rnd):
+    """Return api data for a day of 15 minute slots starting at start."""
+    values = []
+    for slot in range(SLOTS):
+        begin = start + timedelta(minutes=15 * slot)
+        values.append(
+            {
+                "start": begin,
+                "end": begin + timedelta(minutes=15),
+                # a daily curve with some noise
+                "value": round(
+                    90 + 60 * math.sin(2 * math.pi * (slot - 28) / SLOTS)
+                    + rnd.gauss(0, 8),
+                    2,
+                ),
+            }
+        )
+    return {"values": values}
+
+
+async def make_sensors(hass, midnight, now):
+    """Return a sensor with today's and tomorrow's prices per area and currency."""
+    rnd = random.Random(1)
+    sensors = []
+    for currency in CURRENCIES:
+        for area in AREAS:
+            api = FakeApi(
+                hass,
+                make_day(midnight, rnd),
+                make_day(midnight + timedelta(days=1), rnd),
+            )
+            sensor = NordpoolSensor(
+                "", area, "kWh", 3, 1.0, currency, True, False, api,
+                Template(AD_TEMPLATE, hass), hass,
+            )
+            # the state write prices both days for the attributes
+            sensor.async_write_ha_state = lambda sensor=sensor: sensor.extra_state_attributes
+            with patch.object(dt_utils, "now", return_value=now):
+                await sensor.handle_new_price()
+            sensors.append(sensor)
+    return sensors
+
+
+# ---------------------------------------------------------------------------
+# Previous way: what a template does with the today and tomorrow lists
+# ---------------------------------------------------------------------------
+def query_lists(sensor, now):
+    """Answer the queries from copies of the sensor's raw lists."""
+    slots = sensor.raw_today + sensor.raw_tomorrow
+    values = [slot["value"] for slot in slots]
+    width = WINDOW // timedelta(minutes=15)
+    sums = [sum(values[i : i + width]) for i in range(len(values) - width + 1)]
+    best = sums.index(min(sums))
+    # the rounded prices make ties likely, and which of two windows with the
+    # same average wins is up to float rounding, so only the average is compared
+    window = sums[best] / width
+
+    cheapest = sorted(range(len(values)), key=values.__getitem__)[:COUNT]
+
+    current = next(s["value"] for s in slots if s["start"] <= now < s["end"])
+    rank = 100.0 * sum(v < current for v in values) / len(values)
+
+    threshold = sum(values[:SLOTS]) / SLOTS
+    runs = []
+    run = None
+    for i, value in enumerate(values + [math.inf]):
+        if value < threshold and run is None:
+            run = i
+        elif value >= threshold and run is not None:
+            runs.append((slots[run]["start"], sum(values[run:i]) / (i - run)))
+            run = None
+
+    return window, [slots[i]["start"] for i in cheapest], rank, runs
+
+
+def query_index(sensor, now):
+    """Answer the queries from the sensor's PriceIndex."""
+    index = sensor.price_index()
+    window = index.cheapest_window(WINDOW)
+    cheapest = index.top_k(COUNT)
+    rank = index.percentile_rank(index.price_at(now))
+    threshold = sum(index.prices[:SLOTS]) / SLOTS
+    runs = index.threshold_runs(threshold)
+    return (
+        window["average"],
+        [slot["start"] for slot in cheapest],
+        rank,
+        [(run["start"], run["average"]) for run in runs],
+    )
+
+
+def same(old, new):
+    """Compare answers, averages up to float rounding."""
+    if isinstance(old, float):
+        return math.isclose(old, new, abs_tol=1e-9)
+    if isinstance(old, (list, tuple)):
+        return len(old) == len(new) and all(map(same, old, new))
+    return old == new
+
+
+async def main():
+    """Run the benchmark with the lists and the price index."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        dt_utils.set_default_time_zone(dt_utils.get_time_zone("Europe/Stockholm"))
+        midnight = dt_utils.as_utc(dt_utils.start_of_local_day())
+        now = dt_utils.as_local(midnight + timedelta(hours=14, minutes=20))
+        sensors = await make_sensors(hass, midnight, now)
+
+        t_start = time.perf_counter()
+        for sensor in sensors:
+            sensor.price_index()
+        build = time.perf_counter() - t_start
+
+        for sensor in sensors:
+            assert same(query_lists(sensor, now), query_index(sensor, now)), sensor.name
+
+        t_start = time.perf_counter()
+        for _ in range(PASSES):
+            for sensor in sensors:
+                query_lists(sensor, now)
+        lists = (time.perf_counter() - t_start) / PASSES
+
+        t_start = time.perf_counter()
+        for _ in range(PASSES):
+            for sensor in sensors:
+                query_index(sensor, now)
+        index = (time.perf_counter() - t_start) / PASSES
+
+    print(f"{len(sensors)} sensors (areas and currencies), 4 queries each")
+    print(f"lists (previous): {lists * 1000:.2f} ms per pass")
+    print(f"price index: {index * 1000:.2f} ms per pass, {build * 1000:.2f} ms to build")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,171 @@
+"""Benchmark nordpool sensor state writes.
+
+Feeds a sensor 15 minute prices (96 slots for today and for tomorrow) with
+an additional costs template and runs a day of updates: the new prices for
+tomorrow and 24 hourly updates, each writing the state with all attributes.
+Compares the previous sensor, which re-sorted the data and rendered the
+template for every slot of every attribute on each write, with the priced
+series that is computed once per data.  Prints the time and the number of
+template renders per state write.  Needs Home Assistant installed; run from
+the config directory with:
+
+    python -m benchmarks.nordpool_priced_series
+"""
+
+import asyncio
+import random
+import tempfile
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+from homeassistant.util import dt as dt_utils
+
+from custom_components.nordpool.misc import start_of
+from custom_components.nordpool.sensor import NordpoolSensor
+
+SLOTS = 96
+AD_TEMPLATE = "{{ current_price * 0.25 + (0.05 if now().hour < 6 else 0.08) }}"
+
+
+class FakeApi:
+    """Hands out the same price data, as NordpoolData does between fetches."""
+
+    def __init__(self, hass, today, tomorrow):
+        self._hass = hass
+        self._today = today
+        self._tomorrow = tomorrow
+
+    async def today(self, area, currency):
+        return self._today
+
+    async def tomorrow(self, area, currency):
+        return self._tomorrow
+
+
+def make_day(start, rnd):
+    """Return api data for a day of 15 minute slots starting at start (UTC)."""
+    values = []
+    for slot in range(SLOTS):
+        begin = start + timedelta(minutes=15 * slot)
+        values.append(
+            {
+                "start": begin,
+                "end": begin + timedelta(minutes=15),
+                "value": rnd.uniform(10, 250),
+            }
+        )
+    rnd.shuffle(values)
+    return {"values": values}
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation (sensor.py)
+# ---------------------------------------------------------------------------
+class PreviousNordpoolSensor(NordpoolSensor):
+    """The sensor as it rendered every slot for every attribute."""
+
+    @property
+    def additional_costs(self):
+        return self._additional_costs_value
+
+    @property
+    def current_price(self) -> float:
+        return self._calc_price()
+
+    @property
+    def today(self) -> list:
+        return [
+            self._calc_price(i["value"], fake_dt=i["start"])
+            for i in self._someday(self._data_today)
+            if i
+        ]
+
+    @property
+    def tomorrow(self) -> list:
+        return [
+            self._calc_price(i["value"], fake_dt=i["start"])
+            for i in self._someday(self._data_tomorrow)
+            if i
+        ]
+
+    def _add_raw(self, data) -> list:
+        return [
+            {
+                "start": res["start"],
+                "end": res["end"],
+                "value": self._calc_price(res["value"], fake_dt=res["start"]),
+            }
+            for res in self._someday(data)
+        ]
+
+    async def _update_current_price(self) -> None:
+        local_now = dt_utils.now()
+        data = await self._api.today(self._area, self._currency)
+        if data:
+            for item in self._someday(data):
+                if item["start"] == start_of(local_now, "hour"):
+                    self._current_price = item["value"]
+
+    def _reads_states(self) -> bool:
+        return False
+
+
+async def run_day(sensor_cls, hass, midnight):
+    """Run a day of updates, return (seconds, renders, writes, last attributes)."""
+    rnd = random.Random(1)
+    api = FakeApi(hass, make_day(midnight, rnd), None)
+    tomorrow = make_day(midnight + timedelta(days=1), rnd)
+    sensor = sensor_cls(
+        "", "SE3", "kWh", 3, 1.0, "SEK", True, False, api, Template(AD_TEMPLATE, hass), hass
+    )
+    renders = 0
+    render = Template.async_render
+
+    def counting_render(self, *args, **kwargs):
+        nonlocal renders
+        renders += 1
+        return render(self, *args, **kwargs)
+
+    writes = []
+    sensor.async_write_ha_state = lambda: writes.append(
+        (sensor._attr_native_value, sensor.extra_state_attributes)
+    )
+    t_start = time.perf_counter()
+    with patch.object(Template, "async_render", counting_render):
+        for hour in range(24):
+            now = dt_utils.as_local(midnight + timedelta(hours=hour, minutes=1))
+            with patch.object(dt_utils, "now", return_value=now):
+                if hour == 13:
+                    api._tomorrow = tomorrow
+                    await sensor.handle_new_price()
+                await sensor.handle_new_hr()
+    elapsed = time.perf_counter() - t_start
+    return elapsed, renders, len(writes), writes[-1]
+
+
+async def main():
+    """Run the benchmark with the previous and the cached sensor."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        dt_utils.set_default_time_zone(dt_utils.get_time_zone("Europe/Stockholm"))
+        midnight = dt_utils.as_utc(dt_utils.start_of_local_day())
+        results = {}
+        for name, sensor_cls in [
+            ("previous sensor", PreviousNordpoolSensor),
+            ("priced series", NordpoolSensor),
+        ]:
+            elapsed, renders, writes, last = await run_day(sensor_cls, hass, midnight)
+            results[name] = last
+            print(
+                f"{name}: {elapsed / writes * 1000:.2f} ms and "
+                f"{renders / writes:.0f} template renders per state write"
+            )
+        (old, new) = results.values()
+        assert old == new
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""Benchmark the pyscript AST interpreter against the compiled closure engine.
+
+Runs a loop-heavy and a call-heavy pyscript function with AstEval.compile_ast
+off and on, checks both engines return the same result, and prints the best
+time of several runs.  Needs Home Assistant installed; run from the config
+directory with:
+
+    python -m benchmarks.pyscript_compile
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from custom_components.pyscript.const import CONFIG_ENTRY, DOMAIN
+from custom_components.pyscript.eval import AstEval
+from custom_components.pyscript.function import Function
+from custom_components.pyscript.global_ctx import GlobalContext
+
+SOURCE = """
+def loop_heavy(n):
+    total = 0
+    i = 0
+    while i < n:
+        if i % 3 == 0 or i % 5 == 0:
+            total += i * 2 - 1
+        elif i > n // 2:
+            total -= 1
+        i += 1
+    for a, b in [(1, 2), (3, 4)] * 100:
+        total += a * b
+    return total
+
+def add(a, b=1):
+    return a + b
+
+def call_heavy(n):
+    total = 0
+    for i in range(n):
+        total = add(total, b=i & 7)
+    return total
+"""
+
+REPEAT = 5
+
+
+async def bench(func_name, arg, compile_ast):
+    """Return the result and best time of calling func_name(arg)."""
+    global_ctx = GlobalContext("file.bench", manager=None)
+    ast_ctx = AstEval("file.bench", global_ctx)
+    ast_ctx.compile_ast = compile_ast
+    ast_ctx.parse(SOURCE)
+    await ast_ctx.eval()
+    func = global_ctx.get_global_sym_table()[func_name]
+    best = None
+    for _ in range(REPEAT):
+        t_start = time.perf_counter()
+        result = await ast_ctx.call_func(func, func_name, arg)
+        elapsed = time.perf_counter() - t_start
+        best = elapsed if best is None else min(best, elapsed)
+    if ast_ctx.get_exception_obj():
+        raise ast_ctx.get_exception_obj()
+    return result, best
+
+
+async def main():
+    """Run both benchmarks on both engines."""
+    # AstEval and GlobalContext only need hass.data to find the config entry
+    Function.hass = SimpleNamespace(data={DOMAIN: {CONFIG_ENTRY: SimpleNamespace(data={})}})
+    for func_name, arg in [("loop_heavy", 20000), ("call_heavy", 5000)]:
+        result_interp, t_interp = await bench(func_name, arg, False)
+        result_comp, t_comp = await bench(func_name, arg, True)
+        assert result_interp == result_comp, f"{func_name}: {result_interp} != {result_comp}"
+        print(
+            f"{func_name}({arg}): interpreted {t_interp * 1000:.1f} ms, "
+            f"compiled {t_comp * 1000:.1f} ms, speedup {t_interp / t_comp:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
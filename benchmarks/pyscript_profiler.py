@@ -0,0 +1,87 @@
+"""Benchmark the overhead of the pyscript profiler.
+
+Runs a call-heavy pyscript function (recursive fib plus a loop) with the
+profiler stopped, started without line counts and started with line counts,
+on the interpreter and with compile_ast, and reports the time per run and the
+profiler's relative overhead.  This is close to a worst case, since almost
+every statement is a call or a one-line loop body.  Needs Home Assistant
+installed; run from the config directory with:
+
+    python -m benchmarks.pyscript_profiler
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from custom_components.pyscript.const import CONFIG_ENTRY, DOMAIN
+from custom_components.pyscript.eval import AstEval
+from custom_components.pyscript.function import Function
+from custom_components.pyscript.global_ctx import GlobalContext, GlobalContextMgr
+from custom_components.pyscript.profiler import Profiler
+
+REPEAT = 50
+
+SOURCE = """
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+def work():
+    total = 0
+    for i in range(500):
+        total += i % 7
+    return total + fib(12)
+"""
+
+
+async def bench(compile_ast, profile, lines=False):
+    """Return the mean seconds per call of work()."""
+    global_ctx = GlobalContext("file.bench", manager=GlobalContextMgr)
+    _, error_ctx = await GlobalContextMgr.load_file(global_ctx, "bench.py", source=SOURCE, reload=True)
+    if error_ctx:
+        raise RuntimeError(error_ctx.get_exception_long())
+    ast_ctx = AstEval("file.bench", global_ctx)
+    ast_ctx.compile_ast = compile_ast
+    Function.install_ast_funcs(ast_ctx)
+    ast_ctx.parse("work()")
+    await ast_ctx.eval()
+    if profile:
+        Profiler.start(lines=lines)
+    t_start = time.perf_counter()
+    for _ in range(REPEAT):
+        await ast_ctx.eval()
+    elapsed = (time.perf_counter() - t_start) / REPEAT
+    Profiler.stop()
+    GlobalContextMgr.delete("file.bench")
+    return elapsed
+
+
+async def main():
+    """Run the benchmark with the profiler stopped and started."""
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        loop=loop,
+        data={DOMAIN: {CONFIG_ENTRY: SimpleNamespace(data={})}},
+        bus=SimpleNamespace(async_fire=lambda *args, **kwargs: None),
+        states=SimpleNamespace(get=lambda var_name: None),
+        async_add_executor_job=lambda func, *args: loop.run_in_executor(None, func, *args),
+    )
+    Function.init(hass)
+    for compile_ast in (False, True):
+        engine = "compiled" if compile_ast else "interpreted"
+        base = await bench(compile_ast, False)
+        funcs = await bench(compile_ast, True)
+        lines = await bench(compile_ast, True, lines=True)
+        print(
+            f"{engine}: profiler off {base * 1000:.2f} ms/call, "
+            f"on {funcs * 1000:.2f} ms/call (+{(funcs / base - 1) * 100:.0f}%), "
+            f"on with lines {lines * 1000:.2f} ms/call (+{(lines / base - 1) * 100:.0f}%)"
+        )
+    await Function.waiter_stop()
+    await Function.reaper_stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
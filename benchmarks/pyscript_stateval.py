@@ -0,0 +1,128 @@
+"""Benchmark memory and allocations of pyscript's state_changed handling.
+
+Replays a synthetic stream of state_changed events, for many entities with
+large attribute maps of which only a few are watched by a trigger, through
+the old handler (which copied every attribute dict into two eager StateVal
+objects) and the current one (which skips unwatched entities and builds
+lazy StateVal objects).  Reports time and the memory each event
+transiently allocates.  Needs Home Assistant installed; run from the config
+directory with:
+
+    python -m benchmarks.pyscript_stateval
+"""
+
+import asyncio
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from custom_components.pyscript.state import State, StateVal
+
+NUM_ENTITIES = 500
+NUM_WATCHED = 10
+NUM_ATTRS = 200
+NUM_EVENTS = 20000
+
+
+class EagerStateVal(str):
+    """The previous StateVal, which copied all the attributes up front."""
+
+    def __new__(cls, state):
+        """Create a new instance given a state variable."""
+        new_var = super().__new__(cls, state.state)
+        new_var.__dict__ = state.attributes.copy()
+        new_var.entity_id = state.entity_id
+        new_var.last_updated = state.last_updated
+        new_var.last_changed = state.last_changed
+        new_var.last_reported = state.last_reported
+        return new_var
+
+
+def make_state(entity_id, seq):
+    """Return a fake HA state with a large attribute map."""
+    attributes = {f"attr_{i}": i for i in range(NUM_ATTRS)}
+    attributes["seq"] = seq
+    return SimpleNamespace(
+        state=str(seq % 7),
+        attributes=attributes,
+        entity_id=entity_id,
+        last_updated=seq,
+        last_changed=seq,
+        last_reported=seq,
+    )
+
+
+def make_events():
+    """Return a list of synthetic state_changed event data dicts."""
+    entities = [f"media_player.player_{i}" for i in range(NUM_ENTITIES)]
+    states = {entity_id: make_state(entity_id, 0) for entity_id in entities}
+    events = []
+    for seq in range(1, NUM_EVENTS + 1):
+        entity_id = entities[seq % NUM_ENTITIES]
+        new_state = make_state(entity_id, seq)
+        events.append({"entity_id": entity_id, "old_state": states[entity_id], "new_state": new_state})
+        states[entity_id] = new_state
+    return entities, events
+
+
+async def handle_eager(event):
+    """Handle an event the way the previous state_changed handler did."""
+    var_name = event["entity_id"]
+    new_val = EagerStateVal(event["new_state"])
+    old_val = EagerStateVal(event["old_state"])
+    new_vars = {var_name: new_val, f"{var_name}.old": old_val}
+    func_args = {"trigger_type": "state", "var_name": var_name, "value": new_val, "old_value": old_val}
+    await State.update(new_vars, func_args)
+
+
+async def handle_lazy(event):
+    """Handle an event the way the current state_changed handler does."""
+    var_name = event["entity_id"]
+    if var_name not in State.notify:
+        return
+    new_val = StateVal(event["new_state"])
+    old_val = StateVal(event["old_state"])
+    new_vars = {var_name: new_val, f"{var_name}.old": old_val}
+    func_args = {"trigger_type": "state", "var_name": var_name, "value": new_val, "old_value": old_val}
+    await State.update(new_vars, func_args)
+
+
+async def replay(handler, events, queues):
+    """Replay events through handler, draining the trigger queues; return time, mean and total bytes."""
+    total = 0
+    tracemalloc.start()
+    t_start = time.perf_counter()
+    for event in events:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        await handler(event)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - before
+        for queue in queues:
+            while not queue.empty():
+                queue.get_nowait()
+    elapsed = time.perf_counter() - t_start
+    tracemalloc.stop()
+    return elapsed, total / len(events), total
+
+
+async def main():
+    """Replay the event stream through both handlers."""
+    State.hass = SimpleNamespace(states=SimpleNamespace(get=lambda var_name: None))
+    entities, events = make_events()
+    queues = []
+    for entity_id in entities[:NUM_WATCHED]:
+        queue = asyncio.Queue()
+        await State.notify_add({entity_id, f"{entity_id}.seq"}, queue)
+        queues.append(queue)
+
+    for name, handler in [("eager", handle_eager), ("lazy", handle_lazy)]:
+        elapsed, mean, total = await replay(handler, events, queues)
+        print(
+            f"{name}: {len(events)} events in {elapsed * 1000:.1f} ms, "
+            f"{mean / 1024:.1f} KiB per event, {total / 1024 / 1024:.1f} MiB in total"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
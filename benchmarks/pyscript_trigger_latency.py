@@ -0,0 +1,107 @@
+"""Benchmark pyscript trigger-to-action latency.
+
+Sends state changes to a @state_trigger function and measures the time until
+the action starts running, with a new action context per call (pool size 0),
+with pooled action contexts, and with pooled contexts plus
+running_event=False.  hass is a minimal stand-in, so the cost of firing the
+pyscript_running event only covers building it, not bus listeners.  Needs
+Home Assistant installed; run from the config directory with:
+
+    python -m benchmarks.pyscript_trigger_latency
+"""
+
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+
+from custom_components.pyscript import trigger
+from custom_components.pyscript.const import CONFIG_ENTRY, DOMAIN
+from custom_components.pyscript.function import Function
+from custom_components.pyscript.global_ctx import GlobalContext, GlobalContextMgr
+from custom_components.pyscript.state import State, StateVal
+
+NUM_EVENTS = 5000
+
+SOURCE = """
+@state_trigger("sensor.power"{kwargs})
+def on_power(value=None):
+    record(value)
+"""
+
+
+def fake_state(value):
+    """Return a fake HA state for sensor.power."""
+    return SimpleNamespace(
+        state=str(value),
+        attributes={"unit_of_measurement": "W"},
+        entity_id="sensor.power",
+        last_updated=None,
+        last_changed=None,
+        last_reported=None,
+    )
+
+
+async def bench(name, kwargs, pool_size):
+    """Return trigger-to-action latencies in seconds."""
+    trigger.ACTION_CTX_POOL_SIZE = pool_size
+    called = asyncio.Event()
+    latencies = []
+    t_sent = 0
+
+    def record(value):
+        latencies.append(time.perf_counter() - t_sent)
+        called.set()
+
+    global_ctx = GlobalContext(f"file.{name}", global_sym_table={"record": record}, manager=GlobalContextMgr)
+    global_ctx.set_auto_start(True)
+    _, error_ctx = await GlobalContextMgr.load_file(global_ctx, name, source=SOURCE.format(kwargs=kwargs))
+    if error_ctx:
+        raise RuntimeError(error_ctx.get_exception_long())
+    await asyncio.sleep(0.1)
+
+    old_val = StateVal(fake_state(0))
+    for seq in range(1, NUM_EVENTS + 1):
+        new_val = StateVal(fake_state(seq))
+        called.clear()
+        t_sent = time.perf_counter()
+        await State.update(
+            {"sensor.power": new_val, "sensor.power.old": old_val},
+            {"trigger_type": "state", "var_name": "sensor.power", "value": new_val, "old_value": old_val},
+        )
+        await called.wait()
+        old_val = new_val
+    GlobalContextMgr.delete(global_ctx.get_name())
+    return latencies
+
+
+async def main():
+    """Run the benchmark for each configuration."""
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        loop=loop,
+        data={DOMAIN: {CONFIG_ENTRY: SimpleNamespace(data={})}},
+        bus=SimpleNamespace(async_fire=lambda *args, **kwargs: None),
+        states=SimpleNamespace(get=lambda var_name: None),
+        async_add_executor_job=lambda func, *args: loop.run_in_executor(None, func, *args),
+    )
+    Function.init(hass)
+    State.hass = hass
+    for name, kwargs, pool_size in [
+        ("fresh", "", 0),
+        ("pooled", "", trigger.ACTION_CTX_POOL_SIZE),
+        ("pooled_no_event", ", running_event=False", trigger.ACTION_CTX_POOL_SIZE),
+    ]:
+        latencies = await bench(name, kwargs, pool_size)
+        latencies.sort()
+        print(
+            f"{name}: mean {statistics.mean(latencies) * 1e6:.0f} us, "
+            f"p50 {latencies[len(latencies) // 2] * 1e6:.0f} us, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.0f} us"
+        )
+    await Function.waiter_stop()
+    await Function.reaper_stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
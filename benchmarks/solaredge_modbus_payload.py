@@ -0,0 +1,62 @@
+"""Benchmark solaredge_modbus payload decoding.
+
+Decodes the 103 registers of a meter block 100,000 times, field by field with
+BinaryPayloadDecoder.fromRegisters as the meter reader used to (53 decode
+calls, 32 of them 32 bit values that go through _unpack_words), and with
+BinaryPayloadBlockDecoder and one precompiled layout for the whole block.
+Both must return the same values.  Needs Home Assistant installed; run from
+the config directory with:
+
+    python -m benchmarks.solaredge_modbus_payload
+"""
+
+import random
+import time
+
+from custom_components.solaredge_modbus.payload import (
+    BinaryPayloadBlockDecoder,
+    BinaryPayloadDecoder,
+    Endian,
+)
+
+ROUNDS = 100_000
+
+# 4 currents + sf, 8 voltages + sf, frequency + sf, 4 x (4 values + sf),
+# 8 energy counters + sf, 8 VAh counters + sf, 16 varh counters + sf
+METER_LAYOUT = "5h9h2h5h5h5h5h" + "8Ih8Ih16Ih"
+
+
+def decode_previous(registers):
+    """Decode the meter block field by field."""
+    decoder = BinaryPayloadDecoder.fromRegisters(registers, byteorder=Endian.BIG)
+    values = [decoder.decode_16bit_int() for _ in range(36)]
+    for count in (8, 8, 16):
+        values.extend(decoder.decode_32bit_uint() for _ in range(count))
+        values.append(decoder.decode_16bit_int())
+    return tuple(values)
+
+
+def decode_block(registers, layout=BinaryPayloadBlockDecoder.layout(METER_LAYOUT)):
+    """Decode the meter block with one layout."""
+    return BinaryPayloadBlockDecoder(registers).decode_layout(layout)
+
+
+def main():
+    """Run the benchmark with both decoders."""
+    rnd = random.Random(1)
+    registers = [rnd.randrange(65536) for _ in range(103)]
+    assert decode_previous(registers) == decode_block(registers)
+
+    for name, decode in [
+        ("BinaryPayloadDecoder (previous)", decode_previous),
+        ("BinaryPayloadBlockDecoder", decode_block),
+    ]:
+        t_start = time.perf_counter()
+        for _ in range(ROUNDS):
+            decode(registers)
+        elapsed = time.perf_counter() - t_start
+        print(f"{name}: {elapsed:.2f} s, {elapsed / ROUNDS * 1e6:.2f} us per block")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """The Chime TTS integration."""
 
+import asyncio
 import logging
 import time
 from datetime import datetime
@@ -15,6 +16,7 @@ from homeassistant.components.media_player.const import (
     MediaType as MEDIA_TYPE,
 )
 
+from .helpers.audio_cache import AudioCache
 from .helpers.helpers import ChimeTTSHelper
 from .helpers.media_player_helper import (MediaPlayerHelper, ChimeTTSMediaPlayer)
 from .helpers.filesystem import FilesystemHelper
@@ -35,6 +37,7 @@ from homeassistant.exceptions import (
 
 from .const import (
     DOMAIN,
+    SERVICE_AUDIO_CACHE,
     SERVICE_CLEAR_CACHE,
     SERVICE_REPLAY,
     SERVICE_SAY,
@@ -81,6 +84,7 @@ from .const import (
     FALLBACK_TTS_PLATFORM_KEY,
     OFFSET_KEY,
     CROSSFADE_KEY,
+    MAX_CONCURRENT_SEGMENTS,
 )
 from .config import SONOS_SNAPSHOT_ENABLED
 
@@ -93,6 +97,7 @@ media_player_helper = MediaPlayerHelper()
 filesystem_helper = FilesystemHelper()
 queue = ChimeTTSQueueManager()
 services_helper = ChimeTTSServicesHelper()
+audio_cache = AudioCache()
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -247,6 +252,10 @@ async def async_setup(hass: HomeAssistant, _config_entry: ConfigEntry) -> bool:
                                                  clear_temp_tts_cache,
                                                  clear_www_tts_cache)
 
+        # CLEAR DECODED AUDIO CACHE #
+        if clear_chimes_cache or clear_temp_tts_cache:
+            audio_cache.clear()
+
         # CLEAR HA TTS CACHE #
         if clear_ha_tts_cache:
             _LOGGER.debug("Clearing cached Home Assistant TTS audio files...")
@@ -272,6 +281,22 @@ async def async_setup(hass: HomeAssistant, _config_entry: ConfigEntry) -> bool:
                                  SERVICE_CLEAR_CACHE,
                                  async_clear_cache)
 
+    # Audio Cache Service #
+
+    async def async_audio_cache(service) -> ServiceResponse:
+        """Return the contents of the decoded audio cache, and clear it (optional)."""
+        helpers.debug_title("Chime TTS Audio Cache Called")
+        stats = audio_cache.get_stats()
+        if bool(service.data.get("clear", False)):
+            audio_cache.clear()
+            _LOGGER.debug("Decoded audio cache cleared")
+        return stats
+
+    hass.services.async_register(DOMAIN,
+                                 SERVICE_AUDIO_CACHE,
+                                 async_audio_cache,
+                                 supports_response=SupportsResponse.OPTIONAL)
+
     return True
 
 async def async_prepare_media(hass: HomeAssistant, params, options, media_players_array: list[ChimeTTSMediaPlayer], is_say_url, start_time):
@@ -793,150 +818,207 @@ def get_segment_offset(output_audio, segment, params):
 
 
 async def async_process_segments(hass, message, output_audio=None, params={}, options={}):
-    """Process all message segments and add the audio."""
+    """Process all message segments and add the audio.
+
+    The audio of all segments is fetched and converted concurrently, then
+    combined in order.
+    """
     segments = helpers.parse_message(message)
     if segments is None or len(segments) == 0:
         return output_audio
 
+    # Segments from one without a type onwards are left out
     for index, segment in enumerate(segments):
-        segment_cache: bool = segment.get("cache", params.get("cache", False))
-        segment_audio_conversion: str = helpers.parse_ffmpeg_args(segment.get("audio_conversion", ""))
-        segment_offset: int = get_segment_offset(output_audio, segment, params)
-        segment_crossfade: int = segment.get("crossfade", params.get("crossfade", 0))
-        segment_type =  segment.get("type", None)
-        if not segment_type:
+        if not segment.get("type", None):
             _LOGGER.warning("Segment #%s has no type.", str(index+1))
-            return output_audio
-
-        # Chime tag
-        if segment_type == "chime":
-            if len(segment.get("path", "")) > 0:
-                output_audio = await async_get_audio_from_path(hass=hass,
-                                                               filepath=segment["path"],
-                                                               cache=segment_cache,
-                                                               offset=segment_offset,
-                                                               crossfade=segment_crossfade,
-                                                               audio_conversion=segment_audio_conversion,
-                                                               audio=output_audio)
-            else:
-                _LOGGER.warning("Chime path missing from messsage segment #%s", str(index+1))
-                continue
-
-        # Delay tag
-        if segment_type == "delay":
-            if segment.get("length", None):
-                segment_delay_length = float(segment["length"])
-                delay_audio = AudioSegment.silent(duration=segment_delay_length)
-                if output_audio:
-                    output_audio = output_audio + delay_audio
-                else:
-                    output_audio = delay_audio
-            else:
-                _LOGGER.warning("Delay length missing from messsage segment #%s", str(index+1))
-                continue
-
-        # Request TTS audio file
-        if segment_type == "tts":
-            if len(segment.get("message", "")) > 0:
-                # Use exposed parameters if not present in the options dictionary
-                segment_options = helpers.convert_yaml_str(segment.get("options")) or {}
-                exposed_option_keys = ["tld", "voice"]
-                for exposed_option_key in exposed_option_keys:
-                    value = (segment_options.get(exposed_option_key, None) or
-                             segment.get(exposed_option_key, None))
-                    if value is not None:
-                        segment_options[exposed_option_key] = value
-
-                # Extract parameters
-                segment_message = segment["message"]
-                segment_tts_platform = segment.get("tts_platform", params.get("tts_platform", None))
-                segment_language = segment.get("language", segment_options.get("language", params.get("language", None)))
-                segment_tts_speed = float(segment.get("tts_speed", params.get("tts_speed", 100)))
-                segment_tts_pitch = float(segment.get("tts_pitch", params.get("tts_pitch", 0)))
-
-                # Generate hash
-                for key, value in options.items():
-                    if key not in segment_options:
-                        segment_options[key] = value
-                segment_params = {
-                    "message": segment_message,
-                    "tts_platform": segment_tts_platform,
-                    "language": segment_language,
-                    "cache": segment_cache,
-                    "tts_speed": segment_tts_speed,
-                    "tts_pitch": segment_tts_pitch
-                }
-                segment_filepath_hash = get_filename_hash_from_service_data({**segment_params}, {**segment_options})
-
-                tts_audio: AudioSegment = None
-
-                # Use cached TTS audio
-                if segment_cache is True:
-                    _LOGGER.debug(" - Attempting to retrieve TTS audio from cache...")
-                    audio_dict = await async_get_cached_audio_data(hass, segment_filepath_hash)
-                    if audio_dict and audio_dict.get(LOCAL_PATH_KEY, None):
-                        tts_audio = await async_get_audio_from_path(hass=hass,
-                                                                    filepath=audio_dict.get(LOCAL_PATH_KEY, None),
-                                                                    cache=segment_cache,
-                                                                    audio=None)
-
-                        tts_audio_duration = audio_dict.get(AUDIO_DURATION_KEY, None)
-                    else:
-                        _LOGGER.debug("   ...no cached TTS audio found")
-
-
-                # Generate new TTS audio
-                if tts_audio is None:
-                    tts_audio = await tts_audio_helper.async_request_tts_audio(
-                        hass=hass,
-                        tts_platform=segment_tts_platform,
-                        message=segment_message,
-                        language=segment_language,
-                        cache=segment_cache,
-                        options=segment_options
-                    )
-
-                    # Cache the new TTS audio?
-                    if tts_audio is not None:
-                        tts_audio_duration = float(len(tts_audio) / 1000.0)
-                        if segment_cache is True and audio_dict is None:
-                            _LOGGER.debug(" - Saving generated TTS audio to cache...")
-                            tts_audio_full_path = await filesystem_helper.async_save_audio_to_folder(
-                                hass,
-                                tts_audio,
-                                _data.get(TEMP_PATH_KEY, None))
-                            if tts_audio_full_path is not None:
-                                audio_dict = {
-                                    LOCAL_PATH_KEY: tts_audio_full_path,
-                                    AUDIO_DURATION_KEY: tts_audio_duration
-                                }
-                                await async_store_data(hass, segment_filepath_hash, audio_dict)
-                                _LOGGER.debug("  ...TTS audio saved to cache")
-                            else:
-                                _LOGGER.warning("Unable to save generated TTS audio to cache")
-
-                # TTS Audio manipulations
-                if tts_audio is not None:
-                    temp_folder: str = _data.get(TEMP_PATH_KEY, None)
-                    tts_audio = await helpers.async_change_speed_of_audiosegment(hass, tts_audio, segment_tts_speed, temp_folder)
-                    tts_audio = await helpers.async_change_pitch_of_audiosegment(hass, tts_audio, segment_tts_pitch, temp_folder)
-                    tts_audio = await helpers.async_ffmpeg_convert_from_audio_segment(hass, tts_audio, segment_audio_conversion, temp_folder)
-
-                # Combine audio
-                if tts_audio is not None:
-                    output_audio = helpers.combine_audio(output_audio,
-                                                         tts_audio,
-                                                         segment_offset,
-                                                         segment_crossfade)
-                else:
-                    _LOGGER.warning("Error generating TTS audio from messsage segment #%s: %s",
-                                    str(index+1), str(segment))
-            else:
-                _LOGGER.warning("TTS 'message' value missing from messsage segment #%s: %s",
-                                str(index+1), str(segment))
+            segments = segments[:index]
+            break
+
+    start_time = time.monotonic()
+    timings = [{"type": segment["type"]} for segment in segments]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEGMENTS)
+
+    async def async_render(index, segment):
+        async with semaphore:
+            return await async_render_segment(hass, index, segment, params, options, timings[index])
+
+    rendered = await asyncio.gather(*[async_render(index, segment)
+                                      for index, segment in enumerate(segments)])
+    render_time = time.monotonic() - start_time
+
+    for segment, segment_audio, timing in zip(segments, rendered, timings):
+        if segment_audio is None:
+            continue
+        stage_start = time.monotonic()
+        if segment["type"] == "delay":
+            output_audio = output_audio + segment_audio if output_audio else segment_audio
+        else:
+            output_audio = helpers.combine_audio(output_audio,
+                                                 segment_audio,
+                                                 get_segment_offset(output_audio, segment, params),
+                                                 segment.get("crossfade", params.get("crossfade", 0)))
+        timing["combine"] = time.monotonic() - stage_start
+
+    _LOGGER.debug(" - %s message segment%s rendered in %sms and combined in %sms",
+                  str(len(segments)),
+                  "" if len(segments) == 1 else "s",
+                  str(round(render_time * 1000)),
+                  str(round((time.monotonic() - start_time - render_time) * 1000)))
+    for index, timing in enumerate(timings):
+        _LOGGER.debug("   * Segment #%s (%s): %s",
+                      str(index+1),
+                      timing["type"],
+                      ", ".join(f"{stage} {round(seconds * 1000)}ms"
+                                for stage, seconds in timing.items() if stage != "type"))
+    _data["segment_timings"] = timings
 
     return output_audio
 
+async def async_render_segment(hass, index, segment, params, options, timing):
+    """Fetch and convert the audio of a message segment, without combining it.
+
+    The time taken by each stage is added to timing.
+    """
+    segment_cache: bool = segment.get("cache", params.get("cache", False))
+    segment_audio_conversion: str = helpers.parse_ffmpeg_args(segment.get("audio_conversion", ""))
+    segment_type = segment["type"]
+    stage_start = time.monotonic()
+
+    def stage(name):
+        nonlocal stage_start
+        now = time.monotonic()
+        timing[name] = now - stage_start
+        stage_start = now
+
+    # Chime tag
+    if segment_type == "chime":
+        if len(segment.get("path", "")) > 0:
+            chime_audio = await async_load_audio_from_path(hass=hass,
+                                                           filepath=segment["path"],
+                                                           cache=segment_cache,
+                                                           audio_conversion=segment_audio_conversion)
+            stage("chime")
+            return chime_audio
+        _LOGGER.warning("Chime path missing from messsage segment #%s", str(index+1))
+        return None
+
+    # Delay tag
+    if segment_type == "delay":
+        if segment.get("length", None):
+            return AudioSegment.silent(duration=float(segment["length"]))
+        _LOGGER.warning("Delay length missing from messsage segment #%s", str(index+1))
+        return None
+
+    # Request TTS audio file
+    if segment_type != "tts":
+        return None
+    if len(segment.get("message", "")) == 0:
+        _LOGGER.warning("TTS 'message' value missing from messsage segment #%s: %s",
+                        str(index+1), str(segment))
+        return None
+
+    # Use exposed parameters if not present in the options dictionary
+    segment_options = helpers.convert_yaml_str(segment.get("options")) or {}
+    exposed_option_keys = ["tld", "voice"]
+    for exposed_option_key in exposed_option_keys:
+        value = (segment_options.get(exposed_option_key, None) or
+                 segment.get(exposed_option_key, None))
+        if value is not None:
+            segment_options[exposed_option_key] = value
+
+    # Extract parameters
+    segment_message = segment["message"]
+    segment_tts_platform = segment.get("tts_platform", params.get("tts_platform", None))
+    segment_language = segment.get("language", segment_options.get("language", params.get("language", None)))
+    segment_tts_speed = float(segment.get("tts_speed", params.get("tts_speed", 100)))
+    segment_tts_pitch = float(segment.get("tts_pitch", params.get("tts_pitch", 0)))
+
+    # Generate hash
+    for key, value in options.items():
+        if key not in segment_options:
+            segment_options[key] = value
+    segment_params = {
+        "message": segment_message,
+        "tts_platform": segment_tts_platform,
+        "language": segment_language,
+        "cache": segment_cache,
+        "tts_speed": segment_tts_speed,
+        "tts_pitch": segment_tts_pitch
+    }
+    segment_filepath_hash = get_filename_hash_from_service_data({**segment_params}, {**segment_options})
+
+    tts_audio: AudioSegment = None
+    audio_dict = None
+
+    # Use cached TTS audio
+    if segment_cache is True:
+        _LOGGER.debug(" - Attempting to retrieve TTS audio from cache...")
+        audio_dict = await async_get_cached_audio_data(hass, segment_filepath_hash)
+        if audio_dict and audio_dict.get(LOCAL_PATH_KEY, None):
+            tts_audio = await async_load_audio_from_path(hass=hass,
+                                                         filepath=audio_dict.get(LOCAL_PATH_KEY, None),
+                                                         cache=segment_cache)
+        else:
+            _LOGGER.debug("   ...no cached TTS audio found")
+
+    # Generate new TTS audio
+    if tts_audio is None:
+        tts_audio = await tts_audio_helper.async_request_tts_audio(
+            hass=hass,
+            tts_platform=segment_tts_platform,
+            message=segment_message,
+            language=segment_language,
+            cache=segment_cache,
+            options=segment_options
+        )
+
+        # Cache the new TTS audio?
+        if tts_audio is not None:
+            tts_audio_duration = float(len(tts_audio) / 1000.0)
+            if segment_cache is True and audio_dict is None:
+                _LOGGER.debug(" - Saving generated TTS audio to cache...")
+                tts_audio_full_path = await filesystem_helper.async_save_audio_to_folder(
+                    hass,
+                    tts_audio,
+                    _data.get(TEMP_PATH_KEY, None))
+                if tts_audio_full_path is not None:
+                    audio_dict = {
+                        LOCAL_PATH_KEY: tts_audio_full_path,
+                        AUDIO_DURATION_KEY: tts_audio_duration
+                    }
+                    await async_store_data(hass, segment_filepath_hash, audio_dict)
+                    _LOGGER.debug("  ...TTS audio saved to cache")
+                else:
+                    _LOGGER.warning("Unable to save generated TTS audio to cache")
+    stage("tts")
+
+    if tts_audio is None:
+        _LOGGER.warning("Error generating TTS audio from messsage segment #%s: %s",
+                        str(index+1), str(segment))
+        return None
+
+    # TTS Audio manipulations, in one FFmpeg call when they are all audio filters
+    temp_folder: str = _data.get(TEMP_PATH_KEY, None)
+    conversions = [("speed", helpers.get_speed_ffmpeg_args(segment_tts_speed)),
+                   ("pitch", helpers.get_pitch_ffmpeg_args(segment_tts_pitch, tts_audio.frame_rate)),
+                   ("conversion", segment_audio_conversion)]
+    filters = []
+    for _, ffmpeg_args in conversions:
+        if ffmpeg_args and filters is not None:
+            ffmpeg_filters = helpers.get_ffmpeg_filters(ffmpeg_args)
+            filters = filters + ffmpeg_filters if ffmpeg_filters else None
+    if filters and helpers.can_ffmpeg_filter_audio_segment(tts_audio, filters):
+        tts_audio = await helpers.async_ffmpeg_filter_audio_segment(tts_audio, filters)
+        stage("ffmpeg")
+        return tts_audio
+
+    for stage_name, ffmpeg_args in conversions:
+        if ffmpeg_args:
+            tts_audio = await helpers.async_ffmpeg_convert_from_audio_segment(hass, tts_audio, ffmpeg_args, temp_folder)
+            stage(stage_name)
+
+    return tts_audio
+
 async def async_get_audio_from_path(
         hass: HomeAssistant,
         filepath: str,
@@ -950,6 +1032,28 @@ async def async_get_audio_from_path(
     if filepath is None or filepath == "None" or len(filepath) == 0:
         return audio
 
+    audio_from_path = await async_load_audio_from_path(hass=hass,
+                                                       filepath=filepath,
+                                                       cache=cache,
+                                                       audio_conversion=audio_conversion)
+    if audio_from_path is None:
+        return audio
+    if audio is None:
+        return audio_from_path
+
+    # Apply offset
+    return helpers.combine_audio(audio, audio_from_path, offset, crossfade)
+
+async def async_load_audio_from_path(
+        hass: HomeAssistant,
+        filepath: str,
+        cache: bool = False,
+        audio_conversion: str = ""
+    ):
+    """Load the audio from a given file path, with an audio conversion (optional)."""
+    if filepath is None or filepath == "None" or len(filepath) == 0:
+        return None
+
     # Load/download audio file & validate local path
     filepath = await filesystem_helper.async_get_chime_path(
         chime_path=filepath,
@@ -978,16 +1082,29 @@ async def async_get_audio_from_path(
 
         _LOGGER.debug(' - Retrieving audio from path: "%s"...', filepath)
         try:
-            audio_from_path: AudioSegment = await filesystem_helper.async_load_audio(filepath)
+            # Use previously decoded audio, unless it is a download removed after use
+            cache_key = None
+            if cache or file_hash is None:
+                cache_key = await hass.async_add_executor_job(audio_cache.get_key, filepath, audio_conversion)
+            audio_from_path: AudioSegment = audio_cache.get(cache_key)
+            if audio_from_path is not None:
+                _LOGGER.debug("   ...using decoded audio from cache")
+            else:
+                audio_from_path = await filesystem_helper.async_load_audio(filepath)
+                decoded_audio = audio_from_path
+
+                # Apply audio conversion
+                if audio_conversion is not None and len(audio_conversion) > 0:
+                    _LOGGER.debug("  - Performing FFmpeg audio conversion of audio file: \"%s\"...", audio_conversion)
+                    temp_folder: str = _data.get(TEMP_PATH_KEY, None)
+                    audio_from_path = await helpers.async_ffmpeg_convert_from_audio_segment(hass,
+                                                                                            audio_from_path,
+                                                                                            ffmpeg_args=audio_conversion,
+                                                                                            folder=temp_folder)
 
-            # Apply audio conversion
-            if audio_conversion is not None and len(audio_conversion) > 0:
-                _LOGGER.debug("  - Performing FFmpeg audio conversion of audio file: \"%s\"...", audio_conversion)
-                temp_folder: str = _data.get(TEMP_PATH_KEY, None)
-                audio_from_path = await helpers.async_ffmpeg_convert_from_audio_segment(hass,
-                                                                                        audio_from_path,
-                                                                                        ffmpeg_args=audio_conversion,
-                                                                                        folder=temp_folder)
+                # Failed conversions return the original audio and are not cached
+                if not audio_conversion or audio_from_path is not decoded_audio:
+                    audio_cache.put(cache_key, audio_from_path)
 
             # Remove downloaded file when cache=false
             if cache is False and file_hash is not None:
@@ -999,17 +1116,13 @@ async def async_get_audio_from_path(
                     "   ...audio retrieved. Duration: %ss",
                     str(duration),
                 )
-                if audio is None:
-                    return audio_from_path
-
-                # Apply offset
-                return helpers.combine_audio(audio, audio_from_path, offset, crossfade)
+                return audio_from_path
             _LOGGER.warning("Unable to find audio at filepath: %s", filepath)
         except Exception as error:
             _LOGGER.warning('Unable to extract audio from file: "%s"', error)
 
     _LOGGER.warning("Unable to generate local audio filepath")
-    return audio
+    return None
 
 ##################
 
@@ -1351,6 +1464,7 @@ async def async_get_cached_audio_data(hass: HomeAssistant, filepath_hash: str):
             }
 
         # Validate paths and add duration if missing
+        duration_added = False
         for key in [LOCAL_PATH_KEY, PUBLIC_PATH_KEY]:
             audio_dict[key] = audio_dict.get(key, None)
             if audio_dict.get(key, None):
@@ -1362,9 +1476,14 @@ async def async_get_cached_audio_data(hass: HomeAssistant, filepath_hash: str):
                                                                 cache=True)
                         if audio is not None:
                             audio_dict[AUDIO_DURATION_KEY] = float(len(audio) / 1000.0)
+                            duration_added = True
                         else:
                             _LOGGER.warning("Could not load audio from file: %s", audio_dict.get(key, ""))
-                            audio.dict[key] = None
+                            audio_dict[key] = None
+
+        # Store the duration, so the audio is not decoded again to get it
+        if duration_added:
+            await async_store_data(hass, filepath_hash, dict(audio_dict))
         return audio_dict
 
     await async_remove_cached_audio_data(hass, filepath_hash, True, True)
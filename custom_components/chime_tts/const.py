@@ -20,6 +20,7 @@ if os.path.isfile(manifest_path):
 else:
     VERSION = None
 
+SERVICE_AUDIO_CACHE = "audio_cache"
 SERVICE_CLEAR_CACHE = "clear_cache"
 SERVICE_REPLAY = "replay"
 SERVICE_SAY = "say"
@@ -102,6 +103,8 @@ QUEUE_TIMEOUT_DEFAULT = 60
 TTS_TIMEOUT_KEY = "tts_timeout"
 TTS_TIMEOUT_DEFAULT = 30
 MAX_CONCURRENT_TASKS = 10
+MAX_CONCURRENT_SEGMENTS = 4
+AUDIO_CACHE_MAX_BYTES = 64 * 1024 * 1024
 MAX_TIMEOUT = 600
 QUEUE_PROCESSOR_SLEEP_TIME = 0.2
 
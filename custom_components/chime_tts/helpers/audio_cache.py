@@ -0,0 +1,94 @@
+"""Decoded audio cache for Chime TTS."""
+
+import logging
+import os
+from collections import OrderedDict
+
+from pydub import AudioSegment
+
+from ..const import AUDIO_CACHE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AudioCache:
+    """Size-bounded LRU of decoded audio, so chimes and cached TTS clips are decoded once.
+
+    Entries are keyed by file path, modification time, size and audio
+    conversion, so an edited or replaced file is decoded again. AudioSegment
+    objects are immutable, entries are shared by all announcements using them.
+    """
+
+    def __init__(self, max_bytes: int = AUDIO_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_key(self, file_path: str, audio_conversion: str = ""):
+        """Cache key for a file, None if the file cannot be found (blocking)."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size, audio_conversion or "")
+
+    def get(self, key):
+        """Return the decoded audio for a key, None if not cached."""
+        if key is None:
+            return None
+        audio = self._entries.get(key)
+        if audio is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return audio
+
+    def put(self, key, audio: AudioSegment):
+        """Add decoded audio, evicting the least recently used audio above the size limit."""
+        if key is None or audio is None:
+            return
+        size = len(audio.raw_data)
+        if size > self.max_bytes:
+            _LOGGER.debug("Audio of %s bytes is too large for the decoded audio cache", str(size))
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= len(previous.raw_data)
+        self._entries[key] = audio
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted.raw_data)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all decoded audio and reset the usage counts."""
+        self._entries.clear()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self) -> dict:
+        """Summary of the cache's contents and usage."""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "files": [
+                {
+                    "path": path,
+                    "audio_conversion": audio_conversion,
+                    "duration": len(audio) / 1000.0,
+                    "size_bytes": len(audio.raw_data),
+                }
+                for (path, _, _, audio_conversion), audio in reversed(self._entries.items())
+            ],
+        }
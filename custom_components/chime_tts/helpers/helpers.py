@@ -1,5 +1,6 @@
 """Audio helper functions for Chime TTS."""
 
+import asyncio
 import logging
 import os
 import re
@@ -46,6 +47,13 @@ from pydub import AudioSegment
 filesystem_helper = FilesystemHelper()
 
 _LOGGER = logging.getLogger(__name__)
+# FFmpeg raw PCM formats by AudioSegment sample width (pydub samples are signed)
+_PCM_FORMATS = {1: "s8", 2: "s16le", 4: "s32le"}
+# FFmpeg arguments that hold an audio filter graph
+_FFMPEG_FILTER_ARGS = ["-af", "-filter:a", "-filter"]
+# FFmpeg audio filters that set the sample rate, or the channel layout, of their output
+_FFMPEG_RATE_FILTERS = ["aresample", "asetrate"]
+_FFMPEG_LAYOUT_FILTERS = ["aformat", "amerge", "channelmap", "channelsplit", "join", "pan", "surround"]
 class ChimeTTSHelper:
     """Helper functions for Chime TTS."""
 
@@ -442,12 +450,22 @@ class ChimeTTSHelper:
                                                       audio_segment: AudioSegment = None,
                                                       ffmpeg_args: str = "",
                                                       folder: str = ""):
-        """Convert pydub AudioSegment with FFmpeg and provided arguments."""
+        """Convert pydub AudioSegment with FFmpeg and provided arguments.
+
+        Arguments that are only audio filters are applied over pipes, others
+        (or audio or filters the pipe can't carry, see
+        can_ffmpeg_filter_audio_segment) through temporary files.
+        """
         ret_val = audio_segment
 
         if not ffmpeg_args or len(ffmpeg_args) == 0:
             return ret_val
 
+        # Audio filters only: stream the audio through FFmpeg
+        filters = self.get_ffmpeg_filters(ffmpeg_args)
+        if filters and self.can_ffmpeg_filter_audio_segment(audio_segment, filters):
+            return await self.async_ffmpeg_filter_audio_segment(audio_segment, filters)
+
         # Validate parameters
         error_string = ""
         if not audio_segment:
@@ -458,16 +476,13 @@ class ChimeTTSHelper:
             _LOGGER.warning("Skipping FFmpeg conversion: %s", error_string)
             return ret_val
 
-        # Save to temp file
-        temp_filename = "temp_segment.mp3"
+        # Save to a uniquely named temp file, segments are converted concurrently
         temp_audio_file = await filesystem_helper.async_save_audio_to_folder(
             hass=hass,
             audio=audio_segment,
-            folder=folder,
-            file_name=temp_filename)
+            folder=folder)
         if not temp_audio_file:
-            full_path = f"{folder}/{temp_filename}"
-            _LOGGER.warning("ffmpeg_convert_from_audio_segment - Unable to store audio segment to: %s", full_path)
+            _LOGGER.warning("ffmpeg_convert_from_audio_segment - Unable to store audio segment to: %s", folder)
             return ret_val
 
         # Convert with FFmpeg
@@ -496,6 +511,89 @@ class ChimeTTSHelper:
 
         return ret_val
 
+    def get_ffmpeg_filters(self, ffmpeg_args: str):
+        """Return the audio filters of an FFmpeg arguments string, None if it has other arguments."""
+        args = (ffmpeg_args or "").split()
+        filters = []
+        index = 0
+        while index < len(args):
+            if args[index] in _FFMPEG_FILTER_ARGS and index + 1 < len(args):
+                filters.append(args[index + 1])
+                index += 2
+            elif args[index] == "-y":
+                index += 1
+            else:
+                return None
+        return filters or None
+
+    def can_ffmpeg_filter_audio_segment(self, audio_segment: AudioSegment, filters: list[str]):
+        """Whether the filters can be applied to the audio piped through FFmpeg as raw PCM.
+
+        The raw PCM is read back in the sample rate and channel count of the
+        input, so filters that change the channel layout, or leave the audio in
+        another sample rate, need temporary files to keep their output.
+        """
+        if audio_segment is None or audio_segment.sample_width not in _PCM_FORMATS:
+            return False
+        frame_rate = audio_segment.frame_rate
+        for audio_filter in ",".join(filters).split(","):
+            name, _, options = audio_filter.partition("=")
+            if name in _FFMPEG_LAYOUT_FILTERS:
+                return False
+            if name in _FFMPEG_RATE_FILTERS and options:
+                # Only a plain sample rate (eg: aresample=24000) is known here
+                sample_rate = options.split(":")[0]
+                frame_rate = int(sample_rate) if sample_rate.isdigit() else None
+        return frame_rate == audio_segment.frame_rate
+
+    async def async_ffmpeg_filter_audio_segment(self, audio_segment: AudioSegment, filters: list[str]):
+        """Apply FFmpeg audio filters to a pydub AudioSegment in one FFmpeg call.
+
+        The raw PCM audio is written to FFmpeg's stdin and read back from its
+        stdout in the same format, so no files are used and any number of
+        calls can run at the same time.
+        """
+        pcm_format = _PCM_FORMATS.get(audio_segment.sample_width)
+        if pcm_format is None:
+            _LOGGER.warning("Skipping FFmpeg conversion: unsupported sample width %s", str(audio_segment.sample_width))
+            return audio_segment
+
+        pcm_args = ['-f', pcm_format, '-ar', str(audio_segment.frame_rate), '-ac', str(audio_segment.channels)]
+        ffmpeg_cmd = [
+            'ffmpeg',
+            '-hide_banner',
+            '-loglevel', 'error',
+            *pcm_args,
+            '-i', 'pipe:0',
+            '-af', ",".join(filters),
+            *pcm_args,
+            'pipe:1'
+        ]
+        ffmpeg_cmd_string = " ".join(ffmpeg_cmd)
+        _LOGGER.debug("Running FFmpeg operation: \"%s\"", ffmpeg_cmd_string)
+        try:
+            ffmpeg_process = await asyncio.create_subprocess_exec(*ffmpeg_cmd,
+                                                                  stdin=asyncio.subprocess.PIPE,
+                                                                  stdout=asyncio.subprocess.PIPE,
+                                                                  stderr=asyncio.subprocess.PIPE)
+            raw_data, error_output = await ffmpeg_process.communicate(audio_segment.raw_data)
+        except Exception as error:
+            _LOGGER.error("FFmpeg unexpected error: %s FFmpeg options: %s",
+                           error, ffmpeg_cmd_string)
+            return audio_segment
+
+        if ffmpeg_process.returncode != 0:
+            _LOGGER.error(("FFmpeg operation failed.\n\nArguments string: \"%s\"\n\nError code: %s\n\nError output:\n%s"),
+                          ffmpeg_cmd_string,
+                          str(ffmpeg_process.returncode),
+                          error_output.decode('utf-8', errors='replace'))
+            return audio_segment
+
+        return AudioSegment(data=raw_data,
+                            sample_width=audio_segment.sample_width,
+                            frame_rate=audio_segment.frame_rate,
+                            channels=audio_segment.channels)
+
     async def async_ffmpeg_convert_from_file(self, hass: HomeAssistant, file_path: str, ffmpeg_args: str):
         """Convert audio file with FFmpeg and provided arguments."""
 
@@ -547,7 +645,7 @@ class ChimeTTSHelper:
                                               stdin=subprocess.PIPE,
                                               stdout=subprocess.PIPE,
                                               stderr=subprocess.PIPE)
-            _, error_output = ffmpeg_process.communicate()
+            _, error_output = await hass.async_add_executor_job(ffmpeg_process.communicate)
 
 
             if ffmpeg_process.returncode != 0:
@@ -602,25 +700,45 @@ class ChimeTTSHelper:
 
         return ffmpeg_args_string
 
-    async def async_change_speed_of_audiosegment(self, hass: HomeAssistant, audio_segment: AudioSegment, speed: float = 100.0, temp_folder: str = None):
-        """Change the playback speed of an audio segment."""
-        if not audio_segment or speed == 100 or speed < 1 or speed > 500:
-            if not audio_segment:
-                _LOGGER.warning("Cannot change TTS audio playback speed. No audio available")
-            elif speed != 100:
+    def get_speed_ffmpeg_args(self, speed: float = 100.0):
+        """FFmpeg arguments to change the playback speed, None for no change."""
+        if speed == 100 or speed < 1 or speed > 500:
+            if speed != 100:
                 _LOGGER.warning("TTS audio playback speed values must be between 1% and 500%")
-            return audio_segment
+            return None
 
         _LOGGER.debug(f" -  ...changing TTS playback speed to {str(speed)}% of original")
 
         tempo = float(speed / 100)
+        return self.add_atempo_values_to_ffmpeg_args_string(tempo)
 
-        ffmpeg_args_string = self.add_atempo_values_to_ffmpeg_args_string(tempo)
+    def get_pitch_ffmpeg_args(self, pitch: float = 0, frame_rate: int = 0):
+        """FFmpeg arguments to change the pitch of audio with frame_rate, None for no change."""
+        if pitch == 0.0:
+            return None
+
+        _LOGGER.debug(
+            " -  ...changing pitch of TTS audio by %s semitone%s",
+            str(pitch),
+            ("" if pitch == 1 else "s")
+        )
+
+        # Generate FFmpeg arguments string
+        pitch_shift = 2 ** (pitch / 12)
+        tempo_adjustment = 1 / pitch_shift
+        ffmpeg_args_string = f"-af asetrate={frame_rate}*{pitch_shift},aresample={frame_rate}"
+        return self.add_atempo_values_to_ffmpeg_args_string(tempo_adjustment, ffmpeg_args_string)
+
+    async def async_change_speed_of_audiosegment(self, hass: HomeAssistant, audio_segment: AudioSegment, speed: float = 100.0, temp_folder: str = None):
+        """Change the playback speed of an audio segment."""
+        if not audio_segment:
+            _LOGGER.warning("Cannot change TTS audio playback speed. No audio available")
+            return audio_segment
 
         return await self.async_ffmpeg_convert_from_audio_segment(
             hass=hass,
             audio_segment=audio_segment,
-            ffmpeg_args=ffmpeg_args_string,
+            ffmpeg_args=self.get_speed_ffmpeg_args(speed),
             folder=temp_folder)
 
     async def async_change_pitch_of_audiosegment(self, hass: HomeAssistant, audio_segment: AudioSegment, pitch: int = 0, temp_folder: str = None):
@@ -628,25 +746,11 @@ class ChimeTTSHelper:
         if not audio_segment:
             _LOGGER.warning("Cannot change TTS audio pitch. No audio available")
             return audio_segment
-        elif pitch == 0.0:
-            return audio_segment
-
-        _LOGGER.debug(
-            " -  ...changing pitch of TTS audio by %s semitone%s",
-            str(pitch),
-            ("" if pitch == 1 else "s")
-        )
 
-        # Generate FFmpeg arguments string
-        pitch_shift = 2 ** (pitch / 12)
-        tempo_adjustment = 1 / pitch_shift
-        frame_rate = audio_segment.frame_rate
-        ffmpeg_args_string = f"-af asetrate={frame_rate}*{pitch_shift}"
-        ffmpeg_args_string = self.add_atempo_values_to_ffmpeg_args_string(tempo_adjustment, ffmpeg_args_string)
         return await self.async_ffmpeg_convert_from_audio_segment(
             hass=hass,
             audio_segment=audio_segment,
-            ffmpeg_args=ffmpeg_args_string,
+            ffmpeg_args=self.get_pitch_ffmpeg_args(pitch, audio_segment.frame_rate),
             folder=temp_folder)
 
     def combine_audio(self,
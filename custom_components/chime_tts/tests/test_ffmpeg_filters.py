@@ -0,0 +1,85 @@
+# tests/test_ffmpeg_filters.py
+"""FFmpeg audio filter tests for Chime TTS.
+
+Validates:
+- Filters keeping the sample rate and channel count are applied over pipes
+- Filters changing the channel layout or the final sample rate use temporary files
+- The pitch filter ends in the input's sample rate, so it stays on the pipes
+- Converted audio keeps the sample rate and channel count the filters produce
+"""
+from __future__ import annotations
+
+import shutil
+from typing import List
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pydub.generators import Sine
+
+from custom_components.chime_tts.helpers.helpers import ChimeTTSHelper
+
+FRAME_RATE = 24000
+
+helpers = ChimeTTSHelper()
+
+
+def _audio(channels: int = 2):
+    return Sine(440).to_audio_segment(duration=1000).set_frame_rate(FRAME_RATE).set_channels(channels)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        ["volume=0.5"],
+        ["atempo=1.25", "volume=0.5"],
+        ["aresample", "volume=0.5"],
+        ["asetrate=30000,aresample=24000"],
+    ],
+)
+def test_pipeable_filters(filters: List[str]) -> None:
+    """Filters ending in the input's sample rate and channel count are piped."""
+    assert helpers.can_ffmpeg_filter_audio_segment(_audio(), filters)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        ["aresample=16000"],
+        ["aresample=osr=16000"],
+        ["asetrate=30000"],
+        ["volume=0.5,pan=mono|c0=c0"],
+        ["aformat=channel_layouts=mono"],
+    ],
+)
+def test_format_changing_filters_use_files(filters: List[str]) -> None:
+    """Filters changing the channel layout or the final sample rate are not piped."""
+    assert not helpers.can_ffmpeg_filter_audio_segment(_audio(), filters)
+
+
+def test_pitch_filter_is_piped() -> None:
+    """The pitch change resamples back to the input's sample rate."""
+    filters = helpers.get_ffmpeg_filters(helpers.get_pitch_ffmpeg_args(3, FRAME_RATE))
+    assert helpers.can_ffmpeg_filter_audio_segment(_audio(), filters)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="FFmpeg not installed")
+async def test_converted_audio_keeps_filter_format(hass: HomeAssistant, tmp_path) -> None:
+    """Resampling and downmixing filters keep their sample rate and channel count."""
+    audio = _audio()
+
+    resampled = await helpers.async_ffmpeg_convert_from_audio_segment(
+        hass, audio, "-af aresample=16000", str(tmp_path)
+    )
+    assert resampled.frame_rate == 16000
+
+    downmixed = await helpers.async_ffmpeg_convert_from_audio_segment(
+        hass, audio, "-af pan=mono|c0=c0", str(tmp_path)
+    )
+    assert downmixed.channels == 1
+
+    piped = await helpers.async_ffmpeg_convert_from_audio_segment(
+        hass, audio, helpers.get_pitch_ffmpeg_args(3, FRAME_RATE), str(tmp_path)
+    )
+    assert (piped.frame_rate, piped.channels) == (FRAME_RATE, 2)
+    assert list(tmp_path.iterdir()) == []
@@ -2,6 +2,8 @@
 #  GoogleFindMyTools - A set of tools to interact with the Google Find My API
 #  Copyright © 2024 Leon Böttger. All rights reserved.
 #
+from functools import lru_cache
+
 from Cryptodome.Cipher import AES
 from ecdsa import SECP160r1
 
@@ -11,19 +13,45 @@ from custom_components.googlefindmy.example_data_provider import get_example_dat
 K = 10
 ROTATION_PERIOD = 1024  # 2^K seconds
 
+# Rotation windows kept per process; a device's reports span a handful of
+# windows, so this covers many devices and days of history
+WINDOW_CACHE_SIZE = 4096
+
 def generate_eid(identity_key: bytes, timestamp: int) -> bytes:
-    # Calculate r
-    r = calculate_r(identity_key, timestamp)
+    # The EID is the x coordinate of R = r * G for the rotation window
+    return get_window_keys(identity_key, timestamp)[1]
+
+
+def get_window_keys(identity_key: bytes, timestamp: int) -> tuple[int, bytes]:
+    """Return (r, EID) for the rotation window containing timestamp.
+
+    Both only depend on the identity key and the masked timestamp, so they are
+    computed once per window (one AES block and one scalar multiplication) and
+    cached.
+    """
+    return _window_keys(bytes(identity_key), timestamp & ~((1 << K) - 1))
+
+
+@lru_cache(maxsize=WINDOW_CACHE_SIZE)
+def _window_keys(identity_key: bytes, masked_timestamp: int) -> tuple[int, bytes]:
+    r = _calculate_r(identity_key, masked_timestamp)
 
     # Compute R = r * G
     curve = SECP160r1
     R = r * curve.generator
+    return r, R.x().to_bytes(20, 'big')
+
 
-    # Return the x coordinate of R as the EID
-    return R.x().to_bytes(20, 'big')
+def clear_window_cache() -> None:
+    """Drop all cached rotation window keys."""
+    _window_keys.cache_clear()
 
 
 def calculate_r(identity_key: bytes, timestamp: int):
+    return get_window_keys(identity_key, timestamp)[0]
+
+
+def _calculate_r(identity_key: bytes, timestamp: int):
     # ts_bytes is the timestamp in bytes, but the least K significant bits are set to 0
     ts_bytes = get_masked_timestamp(timestamp, K)
     identity_key_bytes = identity_key
@@ -28,13 +28,13 @@ from typing import Tuple
 
 from Cryptodome.Cipher import AES
 from ecdsa import SECP160r1
-from ecdsa.ellipticcurve import Point
+from ecdsa.ellipticcurve import Point, PointJacobi
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from custom_components.googlefindmy.FMDNCrypto.eid_generator import (
     generate_eid,
-    calculate_r,
+    get_window_keys,
 )
 from custom_components.googlefindmy.example_data_provider import get_example_data
 
@@ -46,6 +46,8 @@ from custom_components.googlefindmy.example_data_provider import get_example_dat
 _AES_TAG_LEN: int = 16
 # SECP160r1 coordinate length in bytes (160 bits)
 _COORD_LEN: int = 20
+# Identity key (EIK) length in bytes; it is used as an AES-256 key to derive r
+_IDENTITY_KEY_LEN: int = 32
 # Nonce is constructed as LRx(8) || LSx(8) = 16 bytes (see spec used here)
 _NONCE_LEN: int = 16
 
@@ -215,13 +217,14 @@ def decrypt(identity_key: bytes, encryptedAndTag: bytes, Sx: bytes, beacon_time_
 
     Construction (mirrors `encrypt` above):
     1) Compute r from (identity_key, beacon_time_counter); R = r·G.
+       Both are cached per rotation window (see `eid_generator.get_window_keys`).
     2) Rebuild S from Sx (x-only); choose even y via rx_to_ry.
     3) Derive k = HKDF-SHA256( (r·S).x ) → 32 bytes.
     4) nonce = LRx(8) || LSx(8).
     5) Split m' || tag and AES-EAX-256_DEC(k, nonce, m', tag).
 
     Args:
-        identity_key: 20-byte tracker identity/private key material (domain-specific).
+        identity_key: 32-byte tracker identity key (EIK).
         encryptedAndTag: Ciphertext concatenated with 16-byte tag.
         Sx: 20-byte X coordinate of ephemeral S.
         beacon_time_counter: Time counter used to derive r.
@@ -233,7 +236,7 @@ def decrypt(identity_key: bytes, encryptedAndTag: bytes, Sx: bytes, beacon_time_
         ValueError: On invalid input lengths or verification failure.
     """
     # Basic validations
-    _require_len("identity_key", identity_key, _COORD_LEN)
+    _require_len("identity_key", identity_key, _IDENTITY_KEY_LEN)
     _require_len("Sx", Sx, _COORD_LEN)
     if len(encryptedAndTag) < _AES_TAG_LEN:
         raise ValueError("encryptedAndTag must be at least 16 bytes (contains tag).")
@@ -242,25 +245,23 @@ def decrypt(identity_key: bytes, encryptedAndTag: bytes, Sx: bytes, beacon_time_
     m_dash = encryptedAndTag[:-_AES_TAG_LEN]
     tag = encryptedAndTag[-_AES_TAG_LEN:]
 
-    # Curve and scalar r
+    # Curve, scalar r and Rx = (r·G).x for this rotation window
     curve = SECP160r1
-    r = calculate_r(identity_key, beacon_time_counter)
+    r, Rx = get_window_keys(identity_key, beacon_time_counter)
 
-    # R = r·G
-    R = r * curve.generator
-
-    # Rebuild S from Sx (x-only) and choose even Y
+    # Rebuild S from Sx (x-only) and choose even Y; Jacobian coordinates avoid
+    # a modular inversion per step of the scalar multiplication below
     Sx_int = int.from_bytes(Sx, byteorder="big")
     Sy = rx_to_ry(Sx_int, curve.curve)
-    S = Point(curve.curve, Sx_int, Sy)
+    S = PointJacobi(curve.curve, Sx_int, Sy, 1, curve.order)
 
     # Derive AES-256 key via HKDF-SHA256 over (r·S).x
     hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"")
     k = hkdf.derive((r * S).x().to_bytes(_COORD_LEN, "big"))
 
     # Nonce = LRx(8) || LSx(8)
-    LRx = R.x().to_bytes(_COORD_LEN, "big")[-8:]
-    LSx = S.x().to_bytes(_COORD_LEN, "big")[-8:]
+    LRx = Rx[-8:]
+    LSx = Sx[-8:]
     nonce = LRx + LSx  # 16 bytes
 
     # AES-EAX-256 decrypt & verify
@@ -10,7 +10,8 @@ import datetime
 import hashlib
 import logging
 import math
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 
 from google.protobuf.message import DecodeError
 
@@ -39,6 +40,16 @@ _MAX_REPORTS: int = 500
 # Strict length of Ephemeral Identity Key (bytes). Paper and ecosystem practice expect 32 bytes.
 _EIK_LEN: int = 32
 
+# Decrypted identity keys, keyed by a hash of (owner key, encrypted EIK). The EIK
+# only changes when the owner key or the tracker's secrets change, and either
+# changes the cache key, so entries never go stale; the bound limits memory.
+_IDENTITY_KEY_CACHE_MAX: int = 64
+_identity_key_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+# One report to decrypt: (encrypted_location, public_key_random, time_offset).
+# An empty public_key_random marks an own report (AES-GCM with the hashed EIK).
+EncryptedReport = Tuple[bytes, bytes, int]
+
 
 # ---- Exceptions (specific, compatible via RuntimeError) -----------------------
 class DecryptionError(RuntimeError):
@@ -106,13 +117,23 @@ async def async_retrieve_identity_key(device_registration: DeviceRegistration) -
 
     owner_key = await async_get_owner_key()
 
+    cache_key = hashlib.sha256(bytes(owner_key) + bytes(encrypted_identity_key)).digest()
+    cached = _identity_key_cache.get(cache_key)
+    if cached is not None:
+        _identity_key_cache.move_to_end(cache_key)
+        return cached
+
     try:
         # CPU-heavy → do not block the event loop
         eik_bytes = await asyncio.to_thread(decrypt_eik, owner_key, encrypted_identity_key)
         # Strict sanity: EIK must be exactly 32 bytes
         if not isinstance(eik_bytes, (bytes, bytearray)) or len(eik_bytes) != _EIK_LEN:
             raise DecryptionError(f"Ephemeral identity key invalid (expected {_EIK_LEN} bytes).")
-        return bytes(eik_bytes)
+        eik_bytes = bytes(eik_bytes)
+        _identity_key_cache[cache_key] = eik_bytes
+        if len(_identity_key_cache) > _IDENTITY_KEY_CACHE_MAX:
+            _identity_key_cache.popitem(last=False)
+        return eik_bytes
     except Exception as e:
         current_owner_key_version = None
         try:
@@ -190,20 +211,54 @@ def _normalize_ts_seconds(ts_obj: Any) -> int:
     return int(v)
 
 
-async def _offload_decrypt_aes(identity_key: bytes, encrypted_location: bytes) -> bytes:
-    """Offload AES-GCM decryption; derive key hash cheaply on event loop."""
-    identity_key_hash = hashlib.sha256(identity_key).digest()  # cheap hash → OK on loop
-    return await asyncio.to_thread(decrypt_aes_gcm, identity_key_hash, encrypted_location)
+def clear_identity_key_cache() -> None:
+    """Drop all cached identity keys (e.g. after re-authentication)."""
+    _identity_key_cache.clear()
+
+
+def decrypt_reports(
+    identity_key: bytes,
+    reports: Sequence[EncryptedReport],
+) -> List[Optional[bytes]]:
+    """Decrypt the location reports of one device (synchronous, CPU-bound).
+
+    Own reports use AES-GCM with SHA-256(EIK), computed once per batch. Foreign
+    reports use the ECC construction in `foreign_tracker_cryptor.decrypt`, whose
+    per-rotation-window values (r, EID) are cached, so reports from the same
+    window only pay for their own point multiplication.
+
+    Args:
+        identity_key: The device's 32-byte Ephemeral Identity Key.
+        reports: (encrypted_location, public_key_random, time_offset) tuples.
+
+    Returns:
+        One entry per report, in order: the plaintext, or None if that report
+        failed to decrypt (logged at debug level; the others are unaffected).
+    """
+    identity_key_hash: Optional[bytes] = None
+    out: List[Optional[bytes]] = []
+    for encrypted_location, public_key_random, time_offset in reports:
+        try:
+            if public_key_random == b"":  # Own report
+                if identity_key_hash is None:
+                    identity_key_hash = hashlib.sha256(identity_key).digest()
+                out.append(decrypt_aes_gcm(identity_key_hash, encrypted_location))
+            else:
+                out.append(decrypt(identity_key, encrypted_location, public_key_random, time_offset))
+        except Exception as one_exc:
+            _LOGGER.debug("Failed to decrypt one location report: %s", one_exc)
+            out.append(None)
+    return out
 
 
-async def _offload_decrypt_foreign(
+async def async_decrypt_reports(
     identity_key: bytes,
-    encrypted_location: bytes,
-    public_key_random: bytes,
-    time_offset: int,
-) -> bytes:
-    """Offload ECC-based decryption for foreign reports."""
-    return await asyncio.to_thread(decrypt, identity_key, encrypted_location, public_key_random, time_offset)
+    reports: Sequence[EncryptedReport],
+) -> List[Optional[bytes]]:
+    """Decrypt a batch of reports in a single executor job (see `decrypt_reports`)."""
+    if not reports:
+        return []
+    return await asyncio.to_thread(decrypt_reports, identity_key, reports)
 
 
 # ----------------------------- Validation helpers -----------------------------
@@ -270,7 +325,8 @@ async def async_decrypt_location_response_locations(
     """Decrypt and normalize location reports into HA-friendly dicts (async).
 
     Guarantees:
-    - Event loop remains responsive: CPU-heavy crypto is offloaded via asyncio.to_thread().
+    - Event loop remains responsive: CPU-heavy crypto is offloaded via asyncio.to_thread(),
+      with all reports of the update decrypted in one executor job.
     - Fail-fast: malformed coordinates are dropped at the decryption boundary,
       preventing bad data from leaking into higher layers (HA Platinum quality).
     - Robust against partial/invalid reports (log and continue).
@@ -314,49 +370,55 @@ async def async_decrypt_location_response_locations(
         network_locations = network_locations[:_MAX_REPORTS]
         network_locations_time = network_locations_time[:_MAX_REPORTS]
 
-    wrapped: List[WrappedLocation] = []
+    # Collect the encrypted reports first so they can be decrypted in one batch
+    items: List[Tuple[Any, int, Optional[int]]] = []  # (loc, ts, index into reports or None)
+    reports: List[EncryptedReport] = []
     for loc, time_ts in zip(network_locations, network_locations_time):
         try:
             ts = _normalize_ts_seconds(time_ts)
 
             if loc.status == Common_pb2.Status.SEMANTIC:
-                wrapped.append(
-                    WrappedLocation(
-                        decrypted_location=b"",
-                        time=ts,
-                        accuracy=0,
-                        status=loc.status,
-                        is_own_report=True,
-                        name=loc.semanticLocation.locationName,
-                    )
-                )
+                items.append((loc, ts, None))
                 continue
 
             enc = loc.geoLocation.encryptedReport
-            encrypted_location: bytes = enc.encryptedLocation
-            public_key_random: bytes = enc.publicKeyRandom
+            time_offset = 0 if is_mcu else loc.geoLocation.deviceTimeOffset
+            items.append((loc, ts, len(reports)))
+            reports.append((enc.encryptedLocation, enc.publicKeyRandom, time_offset))
+        except Exception as one_exc:
+            # Continue with other reports (per-item resilience; avoid warn spam)
+            _LOGGER.debug("Failed to process one location report: %s", one_exc)
 
-            if public_key_random == b"":  # Own report
-                decrypted_location = await _offload_decrypt_aes(identity_key, encrypted_location)
-            else:
-                time_offset = 0 if is_mcu else loc.geoLocation.deviceTimeOffset
-                decrypted_location = await _offload_decrypt_foreign(
-                    identity_key, encrypted_location, public_key_random, time_offset
-                )
+    decrypted = await async_decrypt_reports(identity_key, reports)
 
+    wrapped: List[WrappedLocation] = []
+    for loc, ts, report_idx in items:
+        if report_idx is None:
             wrapped.append(
                 WrappedLocation(
-                    decrypted_location=decrypted_location,
+                    decrypted_location=b"",
                     time=ts,
-                    accuracy=loc.geoLocation.accuracy,
+                    accuracy=0,
                     status=loc.status,
-                    is_own_report=enc.isOwnReport,
-                    name="",
+                    is_own_report=True,
+                    name=loc.semanticLocation.locationName,
                 )
             )
-        except Exception as one_exc:
-            # Continue with other reports (per-item resilience; avoid warn spam)
-            _LOGGER.debug("Failed to process one location report: %s", one_exc)
+            continue
+
+        decrypted_location = decrypted[report_idx]
+        if decrypted_location is None:
+            continue
+        wrapped.append(
+            WrappedLocation(
+                decrypted_location=decrypted_location,
+                time=ts,
+                accuracy=loc.geoLocation.accuracy,
+                status=loc.status,
+                is_own_report=loc.geoLocation.encryptedReport.isOwnReport,
+                name="",
+            )
+        )
 
     if not wrapped:
         _LOGGER.debug("[DecryptLocations] No locations found.")
@@ -8,11 +8,10 @@ from __future__ import annotations
 
 import binascii
 import subprocess
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Tuple
 
 from google.protobuf import text_format
 import datetime
-import math
 import pytz
 
 from custom_components.googlefindmy.ProtoDecoders import (
@@ -20,6 +19,7 @@ from custom_components.googlefindmy.ProtoDecoders import (
     LocationReportsUpload_pb2,
 )
 from custom_components.googlefindmy.example_data_provider import get_example_data
+from custom_components.googlefindmy.fix_batch import FixBatch
 
 
 # --------------------------------------------------------------------------------------
@@ -182,154 +182,6 @@ def _build_device_stub(device_name: str, canonic_id: str) -> Dict[str, Any]:
     }
 
 
-def _normalize_location_dict(loc: Dict[str, Any]) -> Dict[str, Any]:
-    """Coerce numeric fields to floats (when present) and drop NaN/Inf.
-
-    Only mutates a shallow copy. Unknown keys are preserved (e.g., `_report_hint`).
-    """
-    out = dict(loc)
-    for num_key in ("latitude", "longitude", "accuracy", "last_seen", "altitude"):
-        val = out.get(num_key)
-        if val is None:
-            continue
-        try:
-            f = float(val)
-            if not math.isfinite(f):
-                out.pop(num_key, None)
-            else:
-                out[num_key] = f
-        except (TypeError, ValueError):
-            out.pop(num_key, None)
-    return out
-
-
-def _select_best_location(
-    cands: List[Dict[str, Any]]
-) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
-    """Choose the most useful location from a list of candidates.
-
-    This function normalizes all candidates once, then sorts them based on a
-    clear priority hierarchy to find the single most relevant location report.
-
-    Priority (high → low):
-        1) Has numeric coordinates (lat/lon)
-        2) Newer `last_seen` timestamp
-        3) Better accuracy (smaller radius)
-        4) `is_own_report` (used as a soft, final tiebreaker)
-
-    Rationale:
-        A fresh, precise crowdsourced fix is typically more helpful than an old,
-        coarse own-report. This ordering reflects that practical preference.
-
-    Returns:
-        A tuple containing:
-        - The single best location as a normalized dictionary, or None.
-        - The complete list of all normalized candidates, which can be reused
-          by downstream functions like semantic merging without re-processing.
-    """
-    if not cands:
-        return None, []
-
-    # Normalize once up front
-    normed_cands: List[Dict[str, Any]] = [_normalize_location_dict(c or {}) for c in cands]
-
-    for n in normed_cands:
-        has_coords = isinstance(n.get("latitude"), (int, float)) and isinstance(
-            n.get("longitude"), (int, float)
-        )
-        n["_rank_has_coords"] = 1 if has_coords else 0
-        try:
-            n["_rank_seen"] = float(n.get("last_seen") or 0.0)
-        except (TypeError, ValueError):
-            n["_rank_seen"] = 0.0
-        try:
-            acc = float(n.get("accuracy")) if n.get("accuracy") is not None else float("inf")
-            n["_rank_acc"] = -acc  # negative => smaller accuracy ranks higher
-        except (TypeError, ValueError):
-            n["_rank_acc"] = float("-inf")
-        n["_rank_is_own"] = 1 if bool(n.get("is_own_report")) else 0
-
-    # Coords → recency → accuracy → own-report
-    normed_cands.sort(
-        key=lambda x: (
-            x["_rank_has_coords"],
-            x["_rank_seen"],
-            x["_rank_acc"],
-            x["_rank_is_own"],
-        ),
-        reverse=True,
-    )
-
-    # Micro-optimization: remove temp rank keys in-place on the winner, then copy.
-    best_candidate = normed_cands[0]
-    for k in ("_rank_has_coords", "_rank_seen", "_rank_acc", "_rank_is_own"):
-        best_candidate.pop(k, None)
-
-    return dict(best_candidate), normed_cands
-
-
-def _merge_semantics_if_near_ts(
-    best: Dict[str, Any],
-    normed_cands: List[Dict[str, Any]],
-    *,
-    tolerance_s: float = _NEAR_TS_TOLERANCE_S,
-) -> Dict[str, Any]:
-    """Attach a semantic label from a candidate with the closest timestamp.
-
-    Behavior:
-        * If `best` already has a `semantic_name`, nothing changes.
-        * Otherwise, it searches for a candidate with a `semantic_name` whose
-          timestamp is within the `tolerance_s` window.
-        * If multiple matches exist, it deterministically chooses the one with the
-          smallest absolute time delta to the `best` location.
-
-    Rationale:
-        Sometimes the API provides a highly accurate GPS fix and a separate
-        semantic report ("Home") at almost the same time. This function merges
-        these two pieces of information, enriching the precise coordinate with
-        a human-readable place name.
-
-    Args:
-        best: The already-selected best location (assumed normalized).
-        normed_cands: The already-normalized list of all available candidates.
-        tolerance_s: The maximum time delta in seconds to consider timestamps "near".
-
-    Returns:
-        A (shallow) copy of `best` with the `semantic_name` field potentially filled.
-    """
-    out = dict(best)
-    if out.get("semantic_name"):
-        return out
-
-    try:
-        t_best = float(out.get("last_seen") or 0.0)
-    except (TypeError, ValueError):
-        t_best = 0.0
-
-    best_label: Optional[str] = None
-    min_delta = float("inf")
-
-    if t_best > 0:
-        for n in normed_cands:
-            label = n.get("semantic_name")
-            if not label:
-                continue
-            try:
-                t = float(n.get("last_seen") or 0.0)
-            except (TypeError, ValueError):
-                t = 0.0
-            if t <= 0:
-                continue
-            delta = abs(t - t_best)
-            if delta <= tolerance_s and delta < min_delta:
-                best_label = str(label)
-                min_delta = delta
-
-    if best_label:
-        out["semantic_name"] = best_label
-    return out
-
-
 def get_devices_with_location(device_list) -> List[Dict[str, Any]]:
     """Extract one consolidated row per canonic device ID from a device list.
 
@@ -360,9 +212,12 @@ def get_devices_with_location(device_list) -> List[Dict[str, Any]]:
         # If the decrypt layer is unavailable, return stubs only.
         decrypt_location_response_locations = None  # type: ignore[assignment]
 
-    results: List[Dict[str, Any]] = []
+    # One batch for all devices: the best fix per device is kept while the
+    # candidates are added; the semantic label is merged at the end.
+    batch = FixBatch()
+    devices: List[Tuple[str, Any]] = []
 
-    for device in getattr(device_list, "deviceMetadata", []):
+    for idx, device in enumerate(getattr(device_list, "deviceMetadata", [])):
         # Resolve canonic IDs for this device (Android vs. generic path)
         try:
             if device.identifierInformation.type == DeviceUpdate_pb2.IDENTIFIER_ANDROID:
@@ -375,6 +230,7 @@ def get_devices_with_location(device_list) -> List[Dict[str, Any]]:
             canonic_ids = []
 
         device_name = getattr(device, "userDefinedDeviceName", None) or ""
+        devices.append((device_name, canonic_ids))
 
         # Try decryption ONCE per device; share across all its canonic IDs
         location_candidates: List[Dict[str, Any]] = []
@@ -396,13 +252,13 @@ def get_devices_with_location(device_list) -> List[Dict[str, Any]]:
                 # Defensive: decryption issues must not break the whole list.
                 location_candidates = []
 
-        # If decryption yielded results, select the best one and keep normalized list.
-        if location_candidates:
-            best, normed = _select_best_location(location_candidates)
-            if best:
-                best = _merge_semantics_if_near_ts(best, normed)
-        else:
-            best, normed = None, []
+        batch.extend(idx, location_candidates)
+
+    best_by_device = batch.best(tolerance_s=_NEAR_TS_TOLERANCE_S)
+    results: List[Dict[str, Any]] = []
+
+    for idx, (device_name, canonic_ids) in enumerate(devices):
+        best = best_by_device.get(idx)
 
         # Emit **exactly one** row per canonic ID.
         for canonic in canonic_ids:
@@ -52,6 +52,7 @@ from .const import (
     OPTION_KEYS,
     OPT_LOCATION_POLL_INTERVAL,
     OPT_DEVICE_POLL_DELAY,
+    OPT_MAX_CONCURRENT_POLLS,
     OPT_MIN_POLL_INTERVAL,
     OPT_MIN_ACCURACY_THRESHOLD,
     OPT_ALLOW_HISTORY_FALLBACK,
@@ -61,6 +62,7 @@ from .const import (
     DEFAULT_OPTIONS,
     DEFAULT_LOCATION_POLL_INTERVAL,
     DEFAULT_DEVICE_POLL_DELAY,
+    DEFAULT_MAX_CONCURRENT_POLLS,
     DEFAULT_MIN_POLL_INTERVAL,
     DEFAULT_MIN_ACCURACY_THRESHOLD,
     DEFAULT_MAP_VIEW_TOKEN_EXPIRATION,
@@ -438,6 +440,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # tracked_devices removed: device inclusion via HA device enable/disable.
         location_poll_interval=_opt(entry, OPT_LOCATION_POLL_INTERVAL, DEFAULT_LOCATION_POLL_INTERVAL),
         device_poll_delay=_opt(entry, OPT_DEVICE_POLL_DELAY, DEFAULT_DEVICE_POLL_DELAY),
+        max_concurrent_polls=_opt(entry, OPT_MAX_CONCURRENT_POLLS, DEFAULT_MAX_CONCURRENT_POLLS),
         min_poll_interval=_opt(entry, OPT_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
         min_accuracy_threshold=_opt(entry, OPT_MIN_ACCURACY_THRESHOLD, DEFAULT_MIN_ACCURACY_THRESHOLD),
         allow_history_fallback=_opt(
@@ -484,6 +487,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator.google_home_filter = GoogleHomeFilter(hass, _effective_config(entry))
     _LOGGER.debug("Initialized Google Home filter (options-first)")
 
+    # In-memory location history (fed by the tracker entities, seeded below)
+    from .location_recorder import LocationRecorder
+
+    coordinator.location_recorder = LocationRecorder(hass)
+
     # Share coordinator in hass.data
     bucket = hass.data.setdefault(DOMAIN, {})
     bucket[entry.entry_id] = coordinator
@@ -505,6 +513,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Forward platforms so RestoreEntity can populate immediately
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Seed the location history from the recorder once (entities are registered now)
+    entry.async_create_background_task(
+        hass,
+        coordinator.location_recorder.async_seed(entry.entry_id),
+        name="googlefindmy.seed_location_history",
+    )
+
     # Defer the first refresh until HA is fully started
     listener_active = False
 
@@ -602,6 +617,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception:  # noqa: BLE001
         pass
 
+    # Drop cached key material (decrypted identity keys, EID rotation windows)
+    try:
+        from .FMDNCrypto.eid_generator import clear_window_cache
+        from .NovaApi.ExecuteAction.LocateTracker.decrypt_locations import clear_identity_key_cache
+        clear_identity_key_cache()
+        clear_window_cache()
+    except Exception:  # noqa: BLE001
+        pass
+
     if unload_ok:
         # Drop coordinator from hass.data
         hass.data.setdefault(DOMAIN, {}).pop(entry.entry_id, None)
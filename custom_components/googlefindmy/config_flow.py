@@ -59,6 +59,7 @@ from .const import (
     # OPT_TRACKED_DEVICES,  # (removed from UI in Step 1; left import commented for clarity)
     OPT_LOCATION_POLL_INTERVAL,
     OPT_DEVICE_POLL_DELAY,
+    OPT_MAX_CONCURRENT_POLLS,
     OPT_MIN_ACCURACY_THRESHOLD,
     OPT_MOVEMENT_THRESHOLD,
     OPT_GOOGLE_HOME_FILTER_ENABLED,
@@ -69,6 +70,7 @@ from .const import (
     # Defaults
     DEFAULT_LOCATION_POLL_INTERVAL,
     DEFAULT_DEVICE_POLL_DELAY,
+    DEFAULT_MAX_CONCURRENT_POLLS,
     DEFAULT_MIN_ACCURACY_THRESHOLD,
     DEFAULT_MOVEMENT_THRESHOLD,
     DEFAULT_GOOGLE_HOME_FILTER_ENABLED,
@@ -766,6 +768,10 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
             dat.get(OPT_LOCATION_POLL_INTERVAL, DEFAULT_LOCATION_POLL_INTERVAL),
         )
         current_delay = opt.get(OPT_DEVICE_POLL_DELAY, dat.get(OPT_DEVICE_POLL_DELAY, DEFAULT_DEVICE_POLL_DELAY))
+        current_concurrency = opt.get(
+            OPT_MAX_CONCURRENT_POLLS,
+            dat.get(OPT_MAX_CONCURRENT_POLLS, DEFAULT_MAX_CONCURRENT_POLLS),
+        )
         current_min_acc = opt.get(
             OPT_MIN_ACCURACY_THRESHOLD,
             dat.get(OPT_MIN_ACCURACY_THRESHOLD, DEFAULT_MIN_ACCURACY_THRESHOLD),
@@ -790,6 +796,7 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
             {
                 vol.Optional(OPT_LOCATION_POLL_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
                 vol.Optional(OPT_DEVICE_POLL_DELAY): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                vol.Optional(OPT_MAX_CONCURRENT_POLLS): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
                 vol.Optional(OPT_MIN_ACCURACY_THRESHOLD): vol.All(vol.Coerce(int), vol.Range(min=25, max=500)),
                 vol.Optional(OPT_MOVEMENT_THRESHOLD): vol.All(vol.Coerce(int), vol.Range(min=10, max=200)),
                 vol.Optional(OPT_GOOGLE_HOME_FILTER_ENABLED): bool,
@@ -803,6 +810,7 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
             new_options = {
                 OPT_LOCATION_POLL_INTERVAL: user_input.get(OPT_LOCATION_POLL_INTERVAL, current_interval),
                 OPT_DEVICE_POLL_DELAY: user_input.get(OPT_DEVICE_POLL_DELAY, current_delay),
+                OPT_MAX_CONCURRENT_POLLS: user_input.get(OPT_MAX_CONCURRENT_POLLS, current_concurrency),
                 OPT_MIN_ACCURACY_THRESHOLD: user_input.get(OPT_MIN_ACCURACY_THRESHOLD, current_min_acc),
                 OPT_MOVEMENT_THRESHOLD: user_input.get(OPT_MOVEMENT_THRESHOLD, current_move_thr),
                 OPT_GOOGLE_HOME_FILTER_ENABLED: user_input.get(OPT_GOOGLE_HOME_FILTER_ENABLED, current_gh_enabled),
@@ -817,6 +825,7 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
         suggested_values = {
             OPT_LOCATION_POLL_INTERVAL: current_interval,
             OPT_DEVICE_POLL_DELAY: current_delay,
+            OPT_MAX_CONCURRENT_POLLS: current_concurrency,
             OPT_MIN_ACCURACY_THRESHOLD: current_min_acc,
             OPT_MOVEMENT_THRESHOLD: current_move_thr,
             OPT_GOOGLE_HOME_FILTER_ENABLED: current_gh_enabled,
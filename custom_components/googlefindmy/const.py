@@ -30,6 +30,7 @@ DATA_AUTH_METHOD: str = "auth_method"          # "secrets_json" | "individual_to
 # (tracked_devices removed in Step 2; device inclusion is managed via HA device enable/disable)
 OPT_LOCATION_POLL_INTERVAL: str = "location_poll_interval"
 OPT_DEVICE_POLL_DELAY: str = "device_poll_delay"
+OPT_MAX_CONCURRENT_POLLS: str = "max_concurrent_polls"
 OPT_MIN_POLL_INTERVAL: str = "min_poll_interval"
 OPT_MIN_ACCURACY_THRESHOLD: str = "min_accuracy_threshold"
 OPT_MOVEMENT_THRESHOLD: str = "movement_threshold"
@@ -45,6 +46,7 @@ OPTION_KEYS: tuple[str, ...] = (
     OPT_IGNORED_DEVICES,
     OPT_LOCATION_POLL_INTERVAL,
     OPT_DEVICE_POLL_DELAY,
+    OPT_MAX_CONCURRENT_POLLS,
     OPT_MIN_POLL_INTERVAL,
     OPT_MIN_ACCURACY_THRESHOLD,
     OPT_MOVEMENT_THRESHOLD,
@@ -66,6 +68,7 @@ UPDATE_INTERVAL: int = 60  # seconds; DataUpdateCoordinator "tick" (lightweight)
 # Polling cadence
 DEFAULT_LOCATION_POLL_INTERVAL: int = 300  # seconds; start a new polling cycle
 DEFAULT_DEVICE_POLL_DELAY: int = 5         # seconds; inter-device delay within one cycle
+DEFAULT_MAX_CONCURRENT_POLLS: int = 1      # location requests in flight per cycle (1 => sequential)
 DEFAULT_MIN_POLL_INTERVAL: int = 60        # seconds; hard lower bound between cycles
 
 # Manual locate policy (button/service)
@@ -96,6 +99,7 @@ DEFAULT_OPTIONS: dict[str, object] = {
     OPT_IGNORED_DEVICES: {},
     OPT_LOCATION_POLL_INTERVAL: DEFAULT_LOCATION_POLL_INTERVAL,
     OPT_DEVICE_POLL_DELAY: DEFAULT_DEVICE_POLL_DELAY,
+    OPT_MAX_CONCURRENT_POLLS: DEFAULT_MAX_CONCURRENT_POLLS,
     OPT_MIN_POLL_INTERVAL: DEFAULT_MIN_POLL_INTERVAL,
     OPT_MIN_ACCURACY_THRESHOLD: DEFAULT_MIN_ACCURACY_THRESHOLD,
     OPT_MOVEMENT_THRESHOLD: DEFAULT_MOVEMENT_THRESHOLD,
@@ -193,6 +197,12 @@ CONFIG_FIELDS: dict[str, dict[str, object]] = {
         "max": 60,
         "step": 1,
     },
+    OPT_MAX_CONCURRENT_POLLS: {
+        "type": "int",
+        "min": 1,
+        "max": 8,
+        "step": 1,
+    },
     OPT_MIN_POLL_INTERVAL: {
         "type": "int",
         "min": 30,
@@ -293,6 +303,7 @@ __all__ = [
     "OPT_IGNORED_DEVICES",
     "OPT_LOCATION_POLL_INTERVAL",
     "OPT_DEVICE_POLL_DELAY",
+    "OPT_MAX_CONCURRENT_POLLS",
     "OPT_MIN_POLL_INTERVAL",
     "OPT_MIN_ACCURACY_THRESHOLD",
     "OPT_MOVEMENT_THRESHOLD",
@@ -306,6 +317,7 @@ __all__ = [
     "UPDATE_INTERVAL",
     "DEFAULT_LOCATION_POLL_INTERVAL",
     "DEFAULT_DEVICE_POLL_DELAY",
+    "DEFAULT_MAX_CONCURRENT_POLLS",
     "DEFAULT_MIN_POLL_INTERVAL",
     "LOCATE_COOLDOWN_S",
     "DEFAULT_MIN_ACCURACY_THRESHOLD",
@@ -5,10 +5,11 @@ Discovery vs. polling semantics:
 - Every coordinator tick fetches the lightweight **full** Google device list.
 - Presence and name/capability caches are updated for all devices.
 - The published snapshot (`self.data`) contains **all** devices (for dynamic entity creation).
-- The sequential **polling cycle** polls **only devices that are enabled** in Home Assistant's
+- The **polling cycle** polls **only devices that are enabled** in Home Assistant's
   Device Registry (devices with `disabled_by is None`) for **this** config entry. Devices explicitly
   ignored via options are filtered out as well. Devices without a Device Registry entry yet are
-  included to allow initial discovery.
+  included to allow initial discovery. Devices are polled one after another by default, or
+  with a bounded number of requests in flight (`max_concurrent_polls`).
 
 Google Home semantic locations (note):
 - When the Google Home filter identifies a "Google Home-like" semantic location,
@@ -64,6 +65,7 @@ from .const import (
     UPDATE_INTERVAL,
     LOCATION_REQUEST_TIMEOUT_S,
     DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_POLLS,
     OPT_IGNORED_DEVICES,
     DEFAULT_OPTIONS,
     coerce_ignored_mapping,
@@ -185,6 +187,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         *,
         location_poll_interval: int = 300,
         device_poll_delay: int = 5,
+        max_concurrent_polls: int = DEFAULT_MAX_CONCURRENT_POLLS,
         min_poll_interval: int = DEFAULT_MIN_POLL_INTERVAL,
         min_accuracy_threshold: int = 100,
         movement_threshold: int = 50,
@@ -204,6 +207,8 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             cache: An object implementing the CacheProtocol for persistent storage.
             location_poll_interval: The interval in seconds between polling cycles.
             device_poll_delay: The delay in seconds between polling individual devices.
+            max_concurrent_polls: The number of location requests in flight during a cycle
+                (1 polls devices sequentially).
             min_poll_interval: The minimum allowed interval between polling cycles.
             min_accuracy_threshold: The minimum GPS accuracy in meters to accept a location.
             movement_threshold: Movement delta in meters for significance gating (default 50 m).
@@ -219,6 +224,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         # Configuration (user options; updated via update_settings())
         self.location_poll_interval = int(location_poll_interval)
         self.device_poll_delay = int(device_poll_delay)
+        self.max_concurrent_polls = max(1, int(max_concurrent_polls))
         self.min_poll_interval = int(min_poll_interval)  # hard lower bound between cycles
         self._min_accuracy_threshold = int(min_accuracy_threshold)  # quality filter (meters)
         self._movement_threshold = int(movement_threshold)  # meters; used by significance gate
@@ -271,7 +277,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         # Statistics (extend as needed)
         self.stats: Dict[str, int] = {
             "background_updates": 0,  # FCM/push-driven updates + manual commits
-            "polled_updates": 0,      # sequential poll-driven updates
+            "polled_updates": 0,      # poll-driven updates
             "crowd_sourced_updates": 0,
             "history_fallback_used": 0,
             "timeouts": 0,
@@ -721,7 +727,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             return None
 
     def get_last_poll_duration_seconds(self) -> Optional[float]:
-        """Duration of the most recent sequential polling cycle (if recorded)."""
+        """Duration of the most recent polling cycle (if recorded)."""
         return self._get_duration("last_poll_start_mono", "last_poll_end_mono")
 
     def get_recent_errors(self) -> List[Dict[str, Any]]:
@@ -817,7 +823,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         - Always fetch the **full** lightweight device list (no executor).
         - Update presence and metadata caches for **all** devices.
         - The published snapshot (`self.data`) contains **all** devices (for dynamic entity creation).
-        - The sequential **polling cycle** polls devices that are enabled in HA's Device Registry
+        - The **polling cycle** polls devices that are enabled in HA's Device Registry
           **for this config entry** and not explicitly ignored in integration options.
 
         Returns:
@@ -971,17 +977,28 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
 
     # ---------------------------- Polling Cycle -----------------------------
     async def _async_start_poll_cycle(self, devices: List[Dict[str, Any]]) -> None:
-        """Run a full sequential polling cycle in a background task.
+        """Run a full polling cycle in a background task.
 
         This runs with a lock to avoid overlapping cycles, updates the
         internal cache, and pushes snapshots at start and end.
 
+        Concurrency:
+        - With `max_concurrent_polls == 1` (default) devices are polled one after
+          another, waiting `device_poll_delay` seconds between requests.
+        - With a higher limit, up to that many location requests are in flight at
+          once. Each request slot still waits `device_poll_delay` between its own
+          requests, so the request rate scales with the limit and one slow device
+          no longer holds back the rest of the cycle. Every device's result is
+          pushed to entities as soon as it arrives.
+
         Throttling awareness:
         - If a device returns a crowdsourced location with `_report_hint` equal to
           "in_all_areas" (~10 min throttle) or "high_traffic" (~5 min throttle),
           we apply a per-device cooldown so subsequent polls avoid the throttled window.
           (See POPETS'25 for measured behaviour.)
         - The cooldown is at least the server minimum and at least one user poll interval.
+        - Cooldowns are re-checked right before each request, so a cooldown applied
+          while the cycle runs (e.g. by a push update or a manual locate) is respected.
 
         Args:
             devices: A list of device dictionaries to poll.
@@ -1007,174 +1024,34 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
 
             self._is_polling = True
             self.safe_update_metric("last_poll_start_mono", time.monotonic())
-            _LOGGER.debug("Starting sequential poll of %d devices", len(devices))
+            limit = max(1, min(self.max_concurrent_polls, len(devices)))
+            _LOGGER.debug(
+                "Starting poll of %d devices (%d request(s) in flight)", len(devices), limit
+            )
 
             try:
-                for idx, dev in enumerate(devices):
-                    dev_id = dev["id"]
-                    dev_name = dev.get("name", dev_id)
-                    _LOGGER.debug(
-                        "Sequential poll: requesting location for %s (%d/%d)",
-                        dev_name,
-                        idx + 1,
-                        len(devices),
-                    )
-
+                pending = deque(enumerate(devices))
+
+                async def _poll_worker() -> None:
+                    """Poll queued devices one at a time, pacing this request slot."""
+                    while pending:
+                        idx, dev = pending.popleft()
+                        requested = await self._async_poll_device(dev, idx, len(devices))
+                        # Inter-request delay (except after the last device)
+                        if requested and pending and self.device_poll_delay > 0:
+                            await asyncio.sleep(self.device_poll_delay)
+
+                if limit == 1:
+                    await _poll_worker()
+                else:
+                    workers = [asyncio.create_task(_poll_worker()) for _ in range(limit)]
                     try:
-                        # Protect API awaitable with timeout
-                        location = await asyncio.wait_for(
-                            self.api.async_get_device_location(dev_id, dev_name),
-                            timeout=LOCATION_REQUEST_TIMEOUT_S,
-                        )
-
-                        if not location:
-                            _LOGGER.info("No location data available for %s (device may be out of range or offline)", dev_name)
-                            continue
-
-                        # --- Apply Google Home filter (keep parity with FCM push path) ---
-                        # Consume coordinate substitution from the filter when needed.
-                        semantic_name = location.get("semantic_name")
-                        if semantic_name and hasattr(self, "google_home_filter"):
-                            try:
-                                should_filter, replacement_attrs = self.google_home_filter.should_filter_detection(
-                                    dev_id, semantic_name
-                                )
-                            except Exception as gf_err:
-                                _LOGGER.debug(
-                                    "Google Home filter error for %s: %s", dev_name, gf_err
-                                )
-                            else:
-                                if should_filter:
-                                    _LOGGER.debug(
-                                        "Filtering out Google Home spam detection for %s", dev_name
-                                    )
-                                    continue
-                                if replacement_attrs:
-                                    _LOGGER.info(
-                                        "Google Home filter: %s detected at '%s', substituting with Home coordinates",
-                                        dev_name,
-                                        semantic_name,
-                                    )
-                                    location = dict(location)
-                                    # Update coordinates and derive accuracy from radius (if present).
-                                    if "latitude" in replacement_attrs and "longitude" in replacement_attrs:
-                                        location["latitude"] = replacement_attrs.get("latitude")
-                                        location["longitude"] = replacement_attrs.get("longitude")
-                                    if "radius" in replacement_attrs and replacement_attrs.get("radius") is not None:
-                                        location["accuracy"] = replacement_attrs.get("radius")
-                                    # Clear semantic name so HA Core's zone engine determines the final state.
-                                    location["semantic_name"] = None
-                        # ------------------------------------------------------------------
-
-                        # If we only got a semantic location, preserve previous coordinates.
-                        if (location.get("latitude") is None or location.get("longitude") is None) and location.get("semantic_name"):
-                            prev = self._device_location_data.get(dev_id, {})
-                            if prev:
-                                location["latitude"] = prev.get("latitude")
-                                location["longitude"] = prev.get("longitude")
-                                location["accuracy"] = prev.get("accuracy")
-                                location["status"] = (
-                                    "Semantic location; preserving previous coordinates"
-                                )
-
-                        # Validate/normalize coordinates (and accuracy if present).
-                        if not self._normalize_coords(location, device_label=dev_name):
-                            if not location.get("semantic_name"):
-                                _LOGGER.debug(
-                                    "No location data (coordinates or semantic name) available for %s in this update.",
-                                    dev_name,
-                                )
-                            # Nothing to commit/update in cache
-                            # Strip any internal hint before dropping to avoid accidental exposure
-                            location.pop("_report_hint", None)
-                            continue
-
-                        # Accuracy quality filter
-                        acc = location.get("accuracy")
-                        if (
-                            isinstance(self._min_accuracy_threshold, int)
-                            and self._min_accuracy_threshold > 0
-                            and isinstance(acc, (int, float))
-                            and acc > self._min_accuracy_threshold
-                        ):
-                            _LOGGER.debug(
-                                "Dropping low-quality fix for %s (accuracy=%sm > %sm)",
-                                dev_name,
-                                acc,
-                                self._min_accuracy_threshold,
-                            )
-                            self.increment_stat("low_quality_dropped")
-                            # Strip any internal hint before dropping to avoid accidental exposure
-                            location.pop("_report_hint", None)
-                            continue
-
-                        # Significance gate (replaces naive duplicate check)
-                        last_seen = location.get("last_seen", 0)
-                        if not self._is_significant_update(dev_id, location):
-                            _LOGGER.debug(
-                                "Skipping non-significant update for %s (last_seen=%s)",
-                                dev_name,
-                                last_seen,
-                            )
-                            self.increment_stat("non_significant_dropped")
-                            # Strip internal hint before dropping to avoid accidental exposure
-                            location.pop("_report_hint", None)
-                            continue
-
-                        # Age diagnostics (informational)
-                        wall_now = time.time()
-                        if last_seen:
-                            age_hours = max(0.0, (wall_now - float(last_seen)) / 3600.0)
-                            if age_hours > 24:
-                                _LOGGER.info(
-                                    "Using old location data for %s (age=%.1fh)",
-                                    dev_name,
-                                    age_hours,
-                                )
-                            elif age_hours > 1:
-                                _LOGGER.debug(
-                                    "Using location data for %s (age=%.1fh)",
-                                    dev_name,
-                                    age_hours,
-                                )
-
-                        # Apply type-aware cooldowns based on internal hint (if any).
-                        report_hint = location.get("_report_hint")
-                        self._apply_report_type_cooldown(dev_id, report_hint)
-
-                        # Track crowd-sourced updates when hint is present
-                        if report_hint:
-                            self.increment_stat("crowd_sourced_updates")
-
-                        # Ensure we don't leak the internal hint into public snapshots/entities.
-                        location.pop("_report_hint", None)
-
-                        # Commit to cache and bump statistics
-                        location["last_updated"] = wall_now  # wall-clock for UX
-                        self._device_location_data[dev_id] = location
-                        self.increment_stat("polled_updates")
-
-                        # Immediate per-device update for more responsive UI during long poll cycles.
-                        self.push_updated([dev_id])
-
-                    except asyncio.TimeoutError as terr:
-                        _LOGGER.info(
-                            "Location request timed out for %s after %s seconds",
-                            dev_name,
-                            LOCATION_REQUEST_TIMEOUT_S,
-                        )
-                        self.increment_stat("timeouts")
-                        self.note_error(terr, where="poll_timeout", device=dev_name)
-                    except ConfigEntryAuthFailed:
-                        # Escalate auth failures to HA; abort remaining devices
-                        raise
-                    except Exception as err:
-                        _LOGGER.error("Failed to get location for %s: %s", dev_name, err)
-                        self.note_error(err, where="poll_exception", device=dev_name)
-
-                    # Inter-device delay (except after the last one)
-                    if idx < len(devices) - 1 and self.device_poll_delay > 0:
-                        await asyncio.sleep(self.device_poll_delay)
+                        # Auth failures abort the cycle; the other workers are cancelled below.
+                        await asyncio.gather(*workers)
+                    finally:
+                        for worker in workers:
+                            worker.cancel()
+                        await asyncio.gather(*workers, return_exceptions=True)
 
                 _LOGGER.debug("Completed polling cycle for %d devices", len(devices))
             finally:
@@ -1187,6 +1064,201 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                 )
                 self.async_set_updated_data(end_snapshot)
 
+    async def _async_poll_device(self, dev: Dict[str, Any], idx: int, total: int) -> bool:
+        """Request, filter and commit the location of one device within a poll cycle.
+
+        The result is committed to the cache and pushed to entities immediately.
+        Errors other than auth failures are recorded and swallowed so that one
+        device cannot abort the cycle for the others.
+
+        Args:
+            dev: The device dictionary (id, name) to poll.
+            idx: The position of the device in the cycle (for logging).
+            total: The number of devices in the cycle (for logging).
+
+        Returns:
+            True if a location request was sent, False if the device was skipped
+            because of an active poll cooldown.
+
+        Raises:
+            ConfigEntryAuthFailed: If the API reports invalid credentials.
+        """
+        dev_id = dev["id"]
+        dev_name = dev.get("name", dev_id)
+
+        # A cooldown may have been applied after the cycle was scheduled.
+        cooldown_left = self._device_poll_cooldown_until.get(dev_id, 0.0) - time.monotonic()
+        if cooldown_left > 0:
+            _LOGGER.debug(
+                "Skipping poll for %s (%d/%d): cooldown active for another %.0fs",
+                dev_name,
+                idx + 1,
+                total,
+                cooldown_left,
+            )
+            return False
+
+        _LOGGER.debug(
+            "Poll: requesting location for %s (%d/%d)",
+            dev_name,
+            idx + 1,
+            total,
+        )
+
+        try:
+            # Protect API awaitable with timeout
+            location = await asyncio.wait_for(
+                self.api.async_get_device_location(dev_id, dev_name),
+                timeout=LOCATION_REQUEST_TIMEOUT_S,
+            )
+
+            if not location:
+                _LOGGER.info("No location data available for %s (device may be out of range or offline)", dev_name)
+                return True
+
+            # --- Apply Google Home filter (keep parity with FCM push path) ---
+            # Consume coordinate substitution from the filter when needed.
+            semantic_name = location.get("semantic_name")
+            if semantic_name and hasattr(self, "google_home_filter"):
+                try:
+                    should_filter, replacement_attrs = self.google_home_filter.should_filter_detection(
+                        dev_id, semantic_name
+                    )
+                except Exception as gf_err:
+                    _LOGGER.debug(
+                        "Google Home filter error for %s: %s", dev_name, gf_err
+                    )
+                else:
+                    if should_filter:
+                        _LOGGER.debug(
+                            "Filtering out Google Home spam detection for %s", dev_name
+                        )
+                        return True
+                    if replacement_attrs:
+                        _LOGGER.info(
+                            "Google Home filter: %s detected at '%s', substituting with Home coordinates",
+                            dev_name,
+                            semantic_name,
+                        )
+                        location = dict(location)
+                        # Update coordinates and derive accuracy from radius (if present).
+                        if "latitude" in replacement_attrs and "longitude" in replacement_attrs:
+                            location["latitude"] = replacement_attrs.get("latitude")
+                            location["longitude"] = replacement_attrs.get("longitude")
+                        if "radius" in replacement_attrs and replacement_attrs.get("radius") is not None:
+                            location["accuracy"] = replacement_attrs.get("radius")
+                        # Clear semantic name so HA Core's zone engine determines the final state.
+                        location["semantic_name"] = None
+            # ------------------------------------------------------------------
+
+            # If we only got a semantic location, preserve previous coordinates.
+            if (location.get("latitude") is None or location.get("longitude") is None) and location.get("semantic_name"):
+                prev = self._device_location_data.get(dev_id, {})
+                if prev:
+                    location["latitude"] = prev.get("latitude")
+                    location["longitude"] = prev.get("longitude")
+                    location["accuracy"] = prev.get("accuracy")
+                    location["status"] = (
+                        "Semantic location; preserving previous coordinates"
+                    )
+
+            # Validate/normalize coordinates (and accuracy if present).
+            if not self._normalize_coords(location, device_label=dev_name):
+                if not location.get("semantic_name"):
+                    _LOGGER.debug(
+                        "No location data (coordinates or semantic name) available for %s in this update.",
+                        dev_name,
+                    )
+                # Nothing to commit/update in cache
+                # Strip any internal hint before dropping to avoid accidental exposure
+                location.pop("_report_hint", None)
+                return True
+
+            # Accuracy quality filter
+            acc = location.get("accuracy")
+            if (
+                isinstance(self._min_accuracy_threshold, int)
+                and self._min_accuracy_threshold > 0
+                and isinstance(acc, (int, float))
+                and acc > self._min_accuracy_threshold
+            ):
+                _LOGGER.debug(
+                    "Dropping low-quality fix for %s (accuracy=%sm > %sm)",
+                    dev_name,
+                    acc,
+                    self._min_accuracy_threshold,
+                )
+                self.increment_stat("low_quality_dropped")
+                # Strip any internal hint before dropping to avoid accidental exposure
+                location.pop("_report_hint", None)
+                return True
+
+            # Significance gate (replaces naive duplicate check)
+            last_seen = location.get("last_seen", 0)
+            if not self._is_significant_update(dev_id, location):
+                _LOGGER.debug(
+                    "Skipping non-significant update for %s (last_seen=%s)",
+                    dev_name,
+                    last_seen,
+                )
+                self.increment_stat("non_significant_dropped")
+                # Strip internal hint before dropping to avoid accidental exposure
+                location.pop("_report_hint", None)
+                return True
+
+            # Age diagnostics (informational)
+            wall_now = time.time()
+            if last_seen:
+                age_hours = max(0.0, (wall_now - float(last_seen)) / 3600.0)
+                if age_hours > 24:
+                    _LOGGER.info(
+                        "Using old location data for %s (age=%.1fh)",
+                        dev_name,
+                        age_hours,
+                    )
+                elif age_hours > 1:
+                    _LOGGER.debug(
+                        "Using location data for %s (age=%.1fh)",
+                        dev_name,
+                        age_hours,
+                    )
+
+            # Apply type-aware cooldowns based on internal hint (if any).
+            report_hint = location.get("_report_hint")
+            self._apply_report_type_cooldown(dev_id, report_hint)
+
+            # Track crowd-sourced updates when hint is present
+            if report_hint:
+                self.increment_stat("crowd_sourced_updates")
+
+            # Ensure we don't leak the internal hint into public snapshots/entities.
+            location.pop("_report_hint", None)
+
+            # Commit to cache and bump statistics
+            location["last_updated"] = wall_now  # wall-clock for UX
+            self._device_location_data[dev_id] = location
+            self.increment_stat("polled_updates")
+
+            # Immediate per-device update for more responsive UI during long poll cycles.
+            self.push_updated([dev_id])
+
+        except asyncio.TimeoutError as terr:
+            _LOGGER.info(
+                "Location request timed out for %s after %s seconds",
+                dev_name,
+                LOCATION_REQUEST_TIMEOUT_S,
+            )
+            self.increment_stat("timeouts")
+            self.note_error(terr, where="poll_timeout", device=dev_name)
+        except ConfigEntryAuthFailed:
+            # Escalate auth failures to HA; abort remaining devices
+            raise
+        except Exception as err:
+            _LOGGER.error("Failed to get location for %s: %s", dev_name, err)
+            self.note_error(err, where="poll_exception", device=dev_name)
+
+        return True
+
     # ---------------------------- Snapshot helpers --------------------------
     def _build_base_snapshot_entry(self, device_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Create the base snapshot entry for a device (no cache lookups here).
@@ -1320,15 +1392,28 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
 
             # Optional history fallback
             if self.allow_history_fallback:
-                _LOGGER.warning(
-                    "No live state for %s (entity_id=%s); attempting history fallback via Recorder.",
-                    entry["name"],
-                    entity_id,
-                )
-                rec = get_recorder(self.hass)
-                result = await rec.async_add_executor_job(
-                    _sync_get_last_gps_from_history, self.hass, entity_id
-                )
+                # In-memory location history first (no DB round-trip), then Recorder.
+                result = None
+                location_recorder = getattr(self, "location_recorder", None)
+                fix = location_recorder.get_last_fix(entity_id) if location_recorder else None
+                if fix:
+                    result = {
+                        "latitude": fix["latitude"],
+                        "longitude": fix["longitude"],
+                        "accuracy": fix["accuracy"],
+                        "last_seen": int(fix["timestamp"]),
+                        "status": "Using historical data",
+                    }
+                else:
+                    _LOGGER.warning(
+                        "No live state for %s (entity_id=%s); attempting history fallback via Recorder.",
+                        entry["name"],
+                        entity_id,
+                    )
+                    rec = get_recorder(self.hass)
+                    result = await rec.async_add_executor_job(
+                        _sync_get_last_gps_from_history, self.hass, entity_id
+                    )
                 if result:
                     entry.update(result)
                     self.increment_stat("history_fallback_used")
@@ -1867,7 +1952,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
 
         Gate conditions:
           - push transport ready,
-          - no sequential polling in progress,
+          - no polling cycle in progress,
           - no in-flight locate for the device,
           - per-device cooldown (lower-bounded by DEFAULT_MIN_POLL_INTERVAL) not active.
         """
@@ -1896,6 +1981,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         ignored_devices: Optional[List[str]] = None,
         location_poll_interval: Optional[int] = None,
         device_poll_delay: Optional[int] = None,
+        max_concurrent_polls: Optional[int] = None,
         min_poll_interval: Optional[int] = None,
         min_accuracy_threshold: Optional[int] = None,
         movement_threshold: Optional[int] = None,
@@ -1910,6 +1996,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             ignored_devices: A list of device IDs to hide from snapshots/polling.
             location_poll_interval: The interval in seconds for location polling.
             device_poll_delay: The delay in seconds between polling devices.
+            max_concurrent_polls: The number of location requests in flight during a cycle.
             min_poll_interval: The minimum polling interval in seconds.
             min_accuracy_threshold: The minimum accuracy in meters.
             movement_threshold: The spatial delta (meters) required to treat updates as significant.
@@ -1933,6 +2020,12 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             except (TypeError, ValueError):
                 _LOGGER.warning("Ignoring invalid device_poll_delay=%r", device_poll_delay)
 
+        if max_concurrent_polls is not None:
+            try:
+                self.max_concurrent_polls = max(1, int(max_concurrent_polls))
+            except (TypeError, ValueError):
+                _LOGGER.warning("Ignoring invalid max_concurrent_polls=%r", max_concurrent_polls)
+
         if min_poll_interval is not None:
             try:
                 self.min_poll_interval = max(1, int(min_poll_interval))
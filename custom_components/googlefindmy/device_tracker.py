@@ -203,6 +203,15 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
 
             self.async_write_ha_state()
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and add the written fix to the in-memory location history."""
+        super().async_write_ha_state()
+        recorder = getattr(self.coordinator, "location_recorder", None)
+        if recorder is not None and self.hass is not None:
+            # Same State object the recorder will persist; unchanged writes are skipped.
+            recorder.async_record_state(self.hass.states.get(self.entity_id))
+
     # ---------------- Device Info + Map Link ----------------
     @property
     def device_info(self) -> DeviceInfo:
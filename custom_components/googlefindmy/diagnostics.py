@@ -30,6 +30,7 @@ from .const import (
     # user-facing options (non-secret)
     OPT_LOCATION_POLL_INTERVAL,
     OPT_DEVICE_POLL_DELAY,
+    OPT_MAX_CONCURRENT_POLLS,
     OPT_MIN_ACCURACY_THRESHOLD,
     OPT_MOVEMENT_THRESHOLD,
     OPT_GOOGLE_HOME_FILTER_ENABLED,
@@ -329,6 +330,7 @@ async def async_get_config_entry_diagnostics(
         # Durations and numeric thresholds
         "location_poll_interval": _coerce_pos_int(opt.get(OPT_LOCATION_POLL_INTERVAL, 300), 300),
         "device_poll_delay": _coerce_pos_int(opt.get(OPT_DEVICE_POLL_DELAY, 5), 5),
+        "max_concurrent_polls": _coerce_pos_int(opt.get(OPT_MAX_CONCURRENT_POLLS, 1), 1),
         "min_accuracy_threshold": _coerce_pos_int(opt.get(OPT_MIN_ACCURACY_THRESHOLD, 100), 100),
         "movement_threshold": _coerce_pos_int(opt.get(OPT_MOVEMENT_THRESHOLD, 50), 50),
         # Feature toggles
@@ -409,6 +411,14 @@ async def async_get_config_entry_diagnostics(
         if recent_errors:
             coordinator_block["recent_errors"] = recent_errors
 
+        # In-memory location history: counters only (no entity ids or coordinates)
+        location_recorder = getattr(coordinator, "location_recorder", None)
+        if location_recorder is not None:
+            try:
+                coordinator_block["location_history"] = location_recorder.stats()
+            except (AttributeError, TypeError):
+                pass
+
     # Concurrency & FCM receiver (global, not per-entry)
     concurrency = _concurrency_block(hass)
     fcm_state = _fcm_receiver_state(hass)
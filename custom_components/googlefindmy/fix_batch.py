@@ -0,0 +1,189 @@
+# custom_components/googlefindmy/fix_batch.py
+"""Best-fix selection over decrypted location reports.
+
+A crowdsourced response can carry dozens of reports per device. The decoder
+selects one fix per device from them; this module does that in one pass over
+the reports of all devices, keeping only the best-ranked fix per device instead
+of normalizing and sorting every report:
+
+- **Best fix per device**: ranking is the decoder's: has coordinates → newer
+  `last_seen` → better accuracy → own report.
+- **Semantic merge**: a best fix without `semantic_name` takes the label of the
+  semantic report closest in time (within a small tolerance).
+
+No Home Assistant imports: used by the protobuf decoder.
+
+Public API (stable)
+-------------------
+- `normalize_fix(loc) -> dict`
+- `FixBatch()`: `add(device, fix)`, `extend(device, fixes)`, `best()`
+- `merge_semantic_label(best, label_times, labels) -> dict`
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Semantic merge tolerance (seconds), see `FixBatch.best`.
+SEMANTIC_MERGE_TOLERANCE_S = 5.0
+
+_NUMERIC_KEYS = ("latitude", "longitude", "accuracy", "last_seen", "altitude")
+
+# Rank tuple: (has_coords, last_seen, -accuracy, is_own); higher is better.
+_Rank = Tuple[int, float, float, int]
+
+
+# ---------------------------------------------------------------------------
+# Fix selection
+# ---------------------------------------------------------------------------
+def normalize_fix(loc: Mapping[str, Any]) -> Dict[str, Any]:
+    """Coerce numeric fields to floats (when present) and drop NaN/Inf.
+
+    Returns a shallow copy. Unknown keys are preserved (e.g., `_report_hint`).
+    """
+    out = dict(loc)
+    for num_key in _NUMERIC_KEYS:
+        val = out.get(num_key)
+        if val is None:
+            continue
+        try:
+            f = float(val)
+        except (TypeError, ValueError):
+            out.pop(num_key, None)
+            continue
+        if math.isfinite(f):
+            out[num_key] = f
+        else:
+            out.pop(num_key, None)
+    return out
+
+
+def _finite(value: Any) -> Optional[float]:
+    """Return value as a finite float, or None (as `normalize_fix` would drop it)."""
+    if value is None:
+        return None
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        return None
+    return f if f - f == 0.0 else None  # NaN and ±Inf give NaN here
+
+
+class FixBatch:
+    """Collect fixes for many devices and select one per device in a single pass.
+
+    Per device, the batch keeps the best-ranked fix seen so far; semantic labels
+    are kept aside for the merge in `best()`. Ranks are computed from the raw
+    fields; only fixes that are returned get normalized (copied).
+    """
+
+    __slots__ = ("_best", "_labels", "added")
+
+    def __init__(self) -> None:
+        # device -> (rank, fix)
+        self._best: Dict[Hashable, Tuple[_Rank, Mapping[str, Any]]] = {}
+        # device -> (last_seen column, label list)
+        self._labels: Dict[Hashable, Tuple[array, List[str]]] = {}
+        self.added = 0
+
+    def add(self, device: Hashable, fix: Optional[Mapping[str, Any]]) -> None:
+        """Add one fix for device."""
+        self.extend(device, (fix,))
+
+    def extend(self, device: Hashable, fixes: Iterable[Optional[Mapping[str, Any]]]) -> None:
+        """Add several fixes for device."""
+        kept = self._best.get(device)
+        count = 0
+        for fix in fixes:
+            count += 1
+            if not fix:
+                fix = {}
+            get = fix.get
+            # Decrypted payloads carry floats/ints; only other types take the slow path.
+            lat = get("latitude")
+            if lat is not None and (lat.__class__ is not float or lat - lat):
+                lat = _finite(lat)
+            lon = get("longitude")
+            if lon is not None and (lon.__class__ is not float or lon - lon):
+                lon = _finite(lon)
+            seen = get("last_seen")
+            seen = _finite(seen) or 0.0 if seen.__class__ is not int else float(seen)
+            acc = get("accuracy")
+            if acc is not None and acc.__class__ is not int and (acc.__class__ is not float or acc - acc):
+                acc = _finite(acc)
+            rank = (
+                1 if lat is not None and lon is not None else 0,
+                seen,
+                -acc if acc is not None else -math.inf,
+                1 if get("is_own_report") else 0,
+            )
+
+            label = get("semantic_name")
+            if label and seen > 0:
+                column = self._labels.get(device)
+                if column is None:
+                    column = self._labels[device] = (array("d"), [])
+                column[0].append(seen)
+                column[1].append(str(label))
+
+            if kept is None or rank > kept[0]:
+                kept = (rank, fix)
+
+        if kept is not None:
+            self._best[device] = kept
+        self.added += count
+
+    def best(
+        self,
+        *,
+        merge_semantics: bool = True,
+        tolerance_s: float = SEMANTIC_MERGE_TOLERANCE_S,
+    ) -> Dict[Hashable, Dict[str, Any]]:
+        """Return the best fix per device (normalized), with semantic labels merged.
+
+        A best fix without `semantic_name` takes the label of the semantic report
+        whose timestamp is closest to its own, if within `tolerance_s` (a precise
+        GPS fix and a "Home" report of the same sighting).
+        """
+        out: Dict[Hashable, Dict[str, Any]] = {}
+        for device, (_, fix) in self._best.items():
+            best = normalize_fix(fix)
+            column = self._labels.get(device)
+            if merge_semantics and column is not None:
+                best = merge_semantic_label(best, *column, tolerance_s=tolerance_s)
+            out[device] = best
+        return out
+
+
+def merge_semantic_label(
+    best: Mapping[str, Any],
+    label_times: Sequence[float],
+    labels: Sequence[str],
+    *,
+    tolerance_s: float = SEMANTIC_MERGE_TOLERANCE_S,
+) -> Dict[str, Any]:
+    """Return a copy of best with the label closest in time, if it has none.
+
+    Only labels whose timestamp is within `tolerance_s` of `best["last_seen"]`
+    are considered; the smallest time delta wins.
+    """
+    out = dict(best)
+    if out.get("semantic_name"):
+        return out
+    try:
+        t_best = float(out.get("last_seen") or 0.0)
+    except (TypeError, ValueError):
+        t_best = 0.0
+    if t_best <= 0:
+        return out
+    label = None
+    min_delta = math.inf
+    for t, candidate in zip(label_times, labels):
+        delta = abs(t - t_best)
+        if delta <= tolerance_s and delta < min_delta:
+            label, min_delta = candidate, delta
+    if label:
+        out["semantic_name"] = label
+    return out
@@ -1,23 +1,346 @@
-"""Location history using Home Assistant's recorder properly."""
+"""Location history for Google Find My Device trackers.
+
+Recent fixes are kept in memory in a fixed-size ring buffer per tracker entity,
+filled from the entity's own state writes and seeded once from Home Assistant's
+recorder at startup. History lookups, best-location scoring, the map view and
+the coordinator's history fallback read from the buffers; the recorder is only
+queried for time ranges older than what a buffer covers.
+"""
 import logging
+import math
+import sys
 import time
+from array import array
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
 from homeassistant.components.recorder import history, get_instance
+from homeassistant.helpers import entity_registry as er
 
 _LOGGER = logging.getLogger(__name__)
 
+# -------------------------------------------------------------------------
+# Memory bound: fixes kept per tracker entity. Each fix takes ~65 bytes
+# (six doubles, one byte, two shared string references), so a full buffer is
+# ~130 KB; at a 5 min poll interval plus push updates this spans several days.
+# -------------------------------------------------------------------------
+LOCATION_HISTORY_SIZE = 2048
+
+# Hours of recorder history loaded into the buffers at startup (the map view's
+# default range).
+LOCATION_HISTORY_SEED_HOURS = 7 * 24
+
+_NAN = float("nan")
+
+
+def _float_or_nan(value: Any) -> float:
+    """Return value as a float, or NaN if it's missing or not a number."""
+    if value is None:
+        return _NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _iso_to_ts(value: Any) -> float:
+    """Return an ISO timestamp string (as in the last_seen attribute) as epoch seconds, or NaN."""
+    if not value:
+        return _NAN
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except (TypeError, ValueError):
+        return _NAN
+
+
+class _FixRing:
+    """Fixed-size ring buffer of one entity's fixes, stored column-wise in arrays."""
+
+    __slots__ = (
+        "size", "head", "covered_since",
+        "ts", "lat", "lon", "acc", "alt", "last_seen", "own", "state", "semantic",
+    )
+
+    def __init__(self, size: int, covered_since: float):
+        self.size = size
+        # slot holding the oldest fix once the ring is full
+        self.head = 0
+        # fixes written since this time (epoch seconds) are all in the ring
+        self.covered_since = covered_since
+        self.ts = array("d")
+        self.lat = array("d")
+        self.lon = array("d")
+        self.acc = array("d")
+        self.alt = array("d")
+        self.last_seen = array("d")
+        self.own = array("b")  # -1 unknown, 0 crowdsourced, 1 own report
+        self.state: List[str] = []
+        self.semantic: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def newest_ts(self) -> float:
+        """Return the timestamp of the newest fix (or -inf if empty)."""
+        if not self.ts:
+            return -math.inf
+        return self.ts[(self.head - 1) % len(self.ts)]
+
+    def oldest_ts(self) -> float:
+        """Return the timestamp of the oldest fix (or inf if empty)."""
+        if not self.ts:
+            return math.inf
+        return self.ts[self.head]
+
+    def extend(self, other: "_FixRing") -> None:
+        """Append all fixes of other (which must all be newer), oldest first."""
+        columns = (
+            other.ts, other.lat, other.lon, other.acc, other.alt, other.last_seen, other.own,
+            other.state, other.semantic,
+        )
+        for slot in other.slots(-math.inf, math.inf):
+            self.append(*(column[slot] for column in columns))
+
+    def append(self, ts, lat, lon, acc, alt, last_seen, own, state, semantic) -> None:
+        """Add a fix newer than all others, overwriting the oldest one when full."""
+        if len(self.ts) < self.size:
+            self.ts.append(ts)
+            self.lat.append(lat)
+            self.lon.append(lon)
+            self.acc.append(acc)
+            self.alt.append(alt)
+            self.last_seen.append(last_seen)
+            self.own.append(own)
+            self.state.append(state)
+            self.semantic.append(semantic)
+            return
+        i = self.head
+        self.ts[i] = ts
+        self.lat[i] = lat
+        self.lon[i] = lon
+        self.acc[i] = acc
+        self.alt[i] = alt
+        self.last_seen[i] = last_seen
+        self.own[i] = own
+        self.state[i] = state
+        self.semantic[i] = semantic
+        self.head = (i + 1) % self.size
+        # the overwritten fix is gone, so only the remaining ones are covered
+        self.covered_since = self.ts[self.head]
+
+    def slots(self, start_ts: float, end_ts: float) -> List[int]:
+        """Return the slots of the fixes in [start_ts, end_ts], oldest first."""
+        count = len(self.ts)
+        head = self.head if count == self.size else 0
+        ts = self.ts
+        # binary search on the logical (time-ordered) positions
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if ts[(head + mid) % count] < start_ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        out = []
+        for pos in range(lo, count):
+            slot = (head + pos) % count
+            if ts[slot] > end_ts:
+                break
+            out.append(slot)
+        return out
+
+    def fix(self, slot: int) -> Dict[str, Any]:
+        """Return the fix in slot as a dict."""
+        own = self.own[slot]
+        acc = self.acc[slot]
+        alt = self.alt[slot]
+        last_seen = self.last_seen[slot]
+        return {
+            "timestamp": self.ts[slot],
+            "latitude": self.lat[slot],
+            "longitude": self.lon[slot],
+            "accuracy": None if math.isnan(acc) else acc,
+            "altitude": None if math.isnan(alt) else alt,
+            "last_seen": None if math.isnan(last_seen) else last_seen,
+            "is_own_report": None if own < 0 else bool(own),
+            "state": self.state[slot],
+            "semantic_location": self.semantic[slot],
+        }
+
+    def memory_bytes(self) -> int:
+        """Return the approximate memory used by the ring."""
+        arrays = (self.ts, self.lat, self.lon, self.acc, self.alt, self.last_seen, self.own)
+        return sum(a.buffer_info()[1] * a.itemsize for a in arrays) + sys.getsizeof(self.state) + sys.getsizeof(
+            self.semantic
+        )
+
+
 class LocationRecorder:
-    """Manage location history using Home Assistant's recorder properly."""
-    
-    def __init__(self, hass: HomeAssistant):
+    """Keep recent location history in memory, backed by Home Assistant's recorder."""
+
+    def __init__(self, hass: HomeAssistant, size: int = LOCATION_HISTORY_SIZE):
         """Initialize location recorder."""
         self.hass = hass
-        
+        self._size = max(1, int(size))
+        self._rings: Dict[str, _FixRing] = {}
+        # every state write since this time has been recorded; moved back by seeding
+        self._covered_since = time.time()
+
+    # ---------------------------- Buffer updates ----------------------------
+    @callback
+    def async_record_state(self, state: Optional[State]) -> None:
+        """Add a tracker state to its entity's buffer if it carries a new fix."""
+        if state is None:
+            return
+        attrs = state.attributes
+        lat = attrs.get(ATTR_LATITUDE)
+        lon = attrs.get(ATTR_LONGITUDE)
+        if lat is None or lon is None:
+            return
+        ring = self._rings.get(state.entity_id)
+        if ring is None:
+            ring = self._rings[state.entity_id] = _FixRing(self._size, self._covered_since)
+        ts = state.last_updated.timestamp()
+        if ts <= ring.newest_ts():
+            # same state written again (or out of order); already recorded
+            return
+        self._append(ring, ts, state)
+
+    @staticmethod
+    def _append(ring: _FixRing, ts: float, state: State) -> None:
+        attrs = state.attributes
+        own = attrs.get("is_own_report")
+        semantic = attrs.get("semantic_location")
+        ring.append(
+            ts,
+            _float_or_nan(attrs.get(ATTR_LATITUDE)),
+            _float_or_nan(attrs.get(ATTR_LONGITUDE)),
+            _float_or_nan(attrs.get("gps_accuracy", attrs.get("accuracy"))),
+            _float_or_nan(attrs.get("altitude")),
+            _iso_to_ts(attrs.get("last_seen")),
+            -1 if own is None else int(bool(own)),
+            sys.intern(str(state.state)),
+            sys.intern(semantic) if isinstance(semantic, str) else None,
+        )
+
+    async def async_seed(self, entry_id: str, hours: int = LOCATION_HISTORY_SEED_HOURS) -> None:
+        """Load the last hours of recorder history for the entry's trackers, once at startup."""
+        ent_reg = er.async_get(self.hass)
+        entity_ids = [
+            entity.entity_id
+            for entity in er.async_entries_for_config_entry(ent_reg, entry_id)
+            if entity.domain == "device_tracker"
+        ]
+        if not entity_ids:
+            return
+        try:
+            recorder_instance = get_instance(self.hass)
+            if not await recorder_instance.async_db_ready:
+                return
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(hours=hours)
+            history_list = await recorder_instance.async_add_executor_job(
+                history.get_significant_states,
+                self.hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,  # filters
+                True,  # include_start_time_state
+                True,  # significant_changes_only
+                False, # minimal_response
+                False  # no_attributes
+            )
+        except Exception as e:
+            _LOGGER.debug(f"Not seeding location history from recorder: {e}")
+            return
+
+        fixes = 0
+        for entity_id in entity_ids:
+            live = self._rings.get(entity_id)
+            first_live_ts = live.oldest_ts() if live else math.inf
+            ring = _FixRing(self._size, start_time.timestamp())
+            for state in history_list.get(entity_id, []):
+                attrs = state.attributes or {}
+                if attrs.get(ATTR_LATITUDE) is None or attrs.get(ATTR_LONGITUDE) is None:
+                    continue
+                ts = state.last_updated.timestamp()
+                # states written since startup are already in the live ring
+                if ts >= first_live_ts:
+                    break
+                if ts > ring.newest_ts():
+                    self._append(ring, ts, state)
+            if live:
+                ring.extend(live)
+            self._rings[entity_id] = ring
+            fixes += len(ring)
+        self._covered_since = min(self._covered_since, start_time.timestamp())
+        _LOGGER.debug(f"Seeded location history with {fixes} fixes for {len(entity_ids)} trackers")
+
+    @callback
+    def async_forget(self, entity_id: str) -> None:
+        """Drop the buffer of a removed entity."""
+        self._rings.pop(entity_id, None)
+
+    # ---------------------------- Buffer reads ------------------------------
+    def get_fixes(self, entity_id: str, start_ts: float, end_ts: float) -> Optional[List[Dict[str, Any]]]:
+        """Return the fixes of entity_id between two epoch times, oldest first.
+
+        Returns None if the entity has no buffer here or the buffer doesn't reach
+        back to start_ts; the caller should then query the recorder.
+        """
+        ring = self._rings.get(entity_id)
+        if ring is None or start_ts < ring.covered_since:
+            return None
+        return [ring.fix(slot) for slot in ring.slots(start_ts, end_ts)]
+
+    def get_last_fix(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Return the newest fix of entity_id, if any."""
+        ring = self._rings.get(entity_id)
+        if not ring:
+            return None
+        return ring.fix((ring.head - 1) % len(ring))
+
+    def memory_bytes(self) -> int:
+        """Return the approximate memory used by all buffers."""
+        return sum(ring.memory_bytes() for ring in self._rings.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Return buffer counters (no entity ids) for diagnostics."""
+        return {
+            "entities": len(self._rings),
+            "fixes": sum(len(ring) for ring in self._rings.values()),
+            "size_per_entity": self._size,
+            "memory_bytes": self.memory_bytes(),
+        }
+
+    # ---------------------------- History API -------------------------------
     async def get_location_history(self, entity_id: str, hours: int = 24) -> List[Dict[str, Any]]:
+        """Get location history for the last N hours, newest first."""
+        end_ts = time.time()
+        fixes = self.get_fixes(entity_id, end_ts - hours * 3600, end_ts)
+        if fixes is None:
+            return await self._async_query_location_history(entity_id, hours)
+
+        locations = [
+            {
+                'timestamp': fix['timestamp'],
+                'latitude': fix['latitude'],
+                'longitude': fix['longitude'],
+                'accuracy': fix['accuracy'],
+                'is_own_report': bool(fix['is_own_report']),
+                'altitude': fix['altitude'],
+                'state': fix['state'],
+            }
+            for fix in reversed(fixes)
+            if fix['state'] not in ('unknown', 'unavailable')
+        ]
+        _LOGGER.debug(f"Retrieved {len(locations)} historical locations from memory")
+        return locations
+
+    async def _async_query_location_history(self, entity_id: str, hours: int) -> List[Dict[str, Any]]:
         """Get location history from recorder for the last N hours."""
         try:
             end_time = datetime.now()
@@ -46,7 +369,7 @@ class LocationRecorder:
                         attrs = state.attributes or {}
                         if ATTR_LATITUDE in attrs and ATTR_LONGITUDE in attrs:
                             locations.append({
-                                'timestamp': state.last_changed.timestamp(),
+                                'timestamp': state.last_updated.timestamp(),
                                 'latitude': attrs.get(ATTR_LATITUDE),
                                 'longitude': attrs.get(ATTR_LONGITUDE),
                                 'accuracy': attrs.get('gps_accuracy', attrs.get('accuracy')),
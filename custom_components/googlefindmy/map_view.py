@@ -169,52 +169,54 @@ class GoogleFindMyMapView(HomeAssistantView):
             except (ValueError, TypeError):
                 accuracy_filter = 0
 
-            # ---- 6) Query Recorder history for location points (single entity) ----
-            from homeassistant.components.recorder.history import get_significant_states
-
-            history = await self.hass.async_add_executor_job(
-                get_significant_states, self.hass, start_time, end_time, [entity_id]
-            )
-
-            locations: list[dict[str, Any]] = []
-            if entity_id in history:
-                last_seen = None
-                for state in history[entity_id]:
-                    lat_raw = state.attributes.get("latitude")
-                    lon_raw = state.attributes.get("longitude")
-                    if lat_raw is None or lon_raw is None:
-                        continue
-                    try:
-                        lat = float(lat_raw)
-                        lon = float(lon_raw)
-                    except (TypeError, ValueError):
-                        continue
-
-                    current_last_seen = state.attributes.get("last_seen")
-                    if current_last_seen and current_last_seen == last_seen:
-                        # de-dupe by identical last_seen
-                        continue
-                    last_seen = current_last_seen
-
-                    acc_raw = state.attributes.get("gps_accuracy", 0)
-                    try:
-                        acc = max(0.0, float(acc_raw))
-                    except (TypeError, ValueError):
-                        acc = 0.0
-
-                    locations.append(
-                        {
-                            "lat": lat,
-                            "lon": lon,
-                            "accuracy": acc,
-                            "timestamp": state.last_updated.isoformat(),
-                            "last_seen": current_last_seen,
-                            "entity_id": entity_id,
-                            "state": state.state,
-                            "is_own_report": state.attributes.get("is_own_report"),
-                            "semantic_location": state.attributes.get("semantic_location"),
-                        }
-                    )
+            # ---- 6) Location points: in-memory history, Recorder for older ranges ----
+            locations = self._locations_from_memory(entity_id, start_time, end_time)
+            if locations is None:
+                from homeassistant.components.recorder.history import get_significant_states
+
+                history = await self.hass.async_add_executor_job(
+                    get_significant_states, self.hass, start_time, end_time, [entity_id]
+                )
+
+                locations = []
+                if entity_id in history:
+                    last_seen = None
+                    for state in history[entity_id]:
+                        lat_raw = state.attributes.get("latitude")
+                        lon_raw = state.attributes.get("longitude")
+                        if lat_raw is None or lon_raw is None:
+                            continue
+                        try:
+                            lat = float(lat_raw)
+                            lon = float(lon_raw)
+                        except (TypeError, ValueError):
+                            continue
+
+                        current_last_seen = state.attributes.get("last_seen")
+                        if current_last_seen and current_last_seen == last_seen:
+                            # de-dupe by identical last_seen
+                            continue
+                        last_seen = current_last_seen
+
+                        acc_raw = state.attributes.get("gps_accuracy", 0)
+                        try:
+                            acc = max(0.0, float(acc_raw))
+                        except (TypeError, ValueError):
+                            acc = 0.0
+
+                        locations.append(
+                            {
+                                "lat": lat,
+                                "lon": lon,
+                                "accuracy": acc,
+                                "timestamp": state.last_updated.isoformat(),
+                                "last_seen": current_last_seen,
+                                "entity_id": entity_id,
+                                "state": state.state,
+                                "is_own_report": state.attributes.get("is_own_report"),
+                                "semantic_location": state.attributes.get("semantic_location"),
+                            }
+                        )
 
             # ---- 7) Render HTML (no secrets) ----
             html_content = self._generate_map_html(
@@ -226,6 +228,54 @@ class GoogleFindMyMapView(HomeAssistantView):
             _LOGGER.error("Error generating map for device %s: %s", device_id, err)
             return _html_response("Server Error", "Error generating map.", status=500)
 
+    # ---------------------------- History sources ----------------------------
+
+    def _locations_from_memory(
+        self, entity_id: str, start_time: datetime, end_time: datetime
+    ) -> list[dict[str, Any]] | None:
+        """Return the map points from a coordinator's in-memory location history.
+
+        Returns None if no location history covers the whole range (the caller
+        then queries the Recorder).
+        """
+        for coordinator in self.hass.data.get(DOMAIN, {}).values():
+            location_recorder = getattr(coordinator, "location_recorder", None)
+            if location_recorder is None:
+                continue
+            fixes = location_recorder.get_fixes(
+                entity_id, start_time.timestamp(), end_time.timestamp()
+            )
+            if fixes is None:
+                continue
+
+            locations: list[dict[str, Any]] = []
+            last_seen = None
+            for fix in fixes:
+                current_last_seen = fix["last_seen"]
+                if current_last_seen is not None and current_last_seen == last_seen:
+                    # de-dupe by identical last_seen
+                    continue
+                last_seen = current_last_seen
+                locations.append(
+                    {
+                        "lat": fix["latitude"],
+                        "lon": fix["longitude"],
+                        "accuracy": max(0.0, fix["accuracy"] or 0.0),
+                        "timestamp": datetime.fromtimestamp(fix["timestamp"], tz=dt_util.UTC).isoformat(),
+                        "last_seen": (
+                            datetime.fromtimestamp(current_last_seen, tz=dt_util.UTC).isoformat()
+                            if current_last_seen is not None
+                            else None
+                        ),
+                        "entity_id": entity_id,
+                        "state": fix["state"],
+                        "is_own_report": fix["is_own_report"],
+                        "semantic_location": fix["semantic_location"],
+                    }
+                )
+            return locations
+        return None
+
     # ---------------------------- HTML builder ----------------------------
 
     def _generate_map_html(
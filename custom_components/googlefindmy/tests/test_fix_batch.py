@@ -0,0 +1,109 @@
+# tests/test_fix_batch.py
+"""Best-fix selection tests for Google Find My Device.
+
+Validates:
+- The best fix per device equals the decoder's ranking (coords → recency → accuracy → own)
+- Semantic labels are merged from the report closest in time (within tolerance)
+"""
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Optional
+
+from custom_components.googlefindmy.fix_batch import FixBatch
+
+
+def _reports(rnd: random.Random, count: int, t0: float = 1_700_000_000.0) -> List[Dict[str, Any]]:
+    """Return decrypted-report-like payloads around one sighting, some semantic-only."""
+    out: List[Dict[str, Any]] = []
+    for _ in range(count):
+        if rnd.random() < 0.15:
+            out.append(
+                {
+                    "latitude": None,
+                    "longitude": None,
+                    "accuracy": rnd.choice([None, 30]),
+                    "last_seen": t0 + rnd.randint(0, 600),
+                    "status": "0",
+                    "is_own_report": False,
+                    "semantic_name": rnd.choice(["Home", "Office"]),
+                }
+            )
+            continue
+        out.append(
+            {
+                "latitude": 52.37 + rnd.uniform(-0.0005, 0.0005),
+                "longitude": 4.90 + rnd.uniform(-0.0005, 0.0005),
+                "altitude": 3,
+                "accuracy": rnd.randint(5, 120),
+                "last_seen": t0 + rnd.randint(0, 600),
+                "status": "1",
+                "is_own_report": rnd.random() < 0.2,
+                "semantic_name": None,
+            }
+        )
+    return out
+
+
+def _rank(fix: Dict[str, Any]) -> tuple:
+    has_coords = fix.get("latitude") is not None and fix.get("longitude") is not None
+    acc = fix.get("accuracy")
+    return (
+        1 if has_coords else 0,
+        float(fix.get("last_seen") or 0.0),
+        -float(acc) if acc is not None else float("-inf"),
+        1 if fix.get("is_own_report") else 0,
+    )
+
+
+def test_best_fix_per_device_matches_ranking() -> None:
+    """One pass over many devices picks the same fix as sorting each device's reports."""
+    rnd = random.Random(3)
+    batches = {f"dev_{i}": _reports(rnd, rnd.randint(1, 60)) for i in range(25)}
+    batch = FixBatch()
+    for device, reports in batches.items():
+        batch.extend(device, reports)
+
+    best = batch.best(merge_semantics=False)
+    assert set(best) == set(batches)
+    for device, reports in batches.items():
+        expected = max(reports, key=_rank)
+        assert _rank(best[device]) == _rank(expected)
+    assert batch.added == sum(len(r) for r in batches.values())
+
+
+def test_best_fix_ties_and_normalization() -> None:
+    """Equal ranks keep the first fix; the returned fix is a normalized copy."""
+    t0 = 1_700_000_000
+    first = {"latitude": 52.37, "longitude": 4.90, "accuracy": 10, "last_seen": t0, "tag": 1}
+    second = dict(first, tag=2)
+    best = _best([None, first, second])
+    assert best["tag"] == 1
+    assert best["accuracy"] == 10.0 and isinstance(best["last_seen"], float)
+    assert first["accuracy"] == 10
+
+    best = _best([{"latitude": float("nan"), "longitude": 4.9, "last_seen": t0 + 60}, first])
+    assert best["tag"] == 1
+    assert _best([]) is None
+
+
+def _best(fixes: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    batch = FixBatch()
+    batch.extend("dev", fixes)
+    return batch.best().get("dev")
+
+
+def test_semantic_label_merged_within_tolerance() -> None:
+    """The label closest in time is attached; labels outside the tolerance are ignored."""
+    t0 = 1_700_000_000.0
+    gps = {"latitude": 52.37, "longitude": 4.90, "accuracy": 10, "last_seen": t0}
+    home = {"latitude": None, "longitude": None, "last_seen": t0 - 2, "semantic_name": "Home"}
+    office = {"latitude": None, "longitude": None, "last_seen": t0 + 4, "semantic_name": "Office"}
+    far = {"latitude": None, "longitude": None, "last_seen": t0 - 60, "semantic_name": "Gym"}
+
+    best = _best([far, office, gps, home])
+    assert best["semantic_name"] == "Home"
+    assert best["accuracy"] == 10.0
+
+    best = _best([far, gps])
+    assert best.get("semantic_name") is None
@@ -0,0 +1,113 @@
+# tests/test_location_history.py
+"""In-memory location history tests for Google Find My Device.
+
+Validates:
+- Fixes are recorded per entity, oldest first; rewrites of the same state are skipped
+- The buffer never grows beyond its size and drops the oldest fixes first
+- Ranges the buffer doesn't cover return None (caller falls back to the Recorder)
+- Seeding from the Recorder merges older history in front of live fixes
+"""
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.googlefindmy.location_recorder import LocationRecorder
+
+ENTITY_ID = "device_tracker.keys"
+
+
+def _state(ts: float, idx: int, **attrs: Any) -> State:
+    """Return a tracker state with a fix written at epoch ts."""
+    base: Dict[str, Any] = {
+        "latitude": 52.0 + idx * 0.001,
+        "longitude": 4.0 + idx * 0.001,
+        "gps_accuracy": 10 + idx % 50,
+        "is_own_report": idx % 3 == 0,
+        "last_seen": datetime.fromtimestamp(ts - 30, tz=timezone.utc).isoformat(),
+    }
+    base.update(attrs)
+    written = datetime.fromtimestamp(ts, tz=timezone.utc)
+    return State(ENTITY_ID, "not_home", base, last_changed=written, last_updated=written)
+
+
+def _record(recorder: LocationRecorder, states: List[State]) -> None:
+    for state in states:
+        recorder.async_record_state(state)
+
+
+def test_records_fixes_in_order(hass: HomeAssistant) -> None:
+    """Fixes come back oldest first; repeated and coordinate-less writes are skipped."""
+    recorder = LocationRecorder(hass, size=16)
+    now = float(int(time.time()) + 1)
+    states = [_state(now + i, i) for i in range(5)]
+    _record(recorder, states)
+    recorder.async_record_state(states[-1])  # same state written again
+    recorder.async_record_state(State(ENTITY_ID, "unknown", {}))
+
+    fixes = recorder.get_fixes(ENTITY_ID, now, now + 10)
+    assert [f["timestamp"] for f in fixes] == [s.last_updated.timestamp() for s in states]
+    assert fixes[0]["is_own_report"] is True
+    assert fixes[1]["accuracy"] == 11.0
+    assert recorder.get_last_fix(ENTITY_ID)["latitude"] == pytest.approx(52.004)
+    assert recorder.get_fixes(ENTITY_ID, now + 1.5, now + 3.5) == fixes[2:4]
+
+
+def test_memory_bound_drops_oldest(hass: HomeAssistant) -> None:
+    """A full buffer overwrites its oldest fixes and stops covering their time range."""
+    recorder = LocationRecorder(hass, size=8)
+    now = float(int(time.time()) + 1)
+    states = [_state(now + i, i) for i in range(20)]
+    _record(recorder, states)
+
+    stats = recorder.stats()
+    assert stats["fixes"] == 8
+    fixes = recorder.get_fixes(ENTITY_ID, now + 12, now + 100)
+    assert [f["timestamp"] for f in fixes] == [s.last_updated.timestamp() for s in states[12:]]
+    # the dropped fixes are no longer covered: ask the Recorder instead
+    assert recorder.get_fixes(ENTITY_ID, now + 5, now + 100) is None
+    assert recorder.get_fixes("device_tracker.other", now, now + 100) is None
+
+    before = recorder.memory_bytes()
+    _record(recorder, [_state(now + i, i) for i in range(20, 200)])
+    assert recorder.memory_bytes() == before
+
+
+@pytest.mark.asyncio
+async def test_seed_merges_recorder_history(hass: HomeAssistant) -> None:
+    """Seeded history goes in front of live fixes, without duplicating them."""
+    recorder = LocationRecorder(hass, size=64)
+    now = float(int(time.time()) + 1)
+    live = [_state(now + i, 100 + i) for i in range(3)]
+    _record(recorder, live)
+    # Recorder returns older states plus the live ones it has already persisted
+    recorded = [_state(now - 3600 + i * 60, i) for i in range(10)] + live[:2]
+
+    async def _db_ready() -> bool:
+        return True
+
+    instance = SimpleNamespace(
+        async_db_ready=_db_ready(),
+        async_add_executor_job=lambda func, *args: _as_future({ENTITY_ID: recorded}),
+    )
+    entity = SimpleNamespace(entity_id=ENTITY_ID, domain="device_tracker")
+    with patch(
+        "custom_components.googlefindmy.location_recorder.get_instance", return_value=instance
+    ), patch(
+        "custom_components.googlefindmy.location_recorder.er.async_entries_for_config_entry",
+        return_value=[entity],
+    ):
+        await recorder.async_seed("entry_1")
+
+    fixes = recorder.get_fixes(ENTITY_ID, now - 2 * 3600, now + 10)
+    assert [f["timestamp"] for f in fixes] == [s.last_updated.timestamp() for s in recorded[:10] + live]
+
+
+async def _as_future(value: Any) -> Any:
+    return value
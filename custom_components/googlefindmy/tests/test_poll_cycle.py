@@ -0,0 +1,195 @@
+# tests/test_poll_cycle.py
+"""Polling cycle tests for Google Find My Device.
+
+Validates:
+- Sequential (default) and concurrent cycles commit every device's location
+- The number of location requests in flight never exceeds the configured limit
+- Results are pushed per device as they arrive, before the end-of-cycle snapshot
+- Per-device cooldowns (incl. ones applied while the cycle runs) skip the request
+- Auth failures abort the cycle and cancel requests still in flight
+- Cycle time with a fake API with random latencies (sequential vs. concurrent)
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed
+
+from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator
+
+NUM_DEVICES = 15
+
+
+class FakeLocationAPI:
+    """Fake API answering location requests after a random latency."""
+
+    def __init__(self, latencies: Dict[str, float], *, auth_fail_id: str | None = None) -> None:
+        self.latencies = latencies
+        self.auth_fail_id = auth_fail_id
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requested: List[str] = []
+        self.completed: List[str] = []
+        self.cancelled: List[str] = []
+
+    async def async_get_device_location(self, device_id: str, device_name: str) -> Dict[str, Any]:
+        self.requested.append(device_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latencies[device_id])
+            if device_id == self.auth_fail_id:
+                raise ConfigEntryAuthFailed("token revoked")
+        except asyncio.CancelledError:
+            self.cancelled.append(device_id)
+            raise
+        finally:
+            self.in_flight -= 1
+        self.completed.append(device_id)
+        idx = int(device_id.split("_")[1])
+        return {
+            "latitude": 52.0 + idx * 0.01,
+            "longitude": 4.0 + idx * 0.01,
+            "accuracy": 20,
+            "last_seen": int(time.time()),
+        }
+
+
+def _devices(count: int = NUM_DEVICES) -> List[Dict[str, Any]]:
+    return [{"id": f"dev_{i}", "name": f"Tracker {i}"} for i in range(count)]
+
+
+def _latencies(devices: List[Dict[str, Any]], seed: int = 1) -> Dict[str, float]:
+    rnd = random.Random(seed)
+    return {d["id"]: rnd.uniform(0.01, 0.08) for d in devices}
+
+
+def _make_coordinator(hass: HomeAssistant, api: FakeLocationAPI, **kwargs: Any) -> GoogleFindMyCoordinator:
+    with patch("custom_components.googlefindmy.coordinator.GoogleFindMyAPI"), patch(
+        "custom_components.googlefindmy.coordinator.async_get_clientsession"
+    ):
+        coordinator = GoogleFindMyCoordinator(hass, cache=None, device_poll_delay=0, **kwargs)
+    coordinator.api = api
+    coordinator._is_fcm_ready_soft = lambda: True  # type: ignore[method-assign]
+    return coordinator
+
+
+async def _timed_cycle(coordinator: GoogleFindMyCoordinator, devices: List[Dict[str, Any]]) -> float:
+    t_start = time.perf_counter()
+    await coordinator._async_start_poll_cycle(devices)
+    return time.perf_counter() - t_start
+
+
+@pytest.mark.asyncio
+async def test_sequential_cycle_is_default(hass: HomeAssistant) -> None:
+    """Without a limit, one request is in flight at a time and every device is committed."""
+    devices = _devices()
+    api = FakeLocationAPI(_latencies(devices))
+    coordinator = _make_coordinator(hass, api)
+
+    await coordinator._async_start_poll_cycle(devices)
+
+    assert api.max_in_flight == 1
+    assert api.requested == [d["id"] for d in devices]
+    assert set(coordinator._device_location_data) == {d["id"] for d in devices}
+    assert coordinator.stats["polled_updates"] == NUM_DEVICES
+    assert not coordinator.is_polling
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [2, 4, 8])
+async def test_concurrent_cycle_respects_limit(hass: HomeAssistant, limit: int) -> None:
+    """The in-flight limit is reached but never exceeded; all devices are committed."""
+    devices = _devices()
+    api = FakeLocationAPI(_latencies(devices))
+    coordinator = _make_coordinator(hass, api, max_concurrent_polls=limit)
+
+    await coordinator._async_start_poll_cycle(devices)
+
+    assert api.max_in_flight == limit
+    assert sorted(api.requested) == sorted(d["id"] for d in devices)
+    assert set(coordinator._device_location_data) == {d["id"] for d in devices}
+    assert coordinator.stats["polled_updates"] == NUM_DEVICES
+    assert coordinator.get_last_poll_duration_seconds() is not None
+
+
+@pytest.mark.asyncio
+async def test_results_pushed_as_they_arrive(hass: HomeAssistant) -> None:
+    """Each device is pushed on its own, in completion order, before the end snapshot."""
+    devices = _devices()
+    api = FakeLocationAPI(_latencies(devices))
+    coordinator = _make_coordinator(hass, api, max_concurrent_polls=4)
+    pushed: List[str] = []
+    coordinator.push_updated = lambda device_ids=None, **kw: pushed.extend(device_ids or [])  # type: ignore[method-assign]
+
+    await coordinator._async_start_poll_cycle(devices)
+
+    assert pushed == api.completed
+    assert len(pushed) == NUM_DEVICES
+
+
+@pytest.mark.asyncio
+async def test_cooldowns_skip_requests(hass: HomeAssistant) -> None:
+    """Devices in cooldown are not requested, including cooldowns applied mid-cycle."""
+    devices = _devices(6)
+    api = FakeLocationAPI({d["id"]: 0.02 for d in devices})
+    coordinator = _make_coordinator(hass, api, max_concurrent_polls=2)
+    coordinator._device_poll_cooldown_until["dev_1"] = time.monotonic() + 600
+
+    original = api.async_get_device_location
+
+    async def _apply_cooldown_then_locate(device_id: str, device_name: str) -> Dict[str, Any]:
+        if device_id == "dev_0":
+            # e.g. a crowdsourced push for dev_5 arrives while the cycle runs
+            coordinator._apply_report_type_cooldown("dev_5", "in_all_areas")
+        return await original(device_id, device_name)
+
+    api.async_get_device_location = _apply_cooldown_then_locate  # type: ignore[method-assign]
+
+    await coordinator._async_start_poll_cycle(devices)
+
+    assert "dev_1" not in api.requested
+    assert "dev_5" not in api.requested
+    assert sorted(api.requested) == ["dev_0", "dev_2", "dev_3", "dev_4"]
+
+
+@pytest.mark.asyncio
+async def test_auth_failure_aborts_cycle(hass: HomeAssistant) -> None:
+    """An auth failure propagates and cancels the other in-flight requests."""
+    devices = _devices()
+    latencies = {d["id"]: 0.5 for d in devices}
+    latencies["dev_0"] = 0.01
+    api = FakeLocationAPI(latencies, auth_fail_id="dev_0")
+    coordinator = _make_coordinator(hass, api, max_concurrent_polls=4)
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await coordinator._async_start_poll_cycle(devices)
+
+    assert api.in_flight == 0
+    assert sorted(api.cancelled) == ["dev_1", "dev_2", "dev_3"]
+    assert len(api.requested) == 4
+    assert not coordinator.is_polling
+
+
+@pytest.mark.asyncio
+async def test_cycle_time_sequential_vs_concurrent(hass: HomeAssistant) -> None:
+    """With random latencies, a concurrent cycle takes a fraction of the sequential one."""
+    devices = _devices()
+    latencies = _latencies(devices, seed=7)
+    timings: Dict[int, float] = {}
+    for limit in (1, 4, 8):
+        api = FakeLocationAPI(latencies)
+        coordinator = _make_coordinator(hass, api, max_concurrent_polls=limit)
+        timings[limit] = await _timed_cycle(coordinator, devices)
+
+    total_latency = sum(latencies.values())
+    assert timings[1] >= total_latency
+    # Ideal is total_latency / limit; leave headroom for scheduler jitter on CI.
+    assert timings[4] < timings[1] / 2
+    assert timings[8] < timings[4]
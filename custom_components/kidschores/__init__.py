@@ -89,6 +89,8 @@ async def async_unload_entry(hass, entry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        # Write any coalesced changes before the entry goes away.
+        await hass.data[DOMAIN][entry.entry_id]["storage_manager"].async_shutdown()
         hass.data[DOMAIN].pop(entry.entry_id)
 
         # Await service unloading
@@ -1,6 +1,8 @@
 # File: calendar.py
 
 import datetime
+from bisect import bisect_right
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
@@ -25,6 +27,9 @@ WEEKDAY_MAP = {i: key for i, key in enumerate(WEEKDAY_OPTIONS.keys())}
 # For chores without a due_date, we generate up to 3 months
 FOREVER_DURATION = datetime.timedelta(days=90)
 
+# Number of requested date windows whose events are kept per kid
+EVENT_CACHE_WINDOWS = 8
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
@@ -56,6 +61,26 @@ class KidsChoresCalendarEntity(CalendarEntity):
         self._attr_unique_id = f"{config_entry.entry_id}_{kid_id}_calendar"
         self.entity_id = f"calendar.kc_{kid_name}"
 
+        # Materialised events, valid for the (calendar revision, local date) in _cache_key:
+        # events per requested (start, end) window, and for the current event the
+        # kid's chores and challenges with an interval index over today's events,
+        # as sorted boundary times and the sources active from each boundary to
+        # the next.
+        self._cache_key = None
+        self._window_events: dict[tuple, list[CalendarEvent]] = {}
+        self._sources: list[tuple] = []
+        self._window_relative_sources: list[int] = []
+        self._current_bounds: list[datetime.datetime] | None = None
+        self._current_sources: list[list[int]] = []
+
+    def _validate_cache(self, now: datetime.datetime) -> None:
+        """Drop the materialised events if this kid's chores or challenges, or the date, changed."""
+        cache_key = (self.coordinator.calendar_revision(self._kid_id), now.date())
+        if cache_key != self._cache_key:
+            self._cache_key = cache_key
+            self._window_events = {}
+            self._current_bounds = None
+
     async def async_get_events(
         self, hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
     ) -> list[CalendarEvent]:
@@ -71,26 +96,22 @@ class KidsChoresCalendarEntity(CalendarEntity):
         if end.tzinfo is None:
             end = end.replace(tzinfo=local_tz)
 
-        events: list[CalendarEvent] = []
+        self._validate_cache(dt_util.now())
+        events = self._window_events.get((start, end))
+        if events is None:
+            events = self._generate_all_events(start, end)
+            if len(self._window_events) >= EVENT_CACHE_WINDOWS:
+                del self._window_events[next(iter(self._window_events))]
+            self._window_events[(start, end)] = events
 
-        # 1) Generate chore events
-        for chore in self.coordinator.chores_data.values():
-            if self._kid_id in chore.get("assigned_kids", []):
-                events.extend(self._generate_events_for_chore(chore, start, end))
-
-        # 2) Generate challenge events
-        for challenge in self.coordinator.challenges_data.values():
-            if self._kid_id in challenge.get("assigned_kids", []):
-                evs = self._generate_events_for_challenge(challenge, start, end)
-                events.extend(evs)
-
-        return events
+        return list(events)
 
     def _generate_events_for_chore(
         self,
         chore: dict,
         window_start: datetime.datetime,
         window_end: datetime.datetime,
+        tz: datetime.tzinfo,
     ) -> list[CalendarEvent]:
         """Same recurring-chores logic from earlier solutions."""
         events: list[CalendarEvent] = []
@@ -118,12 +139,10 @@ class KidsChoresCalendarEntity(CalendarEntity):
             if isinstance(sdt, datetime.date) and not isinstance(
                 sdt, datetime.datetime
             ):
-                tz = dt_util.get_time_zone(self.hass.config.time_zone)
                 sdt = datetime.datetime.combine(sdt, datetime.time.min, tzinfo=tz)
             if isinstance(edt, datetime.date) and not isinstance(
                 edt, datetime.datetime
             ):
-                tz = dt_util.get_time_zone(self.hass.config.time_zone)
                 edt = datetime.datetime.combine(edt, datetime.time.min, tzinfo=tz)
             if not sdt or not edt:
                 return False
@@ -365,6 +384,7 @@ class KidsChoresCalendarEntity(CalendarEntity):
         challenge: dict,
         window_start: datetime.datetime,
         window_end: datetime.datetime,
+        tz: datetime.tzinfo,
     ) -> list[CalendarEvent]:
         """
         Produce a single multi-day event for each challenge that has valid start_date/end_date.
@@ -407,7 +427,6 @@ class KidsChoresCalendarEntity(CalendarEntity):
             sdt = e.start
             edt = e.end
             # convert if needed
-            tz = dt_util.get_time_zone(self.hass.config.time_zone)
             if isinstance(sdt, datetime.date) and not isinstance(
                 sdt, datetime.datetime
             ):
@@ -429,46 +448,114 @@ class KidsChoresCalendarEntity(CalendarEntity):
         Return a single "current" event (chore or challenge) if one is active now (±1h).
         Otherwise None.
         """
-        now = dt_util.as_local(datetime.datetime.utcnow())
+        now = dt_util.now()
+        self._validate_cache(now)
+        if self._current_bounds is None:
+            self._build_current_index(now)
+
+        # Only the chores and challenges with an event active now in today's
+        # index, and those whose events depend on the window, can have one in
+        # the ±1h window; generate theirs in event order.
+        idx = bisect_right(self._current_bounds, now) - 1
+        candidates = self._current_sources[idx] if idx >= 0 else []
+        if self._window_relative_sources:
+            candidates = sorted({*candidates, *self._window_relative_sources})
+
+        tz = dt_util.get_time_zone(self.hass.config.time_zone)
         window_start = now - datetime.timedelta(hours=1)
         window_end = now + datetime.timedelta(hours=1)
-        all_events = self._generate_all_events(window_start, window_end)
-        for e in all_events:
-            # Convert date->datetime for comparison
-            tz = dt_util.get_time_zone(self.hass.config.time_zone)
-            sdt = e.start
-            edt = e.end
-            if isinstance(sdt, datetime.date) and not isinstance(
-                sdt, datetime.datetime
+        for position in candidates:
+            generate, item = self._sources[position]
+            for e in generate(item, window_start, window_end, tz):
+                sdt, edt = self._event_datetimes(e, tz)
+                if sdt and edt and sdt <= now < edt:
+                    return e
+        return None
+
+    def _build_current_index(self, now: datetime.datetime) -> None:
+        """Index today's events (±1h) by the times they start and end.
+
+        Chores with a due date and challenges generate the same events for any
+        window that overlaps them, so the ones active at a time of day are
+        found in the events for the whole day. Between two consecutive
+        boundaries the same ones are active, so looking them up is a binary
+        search. Chores without a due date generate events relative to the
+        window and are always checked.
+        """
+        tz = dt_util.get_time_zone(self.hass.config.time_zone)
+        day_start = dt_util.start_of_local_day(now)
+        window_start = day_start - datetime.timedelta(hours=1)
+        window_end = day_start + datetime.timedelta(days=1, hours=1)
+
+        self._sources = self._event_sources()
+        self._window_relative_sources = []
+        intervals = []
+        for position, (generate, item) in enumerate(self._sources):
+            if generate == self._generate_events_for_chore and not (
+                item.get("due_date") and dt_util.parse_datetime(item["due_date"])
             ):
-                sdt = datetime.datetime.combine(sdt, datetime.time.min, tzinfo=tz)
-            if isinstance(edt, datetime.date) and not isinstance(
-                edt, datetime.datetime
+                self._window_relative_sources.append(position)
+                continue
+            for e in generate(item, window_start, window_end, tz):
+                sdt, edt = self._event_datetimes(e, tz)
+                if sdt and edt and sdt < edt:
+                    intervals.append((sdt, edt, position))
+        intervals.sort(key=lambda interval: interval[0])
+
+        bounds = sorted({t for sdt, edt, _ in intervals for t in (sdt, edt)})
+        current = []
+        active = []
+        next_interval = 0
+        for bound in bounds:
+            while (
+                next_interval < len(intervals)
+                and intervals[next_interval][0] <= bound
             ):
-                edt = datetime.datetime.combine(edt, datetime.time.min, tzinfo=tz)
-            if sdt and edt and sdt <= now < edt:
-                return e
-        return None
+                active.append(intervals[next_interval])
+                next_interval += 1
+            active = [interval for interval in active if interval[1] > bound]
+            current.append(sorted({position for _, _, position in active}))
+
+        self._current_bounds = bounds
+        self._current_sources = current
+
+    @staticmethod
+    def _event_datetimes(
+        e: CalendarEvent, tz: datetime.tzinfo
+    ) -> tuple[datetime.datetime, datetime.datetime]:
+        """Return an event's start and end, all-day dates as local midnights."""
+        sdt = e.start
+        edt = e.end
+        if isinstance(sdt, datetime.date) and not isinstance(sdt, datetime.datetime):
+            sdt = datetime.datetime.combine(sdt, datetime.time.min, tzinfo=tz)
+        if isinstance(edt, datetime.date) and not isinstance(edt, datetime.datetime):
+            edt = datetime.datetime.combine(edt, datetime.time.min, tzinfo=tz)
+        return sdt, edt
+
+    def _event_sources(self) -> list[tuple]:
+        """Return (event generator, chore or challenge) for this kid, in event order."""
+        # chores
+        sources = [
+            (self._generate_events_for_chore, chore)
+            for chore in self.coordinator.chores_data.values()
+            if self._kid_id in chore.get("assigned_kids", [])
+        ]
+        # challenges
+        sources.extend(
+            (self._generate_events_for_challenge, challenge)
+            for challenge in self.coordinator.challenges_data.values()
+            if self._kid_id in challenge.get("assigned_kids", [])
+        )
+        return sources
 
     def _generate_all_events(
         self, window_start: datetime.datetime, window_end: datetime.datetime
     ) -> list[CalendarEvent]:
         """Generate chores + challenges for this kid in the given window."""
+        tz = dt_util.get_time_zone(self.hass.config.time_zone)
         events = []
-        # chores
-        for chore in self.coordinator.chores_data.values():
-            if self._kid_id in chore.get("assigned_kids", []):
-                events.extend(
-                    self._generate_events_for_chore(chore, window_start, window_end)
-                )
-        # challenges
-        for challenge in self.coordinator.challenges_data.values():
-            if self._kid_id in challenge.get("assigned_kids", []):
-                events.extend(
-                    self._generate_events_for_challenge(
-                        challenge, window_start, window_end
-                    )
-                )
+        for generate, item in self._event_sources():
+            events.extend(generate(item, window_start, window_end, tz))
         return events
 
     @property
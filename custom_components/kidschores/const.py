@@ -27,6 +27,11 @@ PLATFORMS = [
 # Storage and Versioning
 STORAGE_KEY = "kidschores_data"  # Persistent storage key
 STORAGE_VERSION = 1  # Storage version
+STORAGE_SAVE_DELAY = 5  # Seconds changes are coalesced before they're written
+STORAGE_JOURNAL_SUFFIX = ".journal"  # Change journal file, next to the storage file
+STORAGE_JOURNAL_SEQ_KEY = "journal_seq"  # Last journaled change held by the storage file
+STORAGE_JOURNAL_COMPACT_SIZE = 256 * 1024  # Journal bytes before it's compacted
+STORAGE_JOURNAL_COMPACT_INTERVAL = 3600  # Seconds between journal compactions
 
 # Update Interval
 UPDATE_INTERVAL = 5  # Update interval for coordinator (in minutes)
@@ -7,10 +7,12 @@ Manages entities primarily using internal_id for consistency.
 """
 
 import asyncio
+import heapq
 import uuid
+from bisect import bisect_right
 from calendar import monthrange
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from homeassistant.auth.models import User
 from homeassistant.config_entries import ConfigEntry
@@ -34,6 +36,10 @@ from .const import (
     ACTION_TITLE_APPROVE,
     ACTION_TITLE_DISAPPROVE,
     ACTION_TITLE_REMIND_30,
+    ATTR_CHORE_NAME,
+    ATTR_CLAIMED_ON,
+    ATTR_REDEEMED_ON,
+    ATTR_REWARD_NAME,
     BADGE_THRESHOLD_TYPE_CHORE_COUNT,
     BADGE_THRESHOLD_TYPE_POINTS,
     CHALLENGE_TYPE_DAILY_MIN,
@@ -101,6 +107,9 @@ from .const import (
     FREQUENCY_NONE,
     FREQUENCY_WEEKLY,
     LOGGER,
+    UNKNOWN_CHORE,
+    UNKNOWN_KID,
+    UNKNOWN_REWARD,
     UPDATE_INTERVAL,
     WEEKDAY_OPTIONS,
 )
@@ -132,6 +141,31 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         self.storage_manager = storage_manager
         self._data: dict[str, Any] = {}
 
+        # Overdue index: min-heap of (due date, chore_id, due_date string) for chores
+        # not yet due, the due date string each chore was indexed with, chores whose
+        # due date has passed, and chores whose due date changed since the last check
+        self._due_heap: list[tuple[datetime, str, str]] = []
+        self._due_indexed: dict[str, Optional[str]] = {}
+        self._past_due: dict[str, datetime] = {}
+        self._due_changed: set[str] = set()
+
+        # Badge index: (threshold_type, chore_count_type) -> [(threshold, position, badge_id)]
+        # sorted by threshold, and the value each kid's badges were last checked against
+        self._badge_index: dict[tuple[str, Optional[str]], list[tuple[Any, int, str]]] = {}
+        self._badge_index_ids: Optional[set[str]] = None
+        self._badge_checked: dict[str, dict[tuple[str, Optional[str]], Any]] = {}
+
+        # Calendar revisions: bumped when a chore or challenge a kid's calendar shows
+        # changes, for all kids or per kid, so calendars can cache their events
+        self._calendar_revision = 0
+        self._kid_calendar_revisions: dict[str, int] = {}
+
+        # Derived metrics: bumped whenever the data may have changed, and the values
+        # sensors derive from it, computed at most once per data version
+        self._data_version = 0
+        self._derived_version = -1
+        self._derived_cache: dict[Any, Any] = {}
+
     # -------------------------------------------------------------------------------------
     # Migrate Data and Converters
     # -------------------------------------------------------------------------------------
@@ -237,6 +271,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             await self._check_overdue_chores()
 
             # Notify entities of changes
+            self._data_version += 1
             self.async_update_listeners()
 
             return self._data
@@ -417,6 +452,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
             # Remove entity from HA registry
             self._remove_entities_in_ha(section, entity_id)
+            if section in (DATA_KIDS, DATA_CHORES, DATA_CHALLENGES):
+                self._calendar_changed()
             if section == DATA_CHORES:
                 for kid_id in self.kids_data.keys():
                     self._remove_kid_chore_entities(kid_id, entity_id)
@@ -955,6 +992,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             self._data[DATA_CHORES][chore_id]["name"],
             chore_id,
         )
+        self._index_chore_due(chore_id)
+        self._calendar_changed(assigned_kids_ids)
 
         # Notify Kids of new chore
         new_name = self._data[DATA_CHORES][chore_id]["name"]
@@ -1050,6 +1089,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         LOGGER.debug("Updated chore '%s' with ID: %s", chore_info["name"], chore_id)
 
+        self._index_chore_due(chore_id)
+        self._calendar_changed(old_assigned | new_assigned)
         self.hass.async_create_task(self._check_overdue_chores())
 
     # -- Badges
@@ -1077,6 +1118,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             self._data[DATA_BADGES][badge_id]["name"],
             badge_id,
         )
+        self._badge_index_ids = None
 
     def _update_badge(self, badge_id: str, badge_data: dict[str, Any]):
         badge_info = self._data[DATA_BADGES][badge_id]
@@ -1107,6 +1149,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         )
 
         LOGGER.debug("Updated badge '%s' with ID: %s", badge_info["name"], badge_id)
+        self._badge_index_ids = None
 
     # -- Rewards
     def _create_reward(self, reward_id: str, reward_data: dict[str, Any]):
@@ -1289,9 +1332,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             self._data[DATA_CHALLENGES][challenge_id]["name"],
             challenge_id,
         )
+        self._calendar_changed(self._data[DATA_CHALLENGES][challenge_id]["assigned_kids"])
 
     def _update_challenge(self, challenge_id: str, challenge_data: dict[str, Any]):
         challenge_info = self._data[DATA_CHALLENGES][challenge_id]
+        self._calendar_changed(challenge_info.get("assigned_kids", []))
         challenge_info["name"] = challenge_data.get("name", challenge_info["name"])
         challenge_info["description"] = challenge_data.get(
             "description", challenge_info["description"]
@@ -1329,6 +1374,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         LOGGER.debug(
             "Updated challenge '%s' with ID: %s", challenge_info["name"], challenge_id
         )
+        self._calendar_changed(challenge_info["assigned_kids"])
 
     # -------------------------------------------------------------------------------------
     # Properties for Easy Access
@@ -1509,7 +1555,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
             )
 
-        self._persist()
+        self._persist(
+            (DATA_KIDS, kid_id),
+            (DATA_CHORES, chore_id),
+            (DATA_PENDING_CHORE_APPROVALS, None),
+        )
         self.async_set_updated_data(self._data)
 
     def approve_chore(
@@ -1663,7 +1713,13 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
             )
 
-        self._persist()
+        self._persist(
+            (DATA_KIDS, kid_id),
+            (DATA_CHORES, chore_id),
+            (DATA_PENDING_CHORE_APPROVALS, None),
+            (DATA_ACHIEVEMENTS, None),
+            (DATA_CHALLENGES, None),
+        )
         self.async_set_updated_data(self._data)
 
     def disapprove_chore(self, parent_name: str, kid_id: str, chore_id: str):
@@ -1690,7 +1746,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
             )
 
-        self._persist()
+        self._persist(
+            (DATA_KIDS, kid_id),
+            (DATA_CHORES, chore_id),
+            (DATA_PENDING_CHORE_APPROVALS, None),
+        )
         self.async_set_updated_data(self._data)
 
     def update_chore_state(self, chore_id: str, state: str):
@@ -1703,7 +1763,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         for kid_id in chore_info.get("assigned_kids", []):
             if kid_id:
                 self._process_chore_state(kid_id, chore_id, state)
-        self._persist()
+        self._persist(
+            *((DATA_KIDS, kid_id) for kid_id in chore_info.get("assigned_kids", [])),
+            (DATA_CHORES, chore_id),
+            (DATA_PENDING_CHORE_APPROVALS, None),
+        )
         self.async_set_updated_data(self._data)
         LOGGER.debug(f"Chore ID '{chore_id}' state manually updated to '{state}'")
 
@@ -1917,7 +1981,9 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         self._check_achievements_for_kid(kid_id)
         self._check_challenges_for_kid(kid_id)
 
-        self._persist()
+        self._persist(
+            (DATA_KIDS, kid_id), (DATA_ACHIEVEMENTS, None), (DATA_CHALLENGES, None)
+        )
         self.async_set_updated_data(self._data)
 
         LOGGER.debug(
@@ -1992,7 +2058,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
         )
 
-        self._persist()
+        self._persist((DATA_KIDS, kid_id), (DATA_PENDING_REWARD_APPROVALS, None))
         self.async_set_updated_data(self._data)
 
     def approve_reward(self, parent_name: str, kid_id: str, reward_id: str):
@@ -2053,7 +2119,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
         )
 
-        self._persist()
+        self._persist((DATA_KIDS, kid_id), (DATA_PENDING_REWARD_APPROVALS, None))
         self.async_set_updated_data(self._data)
 
     def disapprove_reward(self, parent_name: str, kid_id: str, reward_id: str):
@@ -2085,7 +2151,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
         )
 
-        self._persist()
+        self._persist((DATA_KIDS, kid_id), (DATA_PENDING_REWARD_APPROVALS, None))
         self.async_set_updated_data(self._data)
 
     # -------------------------------------------------------------------------------------
@@ -2120,31 +2186,78 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             "internal_id": internal_id,
         }
         LOGGER.debug("Added new badge '%s' with ID: %s", badge_name, internal_id)
+        self._badge_index_ids = None
         self._persist()
         self.async_set_updated_data(self._data)
 
     def _check_badges_for_kid(self, kid_id: str):
-        """Evaluate all badge thresholds for kid."""
+        """Evaluate the badge thresholds kid crossed since the last check."""
         kid_info = self.kids_data.get(kid_id)
         if not kid_info:
             return
 
-        for badge_id, badge_data in self.badges_data.items():
-            if kid_id in badge_data.get("earned_by", []):
+        for badge_id in self._badges_crossed(kid_id, kid_info, kid_info["points"]):
+            if kid_id in self.badges_data[badge_id].get("earned_by", []):
                 continue  # already earned
-            threshold_type = badge_data.get("threshold_type")
-            threshold_val = badge_data.get("threshold_value", 0)
+            self._award_badge(kid_id, badge_id)
+
+    def _rebuild_badge_index(self):
+        """Index the badges by threshold for each threshold and chore count type."""
+        index: dict[tuple[str, Optional[str]], list[tuple[Any, int, str]]] = {}
+        for position, (badge_id, badge_info) in enumerate(self.badges_data.items()):
+            threshold_type = badge_info.get("threshold_type")
             if threshold_type == BADGE_THRESHOLD_TYPE_POINTS:
-                if kid_info["points"] >= threshold_val:
-                    self._award_badge(kid_id, badge_id)
+                key = (threshold_type, None)
             elif threshold_type == BADGE_THRESHOLD_TYPE_CHORE_COUNT:
-                ctype = badge_data.get("chore_count_type", FREQUENCY_DAILY)
-                if ctype == "total":
-                    ccount = kid_info.get("completed_chores_total", 0)
-                else:
-                    ccount = kid_info.get(f"completed_chores_{ctype}", 0)
-                if ccount >= threshold_val:
-                    self._award_badge(kid_id, badge_id)
+                key = (
+                    threshold_type,
+                    badge_info.get("chore_count_type", FREQUENCY_DAILY),
+                )
+            else:
+                continue
+            index.setdefault(key, []).append(
+                (badge_info.get("threshold_value", 0), position, badge_id)
+            )
+        for entries in index.values():
+            entries.sort()
+        self._badge_index = index
+        self._badge_index_ids = set(self.badges_data)
+        self._badge_checked = {}
+
+    def _badges_crossed(
+        self, kid_id: str, kid_info: dict[str, Any], points: float, full: bool = False
+    ) -> list[str]:
+        """Return the badges whose threshold kid reached since the last check, in badge order.
+
+        With full=True, return every badge whose threshold kid has reached, without
+        updating the values kid was last checked against.
+        """
+        if self._badge_index_ids != self.badges_data.keys():
+            self._rebuild_badge_index()
+
+        checked = self._badge_checked.setdefault(kid_id, {})
+        crossed = []
+        for key, entries in self._badge_index.items():
+            threshold_type, ctype = key
+            if threshold_type == BADGE_THRESHOLD_TYPE_POINTS:
+                value = points
+            elif ctype == "total":
+                value = kid_info.get("completed_chores_total", 0)
+            else:
+                value = kid_info.get(f"completed_chores_{ctype}", 0)
+
+            low = 0
+            if not full:
+                last = checked.get(key)
+                checked[key] = value
+                if last is not None:
+                    if value <= last:
+                        continue
+                    low = bisect_right(entries, (last, float("inf")))
+            crossed.extend(entries[low : bisect_right(entries, (value, float("inf")))])
+
+        crossed.sort(key=lambda entry: entry[1])
+        return [badge_id for _, _, badge_id in crossed]
 
     def _award_badge(self, kid_id: str, badge_id: str):
         """Add the badge to kid's 'earned_by' and kid's 'badges' list."""
@@ -2216,21 +2329,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         #    kid_info["badges"] = []
 
         # Re-check thresholds
-        for badge_id, badge_info in self.badges_data.items():
-            ttype = badge_info.get("threshold_type", BADGE_THRESHOLD_TYPE_POINTS)
-            tval = badge_info.get("threshold_value", 0)
-            for kid_id, kid_info in self.kids_data.items():
-                if ttype == BADGE_THRESHOLD_TYPE_POINTS:
-                    if kid_info.get("max_points_ever", 0.0) >= tval:
-                        self._award_badge(kid_id, badge_id)
-                elif ttype == BADGE_THRESHOLD_TYPE_CHORE_COUNT:
-                    ctype = badge_info.get("chore_count_type", FREQUENCY_DAILY)
-                    if ctype == "total":
-                        ccount = kid_info.get("completed_chores_total", 0)
-                    else:
-                        ccount = kid_info.get(f"completed_chores_{ctype}", 0)
-                    if ccount >= tval:
-                        self._award_badge(kid_id, badge_id)
+        for kid_id, kid_info in self.kids_data.items():
+            for badge_id in self._badges_crossed(
+                kid_id, kid_info, kid_info.get("max_points_ever", 0.0), full=True
+            ):
+                self._award_badge(kid_id, badge_id)
 
         self._persist()
         self.async_set_updated_data(self._data)
@@ -2271,7 +2374,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
         )
 
-        self._persist()
+        self._persist((DATA_KIDS, kid_id))
         self.async_set_updated_data(self._data)
 
     def add_penalty(self, penalty_def: dict[str, Any]):
@@ -2330,7 +2433,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
         )
 
-        self._persist()
+        self._persist((DATA_KIDS, kid_id))
         self.async_set_updated_data(self._data)
 
     def add_bonus(self, bonus_def: dict[str, Any]):
@@ -2681,94 +2784,117 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
     # Recurring / Reset / Overdue
     # -------------------------------------------------------------------------------------
 
+    def _parse_due_date(self, chore_id: str, due_str: str) -> Optional[datetime]:
+        """Parse a chore's due_date string into a UTC datetime, or None if it's invalid."""
+        try:
+            due_date = dt_util.parse_datetime(due_str)
+            if due_date is None:
+                raise ValueError("Parsed datetime is None")
+            return dt_util.as_utc(due_date)
+        except Exception as err:
+            LOGGER.error(
+                "Error parsing due_date '%s' for chore '%s': %s",
+                due_str,
+                chore_id,
+                err,
+            )
+            return None
+
+    def _index_chore_due(self, chore_id: str) -> None:
+        """Update the overdue index after a chore's due date may have changed."""
+        chore_info = self.chores_data.get(chore_id)
+        due_str = chore_info.get("due_date") if chore_info else None
+        if chore_id in self._due_indexed and self._due_indexed[chore_id] == due_str:
+            return
+
+        self._due_indexed[chore_id] = due_str
+        self._past_due.pop(chore_id, None)
+        self._due_changed.add(chore_id)
+        if due_str:
+            due_date = self._parse_due_date(chore_id, due_str)
+            if due_date is not None:
+                heapq.heappush(self._due_heap, (due_date, chore_id, due_str))
+
+    def _rebuild_due_index(self) -> None:
+        """Index the due dates of all chores."""
+        self._due_heap = []
+        self._due_indexed = {}
+        self._past_due = {}
+        self._due_changed = set()
+        for chore_id in self.chores_data:
+            self._index_chore_due(chore_id)
+
     async def _check_overdue_chores(self):
         """Check and mark overdue chores if due date is passed.
 
-        Send an overdue notification only if not sent in the last 24 hours.
+        Only chores whose due date has passed, or changed since the last check, are
+        looked at. Send an overdue notification only if not sent in the last 24 hours.
         """
         now = dt_util.utcnow()
         LOGGER.debug("Starting overdue check at %s", now.isoformat())
 
-        for chore_id, chore_info in self.chores_data.items():
-            # LOGGER.debug("Checking chore '%s' id '%s' (state=%s)", chore_info.get("name"), chore_id, chore_info.get("state"))
+        # Chores were added or removed without going through _create_chore
+        if self._due_indexed.keys() != self.chores_data.keys():
+            self._rebuild_due_index()
 
-            # Get the list of assigned kids
-            assigned_kids = chore_info.get("assigned_kids", [])
-            # LOGGER.debug("Chore '%s' id '%s' assigned to kids: %s", chore_info.get("name"), chore_id, assigned_kids,)
+        # Move chores that became due into the past-due set, dropping heap entries
+        # for chores that were removed or rescheduled after they were pushed
+        while self._due_heap and self._due_heap[0][0] <= now:
+            due_date, chore_id, due_str = heapq.heappop(self._due_heap)
+            if self._due_indexed.get(chore_id) == due_str:
+                self._past_due[chore_id] = due_date
 
-            # Check if all assigned kids have either claimed or approved the chore
-            all_kids_claimed_or_approved = all(
-                chore_id in self.kids_data.get(kid_id, {}).get("claimed_chores", [])
-                or chore_id in self.kids_data.get(kid_id, {}).get("approved_chores", [])
-                for kid_id in assigned_kids
-            )
+        # Claimed or approved chores per kid, built on first use in this check
+        kid_done: dict[str, set[str]] = {}
 
-            # Debugging: Log the claim/approval status of each assigned kid
-            for kid_id in assigned_kids:
+        def done_chores(kid_id: str) -> set[str]:
+            done = kid_done.get(kid_id)
+            if done is None:
                 kid_info = self.kids_data.get(kid_id, {})
-                has_claimed = chore_id in kid_info.get("claimed_chores", [])
-                has_approved = chore_id in kid_info.get("approved_chores", [])
-
-                # LOGGER.debug("Kid '%s': claimed=%s, approved=%s", kid_id, has_claimed, has_approved
+                done = kid_done[kid_id] = set(kid_info.get("claimed_chores", []))
+                done.update(kid_info.get("approved_chores", []))
+            return done
 
-            # Log the overall result of the check
-            # LOGGER.debug("Chore '%s': all_kids_claimed_or_approved=%s", chore_id, all_kids_claimed_or_approved)
-
-            # Only skip the chore if ALL assigned kids have acted on it
-            if all_kids_claimed_or_approved:
-                # LOGGER.debug("Skipping chore '%s': all assigned kids have claimed or approved", chore_id,)
+        # Chores that got a future or no due date: clear any overdue flags left over
+        changed, self._due_changed = self._due_changed, set()
+        for chore_id in changed:
+            chore_info = self.chores_data.get(chore_id)
+            if chore_info is None or chore_id in self._past_due:
                 continue
-
-            due_str = chore_info.get("due_date")
-            if not due_str:
-                LOGGER.debug(
-                    "Chore '%s' has no due_date; checking to confirm it isn't overdue; then skipping if not",
-                    chore_id,
-                )
-                # If it has no due date, but is overdue, it should be marked as pending
-                if chore_info.get("state") == CHORE_STATE_OVERDUE:
-                    self._process_chore_state(kid_id, chore_id, CHORE_STATE_PENDING)
+            assigned_kids = chore_info.get("assigned_kids", [])
+            if all(chore_id in done_chores(kid_id) for kid_id in assigned_kids):
                 continue
+            for kid_id in assigned_kids:
+                if chore_id in self.kids_data.get(kid_id, {}).get("overdue_chores", []):
+                    self._process_chore_state(kid_id, chore_id, CHORE_STATE_PENDING)
+                    LOGGER.debug(
+                        "Chore '%s' status is overdue but not yet due; cleared overdue flags",
+                        chore_id,
+                    )
 
-            try:
-                due_date = dt_util.parse_datetime(due_str)
-                if due_date is None:
-                    raise ValueError("Parsed datetime is None")
-                due_date = dt_util.as_utc(due_date)
-                # LOGGER.debug("Chore '%s' due_date parsed as %s", chore_id, due_date.isoformat())
-            except Exception as err:
-                LOGGER.error(
-                    "Error parsing due_date '%s' for chore '%s': %s",
-                    due_str,
-                    chore_id,
-                    err,
-                )
+        for chore_id, due_date in list(self._past_due.items()):
+            chore_info = self.chores_data.get(chore_id)
+            if chore_info is None:
+                del self._past_due[chore_id]
+                continue
+            if chore_info.get("due_date") != self._due_indexed.get(chore_id):
+                # Due date changed without going through _index_chore_due; it's
+                # handled once it's been reindexed
+                self._index_chore_due(chore_id)
                 continue
 
-            # Check for applicable day is no longer required; the scheduling function ensures due_date matches applicable day criteria.
-            # LOGGER.debug("Chore '%s': now=%s, due_date=%s", chore_id, now.isoformat(), due_date.isoformat()
-            if now < due_date:
-                # Not past due date, but before resetting the state back to pending, check if global state is currently overdue
-                for kid_id in assigned_kids:
-                    if chore_id in kid_info.get("overdue_chores", []):
-                        self._process_chore_state(kid_id, chore_id, CHORE_STATE_PENDING)
-                        LOGGER.debug(
-                            "Chore '%s' status is overdue but not yet due; cleared overdue flags",
-                            chore_id,
-                        )
-
+            # Only handle the chore if some assigned kid hasn't acted on it
+            assigned_kids = chore_info.get("assigned_kids", [])
+            if all(chore_id in done_chores(kid_id) for kid_id in assigned_kids):
                 continue
 
             # Handling for overdue is the same for shared and non-shared chores
             # Status and global status will be determined by the chore state processor
-            assigned_kids = chore_info.get("assigned_kids", [])
             for kid_id in assigned_kids:
                 kid_info = self.kids_data.get(kid_id, {})
 
                 # Skip if kid already claimed/approved on the chore.
-                if chore_id in kid_info.get(
-                    "claimed_chores", []
-                ) or chore_id in kid_info.get("approved_chores", []):
+                if chore_id in done_chores(kid_id):
                     continue
 
                 # Mark chore as overdue for this kid.
@@ -3109,6 +3235,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         chore_info["due_date"] = next_due.isoformat()
         chore_id = chore_info.get("internal_id")
+        self._index_chore_due(chore_id)
+        self._calendar_changed(chore_info.get("assigned_kids", []))
 
         # Update config_entry.options for this chore so that the new due_date is visible in Options
         self.hass.async_create_task(
@@ -3158,6 +3286,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             raise HomeAssistantError(
                 f"Missing 'due_date' key in chore data for '{chore_id}': {err}"
             )
+        self._index_chore_due(chore_id)
+        self._calendar_changed(chore_info.get("assigned_kids", []))
 
         # If the due date is cleared (None), then remove any recurring frequency
         # and custom interval settings unless the frequency is none, daily, or weekly.
@@ -3843,10 +3973,244 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
     # Storage
     # -------------------------------------------------------------------------------------
 
-    def _persist(self):
-        """Save to persistent storage."""
+    def _persist(self, *changed: tuple[str, Optional[str]]):
+        """Save to persistent storage; changes are coalesced and journaled by the storage manager.
+
+        changed lists the (section, item_id) pairs changed, item_id None for a whole
+        section, so only those are serialized; without them every item is compared.
+        """
+        self._data_version += 1
         self.storage_manager.set_data(self._data)
-        self.hass.add_job(self.storage_manager.async_save)
+        self.storage_manager.async_schedule_save(changed or None)
+
+    # -------------------------------------------------------------------------------------
+    # Derived Metrics
+    # -------------------------------------------------------------------------------------
+
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Bump the data version, then update the entities."""
+        self._data_version += 1
+        super().async_set_updated_data(data)
+
+    def _derived(self, key: Any, compute) -> Any:
+        """Return compute(), computed at most once per data version."""
+        if self._derived_version != self._data_version:
+            self._derived_version = self._data_version
+            self._derived_cache = {}
+        try:
+            return self._derived_cache[key]
+        except KeyError:
+            value = self._derived_cache[key] = compute()
+            return value
+
+    def get_kid_highest_badge(
+        self, kid_id: str
+    ) -> tuple[Optional[str], Any, dict[str, Any]]:
+        """Return the name, threshold and data of the highest-threshold badge the kid has."""
+
+        def badges_by_name() -> dict[str, dict[str, Any]]:
+            by_name = {}
+            for badge_info in self.badges_data.values():
+                by_name.setdefault(badge_info.get("name"), badge_info)
+            return by_name
+
+        def highest_badge() -> tuple[Optional[str], Any, dict[str, Any]]:
+            by_name = self._derived("badges_by_name", badges_by_name)
+            highest = (None, -1, {})
+            for badge_name in self.kids_data.get(kid_id, {}).get("badges", []):
+                badge_info = by_name.get(badge_name)
+                if not badge_info:
+                    continue
+                threshold_val = badge_info.get("threshold_value", 0)
+                if threshold_val > highest[1]:
+                    highest = (badge_name, threshold_val, badge_info)
+            return highest
+
+        return self._derived(("highest_badge", kid_id), highest_badge)
+
+    def get_points_to_next_badge(self, kid_id: str) -> Any:
+        """Return the points the kid needs for the lowest badge threshold above their points."""
+        thresholds = self._derived(
+            "badge_thresholds",
+            lambda: sorted(
+                badge.get("threshold_value", 0) for badge in self.badges_data.values()
+            ),
+        )
+        current_points = self.kids_data.get(kid_id, {}).get("points", 0)
+        idx = bisect_right(thresholds, current_points)
+        return thresholds[idx] - current_points if idx < len(thresholds) else 0
+
+    def get_achievement_percent(self, achievement_id: str) -> float:
+        """Return the overall progress percentage of all assigned kids toward an achievement."""
+
+        def achievement_percent() -> float:
+            achievement = self.achievements_data.get(achievement_id, {})
+            target = achievement.get("target_value", 1)
+            assigned_kids = achievement.get("assigned_kids", [])
+            if not assigned_kids:
+                return 0
+
+            progress = achievement.get("progress", {})
+            ach_type = achievement.get("type")
+            if ach_type == ACHIEVEMENT_TYPE_TOTAL:
+                total_current = 0
+                total_effective_target = 0
+                for kid_id in assigned_kids:
+                    progress_data = progress.get(kid_id, {})
+                    baseline = (
+                        progress_data.get("baseline", 0)
+                        if isinstance(progress_data, dict)
+                        else 0
+                    )
+                    total_current += self.kids_data.get(kid_id, {}).get(
+                        "completed_chores_total", 0
+                    )
+                    total_effective_target += baseline + target
+                percent = (
+                    (total_current / total_effective_target * 100)
+                    if total_effective_target > 0
+                    else 0
+                )
+
+            elif ach_type == ACHIEVEMENT_TYPE_STREAK:
+                total_current = 0
+                for kid_id in assigned_kids:
+                    progress_data = progress.get(kid_id, {})
+                    total_current += (
+                        progress_data.get("current_streak", 0)
+                        if isinstance(progress_data, dict)
+                        else 0
+                    )
+                global_target = target * len(assigned_kids)
+                percent = (
+                    (total_current / global_target * 100) if global_target > 0 else 0
+                )
+
+            elif ach_type == ACHIEVEMENT_TYPE_DAILY_MIN:
+                total_progress = 0
+                for kid_id in assigned_kids:
+                    daily = self.kids_data.get(kid_id, {}).get(
+                        "completed_chores_today", 0
+                    )
+                    total_progress += (
+                        100
+                        if daily >= target
+                        else (daily / target * 100)
+                        if target > 0
+                        else 0
+                    )
+                percent = total_progress / len(assigned_kids)
+
+            else:
+                percent = 0
+
+            return min(100, round(percent, 1))
+
+        return self._derived(("achievement_percent", achievement_id), achievement_percent)
+
+    def get_kid_streaks_by_achievement(self, kid_id: str) -> dict[str, int]:
+        """Return the kid's current streak for each streak-type achievement, by name."""
+
+        def streaks_by_kid() -> dict[str, dict[str, int]]:
+            streaks: dict[str, dict[str, int]] = {}
+            for achievement in self.achievements_data.values():
+                if achievement.get("type") != ACHIEVEMENT_TYPE_STREAK:
+                    continue
+                achievement_name = achievement.get("name", "Unnamed Achievement")
+                for kid, progress_for_kid in achievement.get("progress", {}).items():
+                    if isinstance(progress_for_kid, dict):
+                        streak = progress_for_kid.get("current_streak", 0)
+                    elif isinstance(progress_for_kid, int):
+                        streak = progress_for_kid
+                    else:
+                        continue
+                    streaks.setdefault(kid, {})[achievement_name] = streak
+            return streaks
+
+        return dict(self._derived("streaks_by_kid", streaks_by_kid).get(kid_id, {}))
+
+    def get_chore_approvals_today(self, chore_id: str) -> int:
+        """Return today's approvals of a chore, summed over its assigned kids."""
+
+        def approvals_today() -> dict[str, int]:
+            totals: dict[str, int] = {}
+            for chore_key, chore_info in self.chores_data.items():
+                total = 0
+                for kid_id in chore_info.get("assigned_kids", []):
+                    total += (
+                        self.kids_data.get(kid_id, {})
+                        .get("today_chore_approvals", {})
+                        .get(chore_key, 0)
+                    )
+                totals[chore_key] = total
+            return totals
+
+        return self._derived("chore_approvals_today", approvals_today).get(chore_id, 0)
+
+    def _pending_approvals_by_kid(
+        self,
+        section: str,
+        items: dict[str, Any],
+        item_key: str,
+        unknown_name: str,
+        name_attr: str,
+        timestamp_attr: str,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Group the pending approvals in section by kid name."""
+        grouped_by_kid: dict[str, list[dict[str, Any]]] = {}
+        for approval in self._data.get(section, []):
+            kid_name = self._get_kid_name_by_id(approval["kid_id"]) or UNKNOWN_KID
+            item_name = items.get(approval[item_key], {}).get("name", unknown_name)
+            grouped_by_kid.setdefault(kid_name, []).append(
+                {name_attr: item_name, timestamp_attr: approval["timestamp"]}
+            )
+        return grouped_by_kid
+
+    def get_pending_chore_approvals_by_kid(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the pending chore approvals, with chore names and claim times, by kid name."""
+        return self._derived(
+            "pending_chore_approvals",
+            lambda: self._pending_approvals_by_kid(
+                DATA_PENDING_CHORE_APPROVALS,
+                self.chores_data,
+                "chore_id",
+                UNKNOWN_CHORE,
+                ATTR_CHORE_NAME,
+                ATTR_CLAIMED_ON,
+            ),
+        )
+
+    def get_pending_reward_approvals_by_kid(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the pending reward approvals, with reward names and redeem times, by kid name."""
+        return self._derived(
+            "pending_reward_approvals",
+            lambda: self._pending_approvals_by_kid(
+                DATA_PENDING_REWARD_APPROVALS,
+                self.rewards_data,
+                "reward_id",
+                UNKNOWN_REWARD,
+                ATTR_REWARD_NAME,
+                ATTR_REDEEMED_ON,
+            ),
+        )
+
+    # -------------------------------------------------------------------------------------
+    # Calendar revisions
+    # -------------------------------------------------------------------------------------
+
+    def _calendar_changed(self, kid_ids: Optional[Iterable[str]] = None) -> None:
+        """Invalidate the cached calendar events of the given kids, or of all kids."""
+        if kid_ids is None:
+            self._calendar_revision += 1
+            return
+        for kid_id in kid_ids:
+            self._kid_calendar_revisions[kid_id] = (
+                self._kid_calendar_revisions.get(kid_id, 0) + 1
+            )
+
+    def calendar_revision(self, kid_id: str) -> tuple[int, int]:
+        """Return a value that changes whenever the kid's calendar events may have."""
+        return self._calendar_revision, self._kid_calendar_revisions.get(kid_id, 0)
 
     # -------------------------------------------------------------------------------------
     # Internal Helper for kid <-> name lookups
@@ -34,9 +34,11 @@ Available Sensors:
 28.* ChoreStreakSensor .................. Current streak (in days) for a kid for a specific chore - DEPRECATE
 """
 
+from copy import deepcopy
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -56,7 +58,6 @@ from .const import (
     ATTR_BADGES,
     ATTR_CHALLENGE_NAME,
     ATTR_CHALLENGE_TYPE,
-    ATTR_CLAIMED_ON,
     ATTR_CHORE_APPROVALS_COUNT,
     ATTR_CHORE_APPROVALS_TODAY,
     ATTR_CHORE_CLAIMS_COUNT,
@@ -85,7 +86,6 @@ from .const import (
     ATTR_RECURRING_FREQUENCY,
     ATTR_RAW_PROGRESS,
     ATTR_RAW_STREAK,
-    ATTR_REDEEMED_ON,
     ATTR_REWARD_APPROVALS_COUNT,
     ATTR_REWARD_CLAIMS_COUNT,
     ATTR_REWARD_NAME,
@@ -130,9 +130,6 @@ from .const import (
     REWARD_STATE_APPROVED,
     REWARD_STATE_CLAIMED,
     REWARD_STATE_NOT_CLAIMED,
-    UNKNOWN_CHORE,
-    UNKNOWN_KID,
-    UNKNOWN_REWARD,
 )
 from .coordinator import KidsChoresDataCoordinator
 from .kc_helpers import get_friendly_label
@@ -368,7 +365,29 @@ async def async_setup_entry(
 
 
 # ------------------------------------------------------------------------------------------
-class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
+class KidsChoresSensor(CoordinatorEntity, SensorEntity):
+    """Base for KidsChores sensors; only writes the state when it changed."""
+
+    _last_written = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state if the value, attributes, icon or availability changed since the last write."""
+        written = (
+            self.available,
+            self.native_value,
+            self.extra_state_attributes,
+            self.icon,
+        )
+        if written == self._last_written:
+            return
+        # Attributes can hold lists from the coordinator data, which change in place
+        self._last_written = deepcopy(written)
+        self.async_write_ha_state()
+
+
+# ------------------------------------------------------------------------------------------
+class ChoreStatusSensor(KidsChoresSensor):
     """Sensor for chore status: pending/claimed/approved/etc."""
 
     _attr_has_entity_name = True
@@ -479,7 +498,7 @@ class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class KidPointsSensor(CoordinatorEntity, SensorEntity):
+class KidPointsSensor(KidsChoresSensor):
     """Sensor for a kid's total points balance."""
 
     _attr_has_entity_name = True
@@ -519,7 +538,7 @@ class KidPointsSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class KidMaxPointsEverSensor(CoordinatorEntity, SensorEntity):
+class KidMaxPointsEverSensor(KidsChoresSensor):
     """Sensor showing the maximum points a kid has ever reached."""
 
     _attr_has_entity_name = True
@@ -556,7 +575,7 @@ class KidMaxPointsEverSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class CompletedChoresTotalSensor(CoordinatorEntity, SensorEntity):
+class CompletedChoresTotalSensor(KidsChoresSensor):
     """Sensor tracking the total number of chores a kid has completed since integration start."""
 
     _attr_has_entity_name = True
@@ -582,7 +601,7 @@ class CompletedChoresTotalSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class CompletedChoresDailySensor(CoordinatorEntity, SensorEntity):
+class CompletedChoresDailySensor(KidsChoresSensor):
     """How many chores kid completed today."""
 
     _attr_has_entity_name = True
@@ -607,7 +626,7 @@ class CompletedChoresDailySensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class CompletedChoresWeeklySensor(CoordinatorEntity, SensorEntity):
+class CompletedChoresWeeklySensor(KidsChoresSensor):
     """How many chores kid completed this week."""
 
     _attr_has_entity_name = True
@@ -632,7 +651,7 @@ class CompletedChoresWeeklySensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class CompletedChoresMonthlySensor(CoordinatorEntity, SensorEntity):
+class CompletedChoresMonthlySensor(KidsChoresSensor):
     """How many chores kid completed this month."""
 
     _attr_has_entity_name = True
@@ -657,7 +676,7 @@ class CompletedChoresMonthlySensor(CoordinatorEntity, SensorEntity):
 
 
 # DEPRECATE --------------------------------------------------------------------------------
-class KidBadgesSensor(CoordinatorEntity, SensorEntity):
+class KidBadgesSensor(KidsChoresSensor):
     """Sensor: number of badges earned + attribute with the list."""
 
     _attr_has_entity_name = True
@@ -687,7 +706,7 @@ class KidBadgesSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
+class KidHighestBadgeSensor(KidsChoresSensor):
     """Sensor that returns the "highest" badge the kid currently has."""
 
     _attr_has_entity_name = True
@@ -706,31 +725,9 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
 
     def _find_highest_badge(self):
         """Determine which badge has the highest ranking."""
-
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        earned_badge_names = kid_info.get("badges", [])
-
-        highest_badge = None
-        highest_value = -1
-
-        for badge_name in earned_badge_names:
-            # Find badge by name
-            badge_data = next(
-                (
-                    info
-                    for bid, info in self.coordinator.badges_data.items()
-                    if info.get("name") == badge_name
-                ),
-                None,
-            )
-            if not badge_data:
-                continue  # skip if not found or invalid
-
-            threshold_val = badge_data.get("threshold_value", 0)
-            if threshold_val > highest_value:
-                highest_value = threshold_val
-                highest_badge = badge_name
-
+        highest_badge, highest_value, _ = self.coordinator.get_kid_highest_badge(
+            self._kid_id
+        )
         return highest_badge, highest_value
 
     @property
@@ -745,16 +742,10 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
     @property
     def icon(self):
         """Return the icon for the highest badge. Fall back if none found."""
-        highest_badge, _ = self._find_highest_badge()
+        highest_badge, _, badge_data = self.coordinator.get_kid_highest_badge(
+            self._kid_id
+        )
         if highest_badge:
-            badge_data = next(
-                (
-                    info
-                    for bid, info in self.coordinator.badges_data.items()
-                    if info.get("name") == highest_badge
-                ),
-                {},
-            )
             return badge_data.get("icon", DEFAULT_TROPHY_ICON)
         return DEFAULT_TROPHY_OUTLINE
 
@@ -762,39 +753,22 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         """Provide additional details."""
         kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        highest_badge, highest_val = self._find_highest_badge()
+        highest_badge, highest_val, badge_data = (
+            self.coordinator.get_kid_highest_badge(self._kid_id)
+        )
 
         current_multiplier = 1.0
         friendly_labels = []
 
         if highest_badge:
-            badge_data = next(
-                (
-                    info
-                    for bid, info in self.coordinator.badges_data.items()
-                    if info.get("name") == highest_badge
-                ),
-                {},
-            )
             current_multiplier = badge_data.get("points_multiplier", 1.0)
             stored_labels = badge_data.get("badge_labels", [])
             friendly_labels = [
                 get_friendly_label(self.hass, label) for label in stored_labels
             ]
 
-        # Compute points needed for next badge:
-        current_points = kid_info.get("points", 0)
-        # Gather thresholds for badges that are higher than current points
-        thresholds = [
-            badge.get("threshold_value", 0)
-            for badge in self.coordinator.badges_data.values()
-            if badge.get("threshold_value", 0) > current_points
-        ]
-        if thresholds:
-            next_threshold = min(thresholds)
-            points_to_next_badge = next_threshold - current_points
-        else:
-            points_to_next_badge = 0
+        # Points needed for the lowest badge threshold above the current points
+        points_to_next_badge = self.coordinator.get_points_to_next_badge(self._kid_id)
 
         return {
             ATTR_KID_NAME: self._kid_name,
@@ -807,7 +781,7 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class BadgeSensor(CoordinatorEntity, SensorEntity):
+class BadgeSensor(KidsChoresSensor):
     """Sensor representing a single badge in KidsChores."""
 
     _attr_has_entity_name = True
@@ -876,7 +850,7 @@ class BadgeSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class PendingChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
+class PendingChoreApprovalsSensor(KidsChoresSensor):
     """Sensor listing all pending chore approvals."""
 
     _attr_has_entity_name = True
@@ -899,33 +873,11 @@ class PendingChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return detailed pending chores."""
-        approvals = self.coordinator._data.get(DATA_PENDING_CHORE_APPROVALS, [])
-        grouped_by_kid = {}
-
-        for approval in approvals:
-            kid_name = (
-                self.coordinator._get_kid_name_by_id(approval["kid_id"]) or UNKNOWN_KID
-            )
-            chore_info = self.coordinator.chores_data.get(approval["chore_id"], {})
-            chore_name = chore_info.get("name", UNKNOWN_CHORE)
-
-            timestamp = approval["timestamp"]
-
-            if kid_name not in grouped_by_kid:
-                grouped_by_kid[kid_name] = []
-
-            grouped_by_kid[kid_name].append(
-                {
-                    ATTR_CHORE_NAME: chore_name,
-                    ATTR_CLAIMED_ON: timestamp,
-                }
-            )
-
-        return grouped_by_kid
+        return self.coordinator.get_pending_chore_approvals_by_kid()
 
 
 # ------------------------------------------------------------------------------------------
-class PendingRewardApprovalsSensor(CoordinatorEntity, SensorEntity):
+class PendingRewardApprovalsSensor(KidsChoresSensor):
     """Sensor listing all pending reward approvals."""
 
     _attr_has_entity_name = True
@@ -948,33 +900,11 @@ class PendingRewardApprovalsSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return detailed pending rewards."""
-        approvals = self.coordinator._data.get(DATA_PENDING_REWARD_APPROVALS, [])
-        grouped_by_kid = {}
-
-        for approval in approvals:
-            kid_name = (
-                self.coordinator._get_kid_name_by_id(approval["kid_id"]) or UNKNOWN_KID
-            )
-            reward_info = self.coordinator.rewards_data.get(approval["reward_id"], {})
-            reward_name = reward_info.get("name", UNKNOWN_REWARD)
-
-            timestamp = approval["timestamp"]
-
-            if kid_name not in grouped_by_kid:
-                grouped_by_kid[kid_name] = []
-
-            grouped_by_kid[kid_name].append(
-                {
-                    ATTR_REWARD_NAME: reward_name,
-                    ATTR_REDEEMED_ON: timestamp,
-                }
-            )
-
-        return grouped_by_kid
+        return self.coordinator.get_pending_reward_approvals_by_kid()
 
 
 # DEPRECATE --------------------------------------------------------------------------------
-class RewardClaimsSensor(CoordinatorEntity, SensorEntity):
+class RewardClaimsSensor(KidsChoresSensor):
     """Sensor tracking how many times each reward has been claimed by a kid."""
 
     _attr_has_entity_name = True
@@ -1009,7 +939,7 @@ class RewardClaimsSensor(CoordinatorEntity, SensorEntity):
 
 
 # DEPRECATE --------------------------------------------------------------------------------
-class RewardApprovalsSensor(CoordinatorEntity, SensorEntity):
+class RewardApprovalsSensor(KidsChoresSensor):
     """Sensor tracking how many times each reward has been approved for a kid."""
 
     _attr_has_entity_name = True
@@ -1044,7 +974,7 @@ class RewardApprovalsSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class SharedChoreGlobalStateSensor(CoordinatorEntity, SensorEntity):
+class SharedChoreGlobalStateSensor(KidsChoresSensor):
     """Sensor that shows the global state of a shared chore."""
 
     _attr_has_entity_name = True
@@ -1089,12 +1019,9 @@ class SharedChoreGlobalStateSensor(CoordinatorEntity, SensorEntity):
             get_friendly_label(self.hass, label) for label in stored_labels
         ]
 
-        total_approvals_today = 0
-        for kid_id in assigned_kids_ids:
-            kid_data = self.coordinator.kids_data.get(kid_id, {})
-            total_approvals_today += kid_data.get("today_chore_approvals", {}).get(
-                self._chore_id, 0
-            )
+        total_approvals_today = self.coordinator.get_chore_approvals_today(
+            self._chore_id
+        )
 
         attributes = {
             ATTR_CHORE_NAME: self._chore_name,
@@ -1130,7 +1057,7 @@ class SharedChoreGlobalStateSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class RewardStatusSensor(CoordinatorEntity, SensorEntity):
+class RewardStatusSensor(KidsChoresSensor):
     """Shows the status of a reward for a particular kid."""
 
     _attr_has_entity_name = True
@@ -1205,7 +1132,7 @@ class RewardStatusSensor(CoordinatorEntity, SensorEntity):
 
 
 # DEPRECATE --------------------------------------------------------------------------------
-class ChoreClaimsSensor(CoordinatorEntity, SensorEntity):
+class ChoreClaimsSensor(KidsChoresSensor):
     """Sensor tracking how many times each chore has been claimed by a kid."""
 
     _attr_has_entity_name = True
@@ -1239,7 +1166,7 @@ class ChoreClaimsSensor(CoordinatorEntity, SensorEntity):
 
 
 # DEPRECATE --------------------------------------------------------------------------------
-class ChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
+class ChoreApprovalsSensor(KidsChoresSensor):
     """Sensor tracking how many times each chore has been approved for a kid."""
 
     _attr_has_entity_name = True
@@ -1273,7 +1200,7 @@ class ChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class PenaltyAppliesSensor(CoordinatorEntity, SensorEntity):
+class PenaltyAppliesSensor(KidsChoresSensor):
     """Sensor tracking how many times each penalty has been applied to a kid."""
 
     _attr_has_entity_name = True
@@ -1325,7 +1252,7 @@ class PenaltyAppliesSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class KidPointsEarnedDailySensor(CoordinatorEntity, SensorEntity):
+class KidPointsEarnedDailySensor(KidsChoresSensor):
     """Sensor for how many net points a kid earned today."""
 
     _attr_has_entity_name = True
@@ -1362,7 +1289,7 @@ class KidPointsEarnedDailySensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class KidPointsEarnedWeeklySensor(CoordinatorEntity, SensorEntity):
+class KidPointsEarnedWeeklySensor(KidsChoresSensor):
     """Sensor for how many net points a kid earned this week."""
 
     _attr_has_entity_name = True
@@ -1400,7 +1327,7 @@ class KidPointsEarnedWeeklySensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class KidPointsEarnedMonthlySensor(CoordinatorEntity, SensorEntity):
+class KidPointsEarnedMonthlySensor(KidsChoresSensor):
     """Sensor for how many net points a kid earned this month."""
 
     _attr_has_entity_name = True
@@ -1438,7 +1365,7 @@ class KidPointsEarnedMonthlySensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class AchievementSensor(CoordinatorEntity, SensorEntity):
+class AchievementSensor(KidsChoresSensor):
     """Sensor representing an achievement."""
 
     _attr_has_entity_name = True
@@ -1460,75 +1387,7 @@ class AchievementSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the overall progress percentage toward the achievement."""
-
-        achievement = self.coordinator.achievements_data.get(self._achievement_id, {})
-        target = achievement.get("target_value", 1)
-        assigned_kids = achievement.get("assigned_kids", [])
-
-        if not assigned_kids:
-            return 0
-
-        ach_type = achievement.get("type")
-        if ach_type == ACHIEVEMENT_TYPE_TOTAL:
-            total_current = 0
-            total_effective_target = 0
-
-            for kid_id in assigned_kids:
-                progress_data = achievement.get("progress", {}).get(kid_id, {})
-                baseline = (
-                    progress_data.get("baseline", 0)
-                    if isinstance(progress_data, dict)
-                    else 0
-                )
-                current_total = self.coordinator.kids_data.get(kid_id, {}).get(
-                    "completed_chores_total", 0
-                )
-                total_current += current_total
-                total_effective_target += baseline + target
-
-            percent = (
-                (total_current / total_effective_target * 100)
-                if total_effective_target > 0
-                else 0
-            )
-
-        elif ach_type == ACHIEVEMENT_TYPE_STREAK:
-            total_current = 0
-
-            for kid_id in assigned_kids:
-                progress_data = achievement.get("progress", {}).get(kid_id, {})
-                total_current += (
-                    progress_data.get("current_streak", 0)
-                    if isinstance(progress_data, dict)
-                    else 0
-                )
-
-            global_target = target * len(assigned_kids)
-
-            percent = (total_current / global_target * 100) if global_target > 0 else 0
-
-        elif ach_type == ACHIEVEMENT_TYPE_DAILY_MIN:
-            total_progress = 0
-
-            for kid_id in assigned_kids:
-                daily = self.coordinator.kids_data.get(kid_id, {}).get(
-                    "completed_chores_today", 0
-                )
-                kid_progress = (
-                    100
-                    if daily >= target
-                    else (daily / target * 100)
-                    if target > 0
-                    else 0
-                )
-                total_progress += kid_progress
-
-            percent = total_progress / len(assigned_kids)
-
-        else:
-            percent = 0
-
-        return min(100, round(percent, 1))
+        return self.coordinator.get_achievement_percent(self._achievement_id)
 
     @property
     def extra_state_attributes(self):
@@ -1598,7 +1457,7 @@ class AchievementSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class ChallengeSensor(CoordinatorEntity, SensorEntity):
+class ChallengeSensor(KidsChoresSensor):
     """Sensor representing a challenge."""
 
     _attr_has_entity_name = True
@@ -1724,7 +1583,7 @@ class ChallengeSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class AchievementProgressSensor(CoordinatorEntity, SensorEntity):
+class AchievementProgressSensor(KidsChoresSensor):
     """Sensor representing a kid's progress toward a specific achievement."""
 
     _attr_has_entity_name = True
@@ -1879,7 +1738,7 @@ class AchievementProgressSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class ChallengeProgressSensor(CoordinatorEntity, SensorEntity):
+class ChallengeProgressSensor(KidsChoresSensor):
     """Sensor representing a kid's progress toward a specific challenge."""
 
     _attr_has_entity_name = True
@@ -2021,7 +1880,7 @@ class ChallengeProgressSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class KidHighestStreakSensor(CoordinatorEntity, SensorEntity):
+class KidHighestStreakSensor(KidsChoresSensor):
     """Sensor returning the highest current streak among streak-type achievements for a kid."""
 
     _attr_has_entity_name = True
@@ -2055,20 +1914,7 @@ class KidHighestStreakSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra attributes including individual streaks per achievement."""
-        streaks = {}
-        for achievement in self.coordinator.achievements_data.values():
-            if achievement.get("type") == ACHIEVEMENT_TYPE_STREAK:
-                achievement_name = achievement.get("name", "Unnamed Achievement")
-                progress_for_kid = achievement.get("progress", {}).get(self._kid_id)
-
-                if isinstance(progress_for_kid, dict):
-                    streaks[achievement_name] = progress_for_kid.get(
-                        "current_streak", 0
-                    )
-
-                elif isinstance(progress_for_kid, int):
-                    streaks[achievement_name] = progress_for_kid
-
+        streaks = self.coordinator.get_kid_streaks_by_achievement(self._kid_id)
         return {"streaks_by_achievement": streaks}
 
     @property
@@ -2078,7 +1924,7 @@ class KidHighestStreakSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class ChoreStreakSensor(CoordinatorEntity, SensorEntity):
+class ChoreStreakSensor(KidsChoresSensor):
     """Sensor returning the current streak for a specific chore for a given kid."""
 
     _attr_has_entity_name = True
@@ -2147,7 +1993,7 @@ class ChoreStreakSensor(CoordinatorEntity, SensorEntity):
 
 
 # ------------------------------------------------------------------------------------------
-class BonusAppliesSensor(CoordinatorEntity, SensorEntity):
+class BonusAppliesSensor(KidsChoresSensor):
     """Sensor tracking how many times each bonus has been applied to a kid."""
 
     _attr_has_entity_name = True
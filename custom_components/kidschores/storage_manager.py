@@ -4,11 +4,28 @@
 Uses Home Assistant's Storage helper to save and load chore-related data, ensuring
 the state is preserved across restarts. This includes data for kids, chores,
 badges, rewards, penalties, and their statuses.
+
+Changes are coalesced for STORAGE_SAVE_DELAY seconds, then only the items that
+changed since the last write are appended to a change journal next to the
+storage file. The journal is replayed on top of the storage file at startup and
+compacted into it when it grows past STORAGE_JOURNAL_COMPACT_SIZE bytes or is
+older than STORAGE_JOURNAL_COMPACT_INTERVAL seconds.
+
+Journal entries carry a sequence number and the storage file records the last
+one it holds, so entries left behind by a crash between writing the storage
+file and removing the journal are skipped instead of replayed over newer data.
 """
 
+import asyncio
 import os
+import time
 
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 from .const import (
     DATA_ACHIEVEMENTS,
     DATA_BADGES,
@@ -22,11 +39,63 @@ from .const import (
     DATA_PENDING_REWARD_APPROVALS,
     DATA_REWARDS,
     LOGGER,
+    STORAGE_JOURNAL_COMPACT_INTERVAL,
+    STORAGE_JOURNAL_COMPACT_SIZE,
+    STORAGE_JOURNAL_SEQ_KEY,
+    STORAGE_JOURNAL_SUFFIX,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
 )
 
 
+def _journal_entry(seq: int, section, item_id, value: bytes = None) -> bytes:
+    """Return a journal line setting (or, without a value, deleting) an item or section."""
+    entry = b"[" + json_bytes(seq) + b"," + json_bytes(section) + b"," + json_bytes(item_id)
+    if value is None:
+        return entry + b"]\n"
+    return entry + b"," + value + b"]\n"
+
+
+def _replay_journal(data: dict, path: str, snapshot_seq: int) -> tuple[int, int]:
+    """Apply the journal entries after snapshot_seq at path to data.
+
+    Returns the number of entries applied and the last sequence number seen.
+    """
+    last_seq = snapshot_seq
+    if not os.path.isfile(path):
+        return 0, last_seq
+    applied = 0
+    with open(path, "rb") as journal:
+        for line in journal:
+            try:
+                entry = json_loads(line)
+            except ValueError:
+                # A write cut short by a crash leaves a partial last line.
+                LOGGER.warning("Ignoring truncated entry at the end of %s", path)
+                break
+            seq, section, item_id = entry[0], entry[1], entry[2]
+            last_seq = max(last_seq, seq)
+            if seq <= snapshot_seq:
+                # Already in the storage file, written before the journal was removed.
+                continue
+            if item_id is None:
+                if len(entry) > 3:
+                    data[section] = entry[3]
+                else:
+                    data.pop(section, None)
+            else:
+                items = data.get(section)
+                if not isinstance(items, dict):
+                    items = data[section] = {}
+                if len(entry) > 3:
+                    items[item_id] = entry[3]
+                else:
+                    items.pop(item_id, None)
+            applied += 1
+    return applied, last_seq
+
+
 class KidsChoresStorageManager:
     """Manages loading, saving, and accessing data from Home Assistant's storage.
 
@@ -46,6 +115,27 @@ class KidsChoresStorageManager:
         self._store = Store(hass, STORAGE_VERSION, storage_key)
         self._data = {}  # In-memory data cache for quick access.
 
+        # Journal of the items changed since the storage file was last written.
+        self._journal_path = self._store._path + STORAGE_JOURNAL_SUFFIX
+        self._journal_size = 0
+        self._last_compact = time.monotonic()
+
+        # Sequence number of the last journaled changes.
+        self._seq = 0
+
+        # Each item as last written, serialized, as {section: {item_id: bytes}}
+        # for dict sections and {section: bytes} for the others.
+        self._written = {}
+
+        # Items changed since the last flush, as {section: set of item_ids}, or
+        # None for a whole section; every item is compared when they're not known.
+        self._changed = {}
+        self._changed_all = True
+
+        self._save_lock = asyncio.Lock()
+        self._unsub_save = None
+        self._unsub_final_write = None
+
     async def async_initialize(self):
         """Load data from storage during startup.
 
@@ -75,6 +165,22 @@ class KidsChoresStorageManager:
             self._data = existing_data
             LOGGER.info("Storage data loaded successfully")
 
+        # Apply the changes written since the storage file, then fold them into it.
+        snapshot_seq = self._data.pop(STORAGE_JOURNAL_SEQ_KEY, 0)
+        applied, self._seq = await self.hass.async_add_executor_job(
+            _replay_journal, self._data, self._journal_path, snapshot_seq
+        )
+        if applied:
+            LOGGER.info("Replayed %s change journal entries", applied)
+            await self.async_save()
+        else:
+            self._collect_changes()
+
+        if self._unsub_final_write is None:
+            self._unsub_final_write = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+            )
+
     @property
     def data(self):
         """Retrieve the in-memory data cache."""
@@ -86,6 +192,8 @@ class KidsChoresStorageManager:
 
     def set_data(self, new_data: dict):
         """Replace the entire in-memory data structure."""
+        if new_data is not self._data:
+            self._changed_all = True
         self._data = new_data
 
     def get_kids(self):
@@ -152,13 +260,171 @@ class KidsChoresStorageManager:
 
         return self._data.get("linked_users", {})
 
-    async def async_save(self):
-        """Save the current data structure to storage asynchronously."""
+    @callback
+    def async_mark_changed(self, changed=None):
+        """Record the (section, item_id) pairs changed, item_id None for a whole section.
+
+        Without them, every item is compared with how it was last written on the
+        next flush.
+        """
+        if changed is None:
+            self._changed_all = True
+        if self._changed_all:
+            return
+        for section, item_id in changed:
+            if item_id is None:
+                self._changed[section] = None
+            else:
+                item_ids = self._changed.setdefault(section, set())
+                if item_ids is not None:
+                    item_ids.add(item_id)
+
+    def _collect_changes(self) -> list[tuple]:
+        """Return (section, item_id, serialized value) for the items changed since the last write.
+
+        Only the items marked changed are serialized and compared with how they
+        were last written, or all of them when the changes aren't known. The
+        value is None for a deleted item or section.
+        """
+        if self._changed_all:
+            changed = dict.fromkeys(
+                [*self._data, *(section for section in self._written if section not in self._data)]
+            )
+        else:
+            changed = self._changed
+        self._changed = {}
+        self._changed_all = False
+        changes = []
+        for section, item_ids in changed.items():
+            self._collect_section_changes(section, item_ids, changes)
+        return changes
+
+    def _collect_section_changes(self, section, item_ids, changes: list):
+        """Add the changes to a section's items to changes; all items when item_ids is None."""
+        old = self._written.get(section)
+        if section not in self._data:
+            if section in self._written:
+                del self._written[section]
+                changes.append((section, None, None))
+            return
+        value = self._data[section]
+        if not isinstance(value, dict):
+            value_bytes = json_bytes(value)
+            if old != value_bytes:
+                self._written[section] = value_bytes
+                changes.append((section, None, value_bytes))
+            return
+        if not isinstance(old, dict):
+            changes.append((section, None, b"{}"))
+            old = self._written[section] = {}
+            item_ids = None
+        if item_ids is None:
+            item_ids = [*value, *(item_id for item_id in old if item_id not in value)]
+        for item_id in item_ids:
+            if item_id in value:
+                item_bytes = json_bytes(value[item_id])
+                if old.get(item_id) != item_bytes:
+                    old[item_id] = item_bytes
+                    changes.append((section, item_id, item_bytes))
+            elif item_id in old:
+                del old[item_id]
+                changes.append((section, item_id, None))
+
+    def _append_journal(self, chunk: bytes):
+        """Append chunk to the journal and sync it to disk (runs in the executor)."""
+        with open(self._journal_path, "ab") as journal:
+            journal.write(chunk)
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def _truncate_journal(self):
+        """Remove the journal once the storage file holds its changes (runs in the executor)."""
+        if os.path.isfile(self._journal_path):
+            os.remove(self._journal_path)
+
+    @callback
+    def async_schedule_save(self, changed=None):
+        """Write the changes made so far once the coalescing window closes.
+
+        changed lists the (section, item_id) pairs changed, see async_mark_changed.
+        """
+        self.async_mark_changed(changed)
+        if self._unsub_save is None:
+            self._unsub_save = async_call_later(
+                self.hass, STORAGE_SAVE_DELAY, self._async_delayed_flush
+            )
+
+    async def _async_delayed_flush(self, _now):
+        """Flush the coalesced changes when the save timer fires."""
+        self._unsub_save = None
+        await self.async_flush()
+
+    async def _async_final_write(self, _event):
+        """Flush pending changes before Home Assistant stops."""
+        self._unsub_final_write = None
+        # Also catch changes made without marking them.
+        self.async_mark_changed()
+        await self.async_flush()
+
+    async def async_flush(self):
+        """Write the changed items to the journal, compacting it when due."""
+        if self._unsub_save is not None:
+            self._unsub_save()
+            self._unsub_save = None
+        async with self._save_lock:
+            changes = self._collect_changes()
+            if not changes:
+                return
+            self._seq += 1
+            chunk = b"".join(_journal_entry(self._seq, *change) for change in changes)
+            if (
+                self._journal_size + len(chunk) > STORAGE_JOURNAL_COMPACT_SIZE
+                or self._journal_size
+                and time.monotonic() - self._last_compact > STORAGE_JOURNAL_COMPACT_INTERVAL
+            ):
+                await self._async_write_snapshot()
+                return
+            try:
+                await self.hass.async_add_executor_job(self._append_journal, chunk)
+                self._journal_size += len(chunk)
+                LOGGER.debug("Journaled %s changed items (%s bytes)", len(changes), len(chunk))
+            except OSError as e:
+                LOGGER.error("Failed to write change journal, saving all data: %s", e)
+                await self._async_write_snapshot()
+
+    async def _async_write_snapshot(self):
+        """Write the whole data structure to storage and empty the journal."""
         try:
-            await self._store.async_save(self._data)
-            LOGGER.info("Data saved successfully to storage")
+            await self._store.async_save({**self._data, STORAGE_JOURNAL_SEQ_KEY: self._seq})
         except Exception as e:
             LOGGER.error("Failed to save data to storage: %s", e)
+            # Write everything again on the next flush.
+            self._written = {}
+            self._changed_all = True
+            return
+        self._journal_size = 0
+        self._last_compact = time.monotonic()
+        LOGGER.info("Data saved successfully to storage")
+        try:
+            await self.hass.async_add_executor_job(self._truncate_journal)
+        except OSError as e:
+            # Its entries are all in the storage file, so they're skipped at startup.
+            LOGGER.error("Failed to remove change journal: %s", e)
+
+    async def async_save(self):
+        """Save the current data structure to storage asynchronously."""
+        async with self._save_lock:
+            self.async_mark_changed()
+            self._collect_changes()
+            await self._async_write_snapshot()
+
+    async def async_shutdown(self):
+        """Flush pending changes and stop listening for Home Assistant stopping."""
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        self.async_mark_changed()
+        await self.async_flush()
 
     async def async_clear_data(self):
         """Clear all stored data and reset to default structure."""
@@ -182,7 +448,10 @@ class KidsChoresStorageManager:
     async def async_delete_storage(self) -> None:
         """Delete the storage file completely from disk."""
 
-        # First clear in-memory data
+        # Drop any pending save, then clear in-memory data
+        if self._unsub_save is not None:
+            self._unsub_save()
+            self._unsub_save = None
         await self.async_clear_data()
 
         # Remove the file if it exists
@@ -195,6 +464,11 @@ class KidsChoresStorageManager:
         else:
             LOGGER.info("Storage file not found: %s", self._store._path)
 
+        try:
+            await self.hass.async_add_executor_job(self._truncate_journal)
+        except OSError as e:
+            LOGGER.error("Failed to remove change journal: %s", e)
+
     async def async_update_data(self, key, value):
         """Update a specific section of the data structure."""
 
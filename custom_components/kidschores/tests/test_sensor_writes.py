@@ -0,0 +1,141 @@
+# tests/test_sensor_writes.py
+"""Sensor state write tests for KidsChores.
+
+Validates:
+- Every sensor writes its state on the first coordinator update
+- Approving a chore writes only the sensors whose value or attributes changed;
+  sensors for other kids and chores are not written again
+- Attribute lists changed in place by the coordinator are still written
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kidschores.const import (
+    CONF_NOTIFY_ON_APPROVAL,
+    DATA_ACHIEVEMENTS,
+    DATA_BADGES,
+    DATA_BONUSES,
+    DATA_CHALLENGES,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PARENTS,
+    DATA_PENALTIES,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
+    DATA_REWARDS,
+)
+from custom_components.kidschores.coordinator import KidsChoresDataCoordinator
+from custom_components.kidschores.sensor import (
+    ChoreStatusSensor,
+    KidPointsSensor,
+    KidsChoresSensor,
+)
+
+KIDS = ["alice", "bob"]
+CHORES = ["dishes", "laundry"]
+
+
+class FakeStorageManager:
+    """Storage manager keeping nothing."""
+
+    def get_data(self) -> Dict[str, Any]:
+        return {}
+
+    def set_data(self, data: Dict[str, Any]) -> None:
+        pass
+
+    def async_schedule_save(self, changed=None) -> None:
+        pass
+
+
+def _make_coordinator(hass: HomeAssistant) -> KidsChoresDataCoordinator:
+    coordinator = KidsChoresDataCoordinator(hass, SimpleNamespace(entry_id="test"), FakeStorageManager())
+    coordinator._data = {
+        DATA_KIDS: {},
+        DATA_CHORES: {},
+        DATA_BADGES: {},
+        DATA_REWARDS: {},
+        DATA_PARENTS: {},
+        DATA_PENALTIES: {},
+        DATA_BONUSES: {},
+        DATA_ACHIEVEMENTS: {},
+        DATA_CHALLENGES: {},
+        DATA_PENDING_CHORE_APPROVALS: [],
+        DATA_PENDING_REWARD_APPROVALS: [],
+    }
+    for kid in KIDS:
+        coordinator._create_kid(kid, {"name": kid})
+    for chore in CHORES:
+        coordinator._create_chore(
+            chore,
+            {
+                "name": chore,
+                "assigned_kids": KIDS,
+                "default_points": 10,
+                CONF_NOTIFY_ON_APPROVAL: False,
+            },
+        )
+    return coordinator
+
+
+def _make_sensors(coordinator: KidsChoresDataCoordinator) -> Dict[tuple, KidsChoresSensor]:
+    """Return the points and chore status sensors of all kids, counting their writes."""
+    entry = coordinator.config_entry
+    sensors: Dict[tuple, KidsChoresSensor] = {}
+    for kid in KIDS:
+        sensors[(kid, "points")] = KidPointsSensor(coordinator, entry, kid, kid, "Points", "mdi:star")
+        for chore in CHORES:
+            sensors[(kid, chore)] = ChoreStatusSensor(coordinator, entry, kid, kid, chore, chore)
+    for sensor in sensors.values():
+        sensor.writes = 0
+
+        def _count_write(sensor: KidsChoresSensor = sensor) -> None:
+            sensor.writes += 1
+
+        sensor.async_write_ha_state = _count_write  # type: ignore[method-assign]
+        coordinator.async_add_listener(sensor._handle_coordinator_update)
+    return sensors
+
+
+def _written(sensors: Dict[tuple, KidsChoresSensor]) -> List[tuple]:
+    written = sorted(key for key, sensor in sensors.items() if sensor.writes)
+    for sensor in sensors.values():
+        sensor.writes = 0
+    return written
+
+
+@pytest.mark.asyncio
+async def test_approval_writes_only_changed_sensors(hass: HomeAssistant) -> None:
+    """Approving a chore writes the sensors showing it and that kid's points, nothing else."""
+    coordinator = _make_coordinator(hass)
+    sensors = _make_sensors(coordinator)
+
+    coordinator.async_set_updated_data(coordinator._data)
+    assert _written(sensors) == sorted(sensors)
+
+    # nothing changed: no sensor is written again
+    coordinator.async_set_updated_data(coordinator._data)
+    assert _written(sensors) == []
+
+    coordinator.approve_chore("parent", "alice", "dishes")
+    # bob's dishes sensor shows the chore's global state, which changed too
+    assert _written(sensors) == [("alice", "dishes"), ("alice", "points"), ("bob", "dishes")]
+
+
+@pytest.mark.asyncio
+async def test_in_place_attribute_changes_are_written(hass: HomeAssistant) -> None:
+    """A list attribute the coordinator changes in place still writes the sensors showing it."""
+    coordinator = _make_coordinator(hass)
+    sensors = _make_sensors(coordinator)
+    coordinator.async_set_updated_data(coordinator._data)
+    _written(sensors)
+
+    # the applicable days attribute is the chore's own list
+    coordinator.chores_data["laundry"]["applicable_days"].append("sat")
+    coordinator.async_set_updated_data(coordinator._data)
+    assert _written(sensors) == [("alice", "laundry"), ("bob", "laundry")]
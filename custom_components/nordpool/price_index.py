@@ -0,0 +1,156 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from operator import itemgetter, sub
+
+
+class PriceIndex:
+    """Answers price queries over today's and tomorrow's prices of a sensor.
+
+    Built once per priced series from the start, end and price of the slots
+    of each day: the slots sorted by start, the prices in an array with
+    prefix sums for window averages and the slot indexes sorted by price for
+    rankings.  Slots without a valid price are NaN and never part of an
+    answer.
+    """
+
+    def __init__(self, *days):
+        items = sorted(
+            (item for day in days for item in day),
+            key=itemgetter("start"),
+        )
+        self.starts = [item["start"] for item in items]
+        self.ends = [item["end"] for item in items]
+        self.prices = array("d")
+        # sums of the valid prices, counts of the invalid ones and of the gaps
+        # (or changes of resolution) between a slot and the one before it,
+        # all before slot i
+        self._sums = array("d", [0.0])
+        self._invalid = array("l", [0])
+        self._gaps = array("l", [0])
+        previous = None
+        for item in items:
+            value = item["value"]
+            valid = value is not None and math.isfinite(value)
+            self.prices.append(value if valid else math.nan)
+            self._sums.append(self._sums[-1] + (value if valid else 0.0))
+            self._invalid.append(self._invalid[-1] + (not valid))
+            gap = previous is not None and (
+                item["start"] != previous["end"]
+                or item["end"] - item["start"] != previous["end"] - previous["start"]
+            )
+            self._gaps.append(self._gaps[-1] + gap)
+            previous = item
+
+        self._by_price = sorted(
+            (i for i, price in enumerate(self.prices) if not math.isnan(price)),
+            key=self.prices.__getitem__,
+        )
+        self._sorted_prices = array("d", [self.prices[i] for i in self._by_price])
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _bounds(self, start=None, end=None) -> tuple:
+        """Return the slot range (lo, hi) of the slots within start and end."""
+        lo = 0 if start is None else bisect_right(self.ends, start)
+        hi = len(self.starts) if end is None else bisect_right(self.ends, end)
+        return lo, max(lo, hi)
+
+    def _slot(self, i) -> dict:
+        return {"start": self.starts[i], "end": self.ends[i], "value": self.prices[i]}
+
+    def _span(self, lo, hi) -> dict:
+        return {
+            "start": self.starts[lo],
+            "end": self.ends[hi - 1],
+            "average": (self._sums[hi] - self._sums[lo]) / (hi - lo),
+        }
+
+    def cheapest_window(self, duration: timedelta, start=None, end=None):
+        """Return the contiguous window of duration with the lowest average.
+
+        Only windows that start at a slot start and lie within start and end
+        are considered, None if there is none.
+        """
+        lo, hi = self._bounds(start, end)
+        if lo == hi:
+            return None
+        width = max(1, math.ceil(duration / (self.ends[lo] - self.starts[lo])))
+        last = hi - width
+        if last < lo:
+            return None
+        sums, invalid, gaps = self._sums, self._invalid, self._gaps
+
+        if invalid[hi] == invalid[lo] and gaps[hi] == gaps[lo + 1]:
+            # no holes, every window counts
+            totals = list(map(sub, sums[lo + width : hi + 1], sums[lo : last + 1]))
+            best = lo + totals.index(min(totals))
+        else:
+            best = None
+            best_sum = math.inf
+            for i in range(lo, last + 1):
+                j = i + width
+                if invalid[j] != invalid[i] or gaps[j] != gaps[i + 1]:
+                    continue
+                if sums[j] - sums[i] < best_sum:
+                    best, best_sum = i, sums[j] - sums[i]
+            if best is None:
+                return None
+        return self._span(best, best + width)
+
+    def top_k(self, count: int, start=None, end=None, highest=False) -> list:
+        """Return the count cheapest (or highest priced) slots, in price order."""
+        lo, hi = self._bounds(start, end)
+        order = reversed(self._by_price) if highest else self._by_price
+        result = []
+        if count <= 0:
+            return result
+        for i in order:
+            if lo <= i < hi:
+                result.append(self._slot(i))
+                if len(result) == count:
+                    break
+        return result
+
+    def price_at(self, when):
+        """Return the price of the slot when falls in, None if there is none."""
+        i = bisect_right(self.starts, when) - 1
+        if i < 0 or when >= self.ends[i] or math.isnan(self.prices[i]):
+            return None
+        return self.prices[i]
+
+    def percentile_rank(self, price: float) -> float:
+        """Return the percentage of priced slots that are cheaper than price."""
+        if not self._sorted_prices:
+            return None
+        return 100.0 * bisect_left(self._sorted_prices, price) / len(self._sorted_prices)
+
+    def threshold_runs(
+        self, threshold: float, start=None, end=None, below=True, min_duration=None
+    ) -> list:
+        """Return the runs of consecutive slots priced below (or above) threshold.
+
+        Runs shorter than min_duration are left out.
+        """
+        lo, hi = self._bounds(start, end)
+        prices, gaps, starts, ends = self.prices, self._gaps, self.starts, self.ends
+        runs = []
+        run = None
+        for i in range(lo, hi):
+            price = prices[i]
+            inside = price < threshold if below else price > threshold
+            # a gap in the data ends a run too
+            if run is not None and (not inside or gaps[i + 1] != gaps[i]):
+                runs.append((run, i))
+                run = None
+            if inside and run is None:
+                run = i
+        if run is not None:
+            runs.append((run, hi))
+        return [
+            self._span(first, last)
+            for first, last in runs
+            if min_duration is None or ends[last - 1] - starts[first] >= min_duration
+        ]
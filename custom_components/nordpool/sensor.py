@@ -1,5 +1,6 @@
 import logging
 import math
+from array import array
 from operator import itemgetter
 from statistics import mean, median
 
@@ -36,6 +37,8 @@ from .const import (
     _CENT_MULTIPLIER,
 )
 from .misc import start_of, stock
+from .price_index import PriceIndex
+from .services import async_setup_entity_services
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -92,6 +95,7 @@ def _dry_setup(hass, config, add_devices, discovery_info=None):
 
 async def async_setup_platform(hass, config, add_devices, discovery_info=None) -> True:
     _dry_setup(hass, config, add_devices)
+    async_setup_entity_services()
     return True
 
 
@@ -99,9 +103,52 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
     """Setup sensor platform for the ui"""
     config = config_entry.data
     _dry_setup(hass, config, async_add_devices)
+    async_setup_entity_services()
     return True
 
 
+class PricedDay:
+    """A day of prices with the sensor's settings and additional costs applied.
+
+    Computed once per api data and kept as arrays, the attribute lists are
+    built the first time they are needed and then reused.
+    """
+
+    __slots__ = ("source", "items", "prices", "costs", "_index", "_values", "_raw")
+
+    def __init__(self, source, items, price_and_cost):
+        self.source = source
+        self.items = items
+        self.prices = array("d")
+        self.costs = array("d")
+        for item in items:
+            price, cost = price_and_cost(item["value"], item["start"])
+            self.prices.append(math.nan if price is None else price)
+            self.costs.append(math.nan if cost is None else cost)
+        self._index = {item["start"]: i for i, item in enumerate(items)}
+        self._values = None
+        self._raw = None
+
+    def slot(self, start):
+        """Index of the slot starting at start, None if there is none."""
+        return self._index.get(start)
+
+    def values(self) -> list:
+        """Prices of the day, None for slots without a price."""
+        if self._values is None:
+            self._values = [None if math.isnan(p) else p for p in self.prices]
+        return self._values
+
+    def raw(self) -> list:
+        """Start, end and price of every slot."""
+        if self._raw is None:
+            self._raw = [
+                {"start": item["start"], "end": item["end"], "value": value}
+                for item, value in zip(self.items, self.values())
+            ]
+        return self._raw
+
+
 class NordpoolSensor(SensorEntity):
     "Sensors data"
 
@@ -173,6 +220,14 @@ class NordpoolSensor(SensorEntity):
         # To control the updates.
         self._last_tick = None
 
+        # Priced series of the last days seen, see _priced_day.
+        self._priced_days = []
+        # (PricedDay, index) of the current hour.
+        self._current_slot = None
+        self._template_reads_states = None
+        # (today, tomorrow, PriceIndex) of the priced series, see price_index.
+        self._price_index = None
+
     @property
     def name(self) -> str:
         return self.unique_id
@@ -224,6 +279,10 @@ class NordpoolSensor(SensorEntity):
     @property
     def additional_costs(self):
         """Additional costs."""
+        if self._current_slot is not None:
+            day, index = self._current_slot
+            cost = day.costs[index]
+            return None if math.isnan(cost) else cost
         return self._additional_costs_value
 
     @property
@@ -251,9 +310,16 @@ class NordpoolSensor(SensorEntity):
         if value is None:
             value = self._current_price
 
+        price, template_value = self._price_and_cost(value, fake_dt)
+        if template_value is not None:
+            self._additional_costs_value = template_value
+        return price
+
+    def _price_and_cost(self, value, fake_dt=None) -> tuple:
+        """Return the price with the users settings and the additional costs in it."""
         if value is None or math.isinf(value):
             # _LOGGER.debug("api returned junk infinty %s", value)
-            return None
+            return None, None
 
         def faker():
             def inner(*_, **__):
@@ -279,7 +345,6 @@ class NordpoolSensor(SensorEntity):
                 )
                 raise
 
-        self._additional_costs_value = template_value
         try:
             price += template_value
         except Exception:
@@ -297,7 +362,48 @@ class NordpoolSensor(SensorEntity):
         if self._use_cents:
             price = price * _CENT_MULTIPLIER
 
-        return round(price, self._precision)
+        return round(price, self._precision), template_value
+
+    def _priced_day(self, data):
+        """Return the priced series of the api data, computed once per data."""
+        if data is None or data is SENTINEL:
+            return None
+
+        for day in self._priced_days:
+            if day.source is data:
+                return day
+
+        day = PricedDay(data, self._someday(data), self._price_and_cost)
+        # today and tomorrow, and yesterday's tomorrow until the api moved it
+        self._priced_days = [*self._priced_days[-2:], day]
+        return day
+
+    def price_index(self) -> PriceIndex:
+        """The PriceIndex over today's and tomorrow's prices as the sensor has
+        them, it is only rebuilt when they are priced again."""
+        today = self._priced_day(self._data_today)
+        tomorrow = self._priced_day(self._data_tomorrow)
+        cached = self._price_index
+        if cached is not None and cached[0] is today and cached[1] is tomorrow:
+            return cached[2]
+
+        index = PriceIndex(*(day.raw() for day in (today, tomorrow) if day))
+        self._price_index = (today, tomorrow, index)
+        return index
+
+    def _reads_states(self) -> bool:
+        """Check if the additional costs template reads entity states."""
+        if self._template_reads_states is None:
+            info = self._ad_template.async_render_to_info(current_price=0.0)
+            self._template_reads_states = bool(
+                info.exception is not None
+                or info.entities
+                or info.domains
+                or info.domains_lifecycle
+                or info.all_states
+                or info.all_states_lifecycle
+            )
+        return self._template_reads_states
 
     def _update(self):
         """Set attrs"""
@@ -318,6 +424,10 @@ class NordpoolSensor(SensorEntity):
     @property
     def current_price(self) -> float:
         """This the current price for the hour we are in at any given time."""
+        if self._current_slot is not None:
+            day, index = self._current_slot
+            price = day.prices[index]
+            return None if math.isnan(price) else price
         res = self._calc_price()
         # _LOGGER.debug("Current hours price for %s is %s", self.name, res)
         return res
@@ -349,11 +459,8 @@ class NordpoolSensor(SensorEntity):
         Returns:
             list: sorted list where today[0] is the price of hour 00.00 - 01.00
         """
-        return [
-            self._calc_price(i["value"], fake_dt=i["start"])
-            for i in self._someday(self._data_today)
-            if i
-        ]
+        day = self._priced_day(self._data_today)
+        return day.values() if day else []
 
     @property
     def tomorrow(self) -> list:
@@ -362,11 +469,8 @@ class NordpoolSensor(SensorEntity):
         Returns:
             list: sorted where tomorrow[0] is the price of hour 00.00 - 01.00 etc.
         """
-        return [
-            self._calc_price(i["value"], fake_dt=i["start"])
-            for i in self._someday(self._data_tomorrow)
-            if i
-        ]
+        day = self._priced_day(self._data_tomorrow)
+        return day.values() if day else []
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -396,15 +500,8 @@ class NordpoolSensor(SensorEntity):
 
     def _add_raw(self, data) -> list:
         """Helper"""
-        result = []
-        for res in self._someday(data):
-            item = {
-                "start": res["start"],
-                "end": res["end"],
-                "value": self._calc_price(res["value"], fake_dt=res["start"]),
-            }
-            result.append(item)
-        return result
+        day = self._priced_day(data)
+        return day.raw() if day else []
 
     @property
     def raw_today(self) -> list:
@@ -428,12 +525,16 @@ class NordpoolSensor(SensorEntity):
 
         data = await self._api.today(self._area, self._currency)
         if data:
-            for item in self._someday(data):
-                if item["start"] == start_of(local_now, "hour"):
-                    self._current_price = item["value"]
-                    _LOGGER.debug(
-                        "Updated %s _current_price %s", self.name, item["value"]
-                    )
+            day = self._priced_day(data)
+            index = day.slot(start_of(local_now, "hour"))
+            if index is not None:
+                self._current_price = day.items[index]["value"]
+                _LOGGER.debug(
+                    "Updated %s _current_price %s", self.name, self._current_price
+                )
+                self._current_slot = (day, index)
+            else:
+                self._current_slot = None
         else:
             _LOGGER.debug("Cant update _update_current_price because it was no data")
 
@@ -447,6 +548,12 @@ class NordpoolSensor(SensorEntity):
     async def handle_new_hr(self):
         """Update attrs for the new hour"""
         _LOGGER.debug("handle_new_hr")
+        # Prices are computed once per data, unless the additional costs
+        # depend on other entities.
+        if self._reads_states():
+            self._priced_days = []
+            self._current_slot = None
+
         today = await self._api.today(self._area, self._currency)
         if today:
             self._data_today = today
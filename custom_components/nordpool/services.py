@@ -5,7 +5,14 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.util import dt as dt_util
@@ -48,6 +55,119 @@ YEAR_SCHEMA = vol.Schema(
 )
 
 
+QUERY_SCHEMA = {
+    vol.Optional("start"): cv.datetime,
+    vol.Optional("end"): cv.datetime,
+}
+
+
+CHEAPEST_WINDOW_SCHEMA = {
+    **QUERY_SCHEMA,
+    vol.Required("duration"): cv.time_period,
+}
+
+
+TOP_K_SCHEMA = {
+    **QUERY_SCHEMA,
+    vol.Required("count"): cv.positive_int,
+    vol.Optional("highest", default=False): cv.boolean,
+}
+
+
+PERCENTILE_RANK_SCHEMA = {
+    vol.Exclusive("price", "price"): vol.Coerce(float),
+    vol.Exclusive("at", "price"): cv.datetime,
+}
+
+
+THRESHOLD_RUNS_SCHEMA = {
+    **QUERY_SCHEMA,
+    vol.Required("threshold"): vol.Coerce(float),
+    vol.Optional("below", default=True): cv.boolean,
+    vol.Optional("min_duration"): cv.time_period,
+}
+
+
+def _local(value):
+    """Datetimes without a timezone are in Home Assistant's timezone."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=dt_util.get_default_time_zone())
+    return value
+
+
+def _window(sc) -> tuple:
+    """The start and end of a query, from now until the end of the data by default."""
+    return _local(sc.get("start")) or dt_util.now(), _local(sc.get("end"))
+
+
+async def cheapest_window(sensor, service_call: ServiceCall) -> ServiceResponse:
+    sc = service_call.data
+    _LOGGER.debug("called cheapest_window on %s with %r", sensor.entity_id, sc)
+    start, end = _window(sc)
+
+    return {
+        "window": sensor.price_index().cheapest_window(sc["duration"], start, end)
+    }
+
+
+async def top_k(sensor, service_call: ServiceCall) -> ServiceResponse:
+    sc = service_call.data
+    _LOGGER.debug("called top_k on %s with %r", sensor.entity_id, sc)
+    start, end = _window(sc)
+
+    return {
+        "slots": sensor.price_index().top_k(
+            sc["count"], start, end, highest=sc["highest"]
+        )
+    }
+
+
+async def percentile_rank(sensor, service_call: ServiceCall) -> ServiceResponse:
+    sc = service_call.data
+    _LOGGER.debug("called percentile_rank on %s with %r", sensor.entity_id, sc)
+    index = sensor.price_index()
+
+    price = sc.get("price")
+    if price is None:
+        price = index.price_at(_local(sc.get("at")) or dt_util.now())
+    return {
+        "price": price,
+        "rank": None if price is None else index.percentile_rank(price),
+    }
+
+
+async def threshold_runs(sensor, service_call: ServiceCall) -> ServiceResponse:
+    sc = service_call.data
+    _LOGGER.debug("called threshold_runs on %s with %r", sensor.entity_id, sc)
+    start, end = _window(sc)
+
+    return {
+        "runs": sensor.price_index().threshold_runs(
+            sc["threshold"],
+            start,
+            end,
+            below=sc["below"],
+            min_duration=sc.get("min_duration"),
+        )
+    }
+
+
+@callback
+def async_setup_entity_services():
+    """Register the price queries on the sensors of the current platform,
+    they answer in the prices as each sensor has them."""
+    platform = entity_platform.async_get_current_platform()
+    for name, schema, func in (
+        ("cheapest_window", CHEAPEST_WINDOW_SCHEMA, cheapest_window),
+        ("top_k", TOP_K_SCHEMA, top_k),
+        ("percentile_rank", PERCENTILE_RANK_SCHEMA, percentile_rank),
+        ("threshold_runs", THRESHOLD_RUNS_SCHEMA, threshold_runs),
+    ):
+        platform.async_register_entity_service(
+            name, schema, func, supports_response=SupportsResponse.ONLY
+        )
+
+
 async def async_setup_services(hass: HomeAssistant):
     _LOGGER.debug("Setting up services")
     from .aio_price import AioPrices
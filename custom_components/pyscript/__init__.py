@@ -29,18 +29,29 @@ from homeassistant.helpers.restore_state import DATA_RESTORE_STATE
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
+from .ast_cache import AstCache
 from .const import (
+    AST_CACHE_FILE,
     CONF_ALLOW_ALL_IMPORTS,
+    CONF_COMPILE_AST,
     CONF_HASS_IS_GLOBAL,
+    CONF_PERSIST_AST_CACHE,
     CONFIG_ENTRY,
     CONFIG_ENTRY_OLD,
     DOMAIN,
     FOLDER,
     LOGGER_PATH,
+    PROFILER_DUMP_FILE,
     REQUIREMENTS_FILE,
     SERVICE_GENERATE_STUBS,
     SERVICE_JUPYTER_KERNEL_START,
+    SERVICE_PROFILER_DUMP,
+    SERVICE_PROFILER_START,
+    SERVICE_PROFILER_STOP,
+    SERVICE_PURE_COMPUTE_STATS,
+    SERVICE_RESPONSE_NONE,
     SERVICE_RESPONSE_ONLY,
+    SERVICE_RESPONSE_OPTIONAL,
     UNSUB_LISTENERS,
     WATCHDOG_TASK,
 )
@@ -50,6 +61,8 @@ from .function import Function
 from .global_ctx import GlobalContext, GlobalContextMgr
 from .jupyter_kernel import Kernel
 from .mqtt import Mqtt
+from .profiler import Profiler
+from .pure_compute import PureCompute
 from .requirements import install_requirements
 from .state import State, StateVal
 from .stubs.generator import StubsGenerator
@@ -62,6 +75,8 @@ PYSCRIPT_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_ALLOW_ALL_IMPORTS, default=False): cv.boolean,
         vol.Optional(CONF_HASS_IS_GLOBAL, default=False): cv.boolean,
+        vol.Optional(CONF_COMPILE_AST, default=False): cv.boolean,
+        vol.Optional(CONF_PERSIST_AST_CACHE, default=False): cv.boolean,
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -110,18 +125,19 @@ async def update_yaml_config(hass: HomeAssistant, config_entry: ConfigEntry) ->
         await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_IMPORT}, data=config)
 
     #
-    # if hass_is_global or allow_all_imports have changed, we need to reload all scripts
-    # since they affect all scripts
+    # if hass_is_global, allow_all_imports or compile_ast have changed, we need to reload
+    # all scripts since they affect all scripts
     #
     config_save = {
-        param: config_entry.data.get(param, False) for param in [CONF_HASS_IS_GLOBAL, CONF_ALLOW_ALL_IMPORTS]
+        param: config_entry.data.get(param, False)
+        for param in [CONF_HASS_IS_GLOBAL, CONF_ALLOW_ALL_IMPORTS, CONF_COMPILE_AST]
     }
     if DOMAIN not in hass.data:
         hass.data.setdefault(DOMAIN, {})
     if CONFIG_ENTRY_OLD in hass.data[DOMAIN]:
         old_entry = hass.data[DOMAIN][CONFIG_ENTRY_OLD]
         hass.data[DOMAIN][CONFIG_ENTRY_OLD] = config_save
-        for param in [CONF_HASS_IS_GLOBAL, CONF_ALLOW_ALL_IMPORTS]:
+        for param in [CONF_HASS_IS_GLOBAL, CONF_ALLOW_ALL_IMPORTS, CONF_COMPILE_AST]:
             if old_entry.get(param, False) != config_entry.data.get(param, False):
                 return True
     hass.data[DOMAIN][CONFIG_ENTRY_OLD] = config_save
@@ -369,8 +385,56 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     hass.services.async_register(DOMAIN, SERVICE_JUPYTER_KERNEL_START, jupyter_kernel_start)
 
+    async def profiler_start(call: ServiceCall) -> None:
+        """Start the pyscript profiler."""
+        Profiler.start(reset=call.data.get("reset", True), lines=call.data.get("lines", False))
+        Profiler.publish()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILER_START, profiler_start, supports_response=SERVICE_RESPONSE_NONE
+    )
+
+    async def profiler_stop(call: ServiceCall) -> Dict[str, Any]:
+        """Stop the pyscript profiler and return its results."""
+        Profiler.stop()
+        Profiler.publish()
+        return Profiler.results(top=call.data.get("top", None))
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILER_STOP, profiler_stop, supports_response=SERVICE_RESPONSE_OPTIONAL
+    )
+
+    async def profiler_dump(call: ServiceCall) -> Dict[str, Any]:
+        """Return the pyscript profiler results, optionally writing the collapsed stacks to a file."""
+        Profiler.publish()
+        result = Profiler.results(top=call.data.get("top", None))
+        result["collapsed"] = Profiler.collapsed()
+        if call.data.get("write_collapsed", False):
+            path = os.path.join(hass.config.path(FOLDER), PROFILER_DUMP_FILE)
+            await Profiler.write_collapsed(hass, path)
+            result["collapsed_path"] = path
+        return result
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILER_DUMP, profiler_dump, supports_response=SERVICE_RESPONSE_OPTIONAL
+    )
+
+    async def pure_compute_stats(call: ServiceCall) -> Dict[str, Any]:
+        """Return the @pure_compute process pool metrics."""
+        stats = PureCompute.get_stats()
+        if call.data.get("reset", False):
+            PureCompute.stats_reset()
+        return stats
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PURE_COMPUTE_STATS, pure_compute_stats, supports_response=SERVICE_RESPONSE_ONLY
+    )
+
     async def state_changed(event: HAEvent) -> None:
         var_name = event.data["entity_id"]
+        if var_name not in State.notify:
+            # no trigger is watching this entity, so skip building the values
+            return
         if event.data.get("new_state", None):
             new_val = StateVal(event.data["new_state"])
         else:
@@ -430,6 +494,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     """Unload a config entry."""
     _LOGGER.info("Unloading all scripts")
     await unload_scripts(unload_all=True)
+    Profiler.stop()
+    Profiler.reset()
+    PureCompute.reset()
 
     for unsub_listener in hass.data[DOMAIN][UNSUB_LISTENERS]:
         unsub_listener()
@@ -596,6 +663,14 @@ async def load_scripts(hass: HomeAssistant, config_data: Dict[str, Any], global_
     apps_config = config_data.get("apps", None)
     ctx2files = await hass.async_add_executor_job(glob_read_files, load_paths, apps_config)
 
+    #
+    # on the first load, seed the AST cache from disk if enabled, so unchanged
+    # files and trigger expressions aren't parsed again
+    #
+    ast_cache_path = os.path.join(pyscript_dir, AST_CACHE_FILE)
+    if config_data.get(CONF_PERSIST_AST_CACHE, False) and not AstCache.cache:
+        await AstCache.load(hass, ast_cache_path)
+
     #
     # figure out what to reload based on global_ctx_only and what's changed
     #
@@ -644,32 +719,16 @@ async def load_scripts(hass: HomeAssistant, config_data: Dict[str, Any], global_
             will_reload.add(root)
 
     if len(will_reload) > 0:
-
-        def import_recurse(ctx_name, visited, ctx2imports):
-            if ctx_name in visited or ctx_name in ctx2imports:
-                return ctx2imports.get(ctx_name, set())
-            visited.add(ctx_name)
-            ctx = GlobalContextMgr.get(ctx_name)
-            if not ctx:
-                return set()
-            ctx2imports[ctx_name] = set()
-            for imp_name in ctx.get_imports():
-                ctx2imports[ctx_name].add(imp_name)
-                ctx2imports[ctx_name].update(import_recurse(imp_name, visited, ctx2imports))
-            return ctx2imports[ctx_name]
-
-        ctx2imports = {}
-        for global_ctx_name, global_ctx in ctx_all.items():
-            if global_ctx_name not in ctx2imports:
-                visited = set()
-                import_recurse(global_ctx_name, visited, ctx2imports)
-            for mod_name in ctx2imports.get(global_ctx_name, set()):
-                parts = mod_name.split(".")
-                root = f"{parts[0]}.{parts[1]}"
-                if root in will_reload:
-                    ctx_delete.add(global_ctx_name)
-                    if global_ctx_name in ctx2files:
-                        ctx2files[global_ctx_name].force = True
+        reload_ctx_names = set()
+        for global_ctx_name in GlobalContextMgr.importers:
+            parts = global_ctx_name.split(".")
+            if f"{parts[0]}.{parts[1]}" in will_reload:
+                reload_ctx_names.add(global_ctx_name)
+        for global_ctx_name in GlobalContextMgr.get_importers(reload_ctx_names):
+            if global_ctx_name in ctx_all:
+                ctx_delete.add(global_ctx_name)
+                if global_ctx_name in ctx2files:
+                    ctx2files[global_ctx_name].force = True
 
     #
     # if any file in an app or module has changed, then reload just the top-level
@@ -697,11 +756,15 @@ async def load_scripts(hass: HomeAssistant, config_data: Dict[str, Any], global_
         done.add(root)
 
     #
-    # delete contexts that are no longer needed or will be reloaded
+    # delete contexts that are no longer needed or will be reloaded; running
+    # triggers of contexts being reloaded are detached first, so the reloaded
+    # functions can take over those whose decorators haven't changed
     #
     for global_ctx_name in ctx_delete:
         if global_ctx_name in ctx_all:
             global_ctx = ctx_all[global_ctx_name]
+            if global_ctx_name in ctx2files:
+                GlobalContextMgr.trig_reuse[global_ctx_name] = global_ctx.trigger_detach()
             global_ctx.stop()
             if global_ctx_name not in ctx2files or not ctx2files[global_ctx_name].autoload:
                 _LOGGER.info("Unloaded %s", global_ctx.get_file_path())
@@ -727,3 +790,7 @@ async def load_scripts(hass: HomeAssistant, config_data: Dict[str, Any], global_
         await GlobalContextMgr.load_file(
             global_ctx, src_info.file_path, source=src_info.source, reload=reload
         )
+    GlobalContextMgr.trigger_reuse_stop()
+
+    if config_data.get(CONF_PERSIST_AST_CACHE, False):
+        await AstCache.save(hass, ast_cache_path)
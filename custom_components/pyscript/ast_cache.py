@@ -0,0 +1,132 @@
+"""Cache of parsed pyscript ASTs, keyed by a hash of their source."""
+
+import ast
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+from .const import LOGGER_PATH
+
+_LOGGER = logging.getLogger(LOGGER_PATH + ".ast_cache")
+
+#
+# bump when the format of the cache entries changes; the python version is
+# also checked since ASTs differ between versions
+#
+AST_CACHE_VERSION = 2
+
+
+class AstCache:
+    """Class for caching parsed ASTs and their names across reloads."""
+
+    #
+    # maximum number of parsed sources we keep; the least recently used are evicted
+    #
+    max_entries = 1024
+
+    #
+    # (mode, source hash) -> [ast, frozenset of names or None], in LRU order
+    #
+    cache = OrderedDict()
+
+    #
+    # whether there are entries not yet saved to disk
+    #
+    dirty = False
+
+    def __init__(self):
+        """Warn on AstCache instantiation."""
+        _LOGGER.error("AstCache class is not meant to be instantiated")
+
+    @classmethod
+    def parse(cls, code_str, filename, mode):
+        """Return the AST of code_str and its cache key, only parsing on a cache miss."""
+        key = (mode, hashlib.sha256(code_str.encode("utf-8", "surrogatepass")).hexdigest())
+        entry = cls.cache.get(key)
+        if entry is not None:
+            cls.cache.move_to_end(key)
+            return entry[0], key
+        #
+        # syntax errors are raised and not cached, so they are reported on every parse
+        #
+        this_ast = ast.parse(code_str, filename=filename, mode=mode)
+        cls.cache[key] = [this_ast, None]
+        cls.dirty = True
+        while len(cls.cache) > cls.max_entries:
+            cls.cache.popitem(last=False)
+        return this_ast, key
+
+    @classmethod
+    def get_names(cls, key):
+        """Return a copy of the cached names of the AST with the given key, or None."""
+        entry = cls.cache.get(key)
+        if entry is None or entry[1] is None:
+            return None
+        return set(entry[1])
+
+    @classmethod
+    def set_names(cls, key, names):
+        """Save the names of the AST with the given key."""
+        entry = cls.cache.get(key)
+        if entry is not None:
+            entry[1] = frozenset(names)
+            cls.dirty = True
+
+    @classmethod
+    def clear(cls):
+        """Empty the cache."""
+        cls.cache.clear()
+        cls.dirty = False
+
+    @classmethod
+    async def load(cls, hass, path):
+        """Add the entries saved in path to the cache."""
+
+        def read_cache(path):
+            try:
+                with open(path, "rb") as file_desc:
+                    return pickle.load(file_desc)
+            except FileNotFoundError:
+                return None
+            except Exception as exc:
+                _LOGGER.warning("ignoring unreadable AST cache %s: %s", path, exc)
+                return None
+
+        data = await hass.async_add_executor_job(read_cache, path)
+        if not isinstance(data, dict) or data.get("version") != (AST_CACHE_VERSION, sys.version_info[:2]):
+            return
+        #
+        # saved entries are older than any we already have, so add them at the LRU end
+        #
+        for key, entry in reversed(data.get("entries", [])):
+            if key not in cls.cache:
+                cls.cache[key] = list(entry)
+                cls.cache.move_to_end(key, last=False)
+        while len(cls.cache) > cls.max_entries:
+            cls.cache.popitem(last=False)
+        _LOGGER.debug("loaded %d AST cache entries from %s", len(data.get("entries", [])), path)
+
+    @classmethod
+    async def save(cls, hass, path):
+        """Save the cache to path if it has changed."""
+        if not cls.dirty:
+            return
+        data = {
+            "version": (AST_CACHE_VERSION, sys.version_info[:2]),
+            "entries": [(key, tuple(entry)) for key, entry in cls.cache.items()],
+        }
+        cls.dirty = False
+
+        def write_cache(path, data):
+            try:
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as file_desc:
+                    pickle.dump(data, file_desc, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except Exception as exc:
+                _LOGGER.warning("unable to save AST cache %s: %s", path, exc)
+
+        await hass.async_add_executor_job(write_cache, path, data)
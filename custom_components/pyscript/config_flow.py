@@ -9,14 +9,23 @@ from homeassistant import config_entries
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.core import callback
 
-from .const import CONF_ALLOW_ALL_IMPORTS, CONF_HASS_IS_GLOBAL, CONF_INSTALLED_PACKAGES, DOMAIN
+from .const import (
+    CONF_ALLOW_ALL_IMPORTS,
+    CONF_COMPILE_AST,
+    CONF_HASS_IS_GLOBAL,
+    CONF_INSTALLED_PACKAGES,
+    CONF_PERSIST_AST_CACHE,
+    DOMAIN,
+)
 
-CONF_BOOL_ALL = {CONF_ALLOW_ALL_IMPORTS, CONF_HASS_IS_GLOBAL}
+CONF_BOOL_ALL = {CONF_ALLOW_ALL_IMPORTS, CONF_HASS_IS_GLOBAL, CONF_COMPILE_AST, CONF_PERSIST_AST_CACHE}
 
 PYSCRIPT_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_ALLOW_ALL_IMPORTS, default=False): bool,
         vol.Optional(CONF_HASS_IS_GLOBAL, default=False): bool,
+        vol.Optional(CONF_COMPILE_AST, default=False): bool,
+        vol.Optional(CONF_PERSIST_AST_CACHE, default=False): bool,
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -31,14 +31,26 @@ ATTR_VERSION = "version"
 
 CONF_ALLOW_ALL_IMPORTS = "allow_all_imports"
 CONF_HASS_IS_GLOBAL = "hass_is_global"
+CONF_COMPILE_AST = "compile_ast"
+CONF_PERSIST_AST_CACHE = "persist_ast_cache"
 CONF_INSTALLED_PACKAGES = "_installed_packages"
 
 SERVICE_JUPYTER_KERNEL_START = "jupyter_kernel_start"
 SERVICE_GENERATE_STUBS = "generate_stubs"
+SERVICE_PROFILER_START = "profiler_start"
+SERVICE_PROFILER_STOP = "profiler_stop"
+SERVICE_PROFILER_DUMP = "profiler_dump"
+SERVICE_PURE_COMPUTE_STATS = "pure_compute_stats"
 
 LOGGER_PATH = "custom_components.pyscript"
 
 REQUIREMENTS_FILE = "requirements.txt"
+
+AST_CACHE_FILE = ".ast_cache.pickle"
+
+PROFILER_ENTITY_ID = "pyscript.profiler"
+PROFILER_DUMP_FILE = "profile.collapsed"
+
 REQUIREMENTS_PATHS = ("", "apps/*", "modules/*", "scripts/**")
 
 WATCHDOG_TASK = "watch_dog_task"
@@ -62,3 +74,29 @@ ALLOWED_IMPORTS = {
     "time",
     "voluptuous",
 }
+
+#
+# standard modules a @pure_compute function can use; it runs in a worker process
+# without pyscript or Home Assistant, so nothing else is available there
+#
+PURE_COMPUTE_MODULES = {
+    "bisect",
+    "cmath",
+    "collections",
+    "datetime",
+    "decimal",
+    "fractions",
+    "functools",
+    "heapq",
+    "itertools",
+    "json",
+    "math",
+    "operator",
+    "random",
+    "re",
+    "statistics",
+    "string",
+}
+
+PURE_COMPUTE_MAX_WORKERS = 2
+PURE_COMPUTE_TIMEOUT = 60
@@ -4,12 +4,14 @@ import ast
 import asyncio
 import builtins
 from collections import OrderedDict
+import copy
 import functools
 import importlib
 import inspect
 import io
 import keyword
 import logging
+import operator
 import sys
 import time
 import traceback
@@ -20,17 +22,22 @@ import yaml
 from homeassistant.const import SERVICE_RELOAD
 from homeassistant.helpers.service import async_set_service_schema
 
+from .ast_cache import AstCache
 from .const import (
     ALLOWED_IMPORTS,
     CONF_ALLOW_ALL_IMPORTS,
+    CONF_COMPILE_AST,
     CONFIG_ENTRY,
     DOMAIN,
     LOGGER_PATH,
+    PURE_COMPUTE_TIMEOUT,
     SERVICE_JUPYTER_KERNEL_START,
     SERVICE_RESPONSE_NONE,
 )
 from .function import Function
-from .state import State
+from .profiler import Profiler
+from .pure_compute import PureCompute
+from .state import State, StateVal
 
 _LOGGER = logging.getLogger(LOGGER_PATH + ".eval")
 
@@ -60,6 +67,7 @@ TRIG_DECORATORS = {
 TRIG_SERV_DECORATORS = TRIG_DECORATORS.union({"service"})
 
 COMP_DECORATORS = {
+    "pure_compute",
     "pyscript_compile",
     "pyscript_executor",
 }
@@ -321,6 +329,7 @@ class EvalFunc:
         self.name = func_def.name
         self.global_ctx = global_ctx
         self.global_ctx_name = global_ctx.get_name()
+        self.profile_name = f"{self.global_ctx_name}.{self.name}"
         self.logger = logging.getLogger(LOGGER_PATH + "." + self.global_ctx_name)
         self.defaults = []
         self.kw_defaults = []
@@ -341,6 +350,7 @@ class EvalFunc:
         self.trigger_service = set()
         self.has_closure = False
         self.async_func = async_func
+        self.compiled_body = None
 
     def get_name(self):
         """Return the function name."""
@@ -349,6 +359,7 @@ class EvalFunc:
     def set_name(self, name):
         """Set the function name."""
         self.name = name
+        self.profile_name = f"{self.global_ctx_name}.{self.name}"
 
     async def eval_defaults(self, ast_ctx):
         """Evaluate the default function arguments."""
@@ -389,12 +400,13 @@ class EvalFunc:
             "webhook_trigger": {"arg_cnt": {1, 2}, "rep_ok": True},
         }
         kwarg_check = {
-            "event_trigger": {"kwargs": {dict}},
+            "event_trigger": {"kwargs": {dict}, "running_event": {bool, int}},
             "mqtt_trigger": {
                 "kwargs": {dict},
                 "encoding": {str},
+                "running_event": {bool, int},
             },
-            "time_trigger": {"kwargs": {dict}},
+            "time_trigger": {"kwargs": {dict}, "running_event": {bool, int}},
             "task_unique": {"kill_me": {bool, int}},
             "time_active": {"hold_off": {int, float}},
             "service": {"supports_response": {str}},
@@ -404,11 +416,13 @@ class EvalFunc:
                 "state_check_now": {bool, int},
                 "state_hold_false": {int, float},
                 "watch": {set, list},
+                "running_event": {bool, int},
             },
             "webhook_trigger": {
                 "kwargs": {dict},
                 "local_only": {bool},
                 "methods": {list, set},
+                "running_event": {bool, int},
             },
         }
 
@@ -710,6 +724,18 @@ class EvalFunc:
             if ast_ctx.exception_long is None:
                 ast_ctx.exception_long = ast_ctx.format_exc(err, arg.lineno, arg.col_offset)
 
+    async def try_compiled(self, ast_ctx, stmt):
+        """Call a compiled statement and capture exceptions."""
+        func, is_async, lineno, col_offset = stmt
+        try:
+            val = func(ast_ctx)
+            return (await val) if is_async else val
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            if ast_ctx.exception_long is None:
+                ast_ctx.exception_long = ast_ctx.format_exc(err, lineno, col_offset)
+
     async def call(self, ast_ctx, *args, **kwargs):
         """Call the function with the given context and arguments."""
         sym_table = {}
@@ -802,15 +828,26 @@ class EvalFunc:
         ast_ctx.user_locals = {}
         ast_ctx.curr_func = self
         del args, kwargs
-        for arg1 in self.func_def.body:
-            val = await self.try_aeval(ast_ctx, arg1)
-            if isinstance(val, EvalReturn):
-                val = val.value
-                break
-            # return None at end if there isn't a return
-            val = None
-            if ast_ctx.get_exception_obj():
-                break
+        if ast_ctx.compile_ast:
+            if self.compiled_body is None:
+                self.compiled_body = AstCompiler().compile_body(self.func_def.body)
+            try_eval, body = self.try_compiled, self.compiled_body
+        else:
+            try_eval, body = self.try_aeval, self.func_def.body
+        prof_frame = Profiler.func_enter(self.profile_name) if Profiler.enabled else None
+        try:
+            for arg1 in body:
+                val = await try_eval(ast_ctx, arg1)
+                if isinstance(val, EvalReturn):
+                    val = val.value
+                    break
+                # return None at end if there isn't a return
+                val = None
+                if ast_ctx.get_exception_obj():
+                    break
+        finally:
+            if prof_frame:
+                Profiler.func_exit(prof_frame)
         ast_ctx.curr_func = prev_func
         ast_ctx.user_locals = save_user_locals
         ast_ctx.code_str, ast_ctx.code_list = code_str, code_list
@@ -909,6 +946,7 @@ class AstEval:
         self.name = name
         self.str = None
         self.ast = None
+        self.ast_key = None
         self.global_ctx = global_ctx
         self.global_sym_table = global_ctx.get_global_sym_table() if global_ctx else {}
         self.sym_table_stack = []
@@ -929,6 +967,8 @@ class AstEval:
         self.logger = None
         self.set_logger_name(logger_name if logger_name is not None else self.name)
         self.config_entry = Function.hass.data.get(DOMAIN, {}).get(CONFIG_ENTRY, {})
+        self.compile_ast = getattr(self.config_entry, "data", {}).get(CONF_COMPILE_AST, False)
+        self.compiled = None
         self.dec_eval_depth = 0
 
     async def ast_not_implemented(self, arg, *args):
@@ -943,18 +983,24 @@ class AstEval:
             if hasattr(arg, "lineno"):
                 self.lineno = arg.lineno
                 self.col_offset = arg.col_offset
+                if Profiler.count_lines and isinstance(arg, ast.stmt):
+                    Profiler.line_hit(self.global_ctx.get_name(), arg.lineno)
             val = await getattr(self, name, self.ast_not_implemented)(arg)
             if undefined_check and isinstance(val, EvalName):
                 raise NameError(f"name '{val.name}' is not defined")
             return val
         except Exception as err:
-            if not self.exception_obj:
-                func_name = self.curr_func.get_name() + "(), " if self.curr_func else ""
-                self.exception_obj = err
-                self.exception = f"Exception in {func_name}{self.filename} line {self.lineno} column {self.col_offset}: {err}"
-                self.exception_long = self.format_exc(err, self.lineno, self.col_offset)
+            self.record_exception(err)
             raise
 
+    def record_exception(self, err):
+        """Save the first exception raised, together with the current line and column."""
+        if not self.exception_obj:
+            func_name = self.curr_func.get_name() + "(), " if self.curr_func else ""
+            self.exception_obj = err
+            self.exception = f"Exception in {func_name}{self.filename} line {self.lineno} column {self.col_offset}: {err}"
+            self.exception_long = self.format_exc(err, self.lineno, self.col_offset)
+
     # Statements return NONE, EvalBreak, EvalContinue, EvalReturn
     async def ast_module(self, arg):
         """Execute ast_module - a list of statements."""
@@ -1152,15 +1198,36 @@ class AstEval:
             pyscript_compile = dec
 
         if pyscript_compile:
+            timeout = PURE_COMPUTE_TIMEOUT
             if isinstance(pyscript_compile, ast.Call):
                 if len(pyscript_compile.args) > 0:
                     raise TypeError(f"@{dec_name}() takes 0 positional arguments")
-                if len(pyscript_compile.keywords) > 0:
+                if len(pyscript_compile.keywords) > 0 and dec_name != "pure_compute":
                     raise TypeError(f"@{dec_name}() takes no keyword arguments")
+                for keyword in pyscript_compile.keywords:
+                    if keyword.arg != "timeout":
+                        raise TypeError(f"@{dec_name}() got unexpected keyword argument '{keyword.arg}'")
+                    timeout = await self.aeval(keyword.value)
+                    if not isinstance(timeout, (int, float)) or timeout <= 0:
+                        raise TypeError(f"@{dec_name}() timeout should be a positive number")
+            #
+            # the AST may be shared through AstCache, so strip the decorator on a copy
+            #
+            arg = copy.copy(arg)
             arg.decorator_list = other_dec
             local_var = None
             if arg.name in self.sym_table and isinstance(self.sym_table[arg.name], EvalLocalVar):
                 local_var = self.sym_table[arg.name]
+            if dec_name == "pure_compute":
+                #
+                # the function runs in a worker process, so it's only compiled there
+                #
+                func = PureCompute.wrap(arg, self.filename, timeout=timeout)
+                if local_var:
+                    local_var.set(func)
+                else:
+                    self.sym_table[arg.name] = func
+                return
             code = compile(ast.Module(body=[arg], type_ignores=[]), filename=self.filename, mode="exec")
             exec(code, self.global_sym_table, self.sym_table)  # pylint: disable=exec-used
 
@@ -1497,9 +1564,9 @@ class AstEval:
 
     async def ast_augassign(self, arg):
         """Execute augmented assignment statement (lhs <BinOp>= value)."""
-        arg.target.ctx = ast.Load()
-        new_val = await self.aeval(ast.BinOp(left=arg.target, op=arg.op, right=arg.value))
-        arg.target.ctx = ast.Store()
+        load_target = copy.copy(arg.target)
+        load_target.ctx = ast.Load()
+        new_val = await self.aeval(ast.BinOp(left=load_target, op=arg.op, right=arg.value))
         await self.recurse_assign(arg.target, new_val)
 
     async def ast_annassign(self, arg):
@@ -1579,9 +1646,7 @@ class AstEval:
         if isinstance(val, ast.Name):
             name = val.id + "." + name
             # ensure the first portion of name is undefined
-            if check_undef and not isinstance(
-                await self.ast_name(ast.Name(id=val.id, ctx=ast.Load())), EvalName
-            ):
+            if check_undef and not isinstance(self.name_lookup(val.id), EvalName):
                 return None
             return name
         return None
@@ -1590,9 +1655,9 @@ class AstEval:
         """Apply attributes."""
         full_name = await self.ast_attribute_collapse(arg)
         if full_name is not None:
-            if isinstance(arg.ctx, ast.Store):
+            if not isinstance(arg.ctx, ast.Load):
                 return full_name
-            val = await self.ast_name(ast.Name(id=full_name, ctx=arg.ctx))
+            val = self.name_lookup(full_name)
             if not isinstance(val, EvalName):
                 return val
         val = await self.aeval(arg.value)
@@ -1603,47 +1668,51 @@ class AstEval:
     async def ast_name(self, arg):
         """Look up value of identifier on load, or returns name on set."""
         if isinstance(arg.ctx, ast.Load):
-            #
-            # check other scopes if required by global declarations
-            #
-            if self.curr_func and arg.id in self.curr_func.global_names:
-                if arg.id in self.global_sym_table:
-                    return self.global_sym_table[arg.id]
-                raise NameError(f"global name '{arg.id}' is not defined")
-            #
-            # now check in our current symbol table, and then some other places
-            #
-            if arg.id in self.sym_table:
-                if isinstance(self.sym_table[arg.id], EvalLocalVar):
-                    return self.sym_table[arg.id].get()
-                return self.sym_table[arg.id]
-            if arg.id in self.local_sym_table:
-                return self.local_sym_table[arg.id]
-            if arg.id in self.global_sym_table:
-                if self.curr_func and arg.id in self.curr_func.local_names:
-                    raise UnboundLocalError(f"local variable '{arg.id}' referenced before assignment")
-                return self.global_sym_table[arg.id]
-            if arg.id in BUILTIN_AST_FUNCS_FACTORY:
-                return BUILTIN_AST_FUNCS_FACTORY[arg.id](self)
-            if hasattr(builtins, arg.id) and arg.id not in BUILTIN_EXCLUDE and arg.id[0] != "_":
-                return getattr(builtins, arg.id)
-            if Function.get(arg.id):
-                return Function.get(arg.id)
-            num_dots = arg.id.count(".")
-            #
-            # any single-dot name could be a state variable
-            # a two-dot name for state.attr needs to exist
-            #
-            if num_dots == 1 or (num_dots == 2 and State.exist(arg.id)):
-                return State.get(arg.id)
-            #
-            # Couldn't find it, so return just the name wrapped in EvalName to
-            # distinguish from a string variable value.  This is to support
-            # names with ".", which are joined by ast_attribute
-            #
-            return EvalName(arg.id)
+            return self.name_lookup(arg.id)
         return arg.id
 
+    def name_lookup(self, name):
+        """Look up value of identifier name, returning EvalName if it isn't found."""
+        #
+        # check other scopes if required by global declarations
+        #
+        if self.curr_func and name in self.curr_func.global_names:
+            if name in self.global_sym_table:
+                return self.global_sym_table[name]
+            raise NameError(f"global name '{name}' is not defined")
+        #
+        # now check in our current symbol table, and then some other places
+        #
+        if name in self.sym_table:
+            if isinstance(self.sym_table[name], EvalLocalVar):
+                return self.sym_table[name].get()
+            return self.sym_table[name]
+        if name in self.local_sym_table:
+            return self.local_sym_table[name]
+        if name in self.global_sym_table:
+            if self.curr_func and name in self.curr_func.local_names:
+                raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
+            return self.global_sym_table[name]
+        if name in BUILTIN_AST_FUNCS_FACTORY:
+            return BUILTIN_AST_FUNCS_FACTORY[name](self)
+        if hasattr(builtins, name) and name not in BUILTIN_EXCLUDE and name[0] != "_":
+            return getattr(builtins, name)
+        if Function.get(name):
+            return Function.get(name)
+        num_dots = name.count(".")
+        #
+        # any single-dot name could be a state variable
+        # a two-dot name for state.attr needs to exist
+        #
+        if num_dots == 1 or (num_dots == 2 and State.exist(name)):
+            return State.get(name)
+        #
+        # Couldn't find it, so return just the name wrapped in EvalName to
+        # distinguish from a string variable value.  This is to support
+        # names with ".", which are joined by ast_attribute
+        #
+        return EvalName(name)
+
     async def ast_binop(self, arg):
         """Evaluate binary operators by calling function based on class."""
         name = "ast_binop_" + arg.op.__class__.__name__.lower()
@@ -1976,8 +2045,9 @@ class AstEval:
                     func_name = func.__name__
             except Exception:
                 func_name = "<function>"
-        arg_str = ", ".join(['"' + elt + '"' if isinstance(elt, str) else str(elt) for elt in args])
-        _LOGGER.debug("%s: calling %s(%s, %s)", self.name, func_name, arg_str, kwargs)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            arg_str = ", ".join(['"' + elt + '"' if isinstance(elt, str) else str(elt) for elt in args])
+            _LOGGER.debug("%s: calling %s(%s, %s)", self.name, func_name, arg_str, kwargs)
         if isinstance(func, (EvalFunc, EvalFuncVar)):
             return await func.call(self, *args, **kwargs)
         if inspect.isclass(func) and hasattr(func, "__init__evalfunc_wrap__"):
@@ -2006,6 +2076,8 @@ class AstEval:
                 await inst.__init__evalfunc_wrap__.call(self, *args, **kwargs)
             return inst
         if asyncio.iscoroutinefunction(func):
+            if Profiler.enabled:
+                return await self.profile_await(func(*args, **kwargs))
             return await func(*args, **kwargs)
         if callable(func):
             if func == time.sleep:  # pylint: disable=comparison-with-callable
@@ -2058,9 +2130,20 @@ class AstEval:
         """Evaluate await expr."""
         coro = await self.aeval(arg.value)
         if coro and (asyncio.iscoroutine(coro) or asyncio.isfuture(coro)):
+            if Profiler.enabled:
+                return await self.profile_await(coro)
             return await coro
         return coro
 
+    @staticmethod
+    async def profile_await(coro):
+        """Await coro, adding the time it took to the profiler's current function."""
+        t_start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            Profiler.await_add(time.perf_counter() - t_start)
+
     async def get_target_names(self, lhs):
         """Recursively find all the target names mentioned in the AST tree."""
         names = set()
@@ -2160,10 +2243,22 @@ class AstEval:
 
     async def get_names(self, this_ast=None, nonlocal_names=None, global_names=None, local_names=None):
         """Return set of all the names mentioned in our AST tree."""
+        #
+        # the names of a whole parsed source only depend on the source, so are cached
+        #
+        cache_key = None
+        if this_ast is None and nonlocal_names is None and global_names is None and local_names is None:
+            cache_key = self.ast_key
+            if cache_key is not None:
+                names = AstCache.get_names(cache_key)
+                if names is not None:
+                    return names
         names = set()
         this_ast = this_ast or self.ast
         if this_ast:
             await self.get_names_set(this_ast, names, nonlocal_names, global_names, local_names)
+        if cache_key is not None:
+            AstCache.set_names(cache_key, names)
         return names
 
     def parse(self, code_str, filename=None, mode="exec"):
@@ -2172,6 +2267,8 @@ class AstEval:
         self.exception_obj = None
         self.exception_long = None
         self.ast = None
+        self.ast_key = None
+        self.compiled = None
         if filename is not None:
             self.filename = filename
         try:
@@ -2184,7 +2281,10 @@ class AstEval:
             else:
                 self.code_str = code_str
                 self.code_list = []
-            self.ast = ast.parse(self.code_str, filename=self.filename, mode=mode)
+            if isinstance(self.code_str, str):
+                self.ast, self.ast_key = AstCache.parse(self.code_str, self.filename, mode)
+            else:
+                self.ast = ast.parse(self.code_str, filename=self.filename, mode=mode)
             return True
         except SyntaxError as err:
             self.exception_obj = err
@@ -2240,6 +2340,20 @@ class AstEval:
         """Return the last exception in a longer str form."""
         return self.exception_long
 
+    def reset(self):
+        """Clear the state left by a call, so this context can be reused for another call."""
+        self.exception = None
+        self.exception_obj = None
+        self.exception_long = None
+        self.exception_curr = None
+        self.lineno = 1
+        self.col_offset = 0
+        self.curr_func = None
+        self.sym_table_stack = []
+        self.sym_table = self.global_sym_table
+        self.user_locals = {}
+        self.dec_eval_depth = 0
+
     def set_local_sym_table(self, sym_table):
         """Set the local symbol table."""
         self.local_sym_table = sym_table
@@ -2302,7 +2416,12 @@ class AstEval:
             if name in self.global_sym_table:
                 var = self.global_sym_table[name]
                 try:
-                    for attr in var.__dict__:
+                    #
+                    # StateVal attributes are read from the state on access,
+                    # so they are not all in its __dict__
+                    #
+                    attrs = var._attributes() if isinstance(var, StateVal) else var.__dict__
+                    for attr in attrs:
                         if attr.lower().startswith(attr_root) and (attr_root != "" or attr[0:1] != "_"):
                             words.add(f"{name}.{attr}")
                 except Exception:
@@ -2331,7 +2450,18 @@ class AstEval:
             self.local_sym_table.update(new_state_vars)
         if self.ast:
             try:
-                val = await self.aeval(self.ast)
+                if self.compile_ast and isinstance(self.ast, ast.Expression):
+                    #
+                    # trigger and other expressions are evaluated many times, so compile them once
+                    #
+                    if self.compiled is None:
+                        self.compiled = AstCompiler().compile_node(self.ast.body)
+                    func, is_async = self.compiled
+                    val = func(self)
+                    if is_async:
+                        val = await val
+                else:
+                    val = await self.aeval(self.ast)
                 if isinstance(val, EvalStopFlow):
                     return None
                 return val
@@ -2345,3 +2475,873 @@ class AstEval:
     def dump(self, this_ast=None):
         """Dump the AST tree for debugging."""
         return ast.dump(this_ast if this_ast else self.ast)
+
+
+class AstCompiler:
+    """Compile an AST tree once into a tree of prebound closures.
+
+    Each compiled node is a function that takes the AstEval context and returns the
+    same value AstEval.aeval would.  The function is a regular function when neither
+    the node nor any of its children need to await, and a coroutine function otherwise;
+    compile_node returns the function together with an is_async flag.  Nodes without a
+    compile_* method fall back to AstEval.aeval, so the two engines can be mixed in the
+    same tree.  The context's lineno and col_offset are updated exactly as aeval does,
+    so exception messages are unchanged.
+    """
+
+    BINOPS = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.truediv,
+        ast.Mod: operator.mod,
+        ast.Pow: operator.pow,
+        ast.LShift: operator.lshift,
+        ast.RShift: operator.rshift,
+        ast.BitOr: operator.or_,
+        ast.BitXor: operator.xor,
+        ast.BitAnd: operator.and_,
+        ast.FloorDiv: operator.floordiv,
+    }
+
+    UNARYOPS = {
+        ast.Not: operator.not_,
+        ast.Invert: operator.invert,
+        # ast_unaryop_uadd returns the operand unchanged, so we do too
+        ast.UAdd: lambda val: val,
+        ast.USub: operator.neg,
+    }
+
+    CMPOPS = {
+        ast.Eq: operator.eq,
+        ast.NotEq: operator.ne,
+        ast.Lt: operator.lt,
+        ast.LtE: operator.le,
+        ast.Gt: operator.gt,
+        ast.GtE: operator.ge,
+        ast.Is: operator.is_,
+        ast.IsNot: operator.is_not,
+        ast.In: lambda val0, val1: val0 in val1,
+        ast.NotIn: lambda val0, val1: val0 not in val1,
+    }
+
+    EVAL_BREAK = EvalBreak()
+    EVAL_CONTINUE = EvalContinue()
+
+    def compile_node(self, arg):
+        """Compile an AST node, returning [func, is_async]."""
+        compile_func = getattr(self, "compile_" + arg.__class__.__name__.lower(), None)
+        #
+        # nodes without line numbers are ones we created, so leave them to aeval
+        #
+        compiled = compile_func(arg) if compile_func and hasattr(arg, "lineno") else None
+        if compiled is None:
+            return self.compile_fallback(arg)
+        return compiled
+
+    def compile_fallback(self, arg):
+        """Evaluate nodes we don't compile with the AstEval interpreter."""
+
+        async def fallback(ast_ctx):
+            return await ast_ctx.aeval(arg)
+
+        return fallback, True
+
+    def compile_body(self, body):
+        """Compile a list of statements, returning a list of [func, is_async, lineno, col_offset]."""
+        return [[*self.compile_node(stmt), stmt.lineno, stmt.col_offset] for stmt in body]
+
+    #
+    # Wrappers that track the current line and record exceptions like aeval does
+    #
+    @staticmethod
+    def wrap(arg, func, is_async, undefined_check=False):
+        """Wrap func so it updates lineno and col_offset and records exceptions."""
+        lineno, col_offset = arg.lineno, arg.col_offset
+        is_stmt = isinstance(arg, ast.stmt)
+        if is_async:
+
+            async def wrap_async(ast_ctx):
+                try:
+                    ast_ctx.lineno = lineno
+                    ast_ctx.col_offset = col_offset
+                    if is_stmt and Profiler.count_lines:
+                        Profiler.line_hit(ast_ctx.global_ctx.get_name(), lineno)
+                    val = await func(ast_ctx)
+                    if undefined_check and isinstance(val, EvalName):
+                        raise NameError(f"name '{val.name}' is not defined")
+                    return val
+                except Exception as err:
+                    ast_ctx.record_exception(err)
+                    raise
+
+            return wrap_async, True
+
+        def wrap_sync(ast_ctx):
+            try:
+                ast_ctx.lineno = lineno
+                ast_ctx.col_offset = col_offset
+                if is_stmt and Profiler.count_lines:
+                    Profiler.line_hit(ast_ctx.global_ctx.get_name(), lineno)
+                val = func(ast_ctx)
+                if undefined_check and isinstance(val, EvalName):
+                    raise NameError(f"name '{val.name}' is not defined")
+                return val
+            except Exception as err:
+                ast_ctx.record_exception(err)
+                raise
+
+        return wrap_sync, False
+
+    def compile_block(self, body, stop_types=EvalStopFlow):
+        """Compile a list of statements that stops at the first result of stop_types."""
+        stmts = [self.compile_node(stmt) for stmt in body]
+        if not any(is_async for _, is_async in stmts):
+            funcs = [func for func, _ in stmts]
+
+            def block_sync(ast_ctx):
+                val = None
+                for func in funcs:
+                    val = func(ast_ctx)
+                    if isinstance(val, stop_types):
+                        return val
+                return val
+
+            return block_sync, False
+
+        async def block_async(ast_ctx):
+            val = None
+            for func, is_async in stmts:
+                val = func(ast_ctx)
+                if is_async:
+                    val = await val
+                if isinstance(val, stop_types):
+                    return val
+            return val
+
+        return block_async, True
+
+    def compile_elt_list(self, elts):
+        """Compile a list of expressions that can include starred elements."""
+        items = []
+        for elt in elts:
+            if isinstance(elt, ast.Starred):
+                items.append([*self.compile_node(elt.value), True])
+            else:
+                items.append([*self.compile_node(elt), False])
+        if not any(is_async for _, is_async, _ in items):
+
+            def elt_list_sync(ast_ctx):
+                val = []
+                for func, _, starred in items:
+                    if starred:
+                        val += func(ast_ctx)
+                    else:
+                        val.append(func(ast_ctx))
+                return val
+
+            return elt_list_sync, False
+
+        async def elt_list_async(ast_ctx):
+            val = []
+            for func, is_async, starred in items:
+                this_val = func(ast_ctx)
+                if is_async:
+                    this_val = await this_val
+                if starred:
+                    val += this_val
+                else:
+                    val.append(this_val)
+            return val
+
+        return elt_list_async, True
+
+    def compile_target(self, lhs):
+        """Compile an assignment target into a function that stores a value."""
+        if isinstance(lhs, ast.Name):
+            name, lineno, col_offset = lhs.id, lhs.lineno, lhs.col_offset
+
+            def store_name(ast_ctx, val):
+                ast_ctx.lineno = lineno
+                ast_ctx.col_offset = col_offset
+                if ast_ctx.curr_func and name in ast_ctx.curr_func.global_names:
+                    ast_ctx.global_sym_table[name] = val
+                    return
+                sym_table = ast_ctx.sym_table
+                if name in sym_table and isinstance(sym_table[name], EvalLocalVar):
+                    sym_table[name].set(val)
+                else:
+                    sym_table[name] = val
+
+            return store_name, False
+
+        if isinstance(lhs, ast.Tuple) and not any(isinstance(elt, ast.Starred) for elt in lhs.elts):
+            targets = [self.compile_target(elt) for elt in lhs.elts]
+            num_targets = len(targets)
+            if not any(is_async for _, is_async in targets):
+
+                def store_tuple(ast_ctx, val):
+                    try:
+                        vals = [*(iter(val))]
+                    except Exception:
+                        raise TypeError("cannot unpack non-iterable object")  # pylint: disable=raise-missing-from
+                    if num_targets > len(vals):
+                        raise ValueError(f"too few values to unpack (expected {num_targets})")
+                    if num_targets < len(vals):
+                        raise ValueError(f"too many values to unpack (expected {num_targets})")
+                    for (store, _), this_val in zip(targets, vals):
+                        store(ast_ctx, this_val)
+
+                return store_tuple, False
+
+        async def store_recurse(ast_ctx, val):
+            await ast_ctx.recurse_assign(lhs, val)
+
+        return store_recurse, True
+
+    #
+    # Statements
+    #
+    def compile_expr(self, arg):
+        """Compile expression statement."""
+        value, is_async = self.compile_node(arg.value)
+        lineno = arg.lineno
+        #
+        # the value sets the line number itself; we only add the profiler's line hit
+        #
+        if is_async:
+
+            async def expr_async(ast_ctx):
+                if Profiler.count_lines:
+                    Profiler.line_hit(ast_ctx.global_ctx.get_name(), lineno)
+                return await value(ast_ctx)
+
+            return expr_async, True
+
+        def expr_sync(ast_ctx):
+            if Profiler.count_lines:
+                Profiler.line_hit(ast_ctx.global_ctx.get_name(), lineno)
+            return value(ast_ctx)
+
+        return expr_sync, False
+
+    def compile_pass(self, arg):
+        """Compile pass statement."""
+
+        def pass_stmt(ast_ctx):
+            ast_ctx.lineno = arg.lineno
+            ast_ctx.col_offset = arg.col_offset
+            if Profiler.count_lines:
+                Profiler.line_hit(ast_ctx.global_ctx.get_name(), arg.lineno)
+
+        return pass_stmt, False
+
+    def compile_break(self, arg):
+        """Compile break statement."""
+        return self.wrap(arg, lambda ast_ctx: self.EVAL_BREAK, False)
+
+    def compile_continue(self, arg):
+        """Compile continue statement."""
+        return self.wrap(arg, lambda ast_ctx: self.EVAL_CONTINUE, False)
+
+    def compile_return(self, arg):
+        """Compile return statement."""
+        if arg.value is None:
+            return self.wrap(arg, lambda ast_ctx: EvalReturn(None), False)
+        value, is_async = self.compile_node(arg.value)
+        if is_async:
+
+            async def return_async(ast_ctx):
+                return EvalReturn(await value(ast_ctx))
+
+            return self.wrap(arg, return_async, True)
+        return self.wrap(arg, lambda ast_ctx: EvalReturn(value(ast_ctx)), False)
+
+    def compile_assign(self, arg):
+        """Compile assignment statement."""
+        value, value_async = self.compile_node(arg.value)
+        targets = [self.compile_target(target) for target in arg.targets]
+        if not value_async and not any(is_async for _, is_async in targets):
+
+            def assign_sync(ast_ctx):
+                rhs = value(ast_ctx)
+                for store, _ in targets:
+                    store(ast_ctx, rhs)
+
+            return self.wrap(arg, assign_sync, False)
+
+        async def assign_async(ast_ctx):
+            rhs = value(ast_ctx)
+            if value_async:
+                rhs = await rhs
+            for store, is_async in targets:
+                if is_async:
+                    await store(ast_ctx, rhs)
+                else:
+                    store(ast_ctx, rhs)
+
+        return self.wrap(arg, assign_async, True)
+
+    def compile_augassign(self, arg):
+        """Compile augmented assignment to a simple name."""
+        if not isinstance(arg.target, ast.Name) or type(arg.op) not in self.BINOPS:
+            return None
+        load = ast.Name(id=arg.target.id, ctx=ast.Load())
+        ast.copy_location(load, arg.target)
+        left, left_async = self.compile_node(load)
+        right, right_async = self.compile_node(arg.value)
+        store, _ = self.compile_target(arg.target)
+        op_func = self.BINOPS[type(arg.op)]
+        if not left_async and not right_async:
+
+            def augassign_sync(ast_ctx):
+                store(ast_ctx, op_func(left(ast_ctx), right(ast_ctx)))
+
+            return self.wrap(arg, augassign_sync, False)
+
+        async def augassign_async(ast_ctx):
+            val0 = left(ast_ctx)
+            if left_async:
+                val0 = await val0
+            val1 = right(ast_ctx)
+            if right_async:
+                val1 = await val1
+            store(ast_ctx, op_func(val0, val1))
+
+        return self.wrap(arg, augassign_async, True)
+
+    def compile_if(self, arg):
+        """Compile if statement."""
+        test, test_async = self.compile_node(arg.test)
+        body, body_async = self.compile_block(arg.body)
+        orelse, orelse_async = self.compile_block(arg.orelse)
+        if not (test_async or body_async or orelse_async):
+
+            def if_sync(ast_ctx):
+                if test(ast_ctx):
+                    return body(ast_ctx)
+                return orelse(ast_ctx)
+
+            return self.wrap(arg, if_sync, False)
+
+        async def if_async(ast_ctx):
+            val = test(ast_ctx)
+            if test_async:
+                val = await val
+            if val:
+                val = body(ast_ctx)
+                return await val if body_async else val
+            val = orelse(ast_ctx)
+            return await val if orelse_async else val
+
+        return self.wrap(arg, if_async, True)
+
+    def compile_for(self, arg):
+        """Compile for statement."""
+        loop_iter, iter_async = self.compile_node(arg.iter)
+        store, store_async = self.compile_target(arg.target)
+        body, body_async = self.compile_block(arg.body)
+        orelse, orelse_async = self.compile_block(arg.orelse, stop_types=EvalReturn)
+        if not (iter_async or store_async or body_async or orelse_async):
+
+            def for_sync(ast_ctx):
+                for loop_var in loop_iter(ast_ctx):
+                    store(ast_ctx, loop_var)
+                    val = body(ast_ctx)
+                    if isinstance(val, EvalBreak):
+                        break
+                    if isinstance(val, EvalReturn):
+                        return val
+                else:
+                    val = orelse(ast_ctx)
+                    if isinstance(val, EvalReturn):
+                        return val
+                return None
+
+            return self.wrap(arg, for_sync, False)
+
+        async def for_async(ast_ctx):
+            loop_vals = loop_iter(ast_ctx)
+            if iter_async:
+                loop_vals = await loop_vals
+            for loop_var in loop_vals:
+                if store_async:
+                    await store(ast_ctx, loop_var)
+                else:
+                    store(ast_ctx, loop_var)
+                val = body(ast_ctx)
+                if body_async:
+                    val = await val
+                if isinstance(val, EvalBreak):
+                    break
+                if isinstance(val, EvalReturn):
+                    return val
+            else:
+                val = orelse(ast_ctx)
+                if orelse_async:
+                    val = await val
+                if isinstance(val, EvalReturn):
+                    return val
+            return None
+
+        return self.wrap(arg, for_async, True)
+
+    def compile_asyncfor(self, arg):
+        """Compile async for statement, which ast_asyncfor runs as a regular for."""
+        return self.compile_for(arg)
+
+    def compile_while(self, arg):
+        """Compile while statement."""
+        test, test_async = self.compile_node(arg.test)
+        body, body_async = self.compile_block(arg.body)
+        orelse, orelse_async = self.compile_block(arg.orelse, stop_types=EvalReturn)
+        if not (test_async or body_async or orelse_async):
+
+            def while_sync(ast_ctx):
+                while test(ast_ctx):
+                    val = body(ast_ctx)
+                    if isinstance(val, EvalBreak):
+                        break
+                    if isinstance(val, EvalReturn):
+                        return val
+                else:
+                    val = orelse(ast_ctx)
+                    if isinstance(val, EvalReturn):
+                        return val
+                return None
+
+            return self.wrap(arg, while_sync, False)
+
+        async def while_async(ast_ctx):
+            while True:
+                val = test(ast_ctx)
+                if test_async:
+                    val = await val
+                if not val:
+                    val = orelse(ast_ctx)
+                    if orelse_async:
+                        val = await val
+                    if isinstance(val, EvalReturn):
+                        return val
+                    break
+                val = body(ast_ctx)
+                if body_async:
+                    val = await val
+                if isinstance(val, EvalBreak):
+                    break
+                if isinstance(val, EvalReturn):
+                    return val
+            return None
+
+        return self.wrap(arg, while_async, True)
+
+    #
+    # Expressions
+    #
+    def compile_constant(self, arg):
+        """Compile constant."""
+        value, lineno, col_offset = arg.value, arg.lineno, arg.col_offset
+
+        def constant(ast_ctx):
+            ast_ctx.lineno = lineno
+            ast_ctx.col_offset = col_offset
+            return value
+
+        return constant, False
+
+    def compile_name(self, arg):
+        """Compile identifier lookup."""
+        if not isinstance(arg.ctx, ast.Load):
+            return None
+        name = arg.id
+        return self.wrap(arg, lambda ast_ctx: ast_ctx.name_lookup(name), False, undefined_check=True)
+
+    def compile_attribute(self, arg):
+        """Compile attribute lookup, including dotted state variable names."""
+        if not isinstance(arg.ctx, ast.Load):
+            return None
+        full_name = arg.attr
+        base = arg.value
+        while isinstance(base, ast.Attribute):
+            full_name = base.attr + "." + full_name
+            base = base.value
+        if isinstance(base, ast.Name):
+            base_name = base.id
+            full_name = base_name + "." + full_name
+        else:
+            base_name = full_name = None
+        value, value_async = self.compile_node(arg.value)
+        attr = arg.attr
+
+        def lookup_full_name(ast_ctx):
+            if full_name is not None and isinstance(ast_ctx.name_lookup(base_name), EvalName):
+                return ast_ctx.name_lookup(full_name)
+            return EvalName(full_name)
+
+        if not value_async:
+
+            def attribute_sync(ast_ctx):
+                val = lookup_full_name(ast_ctx)
+                if not isinstance(val, EvalName):
+                    return val
+                return getattr(value(ast_ctx), attr)
+
+            return self.wrap(arg, attribute_sync, False, undefined_check=True)
+
+        async def attribute_async(ast_ctx):
+            val = lookup_full_name(ast_ctx)
+            if not isinstance(val, EvalName):
+                return val
+            return getattr(await value(ast_ctx), attr)
+
+        return self.wrap(arg, attribute_async, True, undefined_check=True)
+
+    def compile_binop(self, arg):
+        """Compile binary operator."""
+        if type(arg.op) not in self.BINOPS:
+            return None
+        op_func = self.BINOPS[type(arg.op)]
+        left, left_async = self.compile_node(arg.left)
+        right, right_async = self.compile_node(arg.right)
+        if not left_async and not right_async:
+            return self.wrap(arg, lambda ast_ctx: op_func(left(ast_ctx), right(ast_ctx)), False)
+
+        async def binop_async(ast_ctx):
+            val0 = left(ast_ctx)
+            if left_async:
+                val0 = await val0
+            val1 = right(ast_ctx)
+            if right_async:
+                val1 = await val1
+            return op_func(val0, val1)
+
+        return self.wrap(arg, binop_async, True)
+
+    def compile_unaryop(self, arg):
+        """Compile unary operator."""
+        if type(arg.op) not in self.UNARYOPS:
+            return None
+        op_func = self.UNARYOPS[type(arg.op)]
+        operand, operand_async = self.compile_node(arg.operand)
+        if not operand_async:
+            return self.wrap(arg, lambda ast_ctx: op_func(operand(ast_ctx)), False)
+
+        async def unaryop_async(ast_ctx):
+            return op_func(await operand(ast_ctx))
+
+        return self.wrap(arg, unaryop_async, True)
+
+    def compile_compare(self, arg):
+        """Compile comparison operators."""
+        if any(type(cmp_op) not in self.CMPOPS for cmp_op in arg.ops):
+            return None
+        #
+        # ast_compare evaluates each inner operand twice (once on each side), so
+        # the compiled version does the same
+        #
+        operands = [self.compile_node(arg.left)] + [self.compile_node(right) for right in arg.comparators]
+        cmps = [
+            [self.CMPOPS[type(cmp_op)], *operands[i], *operands[i + 1]] for i, cmp_op in enumerate(arg.ops)
+        ]
+        if not any(is_async for _, is_async in operands):
+
+            def compare_sync(ast_ctx):
+                for op_func, left, _, right, _ in cmps:
+                    if not op_func(left(ast_ctx), right(ast_ctx)):
+                        return False
+                return True
+
+            return self.wrap(arg, compare_sync, False)
+
+        async def compare_async(ast_ctx):
+            for op_func, left, left_async, right, right_async in cmps:
+                val0 = left(ast_ctx)
+                if left_async:
+                    val0 = await val0
+                val1 = right(ast_ctx)
+                if right_async:
+                    val1 = await val1
+                if not op_func(val0, val1):
+                    return False
+            return True
+
+        return self.wrap(arg, compare_async, True)
+
+    def compile_boolop(self, arg):
+        """Compile boolean operators and and or."""
+        is_and = isinstance(arg.op, ast.And)
+        values = [self.compile_node(value) for value in arg.values]
+        if not any(is_async for _, is_async in values):
+            funcs = [func for func, _ in values]
+
+            def boolop_sync(ast_ctx):
+                val = is_and
+                for func in funcs:
+                    val = func(ast_ctx)
+                    if bool(val) != is_and:
+                        return val
+                return val
+
+            return self.wrap(arg, boolop_sync, False)
+
+        async def boolop_async(ast_ctx):
+            val = is_and
+            for func, is_async in values:
+                val = func(ast_ctx)
+                if is_async:
+                    val = await val
+                if bool(val) != is_and:
+                    return val
+            return val
+
+        return self.wrap(arg, boolop_async, True)
+
+    def compile_ifexp(self, arg):
+        """Compile if expression."""
+        test, test_async = self.compile_node(arg.test)
+        body, body_async = self.compile_node(arg.body)
+        orelse, orelse_async = self.compile_node(arg.orelse)
+        if not (test_async or body_async or orelse_async):
+            return self.wrap(
+                arg, lambda ast_ctx: body(ast_ctx) if test(ast_ctx) else orelse(ast_ctx), False
+            )
+
+        async def ifexp_async(ast_ctx):
+            val = test(ast_ctx)
+            if test_async:
+                val = await val
+            if val:
+                val = body(ast_ctx)
+                return await val if body_async else val
+            val = orelse(ast_ctx)
+            return await val if orelse_async else val
+
+        return self.wrap(arg, ifexp_async, True)
+
+    def compile_container(self, arg, container_type):
+        """Compile list, tuple or set display."""
+        if not isinstance(arg.ctx if hasattr(arg, "ctx") else ast.Load(), ast.Load):
+            return None
+        elts, elts_async = self.compile_elt_list(arg.elts)
+        if not elts_async:
+            return self.wrap(arg, lambda ast_ctx: container_type(elts(ast_ctx)), False)
+
+        async def container_async(ast_ctx):
+            return container_type(await elts(ast_ctx))
+
+        return self.wrap(arg, container_async, True)
+
+    def compile_list(self, arg):
+        """Compile list."""
+        return self.compile_container(arg, list)
+
+    def compile_tuple(self, arg):
+        """Compile tuple."""
+        return self.compile_container(arg, tuple)
+
+    def compile_set(self, arg):
+        """Compile set."""
+        return self.compile_container(arg, set)
+
+    def compile_dict(self, arg):
+        """Compile dict."""
+        items = [
+            [*(self.compile_node(key) if key is not None else [None, False]), *self.compile_node(value)]
+            for key, value in zip(arg.keys, arg.values)
+        ]
+        if not any(key_async or val_async for _, key_async, _, val_async in items):
+
+            def dict_sync(ast_ctx):
+                val = {}
+                for key, _, value, _ in items:
+                    this_val = value(ast_ctx)
+                    if key is None:
+                        val.update(this_val)
+                    else:
+                        val[key(ast_ctx)] = this_val
+                return val
+
+            return self.wrap(arg, dict_sync, False)
+
+        async def dict_async(ast_ctx):
+            val = {}
+            for key, key_async, value, val_async in items:
+                this_val = value(ast_ctx)
+                if val_async:
+                    this_val = await this_val
+                if key is None:
+                    val.update(this_val)
+                else:
+                    key_val = key(ast_ctx)
+                    if key_async:
+                        key_val = await key_val
+                    val[key_val] = this_val
+            return val
+
+        return self.wrap(arg, dict_async, True)
+
+    def compile_subscript(self, arg):
+        """Compile subscript load."""
+        if not isinstance(arg.ctx, ast.Load):
+            return None
+        value, value_async = self.compile_node(arg.value)
+        if isinstance(arg.slice, ast.Slice):
+            parts = [
+                self.compile_node(part) if part else [None, False]
+                for part in [arg.slice.lower, arg.slice.upper, arg.slice.step]
+            ]
+            index_async = any(is_async for _, is_async in parts)
+
+            def slice_sync(ast_ctx):
+                return slice(*[func(ast_ctx) if func else None for func, _ in parts])
+
+            async def slice_async(ast_ctx):
+                vals = []
+                for func, is_async in parts:
+                    val = func(ast_ctx) if func else None
+                    vals.append(await val if is_async else val)
+                return slice(*vals)
+
+            index = slice_async if index_async else slice_sync
+        else:
+            index, index_async = self.compile_node(arg.slice)
+        if not value_async and not index_async:
+            return self.wrap(arg, lambda ast_ctx: value(ast_ctx)[index(ast_ctx)], False)
+
+        async def subscript_async(ast_ctx):
+            var = value(ast_ctx)
+            if value_async:
+                var = await var
+            ind = index(ast_ctx)
+            if index_async:
+                ind = await ind
+            return var[ind]
+
+        return self.wrap(arg, subscript_async, True)
+
+    def compile_joinedstr(self, arg):
+        """Compile joined string."""
+        values = [self.compile_node(value) for value in arg.values]
+        if not any(is_async for _, is_async in values):
+            funcs = [func for func, _ in values]
+            return self.wrap(arg, lambda ast_ctx: "".join([str(func(ast_ctx)) for func in funcs]), False)
+
+        async def joinedstr_async(ast_ctx):
+            val = ""
+            for func, is_async in values:
+                this_val = func(ast_ctx)
+                if is_async:
+                    this_val = await this_val
+                val = val + str(this_val)
+            return val
+
+        return self.wrap(arg, joinedstr_async, True)
+
+    def compile_formattedvalue(self, arg):
+        """Compile formatted value."""
+        value, value_async = self.compile_node(arg.value)
+        if arg.format_spec is not None:
+            fmt, fmt_async = self.compile_node(arg.format_spec)
+        else:
+            fmt, fmt_async = None, False
+        if not value_async and not fmt_async:
+
+            def formattedvalue_sync(ast_ctx):
+                val = value(ast_ctx)
+                if fmt is not None:
+                    return f"{val:{fmt(ast_ctx)}}"
+                return f"{val}"
+
+            return self.wrap(arg, formattedvalue_sync, False)
+
+        async def formattedvalue_async(ast_ctx):
+            val = value(ast_ctx)
+            if value_async:
+                val = await val
+            if fmt is not None:
+                spec = fmt(ast_ctx)
+                if fmt_async:
+                    spec = await spec
+                return f"{val:{spec}}"
+            return f"{val}"
+
+        return self.wrap(arg, formattedvalue_async, True)
+
+    def compile_namedexpr(self, arg):
+        """Compile named expression."""
+        value, value_async = self.compile_node(arg.value)
+        store, store_async = self.compile_target(arg.target)
+        if not value_async and not store_async:
+
+            def namedexpr_sync(ast_ctx):
+                val = value(ast_ctx)
+                store(ast_ctx, val)
+                return val
+
+            return self.wrap(arg, namedexpr_sync, False)
+
+        async def namedexpr_async(ast_ctx):
+            val = value(ast_ctx)
+            if value_async:
+                val = await val
+            if store_async:
+                await store(ast_ctx, val)
+            else:
+                store(ast_ctx, val)
+            return val
+
+        return self.wrap(arg, namedexpr_async, True)
+
+    def compile_call(self, arg):
+        """Compile function call."""
+        func, func_async = self.compile_node(arg.func)
+        keywords = [[kw_arg.arg, *self.compile_node(kw_arg.value)] for kw_arg in arg.keywords]
+        args, args_async = self.compile_elt_list(arg.args)
+        #
+        # try to deduce function name, although this only works in simple cases
+        #
+        func_name = None
+        if isinstance(arg.func, ast.Name):
+            func_name = arg.func.id
+        elif isinstance(arg.func, ast.Attribute):
+            func_name = arg.func.attr
+
+        async def call(ast_ctx):
+            func_val = func(ast_ctx)
+            if func_async:
+                func_val = await func_val
+            kwargs = {}
+            for kw_name, kw_func, kw_async in keywords:
+                val = kw_func(ast_ctx)
+                if kw_async:
+                    val = await val
+                if kw_name is None:
+                    kwargs.update(val)
+                else:
+                    kwargs[kw_name] = val
+            args_val = args(ast_ctx)
+            if args_async:
+                args_val = await args_val
+            name = func_name
+            if isinstance(func_val, EvalLocalVar):
+                name = func_val.get_name()
+                func_val = func_val.get()
+            return await ast_ctx.call_func(func_val, name, *args_val, **kwargs)
+
+        return self.wrap(arg, call, True)
+
+    def compile_await(self, arg):
+        """Compile await expression."""
+        value, value_async = self.compile_node(arg.value)
+
+        async def await_expr(ast_ctx):
+            coro = value(ast_ctx)
+            if value_async:
+                coro = await coro
+            if coro and (asyncio.iscoroutine(coro) or asyncio.isfuture(coro)):
+                if Profiler.enabled:
+                    return await ast_ctx.profile_await(coro)
+                return await coro
+            return coro
+
+        return self.wrap(arg, await_expr, True)
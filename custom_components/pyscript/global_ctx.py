@@ -43,6 +43,7 @@ class GlobalContext:
         self.mtime: float = mtime
         self.app_config: Dict[str, Any] = app_config
         self.imports: Set[str] = set()
+        self.trig_reuse: Dict[str, List[TrigInfo]] = {}
         config_entry: ConfigEntry = Function.hass.data.get(DOMAIN, {}).get(CONFIG_ENTRY, {})
         if config_entry.data.get(CONF_HASS_IS_GLOBAL, False):
             #
@@ -81,8 +82,34 @@ class GlobalContext:
             func.trigger_stop()
         self.triggers = set()
         self.triggers_delay_start = set()
+        self.trigger_reuse_stop()
         self.set_auto_start(False)
 
+    def trigger_detach(self) -> Dict[str, List[TrigInfo]]:
+        """Remove running triggers that a reload could take over from their functions, by name."""
+        detached = {}
+        for func in self.triggers:
+            keep = []
+            for trigger in func.trigger:
+                if trigger.reusable():
+                    detached.setdefault(trigger.name, []).append(trigger)
+                else:
+                    keep.append(trigger)
+            func.trigger = keep
+        return detached
+
+    def trigger_reuse_add(self, detached: Dict[str, List[TrigInfo]]) -> None:
+        """Offer triggers detached from the previous version of this context for reuse."""
+        for name, triggers in detached.items():
+            self.trig_reuse.setdefault(name, []).extend(triggers)
+
+    def trigger_reuse_stop(self) -> None:
+        """Stop the offered triggers that weren't reused."""
+        for triggers in self.trig_reuse.values():
+            for trigger in triggers:
+                trigger.stop()
+        self.trig_reuse = {}
+
     def get_name(self) -> str:
         """Return the global context name."""
         return self.name
@@ -116,7 +143,13 @@ class GlobalContext:
         return self.imports
 
     def get_trig_info(self, name: str, trig_args: Dict[str, Any]) -> TrigInfo:
-        """Return a new trigger info instance with the given args."""
+        """Return a trigger info instance with the given args, reusing a running one if unchanged."""
+        triggers = self.trig_reuse.get(name, [])
+        for idx, trigger in enumerate(triggers):
+            if trigger.same_cfg(trig_args):
+                del triggers[idx]
+                trigger.adopt(trig_args, self)
+                return trigger
         return TrigInfo(name, trig_args, self)
 
     async def module_import(self, module_name: str, import_level: int) -> List[Optional[str]]:
@@ -172,7 +205,7 @@ class GlobalContext:
         for ctx_name, _, _ in file_paths:
             mod_ctx = self.manager.get(ctx_name)
             if mod_ctx and mod_ctx.module:
-                self.imports.add(mod_ctx.get_name())
+                self.import_add(mod_ctx.get_name())
                 return [mod_ctx.module, None]
 
         #
@@ -199,9 +232,15 @@ class GlobalContext:
             )
             return [None, error_ctx]
         global_ctx.module = mod
-        self.imports.add(ctx_name)
+        self.import_add(ctx_name)
         return [mod, None]
 
+    def import_add(self, ctx_name: str) -> None:
+        """Record that this context imports the module context ctx_name."""
+        self.imports.add(ctx_name)
+        if self.manager:
+            self.manager.importers.setdefault(ctx_name, set()).add(self.name)
+
 
 class GlobalContextMgr:
     """Define class for all global contexts."""
@@ -211,6 +250,19 @@ class GlobalContextMgr:
     #
     contexts = {}
 
+    #
+    # map of module context names to the names of the contexts that import them;
+    # kept up to date as modules are imported and contexts deleted, so reloads
+    # don't have to walk every context's imports
+    #
+    importers = {}
+
+    #
+    # running triggers detached from contexts being reloaded, by context name,
+    # for the reloaded contexts to take over
+    #
+    trig_reuse = {}
+
     #
     # sequence number for sessions
     #
@@ -285,6 +337,29 @@ class GlobalContextMgr:
             global_ctx = cls.contexts[name]
             global_ctx.stop()
             del cls.contexts[name]
+            for imp_name in global_ctx.get_imports():
+                cls.importers.get(imp_name, set()).discard(name)
+
+    @classmethod
+    def trigger_reuse_stop(cls) -> None:
+        """Stop detached triggers that no reloaded context took over."""
+        for detached in cls.trig_reuse.values():
+            for triggers in detached.values():
+                for trigger in triggers:
+                    trigger.stop()
+        cls.trig_reuse = {}
+
+    @classmethod
+    def get_importers(cls, ctx_names: Set[str]) -> Set[str]:
+        """Return the names of all contexts that directly or indirectly import any of ctx_names."""
+        found = set()
+        todo = list(ctx_names)
+        while todo:
+            for importer in cls.importers.get(todo.pop(), set()):
+                if importer not in found:
+                    found.add(importer)
+                    todo.append(importer)
+        return found
 
     @classmethod
     def new_name(cls, root: str) -> str:
@@ -318,9 +393,12 @@ class GlobalContextMgr:
         if source is None:
             return False, None
 
+        global_ctx.trigger_reuse_add(cls.trig_reuse.pop(global_ctx.get_name(), {}))
         ctx_curr = cls.get(global_ctx.get_name())
         if ctx_curr:
-            # stop triggers and destroy old global context
+            # stop triggers and destroy old global context, except for running
+            # triggers the new version of a function can take over
+            global_ctx.trigger_reuse_add(ctx_curr.trigger_detach())
             ctx_curr.stop()
             cls.delete(global_ctx.get_name())
 
@@ -341,6 +419,7 @@ class GlobalContextMgr:
             ast_ctx.get_logger().error(exc)
             global_ctx.stop()
             return False, ast_ctx
+        global_ctx.trigger_reuse_stop()
         global_ctx.source = source
         global_ctx.file_path = file_path
         if mtime is not None:
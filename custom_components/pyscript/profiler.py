@@ -0,0 +1,230 @@
+"""Opt-in profiler for pyscript functions."""
+
+import asyncio
+import logging
+import os
+import time
+
+from .const import LOGGER_PATH, PROFILER_ENTITY_ID
+from .state import State
+
+_LOGGER = logging.getLogger(LOGGER_PATH + ".profiler")
+
+#
+# number of functions and lines shown in the profiler entity's attributes
+#
+PROFILER_ATTR_TOP = 20
+
+
+class Profiler:
+    """Class for profiling pyscript function calls, awaits and line hits."""
+
+    #
+    # when False every hook is a single attribute check, so the profiler costs
+    # nothing unless it's been started
+    #
+    enabled = False
+
+    #
+    # whether statements are counted per source line; this is most of the
+    # profiler's overhead, so it's only done when asked for
+    #
+    count_lines = False
+
+    #
+    # wall time the profiler was started, and seconds profiled by earlier runs
+    # since the last reset
+    #
+    start_time = None
+    elapsed = 0.0
+
+    #
+    # function name -> [calls, cumulative secs, self secs, await secs]
+    #
+    funcs = {}
+
+    #
+    # (global context name, lineno) -> statements executed
+    #
+    lines = {}
+
+    #
+    # "outer;inner;..." call stack -> self secs, for flamegraph collapsed output
+    #
+    stacks = {}
+
+    #
+    # task -> list of active frames [name, start time, child secs, await secs, stack path]
+    #
+    task_frames = {}
+
+    #
+    # function name -> number of active frames, so recursive calls aren't
+    # counted more than once in the cumulative time
+    #
+    active = {}
+
+    def __init__(self):
+        """Warn on Profiler instantiation."""
+        _LOGGER.error("Profiler class is not meant to be instantiated")
+
+    @classmethod
+    def start(cls, reset=True, lines=False):
+        """Start profiling, optionally discarding earlier results and counting line hits."""
+        if reset:
+            cls.reset()
+        if not cls.enabled:
+            cls.start_time = time.monotonic()
+            cls.enabled = True
+        cls.count_lines = lines
+        _LOGGER.info("profiler started")
+
+    @classmethod
+    def stop(cls):
+        """Stop profiling; results are kept until the next reset."""
+        if cls.enabled:
+            cls.elapsed += time.monotonic() - cls.start_time
+            cls.enabled = False
+        cls.count_lines = False
+        #
+        # functions still running when we stop won't be recorded
+        #
+        cls.task_frames = {}
+        cls.active = {}
+        _LOGGER.info("profiler stopped")
+
+    @classmethod
+    def reset(cls):
+        """Discard all results."""
+        cls.funcs = {}
+        cls.lines = {}
+        cls.stacks = {}
+        cls.task_frames = {}
+        cls.active = {}
+        cls.elapsed = 0.0
+        if cls.enabled:
+            cls.start_time = time.monotonic()
+
+    @classmethod
+    def func_enter(cls, name):
+        """Record the start of a call to function name and return its frame."""
+        task = asyncio.current_task()
+        frames = cls.task_frames.get(task)
+        if frames is None:
+            frames = cls.task_frames[task] = []
+        frame = [name, time.perf_counter(), 0.0, 0.0, f"{frames[-1][4]};{name}" if frames else name]
+        frames.append(frame)
+        cls.active[name] = cls.active.get(name, 0) + 1
+        return frame
+
+    @classmethod
+    def func_exit(cls, frame):
+        """Record the end of the call with the given frame."""
+        elapsed = time.perf_counter() - frame[1]
+        task = asyncio.current_task()
+        frames = cls.task_frames.get(task)
+        if not frames or frames[-1] is not frame:
+            #
+            # the profiler was stopped or reset during this call
+            #
+            return
+        frames.pop()
+        if frames:
+            frames[-1][2] += elapsed
+        else:
+            del cls.task_frames[task]
+
+        name = frame[0]
+        self_time = max(elapsed - frame[2] - frame[3], 0.0)
+        stats = cls.funcs.get(name)
+        if stats is None:
+            stats = cls.funcs[name] = [0, 0.0, 0.0, 0.0]
+        stats[0] += 1
+        depth = cls.active.get(name, 1) - 1
+        if depth:
+            cls.active[name] = depth
+        else:
+            cls.active.pop(name, None)
+            stats[1] += elapsed
+        stats[2] += self_time
+        stats[3] += frame[3]
+        cls.stacks[frame[4]] = cls.stacks.get(frame[4], 0.0) + self_time
+
+    @classmethod
+    def await_add(cls, secs):
+        """Add secs spent awaiting to the current function call."""
+        frames = cls.task_frames.get(asyncio.current_task())
+        if frames:
+            frames[-1][3] += secs
+
+    @classmethod
+    def line_hit(cls, global_ctx_name, lineno):
+        """Count an executed statement."""
+        key = (global_ctx_name, lineno)
+        cls.lines[key] = cls.lines.get(key, 0) + 1
+
+    @classmethod
+    def get_elapsed(cls):
+        """Return the number of seconds profiled since the last reset."""
+        if cls.enabled:
+            return cls.elapsed + time.monotonic() - cls.start_time
+        return cls.elapsed
+
+    @classmethod
+    def results(cls, top=None):
+        """Return the function and line statistics, most expensive first."""
+        top = int(top) if top else None
+        funcs = [
+            {
+                "name": name,
+                "calls": stats[0],
+                "cumulative": round(stats[1], 6),
+                "self": round(stats[2], 6),
+                "await": round(stats[3], 6),
+            }
+            for name, stats in sorted(cls.funcs.items(), key=lambda item: item[1][2], reverse=True)
+        ]
+        lines = [
+            {"line": f"{ctx_name}:{lineno}", "hits": hits}
+            for (ctx_name, lineno), hits in sorted(cls.lines.items(), key=lambda item: item[1], reverse=True)
+        ]
+        return {
+            "enabled": cls.enabled,
+            "elapsed": round(cls.get_elapsed(), 3),
+            "functions": funcs[:top] if top else funcs,
+            "lines": lines[:top] if top else lines,
+        }
+
+    @classmethod
+    def collapsed(cls):
+        """Return the call stacks in flamegraph collapsed format, with self time in microseconds."""
+        return [
+            f"{path} {round(secs * 1000000)}" for path, secs in sorted(cls.stacks.items()) if secs >= 0.0000005
+        ]
+
+    @classmethod
+    def publish(cls):
+        """Set the profiler entity, with the top functions and lines as attributes."""
+        results = cls.results(top=PROFILER_ATTR_TOP)
+        State.set(
+            PROFILER_ENTITY_ID,
+            "on" if cls.enabled else "off",
+            {
+                "elapsed": results["elapsed"],
+                "functions": results["functions"],
+                "lines": results["lines"],
+                "friendly_name": "pyscript profiler",
+            },
+        )
+
+    @classmethod
+    async def write_collapsed(cls, hass, path):
+        """Write the collapsed call stacks to path."""
+        body = "\n".join(cls.collapsed()) + "\n"
+
+        def write_file(path, body):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file_desc:
+                file_desc.write(body)
+
+        await hass.async_add_executor_job(write_file, path, body)
@@ -0,0 +1,261 @@
+"""Run @pure_compute functions as native Python in a pool of worker processes."""
+
+import ast
+import asyncio
+import builtins
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import importlib
+import logging
+import multiprocessing
+import pickle
+import symtable
+import time
+
+from .const import LOGGER_PATH, PURE_COMPUTE_MAX_WORKERS, PURE_COMPUTE_MODULES, PURE_COMPUTE_TIMEOUT
+
+_LOGGER = logging.getLogger(LOGGER_PATH + ".pure_compute")
+
+#
+# builtins that could block, do I/O or reach outside the function, so they
+# aren't allowed in @pure_compute functions
+#
+PURE_COMPUTE_BUILTINS_EXCLUDE = {
+    "__import__",
+    "breakpoint",
+    "compile",
+    "eval",
+    "exec",
+    "exit",
+    "globals",
+    "help",
+    "input",
+    "locals",
+    "open",
+    "quit",
+    "vars",
+}
+
+PURE_COMPUTE_BUILTINS = set(dir(builtins)) - PURE_COMPUTE_BUILTINS_EXCLUDE
+
+#
+# maximum number of compiled functions each worker process keeps
+#
+WORKER_FUNCS_MAX = 256
+
+#
+# source hash -> compiled function, in each worker process
+#
+worker_funcs = {}
+
+
+def worker_run(key, source, name, modules, args_pickle):
+    """Run function name defined in source in a worker process; return its result and run time."""
+    func = worker_funcs.get(key)
+    if func is None:
+        if len(worker_funcs) >= WORKER_FUNCS_MAX:
+            worker_funcs.clear()
+        global_sym_table = {"__name__": "pyscript_pure_compute"}
+        for mod_name in modules:
+            global_sym_table[mod_name] = importlib.import_module(mod_name)
+        exec(compile(source, f"<pure_compute {name}>", "exec"), global_sym_table)  # pylint: disable=exec-used
+        func = worker_funcs[key] = global_sym_table[name]
+    args, kwargs = pickle.loads(args_pickle)
+    t_start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - t_start
+
+
+class PureCompute:
+    """Class for running @pure_compute functions in a process pool."""
+
+    #
+    # the process pool, created on first use, and the number of worker processes
+    #
+    pool = None
+    max_workers = PURE_COMPUTE_MAX_WORKERS
+
+    #
+    # limits the calls submitted to the pool to the number of workers, so
+    # the rest wait here and the queue depth is known
+    #
+    slots = None
+
+    #
+    # metrics
+    #
+    stats = {}
+
+    def __init__(self):
+        """Warn on PureCompute instantiation."""
+        _LOGGER.error("PureCompute class is not meant to be instantiated")
+
+    @classmethod
+    def stats_reset(cls):
+        """Reset the metrics."""
+        cls.stats = {
+            "calls": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "queued": 0,
+            "queued_max": 0,
+            "running": 0,
+            "queue_time": 0.0,
+            "exec_time": 0.0,
+            "exec_time_max": 0.0,
+        }
+
+    @classmethod
+    def get_stats(cls):
+        """Return the metrics, including the mean queue and execution times."""
+        stats = cls.stats.copy()
+        done = stats["calls"] - stats["queued"] - stats["running"] - stats["errors"] - stats["timeouts"]
+        stats["workers"] = cls.max_workers
+        stats["queue_time_mean"] = stats["queue_time"] / done if done else 0.0
+        stats["exec_time_mean"] = stats["exec_time"] / done if done else 0.0
+        return stats
+
+    @classmethod
+    def check_function(cls, func_def, filename):
+        """Check a function can run in a worker process; return its source and the modules it uses."""
+        name = func_def.name
+        if isinstance(func_def, ast.AsyncFunctionDef):
+            raise TypeError(f"@pure_compute function {name}() needs to be a regular, not async, function")
+        if func_def.decorator_list:
+            raise SyntaxError(f"@pure_compute function {name}() can't have other decorators")
+        for node in ast.walk(func_def):
+            if isinstance(node, (ast.Yield, ast.YieldFrom, ast.Await)):
+                raise TypeError(f"@pure_compute function {name}() can't be a generator or use await")
+            if isinstance(node, (ast.Global, ast.Nonlocal)):
+                raise TypeError(f"@pure_compute function {name}() can't use global or nonlocal")
+            if isinstance(node, ast.Import):
+                mod_names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                mod_names = [node.module or ""] if node.level == 0 else ["." * node.level]
+            else:
+                continue
+            for mod_name in mod_names:
+                if mod_name.split(".")[0] not in PURE_COMPUTE_MODULES:
+                    raise TypeError(
+                        f"@pure_compute function {name}() can't import {mod_name}; "
+                        f"allowed modules are {', '.join(sorted(PURE_COMPUTE_MODULES))}"
+                    )
+
+        source = ast.unparse(ast.Module(body=[func_def], type_ignores=[]))
+        modules = set()
+
+        def check_names(sym_names):
+            for sym_name in sym_names:
+                if sym_name in PURE_COMPUTE_MODULES:
+                    modules.add(sym_name)
+                elif sym_name not in PURE_COMPUTE_BUILTINS:
+                    raise TypeError(
+                        f"@pure_compute function {name}() uses '{sym_name}', which isn't a builtin "
+                        "or an allowed module, so it's not available in a worker process"
+                    )
+
+        #
+        # the module scope has the names used by the argument defaults and annotations
+        #
+        module_table = symtable.symtable(source, filename, "exec")
+        check_names(set(module_table.get_identifiers()) - {name})
+        func_table = module_table.get_children()[0]
+        if func_table.get_frees():
+            raise TypeError(
+                f"@pure_compute function {name}() uses variables from an enclosing function: "
+                f"{', '.join(sorted(func_table.get_frees()))}"
+            )
+        #
+        # nested functions, classes and comprehensions can use our locals, but
+        # any global they use has to be available in the worker
+        #
+        tables = [func_table]
+        while tables:
+            table = tables.pop()
+            check_names(sym.get_name() for sym in table.get_symbols() if sym.is_global())
+            tables.extend(table.get_children())
+        return source, tuple(sorted(modules))
+
+    @classmethod
+    def wrap(cls, func_def, filename, timeout=PURE_COMPUTE_TIMEOUT):
+        """Return an async function that runs func_def in the process pool."""
+        name = func_def.name
+        source, modules = cls.check_function(func_def, filename)
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+        async def pure_compute_wrap(*args, **kwargs):
+            try:
+                args_pickle = pickle.dumps((args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as exc:
+                raise TypeError(f"@pure_compute function {name}() arguments need to be picklable: {exc}") from exc
+            return await cls.run(name, timeout, worker_run, key, source, name, modules, args_pickle)
+
+        pure_compute_wrap.__name__ = name
+        pure_compute_wrap.__qualname__ = name
+        return pure_compute_wrap
+
+    @classmethod
+    async def run(cls, name, timeout, func, *args):
+        """Run func with args in the process pool, waiting for a free worker first."""
+        if cls.slots is None:
+            cls.slots = asyncio.Semaphore(cls.max_workers)
+        stats = cls.stats
+        stats["calls"] += 1
+        stats["queued"] += 1
+        stats["queued_max"] = max(stats["queued_max"], stats["queued"])
+        t_start = time.perf_counter()
+        try:
+            await cls.slots.acquire()
+        except BaseException:
+            stats["calls"] -= 1
+            raise
+        finally:
+            stats["queued"] -= 1
+        stats["running"] += 1
+        try:
+            if cls.pool is None:
+                cls.pool = ProcessPoolExecutor(
+                    max_workers=cls.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            future = asyncio.get_running_loop().run_in_executor(cls.pool, func, *args)
+            result, exec_time = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            stats["timeouts"] += 1
+            _LOGGER.warning("@pure_compute function %s() timed out after %ss; restarting workers", name, timeout)
+            cls.pool_stop()
+            raise TimeoutError(f"@pure_compute function {name}() timed out after {timeout}s") from None
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            stats["running"] -= 1
+            cls.slots.release()
+        stats["exec_time"] += exec_time
+        stats["exec_time_max"] = max(stats["exec_time_max"], exec_time)
+        stats["queue_time"] += time.perf_counter() - t_start - exec_time
+        return result
+
+    @classmethod
+    def pool_stop(cls):
+        """Stop the process pool, killing any worker still running a function."""
+        pool, cls.pool = cls.pool, None
+        if pool is None:
+            return
+        #
+        # ProcessPoolExecutor can't cancel a running call, so terminate its workers;
+        # other calls running in this pool fail with BrokenProcessPool
+        #
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for proc in processes:
+            proc.terminate()
+
+    @classmethod
+    def reset(cls):
+        """Stop the pool and reset the metrics."""
+        cls.pool_stop()
+        cls.slots = None
+        cls.stats_reset()
+
+
+PureCompute.stats_reset()
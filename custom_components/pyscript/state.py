@@ -33,13 +33,45 @@ class StateVal(str):
     def __new__(cls, state):
         """Create a new instance given a state variable."""
         new_var = super().__new__(cls, state.state)
-        new_var.__dict__ = state.attributes.copy()
-        new_var.entity_id = state.entity_id
-        new_var.last_updated = state.last_updated
-        new_var.last_changed = state.last_changed
-        new_var.last_reported = state.last_reported
+        #
+        # attributes are read from the (immutable) state on access, rather than
+        # copied, since most values are never asked for their attributes;
+        # attributes set on the instance shadow the state's
+        #
+        new_var.__dict__["_StateVal__state"] = state
         return new_var
 
+    def __getattr__(self, name):
+        """Return an attribute of the underlying state."""
+        state = self.__dict__.get("_StateVal__state")
+        if state is not None:
+            if name in STATE_VIRTUAL_ATTRS:
+                return getattr(state, name)
+            if name in state.attributes:
+                return state.attributes[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __delattr__(self, name):
+        """Delete an attribute, after copying the state's attributes into the instance."""
+        state = self.__dict__.pop("_StateVal__state", None)
+        if state is not None:
+            attrs = self._attributes(state)
+            attrs.update(self.__dict__)
+            self.__dict__.update(attrs)
+        super().__delattr__(name)
+
+    def _attributes(self, state=None):
+        """Return a dict of all attributes, including the virtual ones."""
+        state = self.__dict__.get("_StateVal__state") if state is None else state
+        attrs = {}
+        if state is not None:
+            attrs.update(state.attributes)
+            for attr in STATE_VIRTUAL_ATTRS:
+                attrs[attr] = getattr(state, attr)
+        attrs.update(self.__dict__)
+        attrs.pop("_StateVal__state", None)
+        return attrs
+
     def as_float(self, default: float = _SENTINEL) -> float:
         """Return the state converted to float via the forgiving helper."""
         return forgiving_float(self, default=default)
@@ -83,6 +115,49 @@ STATE_CALLABLE_ATTRS = {
 }
 
 
+def state_attrs_changed(value, old_value):
+    """Return whether any non-virtual attribute differs between two StateVal (or None) values."""
+    all_attrs = set()
+    if value is not None:
+        all_attrs |= set(value._attributes().keys())
+    if old_value is not None:
+        all_attrs |= set(old_value._attributes().keys())
+    for attr in all_attrs - STATE_VIRTUAL_ATTRS:
+        if getattr(value, attr, None) != getattr(old_value, attr, None):
+            return True
+    return False
+
+
+class StateWatch:
+    """Precomputed view of the state variables a notify queue watches."""
+
+    def __init__(self, var_names, changed_names):
+        """Split the watched names once, and note which state and attribute changes matter."""
+        self.var_names = var_names
+        self.idents = [(var_name, var_name.split(".")) for var_name in var_names]
+        #
+        # changed maps each state variable to (watch_state, attrs, watch_all_attrs)
+        #
+        changed = {}
+        for var_name in changed_names:
+            parts = var_name.split(".")
+            if len(parts) != 2 and len(parts) != 3:
+                continue
+            watch_state, attrs, all_attrs = changed.get(f"{parts[0]}.{parts[1]}", (False, set(), False))
+            if len(parts) == 2 or parts[2] == "old":
+                watch_state = True
+            elif parts[2] == "*":
+                all_attrs = True
+            else:
+                attrs.add(parts[2])
+            changed[f"{parts[0]}.{parts[1]}"] = (watch_state, attrs, all_attrs)
+        self.changed = changed
+
+    def get_vars(self, new_vars):
+        """Return new_vars plus the last values of the watched variables."""
+        return State.notify_var_resolve(self.idents, new_vars)
+
+
 class State:
     """Class for state functions."""
 
@@ -92,10 +167,17 @@ class State:
     hass = None
 
     #
-    # notify message queues by variable
+    # notify message queues by variable, with the StateWatch for each queue
     #
     notify = {}
 
+    #
+    # for each variable in notify, the queues that watch its state, each
+    # attribute or all attributes, so we only notify queues whose watched
+    # values changed
+    #
+    notify_index = {}
+
     #
     # Last value of state variable notifications.  We maintain this
     # so that trigger evaluation can use the last notified value,
@@ -142,9 +224,14 @@ class State:
                 cls.service2args[domain][service].discard("entity_id")
 
     @classmethod
-    async def notify_add(cls, var_names, queue):
-        """Register to notify state variables changes to be sent to queue."""
+    async def notify_add(cls, var_names, queue, changed_names=None):
+        """Register to notify state variables changes to be sent to queue.
 
+        Notifications are only sent when the state or an attribute named in
+        changed_names (default var_names) changes.
+        """
+
+        watch = StateWatch(var_names, var_names if changed_names is None else changed_names)
         added = False
         for var_name in var_names if isinstance(var_names, set) else {var_names}:
             parts = var_name.split(".")
@@ -153,7 +240,8 @@ class State:
             state_var_name = f"{parts[0]}.{parts[1]}"
             if state_var_name not in cls.notify:
                 cls.notify[state_var_name] = {}
-            cls.notify[state_var_name][queue] = var_names
+            cls.notify[state_var_name][queue] = watch
+            cls.notify_index_update(state_var_name)
             added = True
         return added
 
@@ -167,8 +255,45 @@ class State:
                 continue
             state_var_name = f"{parts[0]}.{parts[1]}"
             if state_var_name not in cls.notify or queue not in cls.notify[state_var_name]:
-                return
+                continue
             del cls.notify[state_var_name][queue]
+            if not cls.notify[state_var_name]:
+                del cls.notify[state_var_name]
+            cls.notify_index_update(state_var_name)
+
+    @classmethod
+    def notify_index_update(cls, state_var_name):
+        """Rebuild the index of which queues watch the state and each attribute of state_var_name."""
+        if state_var_name not in cls.notify:
+            cls.notify_index.pop(state_var_name, None)
+            return
+        index = {"state": set(), "attrs": {}, "all_attrs": set()}
+        for queue, watch in cls.notify[state_var_name].items():
+            watch_state, attrs, all_attrs = watch.changed.get(state_var_name, (False, (), False))
+            if watch_state:
+                index["state"].add(queue)
+            for attr in attrs:
+                index["attrs"].setdefault(attr, set()).add(queue)
+            if all_attrs:
+                index["all_attrs"].add(queue)
+        cls.notify_index[state_var_name] = index
+
+    @classmethod
+    def notify_changed_queues(cls, var_name, value, old_value):
+        """Return the set of queues watching a state or attribute of var_name that changed."""
+        index = cls.notify_index.get(var_name)
+        if index is None:
+            return set()
+        queues = set()
+        if index["state"] and value != old_value:
+            queues.update(index["state"])
+        for attr, attr_queues in index["attrs"].items():
+            if not attr_queues <= queues and getattr(value, attr, None) != getattr(old_value, attr, None):
+                queues.update(attr_queues)
+        if index["all_attrs"] and not index["all_attrs"] <= queues:
+            if state_attrs_changed(value, old_value):
+                queues.update(index["all_attrs"])
+        return queues
 
     @classmethod
     async def update(cls, new_vars, func_args):
@@ -178,21 +303,29 @@ class State:
         for var_name, var_val in new_vars.items():
             if var_name in cls.notify:
                 cls.notify_var_last[var_name] = var_val
-                notify.update(cls.notify[var_name])
+                queues = cls.notify_changed_queues(var_name, var_val, new_vars.get(f"{var_name}.old"))
+                for queue, watch in cls.notify[var_name].items():
+                    if queue in queues:
+                        notify[queue] = watch
 
         if notify:
             _LOGGER.debug("state.update(%s, %s)", new_vars, func_args)
-            for queue, var_names in notify.items():
-                await queue.put(["state", [cls.notify_var_get(var_names, new_vars), func_args.copy()]])
+            for queue, watch in notify.items():
+                await queue.put(["state", [watch.get_vars(new_vars), func_args.copy()]])
 
     @classmethod
     def notify_var_get(cls, var_names, new_vars):
         """Add values of var_names to new_vars, or default to None."""
+        idents = [(var_name, var_name.split(".")) for var_name in var_names or []]
+        return cls.notify_var_resolve(idents, new_vars)
+
+    @classmethod
+    def notify_var_resolve(cls, idents, new_vars):
+        """Add values of the pre-split (var_name, parts) idents to new_vars, or default to None."""
         notify_vars = new_vars.copy()
-        for var_name in var_names if var_names is not None else []:
+        for var_name, parts in idents:
             if var_name in notify_vars:
                 continue
-            parts = var_name.split(".")
             if var_name in cls.notify_var_last:
                 notify_vars[var_name] = cls.notify_var_last[var_name]
             elif len(parts) == 3 and f"{parts[0]}.{parts[1]}" in cls.notify_var_last:
@@ -201,7 +334,7 @@ class State:
                 )
             elif len(parts) == 4 and parts[2] == "old" and f"{parts[0]}.{parts[1]}.old" in notify_vars:
                 notify_vars[var_name] = getattr(notify_vars[f"{parts[0]}.{parts[1]}.old"], parts[3], None)
-            elif 1 <= var_name.count(".") <= 3 and not cls.exist(var_name):
+            elif 2 <= len(parts) <= 4 and not cls.exist(var_name):
                 notify_vars[var_name] = None
         return notify_vars
 
@@ -216,7 +349,7 @@ class State:
                 #
                 # value is a StateVal, so extract the attributes and value
                 #
-                new_attributes = value.__dict__.copy()
+                new_attributes = value._attributes()
                 for discard in STATE_VIRTUAL_ATTRS:
                     new_attributes.pop(discard, None)
             value = str(value)
@@ -414,7 +547,7 @@ class State:
     def getattr(cls, var_name):
         """Return a dict of attributes for a state variable."""
         if isinstance(var_name, StateVal):
-            attrs = var_name.__dict__.copy()
+            attrs = var_name._attributes()
             for discard in STATE_VIRTUAL_ATTRS:
                 attrs.pop(discard, None)
             return attrs
@@ -133,6 +133,16 @@ def pyscript_executor() -> Callable[..., Any]:
     ...
 
 
+def pure_compute(timeout: float = 60) -> Callable[..., Any]:
+    """Compile the wrapped function and run it in a pool of worker processes.
+
+    Use it for CPU-bound code, which would hold the GIL in ``task.executor``. The function can
+    only use builtins and standard modules like ``math`` or ``statistics``, and its arguments
+    and result must be picklable. Calls taking longer than ``timeout`` seconds raise ``TimeoutError``.
+    """
+    ...
+
+
 class log:
     """Logging helpers that mirror Home Assistant's logging levels."""
 
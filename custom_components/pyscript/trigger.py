@@ -1,8 +1,10 @@
 """Implements all the trigger logic."""
 
 import asyncio
+import copy
 import datetime as dt
 import functools
+import heapq
 import locale
 import logging
 import math
@@ -20,7 +22,7 @@ from .eval import AstEval, EvalFunc, EvalFuncVar
 from .event import Event
 from .function import Function
 from .mqtt import Mqtt
-from .state import STATE_VIRTUAL_ATTRS, State
+from .state import State, state_attrs_changed
 from .webhook import Webhook
 
 _LOGGER = logging.getLogger(LOGGER_PATH + ".trigger")
@@ -29,6 +31,18 @@ _LOGGER = logging.getLogger(LOGGER_PATH + ".trigger")
 STATE_RE = re.compile(r"\w+\.\w+(\.((\w+)|\*))?$")
 
 
+#
+# Trigger decorators, which can each take running_event=False to not fire the
+# pyscript_running event when the action is called
+#
+TRIG_DECORATORS = {"event_trigger", "mqtt_trigger", "state_trigger", "time_trigger", "webhook_trigger"}
+
+#
+# Maximum number of idle action contexts each trigger keeps for reuse
+#
+ACTION_CTX_POOL_SIZE = 4
+
+
 def dt_now():
     """Return current time."""
     return dt.datetime.now()
@@ -74,14 +88,8 @@ def ident_any_values_changed(func_args, ident):
             if len(var_pieces) == 3 and f"{var_pieces[0]}.{var_pieces[1]}" == var_name:
                 if var_pieces[2] == "*":
                     # catch all has been requested, check all attributes for change
-                    all_attrs = set()
-                    if value is not None:
-                        all_attrs |= set(value.__dict__.keys())
-                    if old_value is not None:
-                        all_attrs |= set(old_value.__dict__.keys())
-                    for attr in all_attrs - STATE_VIRTUAL_ATTRS:
-                        if getattr(value, attr, None) != getattr(old_value, attr, None):
-                            return True
+                    if state_attrs_changed(value, old_value):
+                        return True
                 elif getattr(value, var_pieces[2], None) != getattr(old_value, var_pieces[2], None):
                     return True
 
@@ -126,6 +134,27 @@ class TrigTime:
     #
     dow2int = {}
 
+    #
+    # time_trigger specs parsed once into (kind, args...) tuples, and for each
+    # cron expression a cached [croniter, base time, first time after base]
+    #
+    time_spec_cache = {}
+    cron_cache = {}
+    spec_cache_max = 1024
+
+    #
+    # Pending trigger timers, as a heap of [when, seq, notify_q, cancelled]
+    # entries keyed by loop time.  A single loop timer is armed for the earliest
+    # entry, and on expiry puts ["time_wakeup", entry] on each due notify_q,
+    # rather than each trigger waiting with its own timeout.
+    #
+    timer_heap = []
+    timer_seq = 0
+    timer_cancelled = 0
+    timer_handle = None
+    timer_handle_when = None
+    timer_wakeups = 0
+
     def __init__(self):
         """Warn on TrigTime instantiation."""
         _LOGGER.error("TrigTime class is not meant to be instantiated")
@@ -767,6 +796,117 @@ class TrigTime:
 
         return result
 
+    @classmethod
+    def time_spec_compile(cls, spec):
+        """Parse a time_trigger spec once, returning a cached (kind, args...) tuple."""
+        compiled = cls.time_spec_cache.get(spec)
+        if compiled is not None:
+            return compiled
+        cron_match = re.search(r"cron\((?P<cron_expr>.*)\)", spec)
+        match1 = re.split(r"once\((.*)\)", spec)
+        match2 = re.split(r"period\(([^,]*),([^,]*)(?:,([^,]*))?\)", spec)
+        if cron_match:
+            if croniter.is_valid(cron_match.group("cron_expr")):
+                compiled = ("cron", cron_match.group("cron_expr"))
+            else:
+                _LOGGER.error("Invalid cron expression: %s", cron_match)
+                compiled = ("invalid",)
+        elif len(match1) == 3:
+            compiled = ("once", match1[1].strip())
+        elif len(match2) == 5:
+            period = parse_time_offset(match2[2].strip())
+            if period <= 0:
+                _LOGGER.error("Invalid non-positive period %s in period(): %s", period, spec)
+                compiled = ("invalid",)
+            else:
+                end_str = match2[3].strip() if match2[3] is not None else None
+                compiled = ("period", match2[1].strip(), period, end_str)
+        else:
+            _LOGGER.warning("Can't parse %s in time_trigger check", spec)
+            compiled = ("invalid",)
+        if len(cls.time_spec_cache) >= cls.spec_cache_max:
+            cls.time_spec_cache.clear()
+        cls.time_spec_cache[spec] = compiled
+        return compiled
+
+    @classmethod
+    def cron_next(cls, cron_expr, now):
+        """Return the first cron_expr time after now, advancing a cached croniter when possible."""
+        entry = cls.cron_cache.get(cron_expr)
+        if entry is not None and now >= entry[1]:
+            #
+            # the cached time is the first after an earlier base, so it is also the
+            # first after now unless it has passed; step forward a few times before
+            # giving up and starting a new croniter
+            #
+            for _ in range(8):
+                if entry[2] > now:
+                    entry[1] = now
+                    return entry[2]
+                entry[2] = entry[0].get_next()
+        cron_iter = croniter(cron_expr, now, dt.datetime)
+        if len(cls.cron_cache) >= cls.spec_cache_max:
+            cls.cron_cache.clear()
+        cls.cron_cache[cron_expr] = [cron_iter, now, cron_iter.get_next()]
+        return cls.cron_cache[cron_expr][2]
+
+    @classmethod
+    def timer_add(cls, timeout, notify_q):
+        """Schedule a ["time_wakeup", entry] message on notify_q after timeout seconds; return entry."""
+        loop = asyncio.get_running_loop()
+        cls.timer_seq += 1
+        entry = [loop.time() + max(0, timeout), cls.timer_seq, notify_q, False]
+        heapq.heappush(cls.timer_heap, entry)
+        if cls.timer_handle is None or entry[0] < cls.timer_handle_when:
+            cls.timer_arm(loop)
+        return entry
+
+    @classmethod
+    def timer_cancel(cls, entry):
+        """Cancel a timer returned by timer_add."""
+        if entry[3]:
+            return
+        entry[3] = True
+        cls.timer_cancelled += 1
+        if cls.timer_cancelled > 64 and cls.timer_cancelled > len(cls.timer_heap) // 2:
+            #
+            # mostly cancelled entries (eg, timers replaced on each state change), so compact
+            #
+            cls.timer_heap = [entry for entry in cls.timer_heap if not entry[3]]
+            heapq.heapify(cls.timer_heap)
+            cls.timer_cancelled = 0
+
+    @classmethod
+    def timer_arm(cls, loop):
+        """Arm the loop timer for the earliest pending entry."""
+        if cls.timer_handle is not None:
+            cls.timer_handle.cancel()
+            cls.timer_handle = None
+        while cls.timer_heap and cls.timer_heap[0][3]:
+            heapq.heappop(cls.timer_heap)
+            cls.timer_cancelled -= 1
+        if cls.timer_heap:
+            cls.timer_handle_when = cls.timer_heap[0][0]
+            cls.timer_handle = loop.call_at(cls.timer_handle_when, cls.timer_fire, loop)
+
+    @classmethod
+    def timer_fire(cls, loop):
+        """Wake up all the triggers whose timers are due."""
+        cls.timer_handle = None
+        cls.timer_wakeups += 1
+        #
+        # allow for the loop running timers up to its clock resolution early
+        #
+        now = loop.time() + 0.001
+        while cls.timer_heap and (cls.timer_heap[0][3] or cls.timer_heap[0][0] <= now):
+            entry = heapq.heappop(cls.timer_heap)
+            if entry[3]:
+                cls.timer_cancelled -= 1
+                continue
+            entry[3] = True
+            entry[2].put_nowait(["time_wakeup", entry])
+        cls.timer_arm(loop)
+
     @classmethod
     async def timer_trigger_next(cls, time_spec, now, startup_time):
         """Return the next trigger time based on the given time and time specification."""
@@ -775,14 +915,8 @@ class TrigTime:
         if not isinstance(time_spec, list):
             time_spec = [time_spec]
         for spec in time_spec:
-            cron_match = re.search(r"cron\((?P<cron_expr>.*)\)", spec)
-            match1 = re.split(r"once\((.*)\)", spec)
-            match2 = re.split(r"period\(([^,]*),([^,]*)(?:,([^,]*))?\)", spec)
-            if cron_match:
-                if not croniter.is_valid(cron_match.group("cron_expr")):
-                    _LOGGER.error("Invalid cron expression: %s", cron_match)
-                    continue
-
+            compiled = cls.time_spec_compile(spec)
+            if compiled[0] == "cron":
                 #
                 # Handling DST changes is tricky; all times in pyscript are naive (no timezone).  This is the
                 # one part of the code where we do check timezones, in case now and next_time bracket a DST
@@ -798,39 +932,39 @@ class TrigTime:
                 # Also, datetime doesn't correctly subtract datetimes in different timezones, so we need to compute
                 # the different in UTC.  See https://blog.ganssle.io/articles/2018/02/aware-datetime-arithmetic.html.
                 #
-                cron_iter = croniter(cron_match.group("cron_expr"), now, dt.datetime)
-                delta = None
-                while delta is None or delta.total_seconds() <= 0:
-                    val = cron_iter.get_next()
+                val = cls.cron_next(compiled[1], now)
+                cron_iter = None
+                while True:
                     delta = dt_util.as_local(val).astimezone(dt_util.UTC) - dt_util.as_local(now).astimezone(
                         dt_util.UTC
                     )
+                    if delta.total_seconds() > 0:
+                        break
+                    if cron_iter is None:
+                        cron_iter = croniter(compiled[1], val, dt.datetime)
+                    val = cron_iter.get_next()
 
                 if next_time is None or val < next_time:
                     next_time = val
                     next_time_adj = now + delta
 
-            elif len(match1) == 3:
-                this_t, _ = await cls.parse_date_time(match1[1].strip(), 0, now, startup_time)
+            elif compiled[0] == "once":
+                this_t, _ = await cls.parse_date_time(compiled[1], 0, now, startup_time)
                 day_offset = (now - this_t).days + 1
                 if day_offset != 0 and this_t != startup_time:
                     #
                     # Try a day offset (won't make a difference if spec has full date)
                     #
-                    this_t, _ = await cls.parse_date_time(match1[1].strip(), day_offset, now, startup_time)
+                    this_t, _ = await cls.parse_date_time(compiled[1], day_offset, now, startup_time)
                 startup = now == this_t and now == startup_time
                 if (now < this_t or startup) and (next_time is None or this_t < next_time):
                     next_time_adj = next_time = this_t
 
-            elif len(match2) == 5:
-                start_str, period_str = match2[1].strip(), match2[2].strip()
+            elif compiled[0] == "period":
+                _, start_str, period, end_str = compiled
                 start, fixed_date_start = await cls.parse_date_time(start_str, 0, now, startup_time)
-                period = parse_time_offset(period_str)
-                if period <= 0:
-                    _LOGGER.error("Invalid non-positive period %s in period(): %s", period, time_spec)
-                    continue
 
-                if match2[3] is None:
+                if end_str is None:
                     startup = now == start and now == startup_time
                     if (now < start or startup) and (next_time is None or start < next_time):
                         next_time_adj = next_time = start
@@ -840,7 +974,6 @@ class TrigTime:
                         if now < this_t and (next_time is None or this_t < next_time):
                             next_time_adj = next_time = this_t
                     continue
-                end_str = match2[3].strip()
                 end, fixed_date_end = await cls.parse_date_time(end_str, 0, now, startup_time)
                 if not fixed_date_start and not fixed_date_end:
                     end_offset = 1 if end < start else 0
@@ -862,8 +995,6 @@ class TrigTime:
                             next_time_adj = next_time = this_t
                         break
 
-            else:
-                _LOGGER.warning("Can't parse %s in time_trigger check", spec)
         return next_time, next_time_adj
 
 
@@ -881,6 +1012,7 @@ class TrigInfo:
         self.task = None
         self.global_ctx = global_ctx
         self.trig_cfg = trig_cfg
+        self.trig_cfg_key = self.get_cfg_key(trig_cfg)
         self.state_trigger = trig_cfg.get("state_trigger", {}).get("args", None)
         self.state_trigger_kwargs = trig_cfg.get("state_trigger", {}).get("kwargs", {})
         self.state_hold = self.state_trigger_kwargs.get("state_hold", None)
@@ -905,6 +1037,11 @@ class TrigInfo:
         self.task_unique_kwargs = trig_cfg.get("task_unique", {}).get("kwargs", None)
         self.action = trig_cfg.get("action")
         self.global_sym_table = trig_cfg.get("global_sym_table", {})
+        self.running_event = True
+        for trig in TRIG_DECORATORS & trig_cfg.keys():
+            if trig_cfg[trig].get("kwargs", {}).get("running_event", None) not in {None, True}:
+                self.running_event = False
+        self.action_ctx_pool = []
         self.notify_q = asyncio.Queue(0)
         self.active_expr = None
         self.state_active_ident = None
@@ -1023,6 +1160,50 @@ class TrigInfo:
 
         self.setup_ok = True
 
+    @staticmethod
+    def get_cfg_key(trig_cfg):
+        """Return a copy of the decorator arguments in trig_cfg, or None if they can't be copied."""
+        try:
+            return copy.deepcopy(
+                {key: value for key, value in trig_cfg.items() if key not in {"action", "global_sym_table"}}
+            )
+        except Exception:
+            return None
+
+    def reusable(self):
+        """Return whether a reloaded function can take over this running trigger."""
+        return (
+            self.task is not None
+            and self.trig_cfg_key is not None
+            and not self.run_on_startup
+            and not self.run_on_shutdown
+        )
+
+    def same_cfg(self, trig_cfg):
+        """Return whether trig_cfg has the same decorator arguments as this trigger."""
+        try:
+            return self.trig_cfg_key == self.get_cfg_key(trig_cfg)
+        except Exception:
+            return False
+
+    def adopt(self, trig_cfg, global_ctx):
+        """Keep this trigger's task and notify registrations, but call the reloaded function."""
+        self.trig_cfg = trig_cfg
+        self.action = trig_cfg.get("action")
+        self.global_sym_table = trig_cfg.get("global_sym_table", {})
+        self.global_ctx = global_ctx
+        self.action_ctx_pool = []
+        for ast_ctx in [
+            self.active_expr,
+            self.state_trig_eval,
+            self.event_trig_expr,
+            self.mqtt_trig_expr,
+            self.webhook_trig_expr,
+        ]:
+            if ast_ctx is not None:
+                ast_ctx.set_global_ctx(global_ctx)
+        _LOGGER.debug("trigger %s: unchanged, keeping it running", self.name)
+
     def stop(self):
         """Stop this trigger task."""
 
@@ -1069,7 +1250,7 @@ class TrigInfo:
                     self.state_trig_ident.update(self.state_trig_ident_any)
                 _LOGGER.debug("trigger %s: watching vars %s", self.name, self.state_trig_ident)
                 if len(self.state_trig_ident) == 0 or not await State.notify_add(
-                    self.state_trig_ident, self.notify_q
+                    self.state_trig_ident, self.notify_q, self.state_trig_ident | self.state_trig_ident_any
                 ):
                     _LOGGER.error(
                         "trigger %s: @state_trigger is not watching any variables; will never trigger",
@@ -1145,16 +1326,26 @@ class TrigInfo:
                             time_next = now + dt.timedelta(seconds=timeout)
                             state_trig_timeout = True
                     if timeout is not None:
-                        while True:
-                            try:
-                                timeout = max(0, timeout)
-                                _LOGGER.debug("trigger %s waiting for %.6g secs", self.name, timeout)
-                                notify_type, notify_info = await asyncio.wait_for(
-                                    self.notify_q.get(), timeout=timeout
-                                )
-                                state_trig_timeout = False
-                                now = dt_now()
-                            except asyncio.TimeoutError:
+                        #
+                        # the shared TrigTime timer puts a time_wakeup message on our queue
+                        # when the timeout expires
+                        #
+                        timer = None
+                        try:
+                            while True:
+                                if timer is None:
+                                    timeout = max(0, timeout)
+                                    _LOGGER.debug("trigger %s waiting for %.6g secs", self.name, timeout)
+                                    timer = TrigTime.timer_add(timeout, self.notify_q)
+                                notify_type, notify_info = await self.notify_q.get()
+                                if notify_type != "time_wakeup":
+                                    state_trig_timeout = False
+                                    now = dt_now()
+                                    break
+                                if notify_info is not timer:
+                                    # stale wakeup from an earlier wait
+                                    continue
+                                timer = None
                                 actual_now = dt_now()
                                 if actual_now < time_next:
                                     timeout = (time_next - actual_now).total_seconds()
@@ -1166,10 +1357,16 @@ class TrigInfo:
                                         "trigger_type": "time",
                                         "trigger_time": time_next,
                                     }
-                            break
+                                break
+                        finally:
+                            if timer is not None:
+                                TrigTime.timer_cancel(timer)
                     elif self.have_trigger:
                         _LOGGER.debug("trigger %s waiting for state change or event", self.name)
                         notify_type, notify_info = await self.notify_q.get()
+                        if notify_type == "time_wakeup":
+                            # stale wakeup from an earlier wait
+                            continue
                         now = dt_now()
                     else:
                         _LOGGER.debug("trigger %s finished", self.name)
@@ -1341,10 +1538,34 @@ class TrigInfo:
                 Webhook.notify_del(self.webhook_trigger[0], self.notify_q)
             return
 
-    def call_action(self, notify_type, func_args, run_task=True):
-        """Call the trigger action function."""
+    def action_ctx_get(self):
+        """Return an idle action context from the pool, or a new one."""
+        if self.action_ctx_pool:
+            return self.action_ctx_pool.pop()
         action_ast_ctx = AstEval(f"{self.action.global_ctx_name}.{self.action.name}", self.action.global_ctx)
         Function.install_ast_funcs(action_ast_ctx)
+        return action_ast_ctx
+
+    def action_ctx_put(self, action_ast_ctx):
+        """Reset a finished action context and return it to the pool."""
+        #
+        # don't reuse a context the action changed (eg, with pyscript.set_global_ctx()),
+        # or one from before the action was reloaded
+        #
+        if (
+            len(self.action_ctx_pool) >= ACTION_CTX_POOL_SIZE
+            or action_ast_ctx.get_global_ctx() is not self.action.global_ctx
+            or action_ast_ctx.name != f"{self.action.global_ctx_name}.{self.action.name}"
+            or action_ast_ctx.get_logger_name() != action_ast_ctx.name
+            or action_ast_ctx.logger_handlers
+        ):
+            return
+        action_ast_ctx.reset()
+        self.action_ctx_pool.append(action_ast_ctx)
+
+    def call_action(self, notify_type, func_args, run_task=True):
+        """Call the trigger action function."""
+        action_ast_ctx = self.action_ctx_get()
         task_unique_func = None
         if self.task_unique is not None:
             task_unique_func = Function.task_unique_factory(action_ast_ctx)
@@ -1363,6 +1584,7 @@ class TrigInfo:
                 notify_type,
                 self.name,
             )
+            self.action_ctx_put(action_ast_ctx)
             return False
 
         # Create new HASS Context with incoming as parent
@@ -1371,13 +1593,14 @@ class TrigInfo:
         else:
             hass_context = Context()
 
-        # Fire an event indicating that pyscript is running
+        # Fire an event indicating that pyscript is running, unless the trigger opted out
         # Note: the event must have an entity_id for logbook to work correctly.
-        ev_name = self.name.replace(".", "_")
-        ev_entity_id = f"pyscript.{ev_name}"
+        if self.running_event:
+            ev_name = self.name.replace(".", "_")
+            ev_entity_id = f"pyscript.{ev_name}"
 
-        event_data = {"name": ev_name, "entity_id": ev_entity_id, "func_args": func_args}
-        Function.hass.bus.async_fire("pyscript_running", event_data, context=hass_context)
+            event_data = {"name": ev_name, "entity_id": ev_entity_id, "func_args": func_args}
+            Function.hass.bus.async_fire("pyscript_running", event_data, context=hass_context)
 
         _LOGGER.debug(
             "trigger %s got %s trigger, running action (kwargs = %s)",
@@ -1407,5 +1630,6 @@ class TrigInfo:
         if run_task:
             task = Function.create_task(func, ast_ctx=action_ast_ctx)
             Function.task_done_callback_ctx(task, action_ast_ctx)
+            task.add_done_callback(lambda task: self.action_ctx_put(action_ast_ctx))
             return True
         return func
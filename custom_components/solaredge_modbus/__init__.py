@@ -3,7 +3,7 @@
 import asyncio
 from datetime import timedelta
 import logging
-import operator
+import time
 from typing import cast
 
 from pymodbus.client import AsyncModbusTcpClient
@@ -23,7 +23,6 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .const import (
-    BATTERY_STATUSSES,
     CONF_MAX_EXPORT_CONTROL_SITE_LIMIT,
     CONF_MODBUS_ADDRESS,
     CONF_POWER_CONTROL,
@@ -45,13 +44,29 @@ from .const import (
     DEFAULT_READ_METER3,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
-    EXPORT_CONTROL_LIMIT_MODE,
-    EXPORT_CONTROL_MODE,
-    STORAGE_AC_CHARGE_POLICY,
-    STORAGE_CHARGE_DISCHARGE_MODE,
-    STORAGE_CONTROL_MODE,
+    READ_OVERHEAD_BYTES,
+    TIER_INTERVALS,
 )
 from .payload import BinaryPayloadDecoder, Endian
+from .register_map import (
+    BATTERY1,
+    BATTERY1_ADDRESS,
+    BATTERY2,
+    BATTERY2_ADDRESS,
+    BATTERY3,
+    BATTERY3_ADDRESS,
+    EXPORT_CONTROL,
+    INVERTER,
+    METER1,
+    METER1_ENERGY,
+    METER2,
+    METER2_ENERGY,
+    METER3,
+    METER3_ENERGY,
+    POWER_LIMIT,
+    STORAGE_CONTROL,
+    plan_reads,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -219,21 +234,6 @@ async def async_migrate_entry(hass, config_entry):
     return True
 
 
-def validate(value, comparison, against):
-    """Validate value."""
-    ops = {
-        ">": operator.gt,
-        "<": operator.lt,
-        ">=": operator.ge,
-        "<=": operator.le,
-        "==": operator.eq,
-        "!=": operator.ne,
-    }
-    if not ops[comparison](value, against):
-        raise ValueError(f"Value {value} failed validation ({comparison}{against})")
-    return value
-
-
 class SolaredgeModbusHub:
     """Thread safe wrapper class for pymodbus."""
 
@@ -254,6 +254,11 @@ class SolaredgeModbusHub:
 
         self.modbus_data = {}
         self.device_info = {}
+        # reads and register bytes per polling tier, reads and bytes on the
+        # wire in total
+        self.read_stats = {
+            tier: {"reads": 0, "bytes": 0} for tier in (*TIER_INTERVALS, "total")
+        }
 
     def get_unit(self) -> int:
         """Get the configured unit."""
@@ -325,10 +330,6 @@ class SolaredgeModbusHub:
         except ModbusException as err:
             raise HomeAssistantError(err) from err
 
-    def calculate_value(self, value, sf):
-        """Calculate a value using scaling factor."""
-        return round(value * 10**sf, max(0, -sf))
-
     async def read_device_info(self):
         data = await self.read_holding_registers(
             unit=self._address, address=40004, count=64
@@ -355,637 +356,83 @@ class SolaredgeModbusHub:
 
         return True
 
-    async def read_modbus_data_meter1(self):
-        """Read meter 1 modbus data."""
-        return await self.read_modbus_data_meter("m1_", 40190)
-
-    async def read_modbus_data_meter2(self):
-        """Read meter 2 modbus data."""
-        return await self.read_modbus_data_meter("m2_", 40364)
-
-    async def read_modbus_data_meter3(self):
-        """Read meter 3 modbus data."""
-        return await self.read_modbus_data_meter("m3_", 40539)
-
-    async def read_modbus_data_meter(self, meter_prefix, start_address):
-        """Start reading meter  data."""
-        meter_data = await self.read_holding_registers(
-            unit=self._address, address=start_address, count=103
+    async def read_modbus_battery_info(self, battery_prefix, start_address):
+        """Read the static battery information."""
+        battery_data = await self.read_holding_registers(
+            unit=self._address, address=start_address, count=0x4C
         )
-        if meter_data.isError():
-            return False
-
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            meter_data.registers, byteorder=Endian.BIG
-        )
-        accurrent = decoder.decode_16bit_int()
-        accurrenta = decoder.decode_16bit_int()
-        accurrentb = decoder.decode_16bit_int()
-        accurrentc = decoder.decode_16bit_int()
-        accurrentsf = decoder.decode_16bit_int()
-
-        accurrent = self.calculate_value(accurrent, accurrentsf)
-        accurrenta = self.calculate_value(accurrenta, accurrentsf)
-        accurrentb = self.calculate_value(accurrentb, accurrentsf)
-        accurrentc = self.calculate_value(accurrentc, accurrentsf)
-
-        self.modbus_data[meter_prefix + "accurrent"] = accurrent
-        self.modbus_data[meter_prefix + "accurrenta"] = accurrenta
-        self.modbus_data[meter_prefix + "accurrentb"] = accurrentb
-        self.modbus_data[meter_prefix + "accurrentc"] = accurrentc
-
-        acvoltageln = decoder.decode_16bit_int()
-        acvoltagean = decoder.decode_16bit_int()
-        acvoltagebn = decoder.decode_16bit_int()
-        acvoltagecn = decoder.decode_16bit_int()
-        acvoltagell = decoder.decode_16bit_int()
-        acvoltageab = decoder.decode_16bit_int()
-        acvoltagebc = decoder.decode_16bit_int()
-        acvoltageca = decoder.decode_16bit_int()
-        acvoltagesf = decoder.decode_16bit_int()
-
-        acvoltageln = self.calculate_value(acvoltageln, acvoltagesf)
-        acvoltagean = self.calculate_value(acvoltagean, acvoltagesf)
-        acvoltagebn = self.calculate_value(acvoltagebn, acvoltagesf)
-        acvoltagecn = self.calculate_value(acvoltagecn, acvoltagesf)
-        acvoltagell = self.calculate_value(acvoltagell, acvoltagesf)
-        acvoltageab = self.calculate_value(acvoltageab, acvoltagesf)
-        acvoltagebc = self.calculate_value(acvoltagebc, acvoltagesf)
-        acvoltageca = self.calculate_value(acvoltageca, acvoltagesf)
-
-        self.modbus_data[meter_prefix + "acvoltageln"] = acvoltageln
-        self.modbus_data[meter_prefix + "acvoltagean"] = acvoltagean
-        self.modbus_data[meter_prefix + "acvoltagebn"] = acvoltagebn
-        self.modbus_data[meter_prefix + "acvoltagecn"] = acvoltagecn
-        self.modbus_data[meter_prefix + "acvoltagell"] = acvoltagell
-        self.modbus_data[meter_prefix + "acvoltageab"] = acvoltageab
-        self.modbus_data[meter_prefix + "acvoltagebc"] = acvoltagebc
-        self.modbus_data[meter_prefix + "acvoltageca"] = acvoltageca
-
-        acfreq = decoder.decode_16bit_int()
-        acfreqsf = decoder.decode_16bit_int()
-
-        acfreq = self.calculate_value(acfreq, acfreqsf)
-
-        self.modbus_data[meter_prefix + "acfreq"] = acfreq
-
-        acpower = decoder.decode_16bit_int()
-        acpowera = decoder.decode_16bit_int()
-        acpowerb = decoder.decode_16bit_int()
-        acpowerc = decoder.decode_16bit_int()
-        acpowersf = decoder.decode_16bit_int()
-
-        acpower = self.calculate_value(acpower, acpowersf)
-        acpowera = self.calculate_value(acpowera, acpowersf)
-        acpowerb = self.calculate_value(acpowerb, acpowersf)
-        acpowerc = self.calculate_value(acpowerc, acpowersf)
-
-        self.modbus_data[meter_prefix + "acpower"] = acpower
-        self.modbus_data[meter_prefix + "acpowera"] = acpowera
-        self.modbus_data[meter_prefix + "acpowerb"] = acpowerb
-        self.modbus_data[meter_prefix + "acpowerc"] = acpowerc
-
-        acva = decoder.decode_16bit_int()
-        acvaa = decoder.decode_16bit_int()
-        acvab = decoder.decode_16bit_int()
-        acvac = decoder.decode_16bit_int()
-        acvasf = decoder.decode_16bit_int()
-
-        acva = self.calculate_value(acva, acvasf)
-        acvaa = self.calculate_value(acvaa, acvasf)
-        acvab = self.calculate_value(acvab, acvasf)
-        acvac = self.calculate_value(acvac, acvasf)
-
-        self.modbus_data[meter_prefix + "acva"] = acva
-        self.modbus_data[meter_prefix + "acvaa"] = acvaa
-        self.modbus_data[meter_prefix + "acvab"] = acvab
-        self.modbus_data[meter_prefix + "acvac"] = acvac
-
-        acvar = decoder.decode_16bit_int()
-        acvara = decoder.decode_16bit_int()
-        acvarb = decoder.decode_16bit_int()
-        acvarc = decoder.decode_16bit_int()
-        acvarsf = decoder.decode_16bit_int()
-
-        acvar = self.calculate_value(acvar, acvarsf)
-        acvara = self.calculate_value(acvara, acvarsf)
-        acvarb = self.calculate_value(acvarb, acvarsf)
-        acvarc = self.calculate_value(acvarc, acvarsf)
-
-        self.modbus_data[meter_prefix + "acvar"] = acvar
-        self.modbus_data[meter_prefix + "acvara"] = acvara
-        self.modbus_data[meter_prefix + "acvarb"] = acvarb
-        self.modbus_data[meter_prefix + "acvarc"] = acvarc
-
-        acpf = decoder.decode_16bit_int()
-        acpfa = decoder.decode_16bit_int()
-        acpfb = decoder.decode_16bit_int()
-        acpfc = decoder.decode_16bit_int()
-        acpfsf = decoder.decode_16bit_int()
-
-        acpf = self.calculate_value(acpf, acpfsf)
-        acpfa = self.calculate_value(acpfa, acpfsf)
-        acpfb = self.calculate_value(acpfb, acpfsf)
-        acpfc = self.calculate_value(acpfc, acpfsf)
-
-        self.modbus_data[meter_prefix + "acpf"] = acpf
-        self.modbus_data[meter_prefix + "acpfa"] = acpfa
-        self.modbus_data[meter_prefix + "acpfb"] = acpfb
-        self.modbus_data[meter_prefix + "acpfc"] = acpfc
-
-        exported = decoder.decode_32bit_uint()
-        exporteda = decoder.decode_32bit_uint()
-        exportedb = decoder.decode_32bit_uint()
-        exportedc = decoder.decode_32bit_uint()
-        imported = decoder.decode_32bit_uint()
-        importeda = decoder.decode_32bit_uint()
-        importedb = decoder.decode_32bit_uint()
-        importedc = decoder.decode_32bit_uint()
-        energywsf = decoder.decode_16bit_int()
-
-        exported = validate(self.calculate_value(exported, energywsf), ">", 0)
-        exporteda = self.calculate_value(exporteda, energywsf)
-        exportedb = self.calculate_value(exportedb, energywsf)
-        exportedc = self.calculate_value(exportedc, energywsf)
-        imported = validate(self.calculate_value(imported, energywsf), ">", 0)
-        importeda = self.calculate_value(importeda, energywsf)
-        importedb = self.calculate_value(importedb, energywsf)
-        importedc = self.calculate_value(importedc, energywsf)
-
-        self.modbus_data[meter_prefix + "exported"] = round(exported * 0.001, 3)
-        self.modbus_data[meter_prefix + "exporteda"] = round(exporteda * 0.001, 3)
-        self.modbus_data[meter_prefix + "exportedb"] = round(exportedb * 0.001, 3)
-        self.modbus_data[meter_prefix + "exportedc"] = round(exportedc * 0.001, 3)
-        self.modbus_data[meter_prefix + "imported"] = round(imported * 0.001, 3)
-        self.modbus_data[meter_prefix + "importeda"] = round(importeda * 0.001, 3)
-        self.modbus_data[meter_prefix + "importedb"] = round(importedb * 0.001, 3)
-        self.modbus_data[meter_prefix + "importedc"] = round(importedc * 0.001, 3)
-
-        exportedva = decoder.decode_32bit_uint()
-        exportedvaa = decoder.decode_32bit_uint()
-        exportedvab = decoder.decode_32bit_uint()
-        exportedvac = decoder.decode_32bit_uint()
-        importedva = decoder.decode_32bit_uint()
-        importedvaa = decoder.decode_32bit_uint()
-        importedvab = decoder.decode_32bit_uint()
-        importedvac = decoder.decode_32bit_uint()
-        energyvasf = decoder.decode_16bit_int()
-
-        exportedva = self.calculate_value(exportedva, energyvasf)
-        exportedvaa = self.calculate_value(exportedvaa, energyvasf)
-        exportedvab = self.calculate_value(exportedvab, energyvasf)
-        exportedvac = self.calculate_value(exportedvac, energyvasf)
-        importedva = self.calculate_value(importedva, energyvasf)
-        importedvaa = self.calculate_value(importedvaa, energyvasf)
-        importedvab = self.calculate_value(importedvab, energyvasf)
-        importedvac = self.calculate_value(importedvac, energyvasf)
-
-        self.modbus_data[meter_prefix + "exportedva"] = exportedva
-        self.modbus_data[meter_prefix + "exportedvaa"] = exportedvaa
-        self.modbus_data[meter_prefix + "exportedvab"] = exportedvab
-        self.modbus_data[meter_prefix + "exportedvac"] = exportedvac
-        self.modbus_data[meter_prefix + "importedva"] = importedva
-        self.modbus_data[meter_prefix + "importedvaa"] = importedvaa
-        self.modbus_data[meter_prefix + "importedvab"] = importedvab
-        self.modbus_data[meter_prefix + "importedvac"] = importedvac
-
-        importvarhq1 = decoder.decode_32bit_uint()
-        importvarhq1a = decoder.decode_32bit_uint()
-        importvarhq1b = decoder.decode_32bit_uint()
-        importvarhq1c = decoder.decode_32bit_uint()
-        importvarhq2 = decoder.decode_32bit_uint()
-        importvarhq2a = decoder.decode_32bit_uint()
-        importvarhq2b = decoder.decode_32bit_uint()
-        importvarhq2c = decoder.decode_32bit_uint()
-        importvarhq3 = decoder.decode_32bit_uint()
-        importvarhq3a = decoder.decode_32bit_uint()
-        importvarhq3b = decoder.decode_32bit_uint()
-        importvarhq3c = decoder.decode_32bit_uint()
-        importvarhq4 = decoder.decode_32bit_uint()
-        importvarhq4a = decoder.decode_32bit_uint()
-        importvarhq4b = decoder.decode_32bit_uint()
-        importvarhq4c = decoder.decode_32bit_uint()
-        energyvarsf = decoder.decode_16bit_int()
-
-        importvarhq1 = self.calculate_value(importvarhq1, energyvarsf)
-        importvarhq1a = self.calculate_value(importvarhq1a, energyvarsf)
-        importvarhq1b = self.calculate_value(importvarhq1b, energyvarsf)
-        importvarhq1c = self.calculate_value(importvarhq1c, energyvarsf)
-        importvarhq2 = self.calculate_value(importvarhq2, energyvarsf)
-        importvarhq2a = self.calculate_value(importvarhq2a, energyvarsf)
-        importvarhq2b = self.calculate_value(importvarhq2b, energyvarsf)
-        importvarhq2c = self.calculate_value(importvarhq2c, energyvarsf)
-        importvarhq3 = self.calculate_value(importvarhq3, energyvarsf)
-        importvarhq3a = self.calculate_value(importvarhq3a, energyvarsf)
-        importvarhq3b = self.calculate_value(importvarhq3b, energyvarsf)
-        importvarhq3c = self.calculate_value(importvarhq3c, energyvarsf)
-        importvarhq4 = self.calculate_value(importvarhq4, energyvarsf)
-        importvarhq4a = self.calculate_value(importvarhq4a, energyvarsf)
-        importvarhq4b = self.calculate_value(importvarhq4b, energyvarsf)
-        importvarhq4c = self.calculate_value(importvarhq4c, energyvarsf)
-
-        self.modbus_data[meter_prefix + "importvarhq1"] = importvarhq1
-        self.modbus_data[meter_prefix + "importvarhq1a"] = importvarhq1a
-        self.modbus_data[meter_prefix + "importvarhq1b"] = importvarhq1b
-        self.modbus_data[meter_prefix + "importvarhq1c"] = importvarhq1c
-        self.modbus_data[meter_prefix + "importvarhq2"] = importvarhq2
-        self.modbus_data[meter_prefix + "importvarhq2a"] = importvarhq2a
-        self.modbus_data[meter_prefix + "importvarhq2b"] = importvarhq2b
-        self.modbus_data[meter_prefix + "importvarhq2c"] = importvarhq2c
-        self.modbus_data[meter_prefix + "importvarhq3"] = importvarhq3
-        self.modbus_data[meter_prefix + "importvarhq3a"] = importvarhq3a
-        self.modbus_data[meter_prefix + "importvarhq3b"] = importvarhq3b
-        self.modbus_data[meter_prefix + "importvarhq3c"] = importvarhq3c
-        self.modbus_data[meter_prefix + "importvarhq4"] = importvarhq4
-        self.modbus_data[meter_prefix + "importvarhq4a"] = importvarhq4a
-        self.modbus_data[meter_prefix + "importvarhq4b"] = importvarhq4b
-        self.modbus_data[meter_prefix + "importvarhq4c"] = importvarhq4c
-
-        return True
-
-    async def read_modbus_data_inverter(self):
-        """Read inverter data."""
-        inverter_data = await self.read_holding_registers(
-            unit=self._address, address=40071, count=38
-        )
-        if inverter_data.isError():
-            return False
+        if battery_data.isError():
+            return
 
         decoder = BinaryPayloadDecoder.fromRegisters(
-            inverter_data.registers, byteorder=Endian.BIG
+            battery_data.registers,
+            byteorder=Endian.BIG,
+            wordorder=Endian.LITTLE,
         )
-        accurrent = decoder.decode_16bit_uint()
-        accurrenta = decoder.decode_16bit_uint()
-        accurrentb = decoder.decode_16bit_uint()
-        accurrentc = decoder.decode_16bit_uint()
-        accurrentsf = decoder.decode_16bit_int()
-
-        accurrent = self.calculate_value(accurrent, accurrentsf)
-        accurrenta = self.calculate_value(accurrenta, accurrentsf)
-        accurrentb = self.calculate_value(accurrentb, accurrentsf)
-        accurrentc = self.calculate_value(accurrentc, accurrentsf)
-
-        self.modbus_data["accurrent"] = accurrent
-        self.modbus_data["accurrenta"] = accurrenta
-        self.modbus_data["accurrentb"] = accurrentb
-        self.modbus_data["accurrentc"] = accurrentc
-
-        acvoltageab = decoder.decode_16bit_uint()
-        acvoltagebc = decoder.decode_16bit_uint()
-        acvoltageca = decoder.decode_16bit_uint()
-        acvoltagean = decoder.decode_16bit_uint()
-        acvoltagebn = decoder.decode_16bit_uint()
-        acvoltagecn = decoder.decode_16bit_uint()
-        acvoltagesf = decoder.decode_16bit_int()
-
-        acvoltageab = self.calculate_value(acvoltageab, acvoltagesf)
-        acvoltagebc = self.calculate_value(acvoltagebc, acvoltagesf)
-        acvoltageca = self.calculate_value(acvoltageca, acvoltagesf)
-        acvoltagean = self.calculate_value(acvoltagean, acvoltagesf)
-        acvoltagebn = self.calculate_value(acvoltagebn, acvoltagesf)
-        acvoltagecn = self.calculate_value(acvoltagecn, acvoltagesf)
-
-        self.modbus_data["acvoltageab"] = acvoltageab
-        self.modbus_data["acvoltagebc"] = acvoltagebc
-        self.modbus_data["acvoltageca"] = acvoltageca
-        self.modbus_data["acvoltagean"] = acvoltagean
-        self.modbus_data["acvoltagebn"] = acvoltagebn
-        self.modbus_data["acvoltagecn"] = acvoltagecn
-
-        acpower = decoder.decode_16bit_int()
-        acpowersf = decoder.decode_16bit_int()
-        acpower = self.calculate_value(acpower, acpowersf)
-
-        self.modbus_data["acpower"] = acpower
-
-        acfreq = decoder.decode_16bit_uint()
-        acfreqsf = decoder.decode_16bit_int()
-        acfreq = self.calculate_value(acfreq, acfreqsf)
-
-        self.modbus_data["acfreq"] = acfreq
-
-        acva = decoder.decode_16bit_int()
-        acvasf = decoder.decode_16bit_int()
-        acva = self.calculate_value(acva, acvasf)
 
-        self.modbus_data["acva"] = acva
+        battery_info = {}
+        # 0x00 - 16 - manufacturer
+        battery_info["manufacturer"] = decoder.decode_string(32)
 
-        acvar = decoder.decode_16bit_int()
-        acvarsf = decoder.decode_16bit_int()
-        acvar = self.calculate_value(acvar, acvarsf)
+        # 0x10 - 16 - model
+        battery_info["model"] = decoder.decode_string(32)
 
-        self.modbus_data["acvar"] = acvar
+        # 0x20 - 16 - firmware version
+        battery_info["firmware_version"] = decoder.decode_string(32)
 
-        acpf = decoder.decode_16bit_int()
-        acpfsf = decoder.decode_16bit_int()
-        acpf = self.calculate_value(acpf, acpfsf)
+        # 0x30 - 16 - serial number
+        battery_info["serial_number"] = decoder.decode_string(32)
 
-        self.modbus_data["acpf"] = acpf
+        # 0x40 - 1 - device ID
+        battery_info["device_id"] = decoder.decode_16bit_uint()
 
-        acenergy = decoder.decode_32bit_uint()
-        acenergysf = decoder.decode_16bit_uint()
-        acenergy = validate(self.calculate_value(acenergy, acenergysf), ">", 0)
+        # 0x41 - 1 - reserved
+        decoder.decode_16bit_uint()
 
-        self.modbus_data["acenergy"] = round(acenergy * 0.001, 3)
+        # 0x42 - 2 - rated energy
+        battery_info["rated_energy"] = decoder.decode_32bit_float()
 
-        dccurrent = decoder.decode_16bit_uint()
-        dccurrentsf = decoder.decode_16bit_int()
-        dccurrent = self.calculate_value(dccurrent, dccurrentsf)
+        # 0x44 - 2 - max charge continuous power
+        battery_info["max_power_continuous_charge"] = decoder.decode_32bit_float()
 
-        self.modbus_data["dccurrent"] = dccurrent
-
-        dcvoltage = decoder.decode_16bit_uint()
-        dcvoltagesf = decoder.decode_16bit_int()
-        dcvoltage = self.calculate_value(dcvoltage, dcvoltagesf)
-
-        self.modbus_data["dcvoltage"] = dcvoltage
-
-        dcpower = decoder.decode_16bit_int()
-        dcpowersf = decoder.decode_16bit_int()
-        dcpower = self.calculate_value(dcpower, dcpowersf)
-
-        self.modbus_data["dcpower"] = dcpower
-
-        # skip register
-        decoder.skip_bytes(2)
-
-        tempsink = decoder.decode_16bit_int()
-
-        # skip 2 registers
-        decoder.skip_bytes(4)
-
-        tempsf = decoder.decode_16bit_int()
-        tempsink = self.calculate_value(tempsink, tempsf)
-
-        self.modbus_data["tempsink"] = tempsink
-
-        status = decoder.decode_16bit_int()
-        self.modbus_data["status"] = status
-        statusvendor = decoder.decode_16bit_int()
-        self.modbus_data["statusvendor"] = statusvendor
-
-        return True
-
-    async def read_modbus_power_limit(self):
-        """Read the active power limit value (%)."""
-
-        inverter_data = await self.read_holding_registers(
-            unit=self._address, address=0xF001, count=1
+        # 0x46 - 2 - max discharge continuous power
+        battery_info["max_power_continuous_discharge"] = (
+            decoder.decode_32bit_float()
         )
-        if inverter_data.isError():
-            _LOGGER.debug("Could not read Active Power Limit")
-            # Don't stop reading other data, could just be advanced power management not enabled
-            return True
-
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            inverter_data.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-        )
-        # 0xF001 - 1 - Active Power Limit
-        self.modbus_data["nominal_active_power_limit"] = decoder.decode_16bit_uint()
-
-        return True
-
-    async def read_modbus_data_storage(self, has_battery, has_meter):
-        """Read storage data."""
-        if has_battery:
-            count = 0x12  # Read storage block as well
-        elif has_meter:
-            count = 4  # Just read export control block
-        else:
-            return True  # Nothing to read here
-
-        storage_data = await self.read_holding_registers(
-            unit=self._address, address=0xE000, count=count
-        )
-        if not storage_data.isError():
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                storage_data.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-
-            # 0xE000 - 1 - Export control mode
-            export_control_mode = decoder.decode_16bit_uint() & 7
-            if export_control_mode in EXPORT_CONTROL_MODE:
-                self.modbus_data["export_control_mode"] = EXPORT_CONTROL_MODE[
-                    export_control_mode
-                ]
-            else:
-                self.modbus_data["export_control_mode"] = export_control_mode
-
-            # 0xE001 - 1 - Export control limit mode
-            export_control_limit_mode = decoder.decode_16bit_uint() & 1
-            if export_control_limit_mode in EXPORT_CONTROL_MODE:
-                self.modbus_data["export_control_limit_mode"] = (
-                    EXPORT_CONTROL_LIMIT_MODE[export_control_limit_mode]
-                )
-            else:
-                self.modbus_data["export_control_limit_mode"] = (
-                    export_control_limit_mode
-                )
-
-            # 0xE002 - 2 - Export control site limit
-            self.modbus_data["export_control_site_limit"] = round(
-                decoder.decode_32bit_float(), 3
-            )
-
-            if not has_battery:
-                # Done with the export control block
-                return True
-
-            # 0xE004 - 1 - storage control mode
-            storage_control_mode = decoder.decode_16bit_uint()
-            if storage_control_mode in STORAGE_CONTROL_MODE:
-                self.modbus_data["storage_contol_mode"] = STORAGE_CONTROL_MODE[
-                    storage_control_mode
-                ]
-            else:
-                self.modbus_data["storage_contol_mode"] = storage_control_mode
-
-            # 0xE005 - 1 - storage ac charge policy
-            storage_ac_charge_policy = decoder.decode_16bit_uint()
-            if storage_ac_charge_policy in STORAGE_AC_CHARGE_POLICY:
-                self.modbus_data["storage_ac_charge_policy"] = STORAGE_AC_CHARGE_POLICY[
-                    storage_ac_charge_policy
-                ]
-            else:
-                self.modbus_data["storage_ac_charge_policy"] = storage_ac_charge_policy
-
-            # 0xE006 - 2 - storage AC charge limit (kWh or %)
-            self.modbus_data["storage_ac_charge_limit"] = round(
-                decoder.decode_32bit_float(), 3
-            )
-
-            # 0xE008 - 2 - storage backup reserved capacity (%)
-            self.modbus_data["storage_backup_reserved"] = round(
-                decoder.decode_32bit_float(), 3
-            )
-
-            # 0xE00A - 1 - storage charge / discharge default mode
-            storage_default_mode = decoder.decode_16bit_uint()
-            if storage_default_mode in STORAGE_CHARGE_DISCHARGE_MODE:
-                self.modbus_data["storage_default_mode"] = (
-                    STORAGE_CHARGE_DISCHARGE_MODE[storage_default_mode]
-                )
-            else:
-                self.modbus_data["storage_default_mode"] = storage_default_mode
 
-            # 0xE00B - 2- storage remote command timeout (seconds)
-            self.modbus_data["storage_remote_command_timeout"] = (
-                decoder.decode_32bit_uint()
-            )
-
-            # 0xE00D - 1 - storage remote command mode
-            storage_remote_command_mode = decoder.decode_16bit_uint()
-            if storage_remote_command_mode in STORAGE_CHARGE_DISCHARGE_MODE:
-                self.modbus_data["storage_remote_command_mode"] = (
-                    STORAGE_CHARGE_DISCHARGE_MODE[storage_remote_command_mode]
-                )
-            else:
-                self.modbus_data["storage_remote_command_mode"] = (
-                    storage_remote_command_mode
-                )
-
-            # 0xE00E - 2- storate remote charge limit
-            self.modbus_data["storage_remote_charge_limit"] = round(
-                decoder.decode_32bit_float(), 3
-            )
-
-            # 0xE010 - 2- storate remote discharge limit
-            self.modbus_data["storage_remote_discharge_limit"] = round(
-                decoder.decode_32bit_float(), 3
+        # 0x48 - 2 - max charge peak power
+        battery_info["max_power_peak_charge"] = decoder.decode_32bit_float()
+
+        # 0x4A - 2 - max discharge peak power
+        battery_info["max_power_peak_discharge"] = decoder.decode_32bit_float()
+
+        self.modbus_data[battery_prefix + "attrs"] = battery_info
+
+    def count_read(self, block):
+        """Count a read in the read statistics."""
+        total = self.read_stats["total"]
+        total["reads"] += 1
+        total["bytes"] += READ_OVERHEAD_BYTES + 2 * block.count
+        for tier in {section.tier for section in block.sections}:
+            self.read_stats[tier]["reads"] += 1
+        for section in block.sections:
+            self.read_stats[section.tier]["bytes"] += 2 * section.count
+
+    async def read_modbus_data(self, read_plan):
+        """Read and decode the planned register blocks."""
+        for block in read_plan:
+            data = await self.read_holding_registers(
+                unit=self._address, address=block.address, count=block.count
             )
-
-        return True
-
-    async def read_modbus_data_battery1(self):
-        """Read battery 1."""
-        return await self.read_modbus_data_battery("battery1_", 0xE100)
-
-    async def read_modbus_data_battery2(self):
-        """Read battery 2."""
-        return await self.read_modbus_data_battery("battery2_", 0xE200)
-
-    async def read_modbus_data_battery3(self):
-        """Read battery 3."""
-        return await self.read_modbus_data_battery("battery3_", 0xE400)
-
-    async def read_modbus_data_battery(self, battery_prefix, start_address):
-        """Read battery data."""
-        if battery_prefix + "attrs" not in self.modbus_data:
-            battery_data = await self.read_holding_registers(
-                unit=self._address, address=start_address, count=0x4C
-            )
-            if not battery_data.isError():
-                decoder = BinaryPayloadDecoder.fromRegisters(
-                    battery_data.registers,
-                    byteorder=Endian.BIG,
-                    wordorder=Endian.LITTLE,
-                )
-
-                battery_info = {}
-                # 0x00 - 16 - manufacturer
-                battery_info["manufacturer"] = decoder.decode_string(32)
-
-                # 0x10 - 16 - model
-                battery_info["model"] = decoder.decode_string(32)
-
-                # 0x20 - 16 - firmware version
-                battery_info["firmware_version"] = decoder.decode_string(32)
-
-                # 0x30 - 16 - serial number
-                battery_info["serial_number"] = decoder.decode_string(32)
-
-                # 0x40 - 1 - device ID
-                battery_info["device_id"] = decoder.decode_16bit_uint()
-
-                # 0x41 - 1 - reserved
-                decoder.decode_16bit_uint()
-
-                # 0x42 - 2 - rated energy
-                battery_info["rated_energy"] = decoder.decode_32bit_float()
-
-                # 0x44 - 2 - max charge continuous power
-                battery_info["max_power_continuous_charge"] = (
-                    decoder.decode_32bit_float()
-                )
-
-                # 0x46 - 2 - max discharge continuous power
-                battery_info["max_power_continuous_discharge"] = (
-                    decoder.decode_32bit_float()
-                )
-
-                # 0x48 - 2 - max charge peak power
-                battery_info["max_power_peak_charge"] = decoder.decode_32bit_float()
-
-                # 0x4A - 2 - max discharge peak power
-                battery_info["max_power_peak_discharge"] = decoder.decode_32bit_float()
-
-                self.modbus_data[battery_prefix + "attrs"] = battery_info
-
-        storage_data = await self.read_holding_registers(
-            unit=self._address, address=start_address + 0x6C, count=28
-        )
-        if storage_data.isError():
-            return False
-
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            storage_data.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-        )
-
-        # 0x6C - 2 - avg temp C
-        tempavg = decoder.decode_32bit_float()
-        # 0x6E - 2 - max temp C
-        tempmax = decoder.decode_32bit_float()
-        # 0x70 - 2 - inst voltage V
-        batteryvoltage = decoder.decode_32bit_float()
-        # 0x72 - 2 - inst current A
-        batterycurrent = decoder.decode_32bit_float()
-        # 0x74 - 2 - inst power W
-        batterypower = decoder.decode_32bit_float()
-        # 0x76 - 4 - cumulative discharged (Wh)
-        cumulative_discharged = decoder.decode_64bit_uint()
-        # 0x7a - 4 - cumulative charged (Wh)
-        cumulative_charged = decoder.decode_64bit_uint()
-        # 0x7E - 2 - current max size Wh
-        battery_max = decoder.decode_32bit_float()
-        # 0x80 - 2 - available size Wh
-        battery_availbable = decoder.decode_32bit_float()
-        # 0x82 - 2 - SoH %
-        battery_SoH = decoder.decode_32bit_float()
-        # 0x84 - 2 - SoC %
-        battery_SoC = validate(decoder.decode_32bit_float(), ">=", 0.0)
-        battery_SoC = validate(battery_SoC, "<", 101)
-
-        self.modbus_data[battery_prefix + "temp_avg"] = round(tempavg, 1)
-        self.modbus_data[battery_prefix + "temp_max"] = round(tempmax, 1)
-        self.modbus_data[battery_prefix + "voltage"] = round(batteryvoltage, 3)
-        self.modbus_data[battery_prefix + "current"] = round(batterycurrent, 3)
-        self.modbus_data[battery_prefix + "power"] = round(batterypower, 3)
-        self.modbus_data[battery_prefix + "energy_discharged"] = round(
-            cumulative_discharged / 1000, 3
-        )
-        self.modbus_data[battery_prefix + "energy_charged"] = round(
-            cumulative_charged / 1000, 3
-        )
-        self.modbus_data[battery_prefix + "size_max"] = round(battery_max, 3)
-        self.modbus_data[battery_prefix + "size_available"] = round(
-            battery_availbable, 3
-        )
-        self.modbus_data[battery_prefix + "state_of_health"] = round(battery_SoH, 0)
-        self.modbus_data[battery_prefix + "state_of_charge"] = round(battery_SoC, 0)
-        battery_status = decoder.decode_32bit_uint()
-
-        # voltage and current are bogus in certain statuses
-        if battery_status not in [3, 4, 6]:
-            self.modbus_data[battery_prefix + "voltage"] = 0
-            self.modbus_data[battery_prefix + "current"] = 0
-            self.modbus_data[battery_prefix + "power"] = 0
-
-        if battery_status in BATTERY_STATUSSES:
-            self.modbus_data[battery_prefix + "status"] = BATTERY_STATUSSES[
-                battery_status
-            ]
-        else:
-            self.modbus_data[battery_prefix + "status"] = battery_status
+            self.count_read(block)
+            if data.isError():
+                if block.optional:
+                    # Don't stop reading other data, e.g. advanced power
+                    # management may just not be enabled
+                    _LOGGER.debug("Could not read %s", block.name)
+                    continue
+                return False
+            block.decode(data.registers, self.modbus_data)
 
         return True
 
@@ -1026,6 +473,10 @@ class SolaredgeModbusCoordinator(DataUpdateCoordinator):
         self.read_battery2 = read_battery2
         self.read_battery3 = read_battery3
         self.max_export_control_site_limit = max_export_control_site_limit
+        self._scan_interval = scan_interval
+        self._sections = self.enabled_sections()
+        self._read_plans = {}
+        self._tier_read_at = {}
 
     @property
     def modbus_data(self):
@@ -1035,6 +486,10 @@ class SolaredgeModbusCoordinator(DataUpdateCoordinator):
     def device_info(self):
         return self.hub.device_info
 
+    @property
+    def read_stats(self):
+        return self.hub.read_stats
+
     async def _async_setup(self):
         """Initialize device information."""
         if not await self.hub.check_and_reconnect():
@@ -1058,23 +513,61 @@ class SolaredgeModbusCoordinator(DataUpdateCoordinator):
 
         return self.modbus_data
 
+    def enabled_sections(self):
+        """Return the register map sections to poll."""
+        sections = [INVERTER]
+        if self.power_control_enabled:
+            sections.append(POWER_LIMIT)
+        for enabled, meter_or_battery in (
+            (self.read_meter1, (METER1, METER1_ENERGY)),
+            (self.read_meter2, (METER2, METER2_ENERGY)),
+            (self.read_meter3, (METER3, METER3_ENERGY)),
+            (self.read_battery1, (BATTERY1,)),
+            (self.read_battery2, (BATTERY2,)),
+            (self.read_battery3, (BATTERY3,)),
+        ):
+            if enabled:
+                sections.extend(meter_or_battery)
+        if self.has_meter or self.has_battery:
+            sections.append(EXPORT_CONTROL)
+        if self.has_battery:
+            sections.append(STORAGE_CONTROL)
+        return sections
+
     async def read_modbus_data(self):
         """Read all modbus data."""
-        return (
-            await self.hub.read_modbus_data_inverter()
-            and (
-                not self.power_control_enabled
-                or await self.hub.read_modbus_power_limit()
-            )
-            and (not self.read_meter1 or await self.hub.read_modbus_data_meter1())
-            and (not self.read_meter2 or await self.hub.read_modbus_data_meter2())
-            and (not self.read_meter2 or await self.hub.read_modbus_data_meter3())
-            and await self.hub.read_modbus_data_storage(
-                self.has_battery, self.has_meter
+        for enabled, prefix, address in (
+            (self.read_battery1, "battery1_", BATTERY1_ADDRESS),
+            (self.read_battery2, "battery2_", BATTERY2_ADDRESS),
+            (self.read_battery3, "battery3_", BATTERY3_ADDRESS),
+        ):
+            if enabled and prefix + "attrs" not in self.modbus_data:
+                await self.hub.read_modbus_battery_info(prefix, address)
+
+        now = time.monotonic()
+        tiers = self.due_tiers(now)
+        if (read_plan := self._read_plans.get(tiers)) is None:
+            read_plan = self._read_plans[tiers] = plan_reads(
+                section for section in self._sections if section.tier in tiers
             )
-            and (not self.read_battery1 or await self.hub.read_modbus_data_battery1())
-            and (not self.read_battery2 or await self.hub.read_modbus_data_battery2())
-            and (not self.read_battery3 or await self.hub.read_modbus_data_battery3())
+        if not await self.hub.read_modbus_data(read_plan):
+            return False
+
+        for tier in tiers:
+            self._tier_read_at[tier] = now
+        _LOGGER.debug("Read tiers %s, totals %s", sorted(tiers), self.read_stats)
+        return True
+
+    def due_tiers(self, now):
+        """Return the polling tiers to read in the update at now."""
+        # Half a scan interval of slack keeps timer jitter from pushing a
+        # tier to the update after the one it is due in.
+        slack = self._scan_interval / 2
+        return frozenset(
+            tier
+            for tier, interval in TIER_INTERVALS.items()
+            if tier not in self._tier_read_at
+            or now - self._tier_read_at[tier] + slack >= interval
         )
 
     @property
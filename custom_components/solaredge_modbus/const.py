@@ -47,6 +47,19 @@ CONF_READ_BATTERY2 = "read_battery_2"
 CONF_READ_BATTERY3 = "read_battery_3"
 CONF_MAX_EXPORT_CONTROL_SITE_LIMIT = "max_export_control_site_limit"
 DEFAULT_MAX_EXPORT_CONTROL_SITE_LIMIT = 10000
+
+# Largest read_holding_registers request allowed by the Modbus specification
+MAX_READ_REGISTERS = 125
+# Modbus TCP bytes of a read request (12) and of the response header (9)
+READ_OVERHEAD_BYTES = 21
+
+# Polling tiers: fast values are read on every update, the others once their
+# interval (seconds) has passed
+TIER_FAST = "fast"
+TIER_MEDIUM = "medium"
+TIER_SLOW = "slow"
+TIER_INTERVALS = {TIER_FAST: 0, TIER_MEDIUM: 60, TIER_SLOW: 600}
+
 METER_1 = "m1"
 METER_2 = "m2"
 METER_3 = "m3"
@@ -7,12 +7,16 @@ modbus messages payloads.
 from __future__ import annotations
 
 __all__ = [
+    "BinaryPayloadBlockDecoder",
     "BinaryPayloadBuilder",
     "BinaryPayloadDecoder",
 ]
 
 # pylint: disable=missing-type-doc
-from struct import pack, unpack
+from array import array
+from functools import lru_cache
+from struct import Struct, pack, unpack
+import sys
 
 import enum
 from pymodbus.exceptions import ParameterException
@@ -480,3 +484,88 @@ class BinaryPayloadDecoder:
         :param nbytes: The number of bytes to skip
         """
         self._pointer += nbytes
+
+
+class BinaryPayloadBlockDecoder:
+    """A decoder for whole register blocks with precompiled struct layouts.
+
+    The registers are copied once into an array of 16 bit words, arranged so
+    that every value of a layout unpacks with a single struct call, and
+    decoded through a memoryview of that array without further copies::
+
+        layout = BinaryPayloadBlockDecoder.layout("4hh", Endian.BIG)
+        decoder = BinaryPayloadBlockDecoder(registers, byteorder=Endian.BIG)
+        current, current_a, current_b, current_c, current_sf = (
+            decoder.decode_layout(layout)
+        )
+
+    Values decode exactly as with BinaryPayloadDecoder.fromRegisters and the
+    same byte and word order.
+    """
+
+    def __init__(self, registers, byteorder=Endian.BIG, wordorder=Endian.BIG):
+        """Initialize a new block decoder.
+
+        :param registers: The register results to initialize with
+        :param byteorder: The Byte order of each word
+        :param wordorder: The endianness of the word (when wordcount is >= 2)
+        :raises ParameterException:
+        """
+        if not isinstance(registers, list):
+            raise ParameterException("Invalid collection of registers supplied")
+        words = array("H", registers)
+        # Layouts unpack with the word order, so the words are stored big
+        # endian when the byte order matches it and little endian otherwise.
+        self._swapped = byteorder != wordorder
+        if self._swapped == (sys.byteorder == "big"):
+            words.byteswap()
+        self._payload = memoryview(words).cast("B")
+        self._pointer = 0x00
+        self._wordorder = wordorder
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def layout(codes: str, wordorder=Endian.BIG) -> Struct:
+        """Return the precompiled layout of struct format codes.
+
+        :param codes: The format codes, without byte order, e.g. "4hh2xI"
+        :param wordorder: The word order of the decoder it is used with
+        """
+        return Struct(wordorder.value + codes)
+
+    def reset(self):
+        """Reset the decoder pointer back to the start."""
+        self._pointer = 0x00
+
+    def decode_layout(self, layout: Struct, offset=None) -> tuple:
+        """Decode all values of a layout from the buffer.
+
+        :param layout: A layout returned by layout() for the decoder's word order
+        :param offset: Byte offset to decode from, defaults to the pointer
+        """
+        if offset is not None:
+            self._pointer = offset
+        values = layout.unpack_from(self._payload, self._pointer)
+        self._pointer += layout.size
+        return values
+
+    def decode_string(self, size=1):
+        """Decode a string from the buffer.
+
+        :param size: The size of the string to decode
+        """
+        self._pointer += size
+        s = self._payload[self._pointer - size : self._pointer].tobytes()
+        if self._swapped:
+            words = array("H", s)
+            words.byteswap()
+            s = words.tobytes()
+        s = s.rstrip(b"\0")  # omit NULL terminators
+        return s.decode()
+
+    def skip_bytes(self, nbytes):
+        """Skip n bytes in the buffer.
+
+        :param nbytes: The number of bytes to skip
+        """
+        self._pointer += nbytes
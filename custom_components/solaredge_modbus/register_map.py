@@ -0,0 +1,423 @@
+"""Register map of the SolarEdge Modbus Integration.
+
+Every block that is polled is described once as a section: where it starts,
+the struct layout of its registers and how each value is scaled and converted.
+plan_reads() merges the enabled sections into as few read_holding_registers
+requests as the device allows and ReadBlock.decode() decodes a response with
+one precompiled struct layout per section on a single buffer.  Each section
+belongs to a polling tier, so slow changing values are not read on every
+update.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import operator
+from typing import Any, NamedTuple
+
+from .const import (
+    BATTERY_STATUSSES,
+    EXPORT_CONTROL_LIMIT_MODE,
+    EXPORT_CONTROL_MODE,
+    MAX_READ_REGISTERS,
+    STORAGE_AC_CHARGE_POLICY,
+    STORAGE_CHARGE_DISCHARGE_MODE,
+    STORAGE_CONTROL_MODE,
+    TIER_FAST,
+    TIER_MEDIUM,
+    TIER_SLOW,
+)
+from .payload import BinaryPayloadBlockDecoder, Endian
+
+
+def validate(value, comparison, against):
+    """Validate value."""
+    ops = {
+        ">": operator.gt,
+        "<": operator.lt,
+        ">=": operator.ge,
+        "<=": operator.le,
+        "==": operator.eq,
+        "!=": operator.ne,
+    }
+    if not ops[comparison](value, against):
+        raise ValueError(f"Value {value} failed validation ({comparison}{against})")
+    return value
+
+
+def calculate_value(value, sf):
+    """Calculate a value using scaling factor."""
+    return round(value * 10**sf, max(0, -sf))
+
+
+class Field(NamedTuple):
+    """One value of a section.
+
+    key: name in modbus_data (without the section prefix), None for
+        reserved registers.
+    code: struct format code of the value, "2x" per reserved register.
+    sf: key of the scale factor field applied to the value.
+    convert: called with the (scaled) value before it is stored.
+    """
+
+    key: str | None
+    code: str
+    sf: str | None = None
+    convert: Callable[[Any], Any] | None = None
+
+
+def _reserved(registers: int) -> Field:
+    return Field(None, f"{registers * 2}x")
+
+
+def _scaled(code: str, keys: Iterable[str], sf: str, sf_code: str = "h") -> list[Field]:
+    """Return a run of values sharing the scale factor that follows them."""
+    return [Field(key, code, sf) for key in keys] + [Field(sf, sf_code)]
+
+
+def _lookup(names: dict[int, str], mask: int | None = None) -> Callable[[int], Any]:
+    """Return a converter mapping a register value to its name if known."""
+
+    def convert(value: int) -> Any:
+        if mask is not None:
+            value &= mask
+        return names.get(value, value)
+
+    return convert
+
+
+def _round(digits: int) -> Callable[[float], float]:
+    return lambda value: round(value, digits)
+
+
+def _kwh(value):
+    return round(value * 0.001, 3)
+
+
+def _kwh_positive(value):
+    return round(validate(value, ">", 0) * 0.001, 3)
+
+
+def _state_of_charge(value):
+    return round(validate(validate(value, ">=", 0.0), "<", 101), 0)
+
+
+def _battery_status(data: dict[str, Any], prefix: str) -> None:
+    """Map the battery status and clear values that are bogus in some statuses."""
+    battery_status = data[prefix + "status"]
+    if battery_status not in [3, 4, 6]:
+        data[prefix + "voltage"] = 0
+        data[prefix + "current"] = 0
+        data[prefix + "power"] = 0
+    data[prefix + "status"] = BATTERY_STATUSSES.get(battery_status, battery_status)
+
+
+class Section:
+    """A run of registers decoded with one precompiled struct layout."""
+
+    def __init__(
+        self,
+        name: str,
+        address: int,
+        fields: Iterable[Field],
+        *,
+        prefix: str = "",
+        wordorder: Endian = Endian.BIG,
+        optional: bool = False,
+        tier: str = TIER_FAST,
+        finish: Callable[[dict[str, Any], str], None] | None = None,
+    ) -> None:
+        """Initialize a section.
+
+        :param name: Name used in logging
+        :param address: First register of the section
+        :param fields: The values of the section, in register order
+        :param prefix: Prefix of the keys in modbus_data
+        :param wordorder: The word order of 32 and 64 bit values
+        :param optional: A failed read of this section does not fail the update
+        :param tier: The polling tier of the section
+        :param finish: Called with (decoded values, prefix) after decoding
+        """
+        fields = list(fields)
+        self.name = name
+        self.address = address
+        self.prefix = prefix
+        self.wordorder = wordorder
+        self.optional = optional
+        self.tier = tier
+        self.finish = finish
+        self.struct = BinaryPayloadBlockDecoder.layout(
+            "".join(f.code for f in fields), wordorder
+        )
+        self.count = self.struct.size // 2
+        self._keys = [f.key for f in fields if f.key is not None]
+        scale_factors = {f.sf for f in fields if f.sf is not None}
+        self._outputs = [
+            (f.key, f.sf, f.convert)
+            for f in fields
+            if f.key is not None and f.key not in scale_factors
+        ]
+
+    @property
+    def end(self) -> int:
+        """Return the register after the section."""
+        return self.address + self.count
+
+    def decode(
+        self, decoder: BinaryPayloadBlockDecoder, offset: int, data: dict[str, Any]
+    ) -> None:
+        """Decode the section at byte offset of the block into data.
+
+        Nothing is stored in data if a value fails validation.
+        """
+        raw = dict(zip(self._keys, decoder.decode_layout(self.struct, offset)))
+        prefix = self.prefix
+        values = {}
+        for key, sf, convert in self._outputs:
+            value = raw[key]
+            if sf is not None:
+                value = calculate_value(value, raw[sf])
+            if convert is not None:
+                value = convert(value)
+            values[prefix + key] = value
+        if self.finish is not None:
+            self.finish(values, prefix)
+        data.update(values)
+
+    def __repr__(self) -> str:
+        """Return the section name and register range."""
+        return f"<Section {self.name} {self.address}+{self.count}>"
+
+
+class ReadBlock(NamedTuple):
+    """One read_holding_registers request covering one or more sections."""
+
+    address: int
+    count: int
+    wordorder: Endian
+    optional: bool
+    sections: tuple[Section, ...]
+
+    def decode(self, registers: list[int], data: dict[str, Any]) -> None:
+        """Decode all sections of the block from the registers into data."""
+        decoder = BinaryPayloadBlockDecoder(
+            registers, byteorder=Endian.BIG, wordorder=self.wordorder
+        )
+        for section in self.sections:
+            section.decode(decoder, (section.address - self.address) * 2, data)
+
+    @property
+    def name(self) -> str:
+        """Return the names of the sections in the block."""
+        return "+".join(section.name for section in self.sections)
+
+
+def plan_reads(
+    sections: Iterable[Section], max_count: int = MAX_READ_REGISTERS
+) -> list[ReadBlock]:
+    """Merge adjacent sections into the fewest reads of at most max_count registers.
+
+    Only sections with the same word order and the same optional flag are
+    merged, so an optional section that the device rejects never takes a
+    required one down with it.
+    """
+    blocks: list[ReadBlock] = []
+    for section in sorted(sections, key=lambda s: s.address):
+        if blocks:
+            last = blocks[-1]
+            if (
+                section.address <= last.address + last.count
+                and section.end - last.address <= max_count
+                and section.wordorder == last.wordorder
+                and section.optional == last.optional
+            ):
+                blocks[-1] = last._replace(
+                    count=max(last.count, section.end - last.address),
+                    sections=(*last.sections, section),
+                )
+                continue
+        if section.count > max_count:
+            raise ValueError(f"{section!r} exceeds {max_count} registers")
+        blocks.append(
+            ReadBlock(
+                section.address,
+                section.count,
+                section.wordorder,
+                section.optional,
+                (section,),
+            )
+        )
+    return blocks
+
+
+INVERTER = Section(
+    "inverter",
+    40071,
+    [
+        *_scaled("H", ["accurrent", "accurrenta", "accurrentb", "accurrentc"], "accurrentsf"),
+        *_scaled(
+            "H",
+            ["acvoltageab", "acvoltagebc", "acvoltageca", "acvoltagean", "acvoltagebn", "acvoltagecn"],
+            "acvoltagesf",
+        ),
+        *_scaled("h", ["acpower"], "acpowersf"),
+        *_scaled("H", ["acfreq"], "acfreqsf"),
+        *_scaled("h", ["acva"], "acvasf"),
+        *_scaled("h", ["acvar"], "acvarsf"),
+        *_scaled("h", ["acpf"], "acpfsf"),
+        Field("acenergy", "I", "acenergysf", _kwh_positive),
+        Field("acenergysf", "H"),
+        *_scaled("H", ["dccurrent"], "dccurrentsf"),
+        *_scaled("H", ["dcvoltage"], "dcvoltagesf"),
+        *_scaled("h", ["dcpower"], "dcpowersf"),
+        _reserved(1),
+        Field("tempsink", "h", "tempsf"),
+        _reserved(2),
+        Field("tempsf", "h"),
+        Field("status", "h"),
+        Field("statusvendor", "h"),
+    ],
+)
+
+# 0xF001 - Active Power Limit, only available with advanced power management
+POWER_LIMIT = Section(
+    "power_limit",
+    0xF001,
+    [Field("nominal_active_power_limit", "H")],
+    wordorder=Endian.LITTLE,
+    optional=True,
+    tier=TIER_SLOW,
+)
+
+
+def meter_sections(name: str, prefix: str, address: int) -> tuple[Section, Section]:
+    """Return the live data and the energy counter sections of a meter."""
+    phases = ("", "a", "b", "c")
+    live = Section(
+        name,
+        address,
+        [
+            *_scaled("h", [f"accurrent{p}" for p in phases], "accurrentsf"),
+            *_scaled(
+                "h",
+                ["acvoltageln", "acvoltagean", "acvoltagebn", "acvoltagecn"]
+                + ["acvoltagell", "acvoltageab", "acvoltagebc", "acvoltageca"],
+                "acvoltagesf",
+            ),
+            *_scaled("h", ["acfreq"], "acfreqsf"),
+            *_scaled("h", [f"acpower{p}" for p in phases], "acpowersf"),
+            *_scaled("h", [f"acva{p}" for p in phases], "acvasf"),
+            *_scaled("h", [f"acvar{p}" for p in phases], "acvarsf"),
+            *_scaled("h", [f"acpf{p}" for p in phases], "acpfsf"),
+        ],
+        prefix=prefix,
+    )
+    energy = Section(
+        f"{name}_energy",
+        live.end,
+        [
+            Field("exported", "I", "energywsf", _kwh_positive),
+            *[Field(f"exported{p}", "I", "energywsf", _kwh) for p in phases[1:]],
+            Field("imported", "I", "energywsf", _kwh_positive),
+            *[Field(f"imported{p}", "I", "energywsf", _kwh) for p in phases[1:]],
+            Field("energywsf", "h"),
+            *_scaled(
+                "I",
+                [f"{d}va{p}" for d in ("exported", "imported") for p in phases],
+                "energyvasf",
+            ),
+            *_scaled(
+                "I",
+                [f"importvarhq{q}{p}" for q in range(1, 5) for p in phases],
+                "energyvarsf",
+            ),
+        ],
+        prefix=prefix,
+        tier=TIER_MEDIUM,
+    )
+    return live, energy
+
+
+METER1, METER1_ENERGY = meter_sections("meter1", "m1_", 40190)
+METER2, METER2_ENERGY = meter_sections("meter2", "m2_", 40364)
+METER3, METER3_ENERGY = meter_sections("meter3", "m3_", 40539)
+
+# 0xE000 - export control, read whenever a meter is configured
+EXPORT_CONTROL = Section(
+    "export_control",
+    0xE000,
+    [
+        Field("export_control_mode", "H", convert=_lookup(EXPORT_CONTROL_MODE, 7)),
+        Field(
+            "export_control_limit_mode",
+            "H",
+            convert=_lookup(EXPORT_CONTROL_LIMIT_MODE, 1),
+        ),
+        Field("export_control_site_limit", "f", convert=_round(3)),
+    ],
+    wordorder=Endian.LITTLE,
+    optional=True,
+    tier=TIER_SLOW,
+)
+
+# 0xE004 - storage control, follows the export control block
+STORAGE_CONTROL = Section(
+    "storage_control",
+    0xE004,
+    [
+        Field("storage_contol_mode", "H", convert=_lookup(STORAGE_CONTROL_MODE)),
+        Field(
+            "storage_ac_charge_policy", "H", convert=_lookup(STORAGE_AC_CHARGE_POLICY)
+        ),
+        Field("storage_ac_charge_limit", "f", convert=_round(3)),
+        Field("storage_backup_reserved", "f", convert=_round(3)),
+        Field(
+            "storage_default_mode", "H", convert=_lookup(STORAGE_CHARGE_DISCHARGE_MODE)
+        ),
+        Field("storage_remote_command_timeout", "I"),
+        Field(
+            "storage_remote_command_mode",
+            "H",
+            convert=_lookup(STORAGE_CHARGE_DISCHARGE_MODE),
+        ),
+        Field("storage_remote_charge_limit", "f", convert=_round(3)),
+        Field("storage_remote_discharge_limit", "f", convert=_round(3)),
+    ],
+    wordorder=Endian.LITTLE,
+    optional=True,
+    tier=TIER_SLOW,
+)
+
+
+def battery_section(name: str, prefix: str, address: int) -> Section:
+    """Return the live data section of the battery whose block starts at address."""
+    return Section(
+        name,
+        address + 0x6C,
+        [
+            Field("temp_avg", "f", convert=_round(1)),
+            Field("temp_max", "f", convert=_round(1)),
+            Field("voltage", "f", convert=_round(3)),
+            Field("current", "f", convert=_round(3)),
+            Field("power", "f", convert=_round(3)),
+            Field("energy_discharged", "Q", convert=lambda wh: round(wh / 1000, 3)),
+            Field("energy_charged", "Q", convert=lambda wh: round(wh / 1000, 3)),
+            Field("size_max", "f", convert=_round(3)),
+            Field("size_available", "f", convert=_round(3)),
+            Field("state_of_health", "f", convert=_round(0)),
+            Field("state_of_charge", "f", convert=_state_of_charge),
+            Field("status", "I"),
+        ],
+        prefix=prefix,
+        wordorder=Endian.LITTLE,
+        finish=_battery_status,
+    )
+
+
+BATTERY1_ADDRESS = 0xE100
+BATTERY2_ADDRESS = 0xE200
+BATTERY3_ADDRESS = 0xE400
+
+BATTERY1 = battery_section("battery1", "battery1_", BATTERY1_ADDRESS)
+BATTERY2 = battery_section("battery2", "battery2_", BATTERY2_ADDRESS)
+BATTERY3 = battery_section("battery3", "battery3_", BATTERY3_ADDRESS)